@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Measure the cold-start cost of importing the library.
+
+    python scripts/bench_import.py [--runs 15] [--max-ms 250]
+
+Each run imports in a fresh interpreter, so nothing is warm except the OS file
+cache and the on-disk bytecode / provider-registry caches, as in a serverless
+cold start.  Three imports are timed: ``import yait_aichain``, a Skill-only
+handler and the full tool layer.  Prints the median and best wall time of
+each.  The Skill-only import must leave ``chain``, ``pool``, ``agent`` and
+the tool groups unloaded; with ``--max-ms`` the script also fails when its
+median exceeds the budget, to catch regressions in CI.
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+CASES = {
+    "import yait_aichain":        "import yait_aichain",
+    "Skill-only handler":         "from yait_aichain import Model, Skill",
+    "full tool layer":            "from yait_aichain.tools import *",
+}
+
+# Must not be loaded by a Skill-only import.
+LAZY = ("yait_aichain.chain", "yait_aichain.pool", "yait_aichain.agent",
+        "yait_aichain.tools.search", "yait_aichain.tools.convert",
+        "yait_aichain.tools.vectordb", "yait_aichain.tools.mcp")
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"ms": elapsed * 1000, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure(stmt: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(stmt=stmt)],
+        cwd=ROOT, env={**os.environ, "PYTHONPATH": str(ROOT)},
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="fail when the Skill-only median exceeds this")
+    args = parser.parse_args()
+
+    measure("import yait_aichain")        # warm bytecode and registry caches
+    failed = False
+    for label, stmt in CASES.items():
+        samples = [measure(stmt) for _ in range(args.runs)]
+        times   = [s["ms"] for s in samples]
+        median  = statistics.median(times)
+        print(f"{label:<22} median {median:7.1f} ms   best {min(times):7.1f} ms")
+        if label != "Skill-only handler":
+            continue
+        loaded = sorted(set(LAZY) & set(samples[0]["modules"]))
+        if loaded:
+            print(f"  eagerly loaded: {', '.join(loaded)}")
+            failed = True
+        if args.max_ms is not None and median > args.max_ms:
+            print(f"  over budget: {median:.1f} ms > {args.max_ms:.1f} ms")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
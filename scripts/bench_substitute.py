@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Compare Skill prompt substitution: per-run ``adapters.substitute`` against a
+template compiled once with ``adapters.compile_messages``.
+
+    python scripts/bench_substitute.py [--chunks 20] [--chunk-chars 2000] [--runs 2000]
+
+The template is RAG-shaped: a fixed system prompt with a JSON example, and a
+user turn holding ``--chunks`` retrieved passages of ``--chunk-chars``
+characters, each behind its own ``{doc_N}`` placeholder, plus the question.
+Prints microseconds per render for both paths, and the same for a render
+whose variables touch no placeholder (the shared, copy-free path).  Exits
+non-zero if the two paths ever produce different messages.
+"""
+
+import argparse
+import pathlib
+import sys
+import timeit
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from yait_aichain.skills import _adapters as adapters  # noqa: E402
+
+
+def template(chunks: int) -> list:
+    context = "\n\n".join(f"[{i}] {{doc_{i}}}" for i in range(chunks))
+    return adapters.normalize_input({"messages": [
+        {"role": "system", "parts": [
+            "Answer from the passages only. Reply as JSON: "
+            '{"answer": "...", "sources": [1, 2]}'
+        ]},
+        {"role": "user", "parts": [f"Passages:\n{context}\n\nQuestion: {{question}}"]},
+    ]})["messages"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=20)
+    parser.add_argument("--chunk-chars", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+
+    messages  = template(args.chunks)
+    compiled  = adapters.compile_messages(messages)
+    passage   = ("lorem ipsum {not a slot} " * args.chunk_chars)[:args.chunk_chars]
+    variables = {f"doc_{i}": passage for i in range(args.chunks)}
+    variables["question"] = "What changed?"
+    unrelated = {"unused": "x"}
+
+    for label, values in (("filled", variables), ("no slot touched", unrelated)):
+        if compiled.render(values) != adapters.substitute(messages, values):
+            print(f"{label}: compiled render differs from substitute")
+            return 1
+        old = min(timeit.repeat(lambda: adapters.substitute(messages, values),
+                                number=args.runs, repeat=5)) / args.runs * 1e6
+        new = min(timeit.repeat(lambda: compiled.render(values),
+                                number=args.runs, repeat=5)) / args.runs * 1e6
+        print(f"{label:<16} substitute {old:8.1f} us   compiled {new:8.1f} us"
+              f"   x{old / new:5.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
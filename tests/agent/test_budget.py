@@ -3,6 +3,7 @@ Agent token-budget enforcement (1.3.4 #46):
   H1 — the budget is checked WITHIN a step (no action+execute+reflect overshoot).
   H2 — agile replan is capped (no non-progressing loop).
   C1 — tokens from a failed-to-parse orchestrator reply are still counted.
+  Pre-flight — a call whose estimated prompt cannot fit is never sent.
 """
 
 import json
@@ -55,13 +56,22 @@ class TestWithinStepBudget(unittest.TestCase):
 
     def test_no_overshoot_within_a_step(self):
         # action call alone exceeds the budget → execution + reflection skipped
-        orch = _orchestrator(_json(_PLAN, 0), _json(_ACTION, 100))
-        agent = Agent(orchestrator=orch, tools=[Noop()], max_tokens=10)
+        orch = _orchestrator(_json(_PLAN, 0), _json(_ACTION, 100_000))
+        agent = Agent(orchestrator=orch, tools=[Noop()], max_tokens=20_000)
         res = agent.run("do it")
         self.assertFalse(res.success)
         # plan + action only — NO reflection call after the budget was blown
         self.assertEqual(orch.client._post.call_count, 2)
 
+    def test_prompt_that_cannot_fit_is_not_sent(self):
+        # the action prompt alone is estimated above the 50-token budget
+        orch = _orchestrator(_json(_PLAN, 0), _json(_ACTION, 0))
+        agent = Agent(orchestrator=orch, tools=[Noop()], max_tokens=50)
+        res = agent.run("do it")
+        self.assertFalse(res.success)
+        self.assertIn("Token budget", res.error)
+        self.assertEqual(orch.client._post.call_count, 1)     # the plan only
+
 
 class TestReplanCap(unittest.TestCase):
 
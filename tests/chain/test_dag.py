@@ -0,0 +1,223 @@
+"""
+tests.chain.test_dag
+====================
+
+Chain(mode="dag"): dependencies inferred from Skill placeholders / Tool
+parameters / output keys (or explicit depends_on), independent steps run
+concurrently on a bounded pool, and history, statuses and suspend/resume stay
+in step order.  Pure — local tools, no network.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+
+from chain import Chain
+from models import Model
+from skills import Skill
+from tools._base import Tool
+from state import Suspend, SuspendedResult
+from tests.skills._fakes import chat_response, chat_skill, fake_model
+
+
+class _Upper(Tool):
+    """Upper-cases ``text``; optionally sleeps and records concurrency."""
+
+    name = "upper"
+    parameters = {"type": "object", "properties": {"text": {"type": "string"}}}
+
+    def __init__(self, delay=0.0, gauge=None):
+        self.delay, self.gauge = delay, gauge
+
+    def run(self, text="", **kw):
+        if self.gauge is not None:
+            self.gauge.enter()
+        time.sleep(self.delay)
+        if self.gauge is not None:
+            self.gauge.leave()
+        return text.upper()
+
+
+class _Join(Tool):
+    name = "join"
+    parameters = {"type": "object", "properties": {"a": {"type": "string"},
+                                                   "b": {"type": "string"}}}
+
+    def run(self, a="", b="", **kw):
+        return f"{a}+{b}"
+
+
+class _Fail(Tool):
+    name = "fail"
+    parameters = {"type": "object", "properties": {"text": {"type": "string"}}}
+
+    def run(self, **kw):
+        raise RuntimeError("boom")
+
+
+class _Approve(Tool):
+    name = "approve"
+    parameters = {"type": "object", "properties": {"text": {"type": "string"}}}
+
+    def run(self, _signal=None, **kw):
+        if _signal is None:
+            raise Suspend("Approve?", {"ok": "bool"})
+        return "approved" if _signal.get("ok") else "rejected"
+
+
+class _Gauge:
+    def __init__(self):
+        self.lock, self.now, self.peak = threading.Lock(), 0, 0
+
+    def enter(self):
+        with self.lock:
+            self.now += 1
+            self.peak = max(self.peak, self.now)
+
+    def leave(self):
+        with self.lock:
+            self.now -= 1
+
+
+class TestDependencies(unittest.TestCase):
+
+    def test_inferred_from_parameters_and_output_keys(self):
+        chain = Chain([(_Upper(), "a"),
+                       (_Upper(), "b"),
+                       (_Join(), "joined")], mode="dag")
+        self.assertEqual(chain._dag_deps({"text": "x"}), [set(), set(), {0, 1}])
+
+    def test_input_map_and_skill_placeholders(self):
+        skill = Skill(model=Model("gpt-4o"), input={"messages": [
+            {"role": "user", "parts": ["Summarise {doc}"]}]})
+        chain = Chain([(_Upper(), "raw"),
+                       (_Upper(), "other"),
+                       (skill, "summary", {"doc": "raw"})], mode="dag")
+        self.assertEqual(chain._dag_deps({"text": "x"})[2], {0})
+
+    def test_unknown_key_waits_for_dict_writers(self):
+        # "b" is neither an initial variable nor a known output: the tool
+        # before may return it in a dict.
+        chain = Chain([(_Upper(), "x"), (_Join(), "j")], mode="dag")
+        self.assertEqual(chain._dag_deps({"text": "t", "a": "1"})[1], {0})
+        self.assertEqual(chain._dag_deps({"text": "t", "a": "1", "b": "2"})[1], set())
+
+    def test_explicit_depends_on(self):
+        chain = Chain([(_Upper(), "a"), (_Upper(), "b"),
+                       (_Upper(), "c", {}, {"depends_on": ["b"]})], mode="dag")
+        self.assertEqual(chain._dag_deps({"text": "x"})[2], {1})
+        with self.assertRaises(ValueError):
+            Chain([(_Upper(), "a", {}, {"depends_on": "later"}), (_Upper(), "later")])
+
+    def test_invalid_mode_and_workers(self):
+        with self.assertRaises(ValueError):
+            Chain([_Upper()], mode="parallel")
+        with self.assertRaises(ValueError):
+            Chain([_Upper()], mode="dag", max_workers=0)
+
+
+class TestDagRun(unittest.TestCase):
+
+    def test_independent_steps_overlap_within_the_bound(self):
+        gauge = _Gauge()
+        chain = Chain([(_Upper(0.05, gauge), f"o{i}") for i in range(6)],
+                      mode="dag", max_workers=3)
+        start = time.monotonic()
+        self.assertEqual(chain.run(variables={"text": "hi"}), "HI")
+        self.assertEqual(gauge.peak, 3)
+        self.assertLess(time.monotonic() - start, 0.25)
+
+    def test_results_and_history_in_step_order(self):
+        chain = Chain([(_Upper(0.05), "a", {}), (_Upper(), "b", {}),
+                       (_Join(), "joined")], mode="dag")
+        self.assertEqual(chain.run(variables={"text": "x"}), "X+X")
+        self.assertEqual([h["step"] for h in chain.history], [0, 1, 2])
+        self.assertEqual(chain.history[2]["input"], {"text": "x", "a": "X", "b": "X"})
+        self.assertNotIn("b", chain.history[0]["input"])
+        self.assertEqual(chain.accumulated["joined"], "X+X")
+
+    def test_last_output_is_the_highest_step(self):
+        chain = Chain([(_Upper(), "a"), (_Upper(0.05), "b", {"text": "other"})],
+                      mode="dag")
+        self.assertEqual(chain.run(variables={"text": "q", "other": "slow"}), "SLOW")
+
+    def test_one_skill_in_parallel_branches_keeps_each_usage(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def send(path, body, headers):
+            barrier.wait()                       # both branches in flight
+            text = body["messages"][-1]["content"]
+            return chat_response(text.upper(), input_tokens=10 if text == "Say 1" else 20)
+
+        skill = chat_skill(fake_model(send=MagicMock(side_effect=send)), "Say {n}")
+        chain = Chain([(skill, "a", {"n": "x"}), (skill, "b", {"n": "y"})], mode="dag")
+        self.assertEqual(chain.run(variables={"x": "1", "y": "2"}), "SAY 2")
+        self.assertEqual(chain.last_usage.input_tokens, 30)
+        self.assertIsNone(skill.last_usage)
+
+    def test_raise_after_in_flight_steps_finish(self):
+        chain = Chain([(_Upper(0.05), "a"), (_Fail(), "f"), (_Join(), "j")], mode="dag")
+        with self.assertRaisesRegex(RuntimeError, "boom"):
+            chain.run(variables={"text": "x", "b": "y"})
+        self.assertEqual([h["step"] for h in chain.history], [0, 1])
+        self.assertEqual(chain.history[1]["error"], "boom")
+
+    def test_skip_runs_dependants(self):
+        chain = Chain([(_Fail(), "a"), (_Join(), "j")], mode="dag",
+                      on_step_error="skip")
+        with self.assertWarns(RuntimeWarning):
+            self.assertEqual(chain.run(variables={"text": "x", "b": "y"}), "+y")
+
+
+class TestDagSuspend(unittest.TestCase):
+
+    def test_suspend_and_resume(self):
+        chain = Chain([(_Upper(), "a"), (_Approve(), "ok"),
+                       (_Upper(), "c", {"text": "ok"})], mode="dag")
+        res = chain.run(variables={"text": "x"})
+        self.assertIsInstance(res, SuspendedResult)
+        doc = chain._store.load(res.run_id)
+        self.assertEqual([s["status"] for s in doc["steps"]],
+                         ["done", "suspended", "pending"])
+        self.assertEqual(chain.resume(res.run_id, signal={"ok": True}), "APPROVED")
+        self.assertEqual(chain.accumulated["a"], "X")
+
+    def test_parks_at_the_lowest_suspended_step(self):
+        chain = Chain([(_Approve(), "first"), (_Approve(), "second")], mode="dag")
+        res = chain.run(variables={"text": "x"})
+        doc = chain._store.load(res.run_id)
+        self.assertEqual([s["status"] for s in doc["steps"]], ["suspended", "pending"])
+        again = chain.resume(res.run_id, signal={"ok": True})
+        self.assertIsInstance(again, SuspendedResult)
+        self.assertEqual(chain.resume(again.run_id, signal={"ok": False}), "rejected")
+        self.assertEqual(chain.accumulated["first"], "approved")
+
+    def test_resume_returns_the_highest_step_output(self):
+        # "final" does not read "approval", so it finishes before the park.
+        chain = Chain([(_Approve(), "approval"), (_Upper(), "final")], mode="dag")
+        res = chain.run(variables={"text": "hi"})
+        doc = chain._store.load(res.run_id)
+        self.assertEqual([s["status"] for s in doc["steps"]], ["suspended", "done"])
+        self.assertEqual(chain.resume(res.run_id, signal={"ok": True}), "HI")
+        self.assertEqual(chain.accumulated["approval"], "approved")
+
+
+class TestDagAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_arun_overlaps(self):
+        gauge = _Gauge()
+        chain = Chain([(_Upper(0.05, gauge), "a"), (_Upper(0.05, gauge), "b"),
+                       (_Join(), "j")], mode="dag")
+        self.assertEqual(await chain.arun(variables={"text": "z"}), "Z+Z")
+        self.assertEqual(gauge.peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
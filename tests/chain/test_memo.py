@@ -0,0 +1,151 @@
+"""
+tests.chain.test_memo
+=====================
+
+Chain(memo=cache): a step whose runner definition and read variables match an
+earlier run is served from the cache — in sequential and DAG mode — with hits
+reported in history and as memo.hit / memo.miss events.  Pure — local tools
+and a stubbed transport, no network.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+
+from chain import Chain
+from clients import MemoryCache, SQLiteCache
+from skills import Skill
+from tests.skills._fakes import chat_response, chat_skill, fake_model
+from tools._base import Tool
+
+
+class _Convert(Tool):
+    name = "convert"
+    parameters = {"type": "object", "properties": {"source": {"type": "string"}}}
+
+    def __init__(self, prefix="doc:"):
+        self.prefix = prefix
+        self.calls = 0
+
+    def run(self, source="", **kw):
+        self.calls += 1
+        return self.prefix + source
+
+
+def _skill(text="Summarise {doc}"):
+    model = fake_model(send=MagicMock(side_effect=lambda path, body, headers: chat_response(
+        "S(" + body["messages"][-1]["content"] + ")", input_tokens=5, output_tokens=2)))
+    return chat_skill(model, text)
+
+
+class TestChainMemo(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = MemoryCache()
+        self.convert = _Convert()
+        self.summary = _skill()
+
+    def _chain(self, **kw):
+        return Chain([(self.convert, "doc"), (self.summary, "summary")],
+                     memo=self.cache, **kw)
+
+    def test_rerun_is_served_from_the_cache(self):
+        events = []
+        chain = self._chain(hooks=[events.append])
+        first = chain.run(variables={"source": "a.pdf"})
+        self.assertEqual(first, "S(Summarise doc:a.pdf)")
+        self.assertEqual(chain.run(variables={"source": "a.pdf"}), first)
+        self.assertEqual(self.convert.calls, 1)
+        self.assertEqual(self.summary.model.client.send.call_count, 1)
+        self.assertEqual([h.get("cached") for h in chain.history], [True, True])
+        self.assertIsNone(chain.last_usage)
+        self.assertEqual([e.type for e in events if e.type.startswith("memo.")],
+                         ["memo.miss", "memo.miss", "memo.hit", "memo.hit"])
+
+    def test_changed_input_reruns_downstream(self):
+        chain = self._chain()
+        chain.run(variables={"source": "a.pdf"})
+        self.assertEqual(chain.run(variables={"source": "b.pdf"}), "S(Summarise doc:b.pdf)")
+        self.assertEqual(self.convert.calls, 2)
+
+    def test_unread_variable_does_not_invalidate(self):
+        chain = self._chain()
+        chain.run(variables={"source": "a.pdf", "note": "x"})
+        chain.run(variables={"source": "a.pdf", "note": "y"})
+        self.assertEqual(self.convert.calls, 1)
+
+    def test_changed_prompt_reruns_only_that_step(self):
+        self._chain().run(variables={"source": "a.pdf"})
+        self.summary = _skill("Condense {doc}")
+        chain = self._chain()
+        self.assertEqual(chain.run(variables={"source": "a.pdf"}), "S(Condense doc:a.pdf)")
+        self.assertEqual(self.convert.calls, 1)
+        self.assertEqual([h.get("cached") for h in chain.history], [True, None])
+
+    def test_changed_model_settings_rerun(self):
+        self._chain().run(variables={"source": "a.pdf"})
+        self.summary = _skill()
+        self.summary.model.temperature = 0.0
+        chain = self._chain()
+        chain.run(variables={"source": "a.pdf"})
+        self.assertEqual(self.summary.model.client.send.call_count, 1)
+        self.assertEqual([h.get("cached") for h in chain.history], [True, None])
+
+    def test_changed_tool_args_rerun(self):
+        self._chain().run(variables={"source": "a.pdf"})
+        self.convert = _Convert(prefix="md:")
+        self.assertEqual(self._chain().run(variables={"source": "a.pdf"}),
+                         "S(Summarise md:a.pdf)")
+
+    def test_edited_file_source_reruns(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "page.png")
+            model = fake_model()
+
+            def run():
+                skill = Skill(model=model, input={"messages": [{"role": "user", "parts": [
+                    "Describe", {"type": "image", "source": {"kind": "file", "path": path}}]}]})
+                chain = Chain([(skill, "caption")], memo=self.cache)
+                chain.run()
+                return chain.history[0].get("cached")
+
+            with open(path, "wb") as fh:
+                fh.write(b"\x89PNG\r\n\x1a\n one")
+            self.assertIsNone(run())
+            self.assertTrue(run())
+            with open(path, "wb") as fh:
+                fh.write(b"\x89PNG\r\n\x1a\n two")
+            self.assertIsNone(run())
+            self.assertEqual(model.client.send.call_count, 2)
+
+    def test_memo_false_always_runs(self):
+        chain = Chain([(self.convert, "doc", {}, {"memo": False})], memo=self.cache)
+        chain.run(variables={"source": "a"})
+        chain.run(variables={"source": "a"})
+        self.assertEqual(self.convert.calls, 2)
+
+    def test_dag_mode(self):
+        chain = self._chain(mode="dag")
+        chain.run(variables={"source": "a.pdf"})
+        self.assertEqual(chain.run(variables={"source": "a.pdf"}), "S(Summarise doc:a.pdf)")
+        self.assertEqual(self.convert.calls, 1)
+        self.assertTrue(all(h["cached"] for h in chain.history))
+
+    def test_sqlite_cache_survives_a_new_chain(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "steps.db")
+            Chain([(self.convert, "doc")], memo=SQLiteCache(path)).run(
+                variables={"source": "a"})
+            chain = Chain([(_Convert(), "doc")], memo=SQLiteCache(path))
+            self.assertEqual(chain.run(variables={"source": "a"}), "doc:a")
+            self.assertTrue(chain.history[0]["cached"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+tests.chain.test_pipeline
+=========================
+
+Chain.pipeline(): every step is a stage with its own workers and bounded
+queue; items stream through with backpressure and come out in order or as
+they finish.  Pure — local tools, no network.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from chain import Chain
+from tools._base import Tool
+from state import Suspend
+
+
+class _Stage(Tool):
+    """Appends its tag to ``text`` after *delay*; tracks peak concurrency."""
+
+    parameters = {"type": "object", "properties": {"text": {"type": "string"}}}
+
+    def __init__(self, tag, delay=0.0, fail_on=()):
+        self.name, self.tag, self.delay, self.fail_on = tag, tag, delay, fail_on
+        self.lock, self.now, self.peak = threading.Lock(), 0, 0
+
+    def run(self, text="", **kw):
+        with self.lock:
+            self.now += 1
+            self.peak = max(self.peak, self.now)
+        try:
+            time.sleep(self.delay(text) if callable(self.delay) else self.delay)
+            if text in self.fail_on:
+                raise RuntimeError(f"{self.tag} failed on {text}")
+            return f"{text}>{self.tag}"
+        finally:
+            with self.lock:
+                self.now -= 1
+
+
+class _Hold(Tool):
+    name = "hold"
+    parameters = {"type": "object", "properties": {}}
+
+    def run(self, **kw):
+        raise Suspend("Approve?", {"ok": "bool"})
+
+
+def _items(n):
+    return [{"text": str(i)} for i in range(n)]
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_ordered_results(self):
+        chain = Chain([(_Stage("a"), "text"), (_Stage("b"), "text")])
+        self.assertEqual(list(chain.pipeline(_items(5), workers=2)),
+                         [(i, f"{i}>a>b") for i in range(5)])
+
+    def test_stages_run_at_their_own_width(self):
+        slow, fast = _Stage("slow", 0.05), _Stage("fast", 0.01)
+        chain = Chain([(slow, "text", {}, {"workers": 4}), (fast, "text")])
+        start = time.monotonic()
+        results = list(chain.pipeline(_items(8)))
+        self.assertEqual(len(results), 8)
+        self.assertEqual((slow.peak, fast.peak), (4, 1))
+        self.assertLess(time.monotonic() - start, 0.3)      # sequential: 0.48 s
+
+    def test_unordered_yields_as_items_finish(self):
+        stage = _Stage("a", delay=lambda text: 0.1 if text == "0" else 0.0)
+        chain = Chain([(stage, "text")])
+        order = [i for i, _ in chain.pipeline(_items(3), workers=3, ordered=False)]
+        self.assertEqual(order[-1], 0)
+        self.assertEqual(sorted(order), [0, 1, 2])
+
+    def test_backpressure_bounds_items_in_flight(self):
+        produced = []
+
+        def items():
+            for i in range(50):
+                produced.append(i)
+                yield {"text": str(i)}
+
+        chain = Chain([(_Stage("a"), "text")])
+        stream = chain.pipeline(items(), queue_size=1)
+        next(stream)
+        time.sleep(0.05)
+        self.assertLess(len(produced), 10)
+        stream.close()
+
+    def test_raise_on_the_failed_item(self):
+        chain = Chain([(_Stage("a", fail_on={"2"}), "text"), (_Stage("b"), "text")])
+        stream = chain.pipeline(_items(4))
+        self.assertEqual([next(stream), next(stream)], [(0, "0>a>b"), (1, "1>a>b")])
+        with self.assertRaisesRegex(RuntimeError, "a failed on 2"):
+            next(stream)
+
+    def test_stop_and_skip_per_item(self):
+        steps = [(_Stage("a", fail_on={"1"}), "text"), (_Stage("b"), "text")]
+        stopped = dict(Chain(steps, on_step_error="stop").pipeline(_items(2)))
+        self.assertEqual(stopped, {0: "0>a>b", 1: None})
+        with self.assertWarns(RuntimeWarning):
+            skipped = dict(Chain(steps).pipeline(_items(2), on_step_error="skip"))
+        self.assertEqual(skipped[1], "1>b")
+
+    def test_suspending_step_fails_the_item(self):
+        chain = Chain([(_Hold(), "x")])
+        with self.assertRaisesRegex(RuntimeError, "cannot suspend"):
+            list(chain.pipeline(_items(1)))
+
+    def test_invalid_arguments(self):
+        chain = Chain([(_Stage("a"), "text"), (_Stage("b"), "text")])
+        with self.assertRaises(ValueError):
+            chain.pipeline(_items(1), workers=[1])
+        with self.assertRaises(ValueError):
+            chain.pipeline(_items(1), workers=0)
+        with self.assertRaises(ValueError):
+            chain.pipeline(_items(1), queue_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+tests.chain.test_scope
+======================
+
+Copy-on-write chain variables: Scope snapshots share structure instead of
+copying every key per step, history / accumulated still read as plain dicts,
+and InMemoryStore shares variable values instead of deep-copying them.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from chain import Chain
+from chain._scope import Scope, _MAX_DEPTH
+from tools._base import Tool
+from state import InMemoryStore, Suspend
+
+
+class TestScope(unittest.TestCase):
+
+    def test_updated_leaves_the_original(self):
+        base = Scope({"a": 1, "b": 2})
+        child = base.updated({"b": 3, "c": 4})
+        self.assertEqual(dict(base), {"a": 1, "b": 2})
+        self.assertEqual(dict(child), {"a": 1, "b": 3, "c": 4})
+        self.assertEqual(list(child), ["a", "b", "c"])
+        self.assertNotIn("c", base)
+        self.assertEqual(child.get("missing", 0), 0)
+        self.assertIs(base.updated({}), base)
+
+    def test_layers_fold_at_max_depth(self):
+        scope = Scope({"k0": 0})
+        for i in range(1, 3 * _MAX_DEPTH):
+            scope = scope.updated({f"k{i}": i})
+            self.assertLessEqual(scope._depth, _MAX_DEPTH)
+        self.assertEqual(len(scope), 3 * _MAX_DEPTH)
+        self.assertEqual(scope["k0"], 0)
+
+    def test_equal_to_a_dict(self):
+        self.assertEqual(Scope({"a": 1}).updated({"b": 2}), {"a": 1, "b": 2})
+
+
+class _Emit(Tool):
+    parameters = {"type": "object", "properties": {}}
+
+    def __init__(self, name):
+        self.name = name
+
+    def run(self, **kw):
+        return ["payload of " + self.name]
+
+
+class _Hold(Tool):
+    name = "hold"
+    parameters = {"type": "object", "properties": {}}
+
+    def run(self, _signal=None, **kw):
+        if _signal is None:
+            raise Suspend("go?", {})
+        return "resumed"
+
+
+class TestChainSnapshots(unittest.TestCase):
+
+    def test_history_inputs_share_values(self):
+        chain = Chain([(_Emit("a"), "a"), (_Emit("b"), "b"), (_Emit("c"), "c")])
+        chain.run(variables={"big": ["x"] * 1000})
+        history = chain.history
+        self.assertEqual([sorted(h["input"]) for h in history],
+                         [["big"], ["a", "big"], ["a", "b", "big"]])
+        self.assertIsInstance(history[1]["input"], dict)
+        self.assertIs(history[1]["input"]["big"], history[2]["input"]["big"])
+        self.assertIs(history[1]["input"]["a"], chain.accumulated["a"])
+        self.assertIsInstance(chain._history[2]["input"], Scope)
+
+    def test_store_shares_values_and_isolates_control_state(self):
+        store = InMemoryStore()
+        chain = Chain([(_Emit("a"), "a"), _Hold()], store=store)
+        res = chain.run()
+        stored = store._runs[res.run_id]
+        self.assertIs(stored["variables"]["a"], chain.accumulated["a"])
+        loaded = store.load(res.run_id)
+        loaded["steps"][0]["status"] = "pending"
+        loaded["variables"]["a"] = "replaced"
+        self.assertEqual(store._runs[res.run_id]["steps"][0]["status"], "done")
+        self.assertEqual(chain.resume(res.run_id, signal={}), "resumed")
+        self.assertEqual(chain.accumulated["a"], ["payload of a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
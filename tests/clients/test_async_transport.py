@@ -0,0 +1,185 @@
+"""
+Native asyncio transport: BaseClient's async primitives (_apost / _aget /
+_adownload / asend) against a local HTTP server, and the async submit → poll →
+download flows of QwenClient and BFLClient (transport mocked).
+"""
+
+import asyncio
+import base64
+import json
+import os
+import sys
+import unittest
+from unittest.mock import AsyncMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import urllib3
+from clients._base import BaseClient
+from clients._errors import AuthenticationError, NetworkError, TaskFailedError
+from clients._families.bfl import BFLClient
+from clients._families.qwen import QwenClient, _IMAGE_SYNTHESIS_PATH, _MULTIMODAL_GEN_PATH
+from models._data import PROVIDERS as _PROVIDERS
+
+_PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+_B64 = base64.b64encode(_PNG).decode("ascii")
+
+
+class _Server:
+    """Tiny keep-alive HTTP/1.1 server; behaviour keyed by request path."""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests: list = []
+        self.busy_left = 0
+
+    async def start(self):
+        self._srv = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return f"http://127.0.0.1:{self._srv.sockets[0].getsockname()[1]}"
+
+    async def stop(self):
+        self._srv.close()
+        await self._srv.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                method, path, _ = line.decode().split(" ", 2)
+                headers = {}
+                while (h := await reader.readline()) not in (b"\r\n", b""):
+                    k, _, v = h.decode().partition(":")
+                    headers[k.strip().lower()] = v.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append((method, path, headers, body))
+                writer.write(self._respond(path, body))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def _respond(self, path, body):
+        if path == "/busy" and self.busy_left > 0:
+            self.busy_left -= 1
+            return b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\n\r\n"
+        if path == "/denied":
+            msg = b'{"error": "bad key"}'
+            return b"HTTP/1.1 401 Unauthorized\r\nContent-Length: %d\r\n\r\n%s" % (len(msg), msg)
+        if path == "/chunked":
+            return (b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n"
+                    b"Content-Type: image/png\r\n\r\n"
+                    b"5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n")
+        payload = json.dumps({"echo": body.decode() or None, "path": path}).encode()
+        return (b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(payload), payload))
+
+
+class TestAsyncPrimitives(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        for k in ("HTTPS_PROXY", "HTTP_PROXY", "https_proxy", "http_proxy"):
+            os.environ.pop(k, None)
+        self.server = _Server()
+        url = await self.server.start()
+        retries = urllib3.Retry(total=3, backoff_factor=0, status_forcelist={503},
+                                allowed_methods=None, raise_on_status=False)
+        self.client = BaseClient("k", url=url, retries=retries)
+
+    async def asyncTearDown(self):
+        await self.client._ahttp.aclose()
+        await self.server.stop()
+
+    async def test_post_json_roundtrip(self):
+        raw = await self.client._apost("/v1/x", {"a": 1}, {"Content-Type": "application/json"})
+        self.assertEqual(json.loads(json.loads(raw)["echo"]), {"a": 1})
+
+    async def test_asend_defaults_to_json_post(self):
+        raw = await self.client.asend("/v1/x", {"q": "hi"}, {})
+        self.assertEqual(json.loads(raw)["path"], "/v1/x")
+        self.assertEqual(self.server.requests[0][0], "POST")
+
+    async def test_connection_is_reused(self):
+        for _ in range(5):
+            await self.client._aget("/v1/models")
+        self.assertEqual(self.server.connections, 1)
+
+    async def test_chunked_download(self):
+        blob = await self.client._adownload(self.client._base_url + "/chunked")
+        self.assertEqual(blob, {"data": b"hello world", "media_type": "image/png"})
+
+    async def test_status_retry(self):
+        self.server.busy_left = 2
+        raw = await self.client._apost("/busy", {}, {})
+        self.assertEqual(json.loads(raw)["path"], "/busy")
+        self.assertEqual(len(self.server.requests), 3)
+
+    async def test_non_2xx_maps_to_api_error(self):
+        with self.assertRaises(AuthenticationError):
+            await self.client._apost("/denied", {}, {})
+
+    async def test_many_concurrent_requests(self):
+        raws = await asyncio.gather(*(self.client._apost("/v1/x", {"i": i}, {})
+                                      for i in range(50)))
+        self.assertEqual(len(raws), 50)
+        self.assertLessEqual(self.server.connections, 50)
+
+    async def test_connection_refused_is_network_error(self):
+        dead = BaseClient("k", url="http://127.0.0.1:1", retries=urllib3.Retry(0))
+        with self.assertRaises(NetworkError):
+            await dead._apost("/v1/x", {}, {})
+
+
+class TestAsyncProviderFlows(unittest.IsolatedAsyncioTestCase):
+
+    async def test_bfl_submit_poll_download(self):
+        c = BFLClient("k", data=_PROVIDERS["bfl"])
+        c._POLL_INTERVAL = 0
+        c._apost = AsyncMock(return_value=json.dumps(
+            {"id": "t-1", "polling_url": "https://api.bfl.ai/v1/get_result?id=t-1"}).encode())
+        c._adownload = AsyncMock(side_effect=[
+            {"data": json.dumps({"status": "Pending"}).encode(), "media_type": "application/json"},
+            {"data": json.dumps({"status": "Ready", "result": {"sample": "https://img/o.png"}}).encode(),
+             "media_type": "application/json"},
+            {"data": _PNG, "media_type": "image/png"},
+        ])
+        raw = await c.asend("/v1/flux-kontext-pro", {"prompt": "x"}, c._auth_headers())
+        self.assertEqual(json.loads(raw)["data"][0]["b64_json"], _B64)
+        self.assertEqual(c._adownload.call_args_list[-1][0][0], "https://img/o.png")
+
+    async def test_bfl_failed_status_raises(self):
+        c = BFLClient("k", data=_PROVIDERS["bfl"])
+        c._apost = AsyncMock(return_value=json.dumps(
+            {"id": "t", "polling_url": "https://api.bfl.ai/v1/get_result?id=t"}).encode())
+        c._adownload = AsyncMock(return_value={
+            "data": json.dumps({"status": "Content Moderated"}).encode(),
+            "media_type": "application/json"})
+        with self.assertRaises(TaskFailedError):
+            await c.asend("/v1/flux-kontext-pro", {"prompt": "x"}, {})
+
+    async def test_qwen_image_synthesis(self):
+        c = QwenClient("k", data=_PROVIDERS["qwen"])
+        c._POLL_INTERVAL = 0
+        c._apost = AsyncMock(return_value=json.dumps({"output": {"task_id": "t1"}}).encode())
+        c._aget = AsyncMock(side_effect=[
+            json.dumps({"output": {"task_status": "RUNNING"}}).encode(),
+            json.dumps({"output": {"task_status": "SUCCEEDED",
+                                   "results": [{"url": "https://oss/a.png"}]}}).encode(),
+        ])
+        c._adownload = AsyncMock(return_value={"data": _PNG, "media_type": "image/png"})
+        raw = await c.asend(_IMAGE_SYNTHESIS_PATH, {"model": "wanx"}, {"Authorization": "Bearer k"})
+        self.assertEqual(json.loads(raw), {"data": [{"b64_json": _B64}]})
+        self.assertEqual(c._apost.call_args[0][2]["X-DashScope-Async"], "enable")
+
+    async def test_qwen_image_edit(self):
+        c = QwenClient("k", data=_PROVIDERS["qwen"])
+        c._apost = AsyncMock(return_value=json.dumps({"output": {"choices": [
+            {"message": {"content": [{"image": "https://oss/e.png"}]}}]}}).encode())
+        c._adownload = AsyncMock(return_value={"data": _PNG, "media_type": "image/png"})
+        raw = await c.asend(_MULTIMODAL_GEN_PATH, {}, {})
+        self.assertEqual(json.loads(raw), {"data": [{"b64_json": _B64}]})
+
+
+if __name__ == "__main__":
+    unittest.main()
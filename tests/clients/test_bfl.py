@@ -123,6 +123,8 @@ class TestAsyncFlow(unittest.TestCase):
         m.client = self._ready_client()
         img = Skill(model=m, input={"messages": _edit_msgs()}, output=_OUT).run()
         self.assertEqual(img["base64"], _B64)
+        body = m.client._post.call_args[0][1]
+        self.assertEqual(body["input_image"], _B64)
 
 
 class TestBflMisc(unittest.TestCase):
@@ -0,0 +1,189 @@
+"""
+Response cache at the send seam: request keys, MemoryCache LRU / TTL /
+size eviction, SQLiteCache persistence across instances, the temperature
+bypass, cache.hit / cache.miss events, and Skill / Agent-path reuse.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from clients._base import BaseClient
+from clients._cache import MemoryCache, SQLiteCache, is_sampled, request_key, set_response_cache
+from models import Model
+from skills import Skill
+
+
+def _resp(text):
+    return json.dumps({"choices": [{"message": {"content": text}}],
+                       "usage": {"prompt_tokens": 1, "completion_tokens": 1}}).encode()
+
+
+class TestRequestKey(unittest.TestCase):
+
+    def test_key_ignores_dict_order(self):
+        a = request_key(("x",), "/p", {"a": 1, "b": [1, {"c": 2, "d": 3}]})
+        b = request_key(("x",), "/p", {"b": [1, {"d": 3, "c": 2}], "a": 1})
+        self.assertEqual(a, b)
+        self.assertEqual(len(a), 64)
+
+    def test_key_covers_scope_path_and_bytes(self):
+        base = request_key(("openai", "https://a"), "/p", {"f": ("a.png", b"1", "image/png")})
+        self.assertNotEqual(base, request_key(("openai", "https://b"), "/p",
+                                              {"f": ("a.png", b"1", "image/png")}))
+        self.assertNotEqual(base, request_key(("openai", "https://a"), "/q",
+                                              {"f": ("a.png", b"1", "image/png")}))
+        self.assertNotEqual(base, request_key(("openai", "https://a"), "/p",
+                                              {"f": ("a.png", b"2", "image/png")}))
+
+    def test_is_sampled(self):
+        self.assertTrue(is_sampled({"temperature": 0.7}))
+        self.assertTrue(is_sampled({"generationConfig": {"temperature": 1.0}}))
+        self.assertFalse(is_sampled({"temperature": 0}))
+        self.assertFalse(is_sampled({"prompt": "a cat"}))
+
+
+class TestMemoryCache(unittest.TestCase):
+
+    def test_lru_size_eviction(self):
+        c = MemoryCache(max_bytes=10)
+        c.set("a", b"12345")
+        c.set("b", b"12345")
+        c.get("a")                      # a is now most recently used
+        c.set("c", b"123")
+        self.assertIsNone(c.get("b"))
+        self.assertEqual(c.get("a"), b"12345")
+        self.assertEqual(c.stats()["evictions"], 1)
+        c.set("huge", b"x" * 11)        # larger than the cache: not stored
+        self.assertIsNone(c.get("huge"))
+
+    def test_ttl(self):
+        c = MemoryCache(ttl=0.01)
+        c.set("k", b"v")
+        self.assertEqual(c.get("k"), b"v")
+        time.sleep(0.02)
+        self.assertIsNone(c.get("k"))
+        self.assertEqual(c.stats()["hits"], 1)
+        self.assertEqual(c.stats()["misses"], 1)
+
+
+class TestSQLiteCache(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "sub", "cache.db")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_shared_between_instances(self):
+        SQLiteCache(self.path).set("k", b"\x00bytes")
+        other = SQLiteCache(self.path)
+        self.assertEqual(other.get("k"), b"\x00bytes")
+        self.assertEqual(len(other), 1)
+
+    def test_ttl_and_size_eviction(self):
+        c = SQLiteCache(self.path, max_bytes=10)
+        c.set("old", b"12345", ttl=-1)
+        self.assertIsNone(c.get("old"))
+        c.set("a", b"12345")
+        c.set("b", b"12345")
+        c.set("c", b"12345")
+        self.assertIsNone(c.get("a"))
+        self.assertEqual(c.get("c"), b"12345")
+        c.clear()
+        self.assertEqual(len(c), 0)
+
+
+class TestSendSeam(unittest.TestCase):
+
+    def tearDown(self):
+        set_response_cache(None)
+
+    def _client(self, **kw):
+        c = BaseClient("k", url="http://x", **kw)
+        c._send = MagicMock(side_effect=lambda p, b, h: _resp(f"call {c._send.call_count}"))
+        return c
+
+    def test_repeat_is_served_from_cache(self):
+        c = self._client(cache=MemoryCache())
+        first = c.send("/v1/x", {"temperature": 0, "q": "hi"}, {})
+        again = c.send("/v1/x", {"q": "hi", "temperature": 0}, {})
+        self.assertEqual(first, again)
+        c._send.assert_called_once()
+        c.send("/v1/x", {"temperature": 0, "q": "other"}, {})
+        self.assertEqual(c._send.call_count, 2)
+
+    def test_sampled_requests_bypass_unless_forced(self):
+        c = self._client(cache=MemoryCache())
+        c.send("/v1/x", {"temperature": 0.7}, {})
+        c.send("/v1/x", {"temperature": 0.7}, {})
+        self.assertEqual(c._send.call_count, 2)
+        self.assertEqual(c._cache.stats()["bypassed"], 2)
+
+        forced = self._client(cache=MemoryCache(force=True))
+        forced.send("/v1/x", {"temperature": 0.7}, {})
+        forced.send("/v1/x", {"temperature": 0.7}, {})
+        forced._send.assert_called_once()
+
+    def test_credentials_do_not_share_entries(self):
+        set_response_cache(MemoryCache())
+        a, b = self._client(), self._client()
+        b._api_key = "other"
+        a.send("/v1/x", {"q": 1}, {})
+        b.send("/v1/x", {"q": 1}, {})
+        a.send("/v1/x", {"q": 1}, {"Authorization": "Bearer tenant-2"})
+        self.assertEqual((a._send.call_count, b._send.call_count), (2, 1))
+
+    def test_process_wide_default(self):
+        set_response_cache(MemoryCache())
+        a, b = self._client(), self._client()
+        a.send("/v1/x", {"q": 1}, {})
+        b.send("/v1/x", {"q": 1}, {})
+        a._send.assert_called_once()
+        b._send.assert_not_called()
+
+    def test_errors_are_not_cached(self):
+        c = BaseClient("k", url="http://x", cache=MemoryCache())
+        c._send = MagicMock(side_effect=[RuntimeError("boom"), b"ok"])
+        with self.assertRaises(RuntimeError):
+            c.send("/v1/x", {}, {})
+        self.assertEqual(c.send("/v1/x", {}, {}), b"ok")
+
+
+class TestAsyncSendSeam(unittest.IsolatedAsyncioTestCase):
+
+    async def test_asend_uses_cache(self):
+        c = BaseClient("k", url="http://x", cache=MemoryCache())
+        c._asend = AsyncMock(return_value=b"ok")
+        self.assertEqual(await c.asend("/v1/x", {}, {}), b"ok")
+        self.assertEqual(await c.asend("/v1/x", {}, {}), b"ok")
+        c._asend.assert_awaited_once()
+
+
+class TestSkillAndEvents(unittest.TestCase):
+
+    def test_skill_rerun_hits_cache_and_reports_events(self):
+        cache = MemoryCache()
+        m = Model("gpt-4o", api_key="k", options={"temperature": 0},
+                  client_options={"cache": cache})
+        m.client._post = MagicMock(return_value=_resp("cached answer"))
+        seen = []
+        skill = Skill(model=m, input={"messages": [{"role": "user", "parts": ["x"]}]},
+                      hooks=[seen.append])
+        self.assertEqual(skill.run(), "cached answer")
+        self.assertEqual(skill.run(), "cached answer")
+        m.client._post.assert_called_once()
+        types = [e.type for e in seen if e.type.startswith("cache.")]
+        self.assertEqual(types, ["cache.miss", "cache.hit"])
+        self.assertEqual(cache.stats()["hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -123,6 +123,18 @@ class TestOpenAIEdit(unittest.TestCase):
         _, body = _build_image_edits_request(_wrap("dall-e-2"), _edit_msgs(), _OUT)
         self.assertIn("image", [f[0] for f in body["fields"]])
 
+    def test_end_to_end_through_skill(self):
+        # Skill wraps sources in MediaSource; the edit must still see them.
+        m = Model("gpt-image-1.5", api_key="k")
+        m.client._post_form = MagicMock(return_value=json.dumps(
+            {"data": [{"b64_json": _B64}]}).encode())
+        img = Skill(model=m, input={"messages": _edit_msgs()}, output=_OUT).run()
+        self.assertEqual(img["base64"], _B64)
+        path, fields = m.client._post_form.call_args[0][:2]
+        self.assertEqual(path, "/v1/images/edits")
+        file_field = next(f for f in fields if f[0] == "image[]")
+        self.assertEqual(file_field[1][1], _PNG)
+
 
 class TestOpenAISendSeam(unittest.TestCase):
 
@@ -226,6 +238,9 @@ class TestQwenEdit(unittest.TestCase):
         img = Skill(model=m, input={"messages": _edit_msgs()}, output=_OUT).run()
         self.assertEqual(img["base64"], _B64)
         self.assertEqual(img["mime_type"], "image/png")
+        body = m.client._post.call_args[0][1]
+        content = body["input"]["messages"][0]["content"]
+        self.assertEqual(content[0], {"image": f"data:image/png;base64,{_B64}"})
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,171 @@
+"""
+Client-side rate limiting: RPM / TPM token-bucket admission, the shared 429
+cooldown, token estimation, BaseClient.send re-admission on RateLimitError,
+the rate_limit.waited event, and Model wiring (data / client_options /
+set_rate_limit).
+"""
+
+import json
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from clients import _ratelimit
+from clients._base import BaseClient
+from clients._constants import DEFAULT_RETRIES
+from clients._errors import RateLimitError
+from clients._ratelimit import RateLimiter, estimate_tokens, set_rate_limit
+from models import Model
+from skills import Skill
+
+
+class _RegistryReset(unittest.TestCase):
+    def tearDown(self):
+        _ratelimit._limiters.clear()
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_rpm_burst_then_steady_rate(self):
+        lim = RateLimiter(rpm=600)          # burst 600, then 10 / s
+        waits = [lim.reserve() for _ in range(602)]
+        self.assertEqual(max(waits[:600]), 0.0)
+        self.assertAlmostEqual(waits[600], 0.1, places=2)
+        self.assertAlmostEqual(waits[601], 0.2, places=2)
+
+    def test_tpm_counts_tokens(self):
+        lim = RateLimiter(tpm=6000)         # 100 tokens / s
+        self.assertEqual(lim.reserve(6000), 0.0)
+        self.assertAlmostEqual(lim.reserve(50), 0.5, places=2)
+
+    def test_cooldown_holds_everyone_then_resumes_at_rate(self):
+        lim = RateLimiter(rpm=600)
+        lim.cooldown(5)
+        self.assertAlmostEqual(lim.reserve(), 5.1, places=1)
+        self.assertAlmostEqual(lim.reserve(), 5.2, places=1)
+
+    def test_acquire_sleeps_for_reservation(self):
+        lim = RateLimiter(rpm=60)
+        for _ in range(60):
+            lim.reserve()
+        with patch("clients._ratelimit.time.sleep") as sleep:
+            waited = lim.acquire()
+        self.assertAlmostEqual(waited, 1.0, places=1)
+        sleep.assert_called_once()
+
+    def test_reconfigure_same_limits_keeps_state(self):
+        lim = RateLimiter(rpm=60)
+        for _ in range(60):
+            lim.reserve()
+        lim.configure(rpm=60)
+        self.assertGreater(lim.reserve(), 0.0)
+        lim.configure(rpm=0)
+        self.assertEqual(lim.reserve(), 0.0)
+        self.assertIsNone(lim.rpm)
+
+
+class TestEstimateTokens(unittest.TestCase):
+
+    def test_text_plus_output_budget(self):
+        body = {"model": "m", "messages": [{"role": "user", "content": "x" * 400}],
+                "max_completion_tokens": 1000}
+        # "m" + "user" + content + len("1000"), then the output budget itself
+        self.assertEqual(estimate_tokens(body), (1 + 4 + 400 + 4) // 4 + 1000)
+
+    def test_google_generation_config(self):
+        body = {"contents": [], "generationConfig": {"maxOutputTokens": 256}}
+        self.assertEqual(estimate_tokens(body), 256)
+
+    def test_inline_blobs_are_flat_rate(self):
+        image = {"data": "A" * 500_000}
+        self.assertLess(estimate_tokens(image), 2_000)
+        self.assertEqual(estimate_tokens({"fields": {"image": ("a.png", b"\x89PNG", "image/png")}}),
+                         (5 + 4000 + 9) // 4)
+
+
+class TestClientAdmission(_RegistryReset):
+
+    def test_retries_without_429_when_limited(self):
+        plain   = BaseClient("k", url="http://x")
+        limited = BaseClient("k", url="http://x", rate_limit=RateLimiter(rpm=60))
+        self.assertIn(429, plain._retries.status_forcelist)
+        self.assertNotIn(429, limited._retries.status_forcelist)
+        self.assertIn(503, limited._retries.status_forcelist)
+        self.assertIn(429, DEFAULT_RETRIES.status_forcelist)
+
+    def test_429_triggers_shared_cooldown_and_readmission(self):
+        lim = RateLimiter(rpm=6000)
+        c = BaseClient("k", url="http://x", rate_limit=lim)
+        c._send = MagicMock(side_effect=[RateLimitError(429, "slow", retry_after=0.0), b"ok"])
+        lim.cooldown = MagicMock(wraps=lim.cooldown)
+        self.assertEqual(c.send("/p", {}, {}), b"ok")
+        lim.cooldown.assert_called_once_with(0.0)
+        self.assertEqual(c._send.call_count, 2)
+
+    def test_backoff_without_retry_after(self):
+        c = BaseClient("k", url="http://x", rate_limit=RateLimiter(rpm=60))
+        self.assertEqual(c._rate_limit_delay(RateLimitError(429, "x"), 2), 8.0)
+        self.assertEqual(c._rate_limit_delay(RateLimitError(429, "x", retry_after=3), 2), 3)
+
+    def test_gives_up_after_retries(self):
+        c = BaseClient("k", url="http://x", rate_limit=RateLimiter(rpm=6000))
+        c._send = MagicMock(side_effect=RateLimitError(429, "slow", retry_after=0.0))
+        with self.assertRaises(RateLimitError):
+            c.send("/p", {}, {})
+        self.assertEqual(c._send.call_count, c._RATE_LIMIT_RETRIES + 1)
+
+    def test_unlimited_client_sends_directly(self):
+        c = BaseClient("k", url="http://x")
+        c._send = MagicMock(side_effect=RateLimitError(429, "slow"))
+        with self.assertRaises(RateLimitError):
+            c.send("/p", {}, {})
+        c._send.assert_called_once()
+
+
+class TestModelWiring(_RegistryReset):
+
+    def test_client_options_limit_is_shared_per_model_name(self):
+        a = Model("gpt-4o", api_key="k", client_options={"rate_limit": {"rpm": 100}})
+        b = Model("gpt-4o", api_key="k")
+        c = Model("gpt-4o-mini", api_key="k")
+        self.assertIs(a.client._limiter, b.client._limiter)
+        self.assertEqual(a.client._limiter.rpm, 100)
+        self.assertIsNone(c.client._limiter)
+
+    def test_set_rate_limit_applies_to_new_models(self):
+        set_rate_limit("anthropic", "claude-sonnet-4-5", tpm=40_000)
+        m = Model("claude-sonnet-4-5", api_key="k")
+        self.assertEqual(m.client._limiter.tpm, 40_000)
+
+    def test_provider_data_limit(self):
+        data = {**Model("gpt-4o", api_key="k").client._data}
+        with patch.dict("models._base.PROVIDERS", {"openai": {
+                "provider": {**data["provider"], "rate_limit": {"rpm": 30}},
+                "models": data["models"]}}):
+            m = Model("gpt-4o", api_key="k")
+        self.assertEqual(m.client._limiter.rpm, 30)
+
+    def test_unknown_limit_key(self):
+        with self.assertRaises(ValueError):
+            Model("gpt-4o", api_key="k", client_options={"rate_limit": {"rps": 1}})
+
+    def test_wait_is_reported_to_skill_hooks(self):
+        m = Model("gpt-4o", api_key="k", client_options={"rate_limit": {"rpm": 60}})
+        m.client._limiter.acquire = MagicMock(return_value=0.25)
+        m.client._post = MagicMock(return_value=json.dumps(
+            {"choices": [{"message": {"content": "hi"}}]}).encode())
+        seen = []
+        Skill(model=m, input={"messages": [{"role": "user", "parts": ["x"]}]},
+              hooks=[seen.append]).run()
+        waited = [e for e in seen if e.type == "rate_limit.waited"]
+        self.assertEqual(len(waited), 1)
+        self.assertEqual(waited[0].duration, 0.25)
+        self.assertEqual(waited[0].name, "gpt-4o")
+        self.assertEqual(waited[0].payload["provider"], "openai")
+
+
+if __name__ == "__main__":
+    unittest.main()
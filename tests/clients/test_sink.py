@@ -0,0 +1,166 @@
+"""
+Streaming artifact downloads: BaseClient._download / _adownload write a body
+to a FileSink chunk by chunk (local HTTP server), the download target set by
+Skill from output["save_to"], and the image families returning a path instead
+of inline base64.
+"""
+
+import http.server
+import io
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import urllib3
+from clients._base import BaseClient
+from clients._errors import NotFoundError
+from clients._sink import FileSink, download_target, download_to
+from models import Model
+from skills import Skill
+
+_PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 512
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/missing":
+            body = b'{"error": "gone"}'
+            self.send_response(404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        if self.path == "/chunked.png":
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(0, len(_PNG), 50_000):
+                part = _PNG[i:i + 50_000]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(part), part))
+            self.wfile.write(b"0\r\n\r\n")
+            return
+        self.send_header("Content-Length", str(len(_PNG)))
+        self.end_headers()
+        self.wfile.write(_PNG)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ServerCase(unittest.TestCase):
+
+    def setUp(self):
+        for k in ("HTTPS_PROXY", "HTTP_PROXY", "https_proxy", "http_proxy"):
+            os.environ.pop(k, None)
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.client = BaseClient("k", url=self.url, retries=urllib3.Retry(0))
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+
+class TestDownloadToSink(_ServerCase):
+
+    def test_streams_to_a_new_file_in_the_directory(self):
+        for path in ("/img.png", "/chunked.png"):
+            blob = self.client._download(self.url + path, sink=FileSink(self.tmp.name))
+            self.assertNotIn("data", blob)
+            self.assertEqual(os.path.dirname(blob["path"]), self.tmp.name)
+            self.assertTrue(blob["path"].endswith(".png"))
+            self.assertEqual(blob["size"], len(_PNG))
+            with open(blob["path"], "rb") as f:
+                self.assertEqual(f.read(), _PNG)
+
+    def test_callable_target_may_return_a_file_object(self):
+        buf = io.BytesIO()
+        blob = self.client._download(self.url + "/img.png", sink=FileSink(lambda mime: buf))
+        self.assertEqual(buf.getvalue(), _PNG)
+        self.assertIsNone(blob["path"])
+        self.assertFalse(buf.closed)            # the caller owns it
+
+    def test_error_status_raises_and_leaves_no_file(self):
+        with self.assertRaises(NotFoundError):
+            self.client._download(self.url + "/missing", sink=FileSink(self.tmp.name))
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_download_artifact_follows_the_active_target(self):
+        self.assertIn("data", self.client._download_artifact(self.url + "/img.png"))
+        with download_to(self.tmp.name):
+            blob = self.client._download_artifact(self.url + "/img.png")
+        self.assertIn("path", blob)
+        self.assertIsNone(download_target())
+
+
+class TestAsyncDownloadToSink(_ServerCase, unittest.IsolatedAsyncioTestCase):
+
+    async def test_streams_to_file(self):
+        for path in ("/img.png", "/chunked.png"):
+            blob = await self.client._adownload(self.url + path, sink=FileSink(self.tmp.name))
+            with open(blob["path"], "rb") as f:
+                self.assertEqual(f.read(), _PNG)
+            self.assertEqual(blob["media_type"], "image/png")
+
+    async def test_error_status_raises(self):
+        with self.assertRaises(NotFoundError):
+            await self.client._adownload(self.url + "/missing", sink=FileSink(self.tmp.name))
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
+class TestSkillSaveTo(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _skill(self, model, **output):
+        return Skill(model=model, input={"messages": [{"role": "user", "parts": ["A fox"]}]},
+                     output={"modalities": ["image"], "format": {"type": "image"}, **output})
+
+    def test_bfl_result_carries_the_path(self):
+        model = Model("flux-pro-1.1", api_key="k")
+        client = model.client
+        client._post = MagicMock(return_value=b'{"id": "1", "polling_url": "https://poll"}')
+        client._poll = MagicMock(return_value="https://cdn/sample.png")
+
+        def download(url, headers=None, sink=None):
+            self.assertIsNotNone(sink)
+            sink.start("image/png")
+            sink.write(_PNG)
+            sink.close()
+            return sink.result()
+        client._download = download
+
+        result = self._skill(model, save_to=self.tmp.name).run()
+        self.assertIsNone(result["base64"])
+        self.assertEqual(result["mime_type"], "image/png")
+        with open(result["path"], "rb") as f:
+            self.assertEqual(f.read(), _PNG)
+
+    def test_recraft_requests_urls_when_saving(self):
+        _, body = Model("recraftv4_1", api_key="k").to_request(
+            [{"role": "user", "parts": [{"type": "text", "text": "A fox"}]}],
+            {"modalities": ["image"], "format": {"type": "image"}, "save_to": self.tmp.name})
+        self.assertEqual(body["response_format"], "url")
+
+    def test_invalid_save_to(self):
+        with self.assertRaises(ValueError):
+            self._skill(Model("flux-pro-1.1", api_key="k"), save_to=42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,243 @@
+"""
+Token streaming: the incremental SSE parser, each family's stream decoder
+(OpenAI Chat Completions / Responses, Anthropic Messages, Google
+generateContent) and BaseClient._post_stream against a local HTTP server.
+"""
+
+import http.server
+import json
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import urllib3
+from clients._base import BaseClient
+from clients._errors import AuthenticationError, RateLimitError, ServerError
+from clients._families._openai_compat import _ChatCompletionsStream, _ResponsesStream
+from clients._families.anthropic import AnthropicClient, _MessagesStream
+from clients._families.google import GoogleClient, _GenerateContentStream
+from clients._families.openai import OpenAIClient
+from clients._sse import SSEEvent, iter_sse
+from models._data import PROVIDERS as _PROVIDERS
+
+
+def _sse(*payloads, event=None) -> bytes:
+    out = b""
+    for p in payloads:
+        data = p if isinstance(p, str) else json.dumps(p)
+        if event:
+            out += f"event: {event}\n".encode()
+        out += f"data: {data}\n\n".encode()
+    return out
+
+
+def _feed(decoder, raw: bytes) -> list:
+    deltas = []
+    for ev in iter_sse([raw]):
+        deltas += decoder.feed(ev)
+    return deltas
+
+
+class TestIterSSE(unittest.TestCase):
+
+    def test_events_split_across_chunks(self):
+        raw = b'event: a\ndata: {"x": 1}\n\ndata: two\r\n\r\n'
+        chunks = [raw[i:i + 3] for i in range(0, len(raw), 3)]
+        self.assertEqual(list(iter_sse(chunks)), [
+            SSEEvent(event="a", data='{"x": 1}'),
+            SSEEvent(event=None, data="two"),
+        ])
+
+    def test_multiline_data_comments_and_id(self):
+        raw = b": keep-alive\nid: 7\ndata: one\ndata:two\n\n"
+        self.assertEqual(list(iter_sse([raw])), [SSEEvent(None, "one\ntwo", "7")])
+
+    def test_unterminated_final_event_is_dispatched(self):
+        self.assertEqual([e.data for e in iter_sse([b"data: last"])], ["last"])
+
+
+class TestOpenAIDecoders(unittest.TestCase):
+
+    def test_chat_completions(self):
+        dec = _ChatCompletionsStream()
+        raw = _sse(
+            {"choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}}]},
+            {"choices": [{"index": 0, "delta": {"content": "Hel"}}]},
+            {"choices": [{"index": 0, "delta": {"content": "lo"}, "finish_reason": "stop"}]},
+            {"choices": [], "usage": {"prompt_tokens": 5, "completion_tokens": 2}},
+            "[DONE]",
+        )
+        self.assertEqual(_feed(dec, raw), ["Hel", "lo"])
+        self.assertEqual(dec.response(), {
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": "Hello"}}],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 2},
+        })
+
+    def test_chat_completions_error_chunk(self):
+        with self.assertRaises(RateLimitError):
+            _feed(_ChatCompletionsStream(), _sse({"error": {"code": 429, "message": "slow"}}))
+
+    def test_responses_api(self):
+        dec = _ResponsesStream()
+        final = {"output": [{"type": "message", "content": [{"type": "output_text", "text": "Hi!"}]}],
+                 "usage": {"input_tokens": 3, "output_tokens": 2}}
+        raw = (_sse({"type": "response.output_text.delta", "delta": "Hi"},
+                    event="response.output_text.delta")
+               + _sse({"type": "response.output_text.delta", "delta": "!"})
+               + _sse({"type": "response.completed", "response": final}))
+        self.assertEqual(_feed(dec, raw), ["Hi", "!"])
+        self.assertEqual(dec.response(), final)
+
+    def test_responses_failed_raises(self):
+        raw = _sse({"type": "response.failed",
+                    "response": {"error": {"code": "server_error", "message": "boom"}}})
+        with self.assertRaises(ServerError):
+            _feed(_ResponsesStream(), raw)
+
+    def test_stream_request(self):
+        c = OpenAIClient("k", data=_PROVIDERS["openai"])
+        path, body = c.stream_request("/v1/chat/completions", {"model": "gpt-4o"})
+        self.assertEqual(path, "/v1/chat/completions")
+        self.assertEqual(body, {"model": "gpt-4o", "stream": True,
+                                "stream_options": {"include_usage": True}})
+        self.assertIsInstance(c.stream_decoder(path), _ChatCompletionsStream)
+        self.assertIsInstance(c.stream_decoder("/v1/responses"), _ResponsesStream)
+        with self.assertRaises(ValueError):
+            c.stream_request("/v1/images/generations", {})
+
+
+class TestAnthropicDecoder(unittest.TestCase):
+
+    def test_text_message(self):
+        dec = _MessagesStream()
+        raw = (_sse({"type": "message_start", "message": {
+                    "id": "m1", "role": "assistant", "content": [],
+                    "usage": {"input_tokens": 10, "output_tokens": 1}}})
+               + _sse({"type": "content_block_start", "index": 0,
+                       "content_block": {"type": "text", "text": ""}})
+               + _sse({"type": "ping"})
+               + _sse({"type": "content_block_delta", "index": 0,
+                       "delta": {"type": "text_delta", "text": "Bon"}})
+               + _sse({"type": "content_block_delta", "index": 0,
+                       "delta": {"type": "text_delta", "text": "jour"}})
+               + _sse({"type": "content_block_stop", "index": 0})
+               + _sse({"type": "message_delta", "delta": {"stop_reason": "end_turn"},
+                       "usage": {"output_tokens": 4}})
+               + _sse({"type": "message_stop"}))
+        self.assertEqual(_feed(dec, raw), ["Bon", "jour"])
+        resp = dec.response()
+        self.assertEqual(resp["content"], [{"type": "text", "text": "Bonjour"}])
+        self.assertEqual(resp["stop_reason"], "end_turn")
+        self.assertEqual(resp["usage"], {"input_tokens": 10, "output_tokens": 4})
+
+    def test_tool_use_input_is_assembled(self):
+        dec = _MessagesStream()
+        raw = (_sse({"type": "content_block_start", "index": 0,
+                     "content_block": {"type": "tool_use", "id": "t", "name": "out", "input": {}}})
+               + _sse({"type": "content_block_delta", "index": 0,
+                       "delta": {"type": "input_json_delta", "partial_json": '{"a": '}})
+               + _sse({"type": "content_block_delta", "index": 0,
+                       "delta": {"type": "input_json_delta", "partial_json": "1}"}}))
+        self.assertEqual(_feed(dec, raw), ['{"a": ', "1}"])
+        self.assertEqual(dec.response()["content"][0]["input"], {"a": 1})
+
+    def test_error_event(self):
+        raw = _sse({"type": "error", "error": {"type": "overloaded_error", "message": "busy"}})
+        with self.assertRaises(ServerError) as ctx:
+            _feed(_MessagesStream(), raw)
+        self.assertEqual(ctx.exception.status, 529)
+
+    def test_stream_request(self):
+        c = AnthropicClient("k", data=_PROVIDERS["anthropic"])
+        self.assertEqual(c.stream_request("/v1/messages", {"a": 1}),
+                         ("/v1/messages", {"a": 1, "stream": True}))
+
+
+class TestGoogleDecoder(unittest.TestCase):
+
+    def test_chunks_fold_into_one_response(self):
+        dec = _GenerateContentStream()
+        raw = _sse(
+            {"candidates": [{"content": {"role": "model", "parts": [
+                {"text": "thinking…", "thought": True}, {"text": "Hel"}]}}]},
+            {"candidates": [{"content": {"role": "model", "parts": [{"text": "lo"}]},
+                             "finishReason": "STOP"}],
+             "usageMetadata": {"promptTokenCount": 4, "candidatesTokenCount": 2}},
+        )
+        self.assertEqual(_feed(dec, raw), ["Hel", "lo"])
+        self.assertEqual(dec.response(), {
+            "candidates": [{"content": {"role": "model", "parts": [{"text": "Hello"}]},
+                            "finishReason": "STOP"}],
+            "usageMetadata": {"promptTokenCount": 4, "candidatesTokenCount": 2},
+        })
+
+    def test_stream_request_path(self):
+        c = GoogleClient("k", data=_PROVIDERS["google"])
+        path, _ = c.stream_request("/models/gemini-2.0-flash:generateContent", {})
+        self.assertEqual(path, "/models/gemini-2.0-flash:streamGenerateContent?alt=sse")
+        with self.assertRaises(ValueError):
+            c.stream_request("/models/imagen-4:predict", {})
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    release = threading.Event()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/denied":
+            body = b'{"error": "bad key"}'
+            self.send_response(401)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i, part in enumerate((b"data: first\n\n", b"data: second\n\n")):
+            if i:
+                # Hold the rest until the client has seen the first event.
+                self.release.wait(5)
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(part), part))
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPostStream(unittest.TestCase):
+
+    def setUp(self):
+        for k in ("HTTPS_PROXY", "HTTP_PROXY", "https_proxy", "http_proxy"):
+            os.environ.pop(k, None)
+        _Handler.release.clear()
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.client = BaseClient("k", url=url, retries=urllib3.Retry(0))
+
+    def tearDown(self):
+        _Handler.release.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_first_event_arrives_before_body_ends(self):
+        events = iter_sse(self.client._post_stream("/v1/x", {}, {}))
+        self.assertEqual(next(events).data, "first")
+        _Handler.release.set()
+        self.assertEqual([e.data for e in events], ["second"])
+
+    def test_non_2xx_raises_before_first_chunk(self):
+        with self.assertRaises(AuthenticationError):
+            next(self.client._post_stream("/denied", {}, {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
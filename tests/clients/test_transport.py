@@ -2,16 +2,24 @@
 Unified HTTP transport factory (1.3.4 #52): make_http honours an explicit proxy
 and the HTTPS_PROXY / HTTP_PROXY env vars, and both model clients and tool
 clients build their transport through it.
+
+Shared manager registry: make_http returns one process-wide manager per
+configuration, so connections are reused across clients; configure_http /
+http_stats tune and report on them.
 """
 
+import http.server
 import os
 import sys
+import threading
 import unittest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 import urllib3
 from clients._base import make_http
+from clients import configure_http, http_stats
+from clients._http import _DEFAULTS
 
 
 class TestMakeHttp(unittest.TestCase):
@@ -47,5 +55,72 @@ class TestMakeHttp(unittest.TestCase):
         self.assertIsInstance(tool._http, urllib3.ProxyManager)
 
 
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSharedPools(unittest.TestCase):
+
+    def setUp(self):
+        for k in ("HTTPS_PROXY", "HTTP_PROXY", "https_proxy", "http_proxy"):
+            os.environ.pop(k, None)
+
+    def tearDown(self):
+        configure_http(**_DEFAULTS)
+
+    def test_equal_settings_share_one_manager(self):
+        self.assertIs(make_http(), make_http())
+        proxied = make_http({"url": "http://p:3128"})
+        self.assertIs(proxied, make_http({"url": "http://p:3128"}))
+        self.assertIsNot(proxied, make_http())
+
+    def test_equal_settings_share_one_timeout_object(self):
+        a = make_http(timeout=urllib3.Timeout(connect=3, read=7))
+        b = make_http(timeout=urllib3.Timeout(connect=3, read=7))
+        self.assertIs(a.connection_pool_kw["timeout"], b.connection_pool_kw["timeout"])
+
+    def test_connections_reused_across_clients(self):
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/"
+            before = http_stats()
+            for _ in range(3):
+                for mgr in (make_http(), make_http()):    # two independent "clients"
+                    self.assertEqual(mgr.request("GET", url).data, b"ok")
+            after = http_stats()
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(after["connections_opened"] - before["connections_opened"], 1)
+        self.assertEqual(after["reused"] - before["reused"], 5)
+
+    def test_failed_request_is_not_counted_as_reuse(self):
+        before = http_stats()
+        with self.assertRaises(urllib3.exceptions.HTTPError):
+            make_http(retries=urllib3.Retry(total=2, backoff_factor=0)).request(
+                "GET", "http://127.0.0.1:9/")
+        after = http_stats()
+        self.assertEqual(after["requests"] - before["requests"], 3)
+        self.assertEqual(after["reused"], before["reused"])
+
+    def test_configure_http_applies_to_new_managers(self):
+        cfg = configure_http(maxsize=64, block=True)
+        self.assertEqual((cfg["maxsize"], cfg["block"]), (64, True))
+        mgr = make_http()
+        self.assertEqual(mgr.connection_pool_kw["maxsize"], 64)
+        self.assertTrue(mgr.connection_pool_kw["block"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,7 @@ tests.models.test_models_features
 Tests for cross-cutting model features:
   1. Reasoning parameter translation per provider
   2. JSON / json_schema output format in request body
-  3. Cache control (Anthropic)
+  3. Prompt caching (cache_control) and cache-token usage
   4. Registry query helpers
   5. _detect_image_mime  helper
 """
@@ -355,7 +355,179 @@ class TestDeepSeekJsonOutput(unittest.TestCase):
 
 
 # ---------------------------------------------------------------------------
-# 3. Registry helpers
+# 3. Prompt caching (cache_control)
+# ---------------------------------------------------------------------------
+
+_SYSTEM = {"role": "system", "parts": [{"type": "text", "text": "You are terse. " * 400}]}
+_TURNS  = [
+    {"role": "user",      "parts": [{"type": "text", "text": "First question"}]},
+    {"role": "assistant", "parts": [{"type": "text", "text": "First answer"}]},
+    {"role": "user",      "parts": [{"type": "text", "text": "Second question"}]},
+]
+
+
+def _cached(name):
+    return Model(name, options={"cache_control": True})
+
+
+class TestAnthropicPromptCache(unittest.TestCase):
+
+    def test_breakpoints_on_system_and_history(self):
+        _, body = _cached("claude-sonnet-4-6").to_request([_SYSTEM, *_TURNS], _TEXT_OUTPUT)
+        self.assertEqual(body["system"][-1]["cache_control"], {"type": "ephemeral"})
+        marked = [m["role"] for m in body["messages"]
+                  if any("cache_control" in b for b in m["content"])]
+        self.assertEqual(marked, ["assistant"])
+
+    def test_off_by_default(self):
+        _, body = Model("claude-sonnet-4-6").to_request([_SYSTEM, *_TURNS], _TEXT_OUTPUT)
+        self.assertIsInstance(body["system"], str)
+        self.assertNotIn("cache_control", json.dumps(body))
+
+
+class TestOpenAIPromptCache(unittest.TestCase):
+
+    def test_key_follows_the_system_prompt(self):
+        model = _cached("gpt-4o")
+        _, first  = model.to_request([_SYSTEM, *_TURNS[:1]], _TEXT_OUTPUT)
+        _, second = model.to_request([_SYSTEM, *_TURNS], _TEXT_OUTPUT)
+        _, other  = model.to_request(_USER_MSG, _TEXT_OUTPUT)
+        self.assertEqual(first["prompt_cache_key"], second["prompt_cache_key"])
+        self.assertNotEqual(first["prompt_cache_key"], other["prompt_cache_key"])
+        self.assertNotIn("prompt_cache_key", Model("gpt-4o").to_request(_USER_MSG, _TEXT_OUTPUT)[1])
+
+    def test_responses_api(self):
+        _, body = _cached("gpt-5.4").to_request([_SYSTEM, *_TURNS], _TEXT_OUTPUT)
+        self.assertIn("prompt_cache_key", body)
+
+    def test_other_providers_untouched(self):
+        _, body = _cached("grok-3").to_request([_SYSTEM, *_TURNS], _TEXT_OUTPUT)
+        self.assertNotIn("prompt_cache_key", body)
+
+
+class TestGooglePromptCache(unittest.TestCase):
+
+    def setUp(self):
+        from unittest.mock import MagicMock
+        self.model = _cached("gemini-2.5-flash")
+        self.sent = []
+
+        def post(path, body, headers):
+            self.sent.append((path, dict(body)))
+            if path == "/cachedContents":
+                return json.dumps({"name": "cachedContents/abc"}).encode()
+            return b"{}"
+
+        self.model.client._post = MagicMock(side_effect=post)
+
+    def test_prefix_created_once_then_referenced(self):
+        path, body = self.model.to_request([_SYSTEM, *_TURNS], _TEXT_OUTPUT)
+        for _ in range(2):
+            self.model.client._send(path, body, {})
+        creates = [b for p, b in self.sent if p == "/cachedContents"]
+        calls   = [b for p, b in self.sent if p != "/cachedContents"]
+        self.assertEqual(len(creates), 1)
+        self.assertEqual(creates[0]["model"], "models/gemini-2.5-flash")
+        self.assertEqual(creates[0]["contents"], [{"role": "user",
+                                                   "parts": [{"text": "First question"}]}])
+        self.assertIn("systemInstruction", creates[0])
+        for sent in calls:
+            self.assertEqual(sent["cachedContent"], "cachedContents/abc")
+            self.assertEqual(len(sent["contents"]), 2)
+            self.assertNotIn("system_instruction", sent)
+
+    def test_growing_conversation_reuses_the_seed(self):
+        more = [{"role": "assistant", "parts": [{"type": "text", "text": "Second answer"}]},
+                {"role": "user",      "parts": [{"type": "text", "text": "Third question"}]}]
+        for messages in ([_SYSTEM, *_TURNS], [_SYSTEM, *_TURNS, *more],
+                         [_SYSTEM, *_TURNS, *more, *more]):
+            path, body = self.model.to_request(messages, _TEXT_OUTPUT)
+            self.model.client._send(path, body, {})
+        creates = [b for p, b in self.sent if p == "/cachedContents"]
+        self.assertEqual(len(creates), 1)
+        self.assertEqual(len(creates[0]["contents"]), 1)
+        self.assertEqual([len(b["contents"]) for p, b in self.sent if p != "/cachedContents"],
+                         [2, 4, 6])
+
+    def test_remembered_prefixes_are_bounded(self):
+        from unittest.mock import patch
+        from clients._families import google
+        with patch.object(google, "_CACHE_MAX_CONTEXTS", 2):
+            for i in range(3):
+                system = {"role": "system", "parts": [{"type": "text", "text": f"{i} " * 3000}]}
+                path, body = self.model.to_request([system, *_TURNS[:1]], _TEXT_OUTPUT)
+                self.model.client._send(path, body, {})
+        self.assertEqual(len(self.model.client._contexts), 2)
+
+    def test_short_prefix_is_sent_in_full(self):
+        path, body = self.model.to_request(_TURNS, _TEXT_OUTPUT)
+        self.model.client._send(path, body, {})
+        self.assertEqual([p for p, _ in self.sent], [path])
+        self.assertEqual(len(self.sent[0][1]["contents"]), 3)
+        self.assertEqual(len(self.model.client._contexts), 0)
+
+    def test_refused_cache_falls_back_to_full_prompt(self):
+        from clients._errors import InvalidRequestError
+
+        def post(path, body, headers):
+            self.sent.append((path, dict(body)))
+            if path == "/cachedContents":
+                raise InvalidRequestError(400, "too small")
+            return b"{}"
+
+        self.model.client._post.side_effect = post
+        path, body = self.model.to_request([_SYSTEM, *_TURNS], _TEXT_OUTPUT)
+        for _ in range(2):
+            self.model.client._send(path, body, {})
+        self.assertEqual([p for p, _ in self.sent], ["/cachedContents", path, path])
+        self.assertNotIn("cachedContent", self.sent[-1][1])
+
+
+class TestCacheUsage(unittest.TestCase):
+
+    def test_anthropic_cache_tokens_join_input(self):
+        from models._usage import extract_usage
+        u = extract_usage({"usage": {"input_tokens": 10, "output_tokens": 5,
+                                     "cache_read_input_tokens": 1000,
+                                     "cache_creation_input_tokens": 200}})
+        self.assertEqual((u.input_tokens, u.cache_read_tokens, u.cache_write_tokens),
+                         (1210, 1000, 200))
+        self.assertEqual(u.total_tokens, 1215)
+
+    def test_openai_deepseek_and_google_shapes(self):
+        from models._usage import extract_usage
+        chat = extract_usage({"usage": {"prompt_tokens": 100, "completion_tokens": 1,
+                                        "prompt_tokens_details": {"cached_tokens": 64}}})
+        responses = extract_usage({"usage": {"input_tokens": 100, "output_tokens": 1,
+                                             "input_tokens_details": {"cached_tokens": 32}}})
+        deepseek = extract_usage({"usage": {"prompt_tokens": 100, "completion_tokens": 1,
+                                            "prompt_cache_hit_tokens": 80}})
+        google = extract_usage({"usageMetadata": {"promptTokenCount": 100,
+                                                  "candidatesTokenCount": 1,
+                                                  "cachedContentTokenCount": 90}})
+        self.assertEqual([u.cache_read_tokens for u in (chat, responses, deepseek, google)],
+                         [64, 32, 80, 90])
+        self.assertEqual({u.input_tokens for u in (chat, responses, deepseek, google)}, {100})
+
+    def test_cached_tokens_priced_at_cache_rates(self):
+        from models._usage import Usage, estimate_cost
+        # claude-sonnet-4-6: input $3/M; reads at 0.1x, writes at 1.25x
+        u = Usage(input_tokens=3_000_000, cache_read_tokens=1_000_000,
+                  cache_write_tokens=1_000_000)
+        self.assertAlmostEqual(estimate_cost(u, "claude-sonnet-4-6"), 3.0 + 0.3 + 3.75)
+        # gpt-4o lists an absolute cache_read rate
+        u = Usage(input_tokens=1_000_000, cache_read_tokens=1_000_000)
+        self.assertAlmostEqual(estimate_cost(u, "gpt-4o"), 1.25)
+
+    def test_sum_keeps_cache_counts(self):
+        from models._usage import Usage
+        total = sum([Usage(input_tokens=5, cache_read_tokens=3),
+                     Usage(input_tokens=5, cache_write_tokens=2)])
+        self.assertEqual((total.cache_read_tokens, total.cache_write_tokens), (3, 2))
+
+
+# ---------------------------------------------------------------------------
+# 4. Registry helpers
 # ---------------------------------------------------------------------------
 
 class TestRegistry(unittest.TestCase):
@@ -433,7 +605,7 @@ class TestRegistry(unittest.TestCase):
 
 
 # ---------------------------------------------------------------------------
-# 4. _detect_image_mime helper
+# 5. _detect_image_mime helper
 # ---------------------------------------------------------------------------
 
 class TestDetectImageMime(unittest.TestCase):
@@ -0,0 +1,100 @@
+"""
+tests.models.test_tokens
+========================
+
+Local token estimates and the pre-flight context-window check:
+  1. heuristic counter and register_tokenizer overrides
+  2. Model.count_tokens over universal messages (text + media parts)
+  3. on_overflow="raise" / "trim" / "ignore" in to_request
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from clients._errors import ContextWindowExceededError, InvalidRequestError
+from models import Model, register_tokenizer
+from models._tokens import MEDIA_TOKENS, heuristic_count
+
+_TEXT_OUTPUT = {"modalities": ["text"], "format": {"type": "text"}}
+
+
+def _msg(role, text):
+    return {"role": role, "parts": [{"type": "text", "text": text}]}
+
+
+def _texts(body):
+    return [m["content"] for m in body["messages"]]
+
+
+class TestCounters(unittest.TestCase):
+
+    def test_heuristic(self):
+        self.assertEqual(heuristic_count(""), 0)
+        self.assertEqual(heuristic_count("abcd" * 10), 10)
+        self.assertEqual(heuristic_count("你好世界"), 2)
+
+    def test_registered_counter_wins_and_resets(self):
+        model = Model("deepseek-chat", api_key="k")
+        messages = [_msg("user", "x" * 400)]
+        default = model.count_tokens(messages)
+        register_tokenizer("deepseek", lambda text, name: 1)
+        try:
+            self.assertEqual(model.count_tokens(messages), 4 + 1)
+        finally:
+            register_tokenizer("deepseek", None)
+        self.assertEqual(model.count_tokens(messages), default)
+
+    def test_media_parts_count_flat(self):
+        model = Model("claude-sonnet-4-6", api_key="k")
+        image = {"role": "user", "parts": [
+            {"type": "image", "source": {"type": "url", "url": "https://x/y.png"}},
+        ]}
+        self.assertEqual(model.count_tokens([image]), 4 + MEDIA_TOKENS)
+
+
+class TestContextWindow(unittest.TestCase):
+
+    def test_limits_from_data(self):
+        model = Model("gpt-4o", api_key="k")
+        self.assertEqual((model.context_window, model.max_output), (128000, 16384))
+        self.assertIsNone(Model("claude-opus-4-8", api_key="k").context_window)
+
+    def test_oversize_prompt_raises_before_send(self):
+        model = Model("deepseek-chat", api_key="k")
+        with self.assertRaises(ContextWindowExceededError) as ctx:
+            model.to_request([_msg("user", "x" * 600_000)], _TEXT_OUTPUT)
+        err = ctx.exception
+        self.assertIsInstance(err, InvalidRequestError)
+        self.assertEqual(err.status, 400)
+        self.assertEqual(err.context_window, 128000)
+        self.assertGreater(err.tokens, 128000)
+
+    def test_trim_drops_oldest_history(self):
+        model = Model("deepseek-chat", options={"on_overflow": "trim"}, api_key="k")
+        messages = [_msg("system", "be brief"),
+                    _msg("user", "a" * 300_000), _msg("assistant", "b" * 300_000),
+                    _msg("user", "c" * 100)]
+        _, body = model.to_request(messages, _TEXT_OUTPUT)
+        self.assertEqual(_texts(body), ["be brief", "b" * 300_000, "c" * 100])
+
+    def test_trim_never_drops_the_last_message(self):
+        model = Model("deepseek-chat", options={"on_overflow": "trim"}, api_key="k")
+        with self.assertRaises(ContextWindowExceededError):
+            model.to_request([_msg("user", "x"), _msg("user", "y" * 600_000)],
+                             _TEXT_OUTPUT)
+
+    def test_ignore_skips_the_check(self):
+        model = Model("deepseek-chat", options={"on_overflow": "ignore"}, api_key="k")
+        _, body = model.to_request([_msg("user", "x" * 600_000)], _TEXT_OUTPUT)
+        self.assertEqual(len(_texts(body)), 1)
+
+    def test_invalid_on_overflow(self):
+        with self.assertRaises(ValueError):
+            Model("gpt-4o", options={"on_overflow": "drop"}, api_key="k")
+
+
+if __name__ == "__main__":
+    unittest.main()
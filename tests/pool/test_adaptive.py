@@ -0,0 +1,143 @@
+"""
+Adaptive concurrency: FlowLimit's AIMD control (slow start, additive
+increase, multiplicative decrease on overload errors and rising p95 latency)
+and Pool(max_flows="auto") driving it from item timings.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from pool import Pool
+from pool._adaptive import FlowLimit
+from tools._base import Tool
+from clients._errors import AuthenticationError, RateLimitError, ServerError
+
+
+class TestFlowLimit(unittest.TestCase):
+
+    def test_fixed_limit_ignores_outcomes(self):
+        gate = FlowLimit(4)
+        gate.record(0.1, RateLimitError(429, "x"))
+        gate.record(0.1)
+        self.assertEqual(gate.limit, 4)
+        self.assertFalse(gate.adaptive)
+
+    def test_slow_start_then_ceiling(self):
+        gate = FlowLimit(2, floor=2, ceiling=16)
+        for _ in range(10):
+            gate.record(0.1)
+        self.assertEqual(gate.limit, 12)
+        for _ in range(10):
+            gate.record(0.1)
+        self.assertEqual(gate.limit, 16)
+
+    def test_overload_halves_once_per_round(self):
+        gate = FlowLimit(2, floor=2, ceiling=64)
+        for _ in range(30):
+            gate.record(0.1)
+        self.assertEqual(gate.limit, 32)
+        gate.record(0.1, RateLimitError(429, "slow down"))
+        gate.record(0.1, ServerError(503, "busy"))     # same round: no second cut
+        self.assertEqual(gate.limit, 16)
+
+    def test_additive_increase_after_cut(self):
+        gate = FlowLimit(2, floor=2, ceiling=64)
+        for _ in range(14):
+            gate.record(0.1)
+        gate.record(0.1, ServerError(500, "x"))
+        self.assertEqual(gate.limit, 8)
+        for _ in range(9):
+            gate.record(0.1)
+        self.assertEqual(gate.limit, 9)                  # ~ +1 per round of 8
+
+    def test_other_errors_do_not_cut(self):
+        gate = FlowLimit(8, floor=8, ceiling=8)
+        gate.record(0.1, AuthenticationError(401, "bad key"))
+        gate.record(0.1, ValueError("parse"))
+        self.assertEqual(gate.limit, 8)
+
+    def test_rising_p95_latency_cuts(self):
+        gate = FlowLimit(2, floor=2, ceiling=64)
+        for _ in range(40):
+            gate.record(0.1)
+        before = gate.limit
+        for _ in range(20):
+            gate.record(1.0)
+        self.assertLess(gate.limit, before)
+
+    def test_never_below_floor(self):
+        gate = FlowLimit(3, floor=3, ceiling=10)
+        for _ in range(5):
+            gate.record(0.1, RateLimitError(429, "x"))
+        self.assertEqual(gate.limit, 3)
+
+
+class _Probe(Tool):
+    name = "probe"
+    parameters = {"type": "object",
+                  "properties": {"i": {"type": "integer"}},
+                  "required": ["i"]}
+
+    def __init__(self, fail_with=None):
+        self.fail_with = fail_with
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def run(self, i: int) -> int:
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.005)
+        with self._lock:
+            self.in_flight -= 1
+        if self.fail_with is not None:
+            raise self.fail_with
+        return i
+
+
+class TestAutoPool(unittest.TestCase):
+
+    def test_grows_to_ceiling_when_healthy(self):
+        probe = _Probe()
+        pool = Pool(probe, items=[{"i": i} for i in range(80)],
+                    max_flows="auto", flow_bounds=(2, 8))
+        self.assertEqual(pool.status["max_flows"], 2)
+        self.assertEqual(pool.run(), list(range(80)))
+        self.assertGreater(pool.status["max_flows"], 2)
+        self.assertLessEqual(probe.peak, 8)
+
+    def test_rate_limits_drive_limit_to_floor(self):
+        pool = Pool(_Probe(fail_with=RateLimitError(429, "slow down")),
+                    items=[{"i": i} for i in range(40)],
+                    max_flows="auto", flow_bounds=(2, 8))
+        self.assertEqual(pool.run(), [None] * 40)
+        self.assertEqual(pool.status["max_flows"], 2)
+
+    def test_fixed_pool_reports_its_limit(self):
+        pool = Pool(_Probe(), items=[{"i": 1}], max_flows=5)
+        pool.run()
+        self.assertEqual(pool.status["max_flows"], 5)
+
+    def test_arun_auto(self):
+        probe = _Probe()
+        pool = Pool(probe, items=[{"i": i} for i in range(30)],
+                    max_flows="auto", flow_bounds=(1, 4))
+        self.assertEqual(asyncio.run(pool.arun()), list(range(30)))
+        self.assertLessEqual(probe.peak, 4)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            Pool(_Probe(), items=[{"i": 1}], max_flows="fast")
+        with self.assertRaises(ValueError):
+            Pool(_Probe(), items=[{"i": 1}], max_flows="auto", flow_bounds=(4, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
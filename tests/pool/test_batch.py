@@ -0,0 +1,214 @@
+"""
+BatchPool over provider batch APIs: request building via Model.to_request,
+the OpenAI / Anthropic / Gemini submit + poll protocols, ordered results via
+Model.from_response, per-item errors, chunking, discounted usage, and
+reattaching to stored job ids after a crash.
+"""
+
+import json
+import os
+import sys
+import time
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from clients._errors import InvalidRequestError, TaskFailedError
+from models import Model
+from models._usage import attach_cost, extract_usage
+from pool import BatchPool, DONE, FAILED
+from skills import Skill
+from state import InMemoryStore
+from tools._base import Tool
+
+_INPUT = {"messages": [{"role": "user", "parts": ["Classify: {text}"]}]}
+_ITEMS = [{"text": "a"}, {"text": "b"}, {"text": "c"}]
+
+
+def _chat(text):
+    return {"choices": [{"message": {"content": text}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12}}
+
+
+def _jsonl(records):
+    return b"".join(json.dumps(r).encode() + b"\n" for r in records)
+
+
+class TestOpenAIBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.skill = Skill(model=Model("gpt-4o", api_key="k"), input=_INPUT)
+        self.client = self.skill.model.client
+        self.client._post_form = MagicMock(return_value=b'{"id": "file-in"}')
+        self.client._post = MagicMock(return_value=b'{"id": "batch_1"}')
+        output = _jsonl([
+            {"custom_id": "2", "response": {"status_code": 200, "body": _chat("C")}},
+            {"custom_id": "0", "response": {"status_code": 200, "body": _chat("A")}},
+        ])
+        errors = _jsonl([{"custom_id": "1", "response": {"status_code": 400, "body": {
+            "error": {"message": "bad prompt"}}}}])
+        self.client._get = MagicMock(side_effect=lambda path, h: {
+            "/v1/batches/batch_1": json.dumps({"status": "completed",
+                                               "output_file_id": "file-out",
+                                               "error_file_id": "file-err"}).encode(),
+            "/v1/files/file-out/content": output,
+            "/v1/files/file-err/content": errors,
+        }[path])
+
+    def test_results_in_item_order(self):
+        pool = BatchPool(self.skill, items=_ITEMS, poll_interval=0)
+        self.assertEqual(pool.run(), ["A", None, "C"])
+        self.assertEqual(pool.job_ids, ["batch_1"])
+
+        fields = self.client._post_form.call_args[0][1]
+        self.assertEqual(fields["purpose"], "batch")
+        lines = [json.loads(l) for l in fields["file"][1].splitlines()]
+        self.assertEqual([l["custom_id"] for l in lines], ["0", "1", "2"])
+        self.assertEqual(lines[1]["url"], "/v1/chat/completions")
+        self.assertEqual(lines[1]["body"]["messages"][0]["content"], "Classify: b")
+        self.assertEqual(self.client._post.call_args[0][1]["endpoint"], "/v1/chat/completions")
+
+        history = pool.history
+        self.assertEqual([r["status"] for r in history], [DONE, FAILED, DONE])
+        self.assertIn("bad prompt", history[1]["error"])
+        self.assertEqual(pool.last_usage.total_tokens, 24)
+
+    def test_usage_cost_is_discounted(self):
+        pool = BatchPool(self.skill, items=[_ITEMS[0]], poll_interval=0)
+        pool.run()
+        live = Model("gpt-4o", api_key="k")
+        full = attach_cost(extract_usage(_chat("A")), live.name).cost
+        self.assertAlmostEqual(pool.last_usage.cost, full / 2)
+
+    def test_on_error_raise(self):
+        pool = BatchPool(self.skill, items=_ITEMS, poll_interval=0, on_error="raise")
+        with self.assertRaises(InvalidRequestError):
+            pool.run()
+
+    def test_timeout_cuts_the_poll_sleep_short(self):
+        self.client._get = MagicMock(return_value=b'{"status": "in_progress"}')
+        pool = BatchPool(self.skill, items=_ITEMS, poll_interval=60, timeout=0.1)
+        start = time.monotonic()
+        with self.assertRaises(TaskFailedError):
+            pool.run()
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_chunks_into_several_jobs(self):
+        self.client.max_batch_requests = lambda: 2
+        self.client._post = MagicMock(side_effect=[b'{"id": "batch_1"}', b'{"id": "batch_2"}'])
+        self.client._get = MagicMock(return_value=b'{"status": "in_progress"}')
+        pool = BatchPool(self.skill, items=_ITEMS, poll_interval=0, timeout=0)
+        with self.assertRaises(TaskFailedError):
+            pool.run()
+        self.assertEqual(pool.job_ids, ["batch_1", "batch_2"])
+        sizes = [len(c[0][1]["file"][1].splitlines()) for c in self.client._post_form.call_args_list]
+        self.assertEqual(sizes, [2, 1])
+
+
+class TestReattach(unittest.TestCase):
+
+    def test_crashed_run_reattaches_without_resubmitting(self):
+        store = InMemoryStore()
+        skill = Skill(model=Model("claude-sonnet-4-5", api_key="k"), input=_INPUT)
+        client = skill.model.client
+        client._post = MagicMock(return_value=b'{"id": "msgbatch_1"}')
+        client._get = MagicMock(return_value=b'{"processing_status": "in_progress"}')
+
+        first = BatchPool(skill, items=_ITEMS, store=store, job_key="nightly",
+                          poll_interval=0, timeout=0)
+        with self.assertRaises(TaskFailedError):
+            first.run()
+        self.assertEqual(store.load("nightly")["jobs"], {"0": "msgbatch_1"})
+
+        message = lambda t: {"content": [{"type": "text", "text": t}],
+                             "usage": {"input_tokens": 5, "output_tokens": 1}}
+        client._get = MagicMock(return_value=json.dumps({
+            "processing_status": "ended", "results_url": "https://x/results"}).encode())
+        client._download = MagicMock(return_value={"data": _jsonl([
+            {"custom_id": "0", "result": {"type": "succeeded", "message": message("A")}},
+            {"custom_id": "1", "result": {"type": "expired"}},
+            {"custom_id": "2", "result": {"type": "errored", "error": {"type": "error",
+                "error": {"type": "invalid_request_error", "message": "too long"}}}},
+        ])})
+        second = BatchPool(skill, items=_ITEMS, store=store, job_key="nightly", poll_interval=0)
+        self.assertEqual(second.run(), ["A", None, None])
+        client._post.assert_called_once()                  # submitted only by the first run
+        self.assertIsNone(store.load("nightly"))
+        self.assertIn("too long", second.history[2]["error"])
+
+    def test_default_key_is_content_addressed(self):
+        store = InMemoryStore()
+        skill = Skill(model=Model("claude-sonnet-4-5", api_key="k"), input=_INPUT)
+        skill.model.client._post = MagicMock(return_value=b'{"id": "msgbatch_1"}')
+        skill.model.client._get = MagicMock(return_value=b'{"processing_status": "in_progress"}')
+        for _ in range(2):
+            with self.assertRaises(TaskFailedError):
+                BatchPool(skill, items=_ITEMS, store=store, poll_interval=0, timeout=0).run()
+        skill.model.client._post.assert_called_once()
+
+    def test_mismatched_stored_batch(self):
+        store = InMemoryStore()
+        store.save("k", {"kind": "batch", "count": 99, "jobs": {}})
+        skill = Skill(model=Model("gpt-4o", api_key="k"), input=_INPUT)
+        with self.assertRaises(ValueError):
+            BatchPool(skill, items=_ITEMS, store=store, job_key="k").run()
+
+
+class TestGeminiBatch(unittest.TestCase):
+
+    def test_inline_requests_and_responses(self):
+        skill = Skill(model=Model("gemini-2.5-flash", api_key="k"), input=_INPUT)
+        client = skill.model.client
+        client._post = MagicMock(return_value=b'{"name": "batches/123"}')
+        reply = lambda t: {"candidates": [{"content": {"parts": [{"text": t}]}}]}
+        client._get = MagicMock(return_value=json.dumps({"name": "batches/123", "done": True,
+            "metadata": {"state": "BATCH_STATE_SUCCEEDED"},
+            "response": {"inlinedResponses": {"inlinedResponses": [
+                {"response": reply("A"), "metadata": {"key": "0"}},
+                {"error": {"code": 8, "message": "quota"}, "metadata": {"key": "1"}},
+                {"response": reply("C"), "metadata": {"key": "2"}},
+            ]}}}).encode())
+        pool = BatchPool(skill, items=_ITEMS, poll_interval=0)
+        self.assertEqual(pool.run(), ["A", None, "C"])
+        path, body = client._post.call_args[0][:2]
+        self.assertTrue(path.endswith(":batchGenerateContent"))
+        requests = body["batch"]["input_config"]["requests"]["requests"]
+        self.assertEqual([r["metadata"]["key"] for r in requests], ["0", "1", "2"])
+        self.assertIn("quota", pool.history[1]["error"])
+
+    def test_failed_job_fails_every_item(self):
+        skill = Skill(model=Model("gemini-2.5-flash", api_key="k"), input=_INPUT)
+        skill.model.client._post = MagicMock(return_value=b'{"name": "batches/9"}')
+        skill.model.client._get = MagicMock(return_value=json.dumps({
+            "done": True, "error": {"message": "invalid input"}}).encode())
+        pool = BatchPool(skill, items=_ITEMS, poll_interval=0)
+        self.assertEqual(pool.run(), [None, None, None])
+        self.assertEqual(pool.status[FAILED], 3)
+
+
+class TestValidation(unittest.TestCase):
+
+    def test_provider_without_batch_api(self):
+        with self.assertRaises(ValueError):
+            BatchPool(Skill(model=Model("deepseek-chat", api_key="k"), input=_INPUT), items=_ITEMS)
+
+    def test_runner_must_be_a_skill(self):
+        class Echo(Tool):
+            name = "echo"
+            parameters = {"type": "object", "properties": {}}
+
+            def run(self):
+                return None
+        with self.assertRaises(TypeError):
+            BatchPool(Echo(), items=_ITEMS)
+
+    def test_unrelated_class_named_skill_is_rejected(self):
+        class Skill:                                # noqa: F811 — not skills.Skill
+            model = Model("gpt-4o", api_key="k")
+        with self.assertRaises(TypeError):
+            BatchPool(Skill(), items=_ITEMS)
+
+
+if __name__ == "__main__":
+    unittest.main()
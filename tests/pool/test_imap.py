@@ -0,0 +1,122 @@
+"""
+tests.pool.test_imap
+====================
+
+Pool.imap(): items pulled lazily through a bounded window, results yielded
+in order or as they finish, and status / history kept as counters and a
+ring buffer rather than one record per item.  Pure — local tools, no network.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from pool import Pool, PENDING, RUNNING, DONE, FAILED
+from tools._base import Tool
+
+
+class _Echo(Tool):
+    """Returns ``n * 10`` after *delay*; fails for the ``n`` in *fail_on*."""
+
+    name = "echo"
+    parameters = {"type": "object", "properties": {"n": {"type": "integer"}}}
+
+    def __init__(self, delay=0.0, fail_on=()):
+        self.delay, self.fail_on = delay, fail_on
+        self.lock, self.now, self.peak = threading.Lock(), 0, 0
+
+    def run(self, n=0, **kw):
+        with self.lock:
+            self.now += 1
+            self.peak = max(self.peak, self.now)
+        try:
+            time.sleep(self.delay(n) if callable(self.delay) else self.delay)
+            if n in self.fail_on:
+                raise RuntimeError(f"failed on {n}")
+            return n * 10
+        finally:
+            with self.lock:
+                self.now -= 1
+
+
+def _rows(n, produced=None):
+    for i in range(n):
+        if produced is not None:
+            produced.append(i)
+        yield {"n": i}
+
+
+class TestImap(unittest.TestCase):
+
+    def test_ordered_results_from_a_generator(self):
+        pool = Pool(_Echo(delay=lambda n: 0.02 if n % 3 == 0 else 0.0), max_flows=4)
+        self.assertEqual(list(pool.imap(_rows(20))),
+                         [(i, i * 10) for i in range(20)])
+        self.assertEqual(pool.status, {PENDING: 0, RUNNING: 0, DONE: 20,
+                                       FAILED: 0, "max_flows": 4})
+
+    def test_unordered_yields_as_items_finish(self):
+        pool = Pool(_Echo(delay=lambda n: 0.1 if n == 0 else 0.0), max_flows=3)
+        order = [i for i, _ in pool.imap(_rows(3), ordered=False)]
+        self.assertEqual(order[-1], 0)
+        self.assertEqual(sorted(order), [0, 1, 2])
+
+    def test_window_bounds_items_pulled(self):
+        produced = []
+        tool = _Echo(delay=0.01)
+        stream = Pool(tool, max_flows=2).imap(_rows(1000, produced), window=3)
+        self.assertEqual(next(stream), (0, 0))
+        time.sleep(0.05)
+        self.assertLessEqual(len(produced), 4)
+        stream.close()
+        self.assertLessEqual(tool.peak, 2)
+
+    def test_history_is_a_ring_buffer(self):
+        pool = Pool(_Echo(), max_flows=2)
+        for _ in pool.imap(_rows(50), keep=5):
+            pass
+        history = pool.history
+        self.assertEqual(len(history), 5)
+        self.assertTrue(all(r["status"] == DONE for r in history))
+        self.assertEqual(pool.status[DONE], 50)
+
+    def test_collect_yields_none_and_counts_failures(self):
+        pool = Pool(_Echo(fail_on={1}), max_flows=2)
+        self.assertEqual(dict(pool.imap(_rows(3), variables={"extra": 1})),
+                         {0: 0, 1: None, 2: 20})
+        self.assertEqual(pool.status[FAILED], 1)
+        failed = [r for r in pool.history if r["status"] == FAILED]
+        self.assertEqual(failed[0]["error"], "failed on 1")
+
+    def test_raise_stops_the_stream(self):
+        produced = []
+        pool = Pool(_Echo(fail_on={2}), max_flows=1, on_error="raise")
+        with self.assertRaisesRegex(RuntimeError, "failed on 2"):
+            list(pool.imap(_rows(100, produced), window=2))
+        self.assertLess(len(produced), 10)
+
+    def test_run_after_imap_uses_full_history(self):
+        pool = Pool(_Echo(), items=[{"n": 1}, {"n": 2}])
+        list(pool.imap(_rows(10), keep=2))
+        self.assertEqual(pool.run(), [10, 20])
+        self.assertEqual(len(pool.history), 2)
+        self.assertEqual(pool.status[DONE], 2)
+
+    def test_invalid_arguments(self):
+        pool = Pool(_Echo())
+        with self.assertRaises(ValueError):
+            pool.run()
+        with self.assertRaises(ValueError):
+            pool.imap(_rows(1), window=0)
+        with self.assertRaises(ValueError):
+            pool.imap(_rows(1), keep=-1)
+        with self.assertRaises(ValueError):
+            Pool(_Echo(), items=[])
+
+
+if __name__ == "__main__":
+    unittest.main()
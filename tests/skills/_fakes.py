@@ -0,0 +1,43 @@
+"""
+tests.skills._fakes
+===================
+
+Fake chat models for Skill tests: a real ``Model`` whose client never
+touches the network — ``send`` / ``asend`` are replaced by the test's mock,
+and the replies are OpenAI Chat Completions bodies.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+from models import Model
+from skills import Skill
+
+
+def chat_response(content, input_tokens=3, output_tokens=1) -> bytes:
+    """A Chat Completions response body answering *content*."""
+    return json.dumps({
+        "choices": [{"message": {"content": content}}],
+        "usage": {"prompt_tokens": input_tokens, "completion_tokens": output_tokens},
+    }).encode()
+
+
+def fake_model(name="gpt-4o", send=None, *, asend=None) -> Model:
+    """
+    *name* with its transport replaced: *send* for the sync path (default:
+    answer with the model's name), *asend* for the async one (the sync path
+    then fails the test if used).
+    """
+    m = Model(name, api_key="k")
+    m.client._auth_headers = MagicMock(return_value={})
+    if asend is None:
+        m.client.send = send or MagicMock(return_value=chat_response(name))
+    else:
+        m.client.asend = asend
+        m.client._post = MagicMock(side_effect=AssertionError("sync path used"))
+    return m
+
+
+def chat_skill(model, text="Hi", **kw) -> Skill:
+    """A Skill over *model* (one model or a fallback list) with one user turn."""
+    return Skill(model=model, input={"messages": [{"role": "user", "parts": [text]}]}, **kw)
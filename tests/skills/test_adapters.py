@@ -3,7 +3,8 @@ tests.skills.test_adapters
 ===========================
 
 Unit tests for the format utilities in ``skills._adapters``
-(``validate_input``, ``validate_output``, ``substitute``) and for the
+(``validate_input``, ``validate_output``, ``substitute``,
+``compile_messages``) and for the
 provider-specific ``to_request`` / ``from_response`` methods that now live
 directly on each model class.
 
@@ -30,7 +31,9 @@ for _k, _v in _TEST_KEYS.items():
     if not os.environ.get(_k):
         os.environ[_k] = _v
 
-from skills._adapters import validate_input, validate_output, substitute
+from skills._adapters import (
+    validate_input, validate_output, substitute, compile_messages,
+)
 from models import Model
 
 
@@ -277,6 +280,38 @@ class TestSubstitute(unittest.TestCase):
         self.assertEqual(result[0]["parts"][1]["type"], "image")
 
 
+# ---------------------------------------------------------------------------
+# compile_messages
+# ---------------------------------------------------------------------------
+
+class TestCompiledMessages(unittest.TestCase):
+
+    def _msgs(self):
+        return [
+            {"role": "system", "parts": [{"type": "text", "text": "Reply as JSON: {\"a\": 1}"}]},
+            {"role": "user",   "parts": [
+                {"type": "text",  "text": "About {topic}, not {{topic}} or {other}."},
+                {"type": "image", "source": {"kind": "url", "url": "https://x.com/img.png"}},
+            ]},
+        ]
+
+    def test_matches_substitute(self):
+        compiled = compile_messages(self._msgs())
+        for variables in ({}, {"topic": "mars"}, {"topic": "{x}", "other": 7}, {"z": 1}):
+            self.assertEqual(compiled.render(variables), substitute(self._msgs(), variables))
+
+    def test_referenced_names(self):
+        self.assertEqual(compile_messages(self._msgs()).names, {"topic", "other"})
+
+    def test_unchanged_parts_are_shared(self):
+        msgs = self._msgs()
+        result = compile_messages(msgs).render({"topic": "mars"})
+        self.assertIs(result[0], msgs[0])
+        self.assertIsNot(result[1], msgs[1])
+        self.assertIs(result[1]["parts"][1], msgs[1]["parts"][1])
+        self.assertIn("{topic}", msgs[1]["parts"][0]["text"])
+
+
 # ---------------------------------------------------------------------------
 # Model.to_request / from_response
 # ---------------------------------------------------------------------------
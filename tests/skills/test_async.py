@@ -0,0 +1,159 @@
+"""
+Async entry points: Skill.arun / Chain.arun / Pool.arun drive the same run
+logic as run() — retries, fallback, usage, hooks — through client.asend on the
+event loop (transport mocked).
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import AsyncMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from skills import Skill
+from chain import Chain
+from pool import Pool
+from tools._base import Tool
+from clients._errors import AuthenticationError, RateLimitError, ServerError
+from tests.skills._fakes import chat_response, chat_skill, fake_model
+
+_SAY = "Say {word}"
+
+
+class TestSkillArun(unittest.IsolatedAsyncioTestCase):
+
+    async def test_returns_result_and_usage(self):
+        m = fake_model(asend=AsyncMock(return_value=chat_response("hello")))
+        skill = chat_skill(m, _SAY, variables={"word": "hi"})
+        self.assertEqual(await skill.arun(), "hello")
+        self.assertEqual(skill.last_usage.input_tokens, 3)
+        self.assertEqual(skill.history, ["hello"])
+        body = m.client.asend.call_args[0][1]
+        self.assertEqual(body["messages"][0]["content"], "Say hi")
+
+    async def test_retries_transient_error(self):
+        m = fake_model(asend=AsyncMock(side_effect=[ServerError(503, "busy"), chat_response("ok")]))
+        skill = chat_skill(m, _SAY, max_retries=1, retry_delay=0)
+        self.assertEqual(await skill.arun(variables={"word": "x"}), "ok")
+        self.assertEqual(m.client.asend.await_count, 2)
+
+    async def test_falls_back_to_next_model(self):
+        first  = fake_model(asend=AsyncMock(side_effect=RateLimitError(429, "slow down")))
+        second = fake_model(asend=AsyncMock(return_value=chat_response("from backup")))
+        skill = chat_skill([first, second], _SAY)
+        self.assertEqual(await skill.arun(variables={"word": "x"}), "from backup")
+
+    async def test_non_transient_error_propagates(self):
+        m = fake_model(asend=AsyncMock(side_effect=AuthenticationError(401, "bad key")))
+        with self.assertRaises(AuthenticationError):
+            await chat_skill(m, _SAY).arun(variables={"word": "x"})
+
+    async def test_multi_turn(self):
+        m = fake_model(asend=AsyncMock(side_effect=[chat_response("draft"),
+                                                    chat_response("final")]))
+        skill = Skill(model=m, input={"messages": [
+            {"role": "user", "parts": ["Draft it"]},
+            {"role": "assistant"},
+            {"role": "user", "parts": ["Improve it"]},
+        ]})
+        self.assertEqual(await skill.arun(), "final")
+        self.assertEqual(skill.history, ["draft", "final"])
+        self.assertEqual(skill.last_usage.input_tokens, 6)
+
+    async def test_hooks_fire(self):
+        seen = []
+        m = fake_model(asend=AsyncMock(return_value=chat_response("ok")))
+        skill = chat_skill(m, _SAY, hooks=[lambda e: seen.append(e.type)])
+        await skill.arun(variables={"word": "x"})
+        self.assertEqual(seen, ["llm_call.started", "llm_call.ended"])
+
+    async def test_concurrent_calls_share_one_loop(self):
+        in_flight = [0]
+        peak = [0]
+
+        async def asend(path, body, headers):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return chat_response(body["messages"][0]["content"])
+
+        skill = chat_skill(fake_model(asend=asend), _SAY)
+        results = await asyncio.gather(*(skill.arun(variables={"word": str(i)})
+                                         for i in range(100)))
+        self.assertEqual(results, [f"Say {i}" for i in range(100)])
+        self.assertEqual(peak[0], 100)
+
+
+class _Upper(Tool):
+    name = "upper"
+    parameters = {"type": "object",
+                  "properties": {"text": {"type": "string"}},
+                  "required": ["text"]}
+
+    def run(self, text: str) -> str:
+        return text.upper()
+
+
+class TestChainArun(unittest.IsolatedAsyncioTestCase):
+
+    async def test_skill_then_tool(self):
+        m = fake_model(asend=AsyncMock(return_value=chat_response("quiet words")))
+        chain = Chain(steps=[(chat_skill(m, _SAY), "text"), _Upper()])
+        self.assertEqual(await chain.arun(variables={"word": "x"}), "QUIET WORDS")
+        self.assertEqual([h["kind"] for h in chain.history], ["skill", "tool"])
+        self.assertEqual(chain.last_usage.input_tokens, 3)
+
+    async def test_step_error_modes(self):
+        m = fake_model(asend=AsyncMock(side_effect=AuthenticationError(401, "bad key")))
+        with self.assertRaises(AuthenticationError):
+            await Chain(steps=[chat_skill(m, _SAY)]).arun(variables={"word": "x"})
+        self.assertIsNone(await Chain(steps=[chat_skill(m, _SAY)], on_step_error="stop")
+                          .arun(variables={"word": "x"}))
+
+
+class TestPoolArun(unittest.IsolatedAsyncioTestCase):
+
+    async def test_order_and_concurrency_bound(self):
+        in_flight = [0]
+        peak = [0]
+
+        async def asend(path, body, headers):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.005)
+            in_flight[0] -= 1
+            return chat_response(body["messages"][0]["content"])
+
+        pool = Pool(chat_skill(fake_model(asend=asend), _SAY),
+                    items=[{"word": str(i)} for i in range(40)], max_flows=8)
+        results = await pool.arun()
+        self.assertEqual(results, [f"Say {i}" for i in range(40)])
+        self.assertEqual(peak[0], 8)
+        self.assertEqual(pool.status, {0: 0, 1: 0, 2: 40, 3: 0, "max_flows": 8})
+
+    async def test_collect_and_raise(self):
+        async def asend(path, body, headers):
+            if body["messages"][0]["content"] == "Say 1":
+                raise AuthenticationError(401, "bad key")
+            return chat_response("ok")
+
+        items = [{"word": str(i)} for i in range(3)]
+        pool = Pool(chat_skill(fake_model(asend=asend), _SAY), items=items)
+        self.assertEqual(await pool.arun(), ["ok", None, "ok"])
+        self.assertEqual(pool.history[1]["status"], 3)
+
+        with self.assertRaises(AuthenticationError):
+            await Pool(chat_skill(fake_model(asend=asend), _SAY), items=items,
+                       on_error="raise").arun()
+
+    async def test_tool_runner_uses_threads(self):
+        pool = Pool(_Upper(), items=[{"text": "a"}, {"text": "b"}])
+        self.assertEqual(await pool.arun(), ["A", "B"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Run-level deadlines: deadline_scope nesting, Skill / Chain refusing to start
+work past the deadline, and BaseClient capping each request's timeout and
+transport retries to the time left (transport mocked, except for one local
+HTTP server that never answers).
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import urllib3
+from chain import Chain
+from clients._base import BaseClient, _DeadlineRetry
+from clients._errors import DeadlineExceededError, ServerError
+from tests.skills._fakes import chat_response, chat_skill, fake_model
+from yait_aichain._deadline import deadline_at, deadline_scope, remaining
+
+
+class TestDeadlineScope(unittest.TestCase):
+
+    def test_nested_scope_only_tightens(self):
+        self.assertIsNone(deadline_at())
+        with deadline_scope(10):
+            outer = deadline_at()
+            with deadline_scope(60):
+                self.assertEqual(deadline_at(), outer)
+            with deadline_scope(1):
+                self.assertLess(deadline_at(), outer)
+            with deadline_scope(None):
+                self.assertEqual(deadline_at(), outer)
+        self.assertIsNone(remaining())
+
+    def test_negative_deadline(self):
+        with self.assertRaises(ValueError):
+            with deadline_scope(-1):
+                pass
+
+
+class TestSkillDeadline(unittest.TestCase):
+
+    def test_expired_deadline_sends_nothing(self):
+        send = MagicMock(return_value=chat_response("ok"))
+        with self.assertRaises(DeadlineExceededError) as ctx:
+            chat_skill(fake_model("gpt-4o", send)).run(deadline=0)
+        self.assertEqual(ctx.exception.status, 408)
+        send.assert_not_called()
+
+    def test_retry_backoff_past_the_deadline_is_not_slept(self):
+        send = MagicMock(side_effect=ServerError(503, "busy"))
+        skill = chat_skill(fake_model("gpt-4o", send), max_retries=3, retry_delay=5)
+        t0 = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            skill.run(deadline=1)
+        self.assertLess(time.monotonic() - t0, 1)
+        self.assertEqual(send.call_count, 1)
+
+    def test_deadline_reaches_the_transport(self):
+        seen = []
+
+        def send(*_):
+            seen.append(remaining())
+            return chat_response("ok")
+
+        self.assertEqual(chat_skill(fake_model("gpt-4o", send)).run(deadline=30), "ok")
+        self.assertTrue(0 < seen[0] <= 30)
+        self.assertIsNone(remaining())
+
+
+class TestChainDeadline(unittest.TestCase):
+
+    def test_steps_share_one_budget(self):
+        seen = []
+
+        def send(*_):
+            seen.append(deadline_at())
+            return chat_response("ok")
+
+        chain = Chain(steps=[chat_skill(fake_model("gpt-4o", send)),
+                             chat_skill(fake_model("gpt-4o-mini", send))])
+        chain.run(deadline=30)
+        self.assertEqual(len(seen), 2)
+        self.assertEqual(seen[0], seen[1])
+
+    def test_expired_deadline_raises_even_when_skipping(self):
+        send = MagicMock(return_value=chat_response("ok"))
+        chain = Chain(steps=[chat_skill(fake_model("gpt-4o", send))], on_step_error="skip")
+        with self.assertRaises(DeadlineExceededError):
+            chain.run(deadline=0)
+        send.assert_not_called()
+
+
+class TestClientBudget(unittest.TestCase):
+
+    def setUp(self):
+        self.client = BaseClient("k", url="http://127.0.0.1:9")
+
+    def test_no_deadline_no_overrides(self):
+        self.assertEqual(self.client._budget(), {})
+        retries = urllib3.Retry(1)
+        self.assertEqual(self.client._budget(retries), {"retries": retries})
+
+    def test_timeout_and_retries_capped(self):
+        with deadline_scope(5):
+            budget = self.client._budget()
+        self.assertLessEqual(budget["timeout"].read_timeout, 5)
+        self.assertLessEqual(budget["timeout"].connect_timeout, 5)
+        retry = budget["retries"]
+        self.assertIsInstance(retry, _DeadlineRetry)
+        self.assertEqual(retry.total, self.client._retries.total)
+        self.assertEqual(retry.new().deadline, retry.deadline)
+        self.assertLessEqual(retry.get_backoff_time(), 5)
+
+    def test_expired_budget_raises(self):
+        with deadline_scope(0):
+            with self.assertRaises(DeadlineExceededError):
+                self.client._budget()
+
+    def test_retry_exhausted_at_the_deadline(self):
+        retry = _DeadlineRetry.within(urllib3.Retry(total=5), time.monotonic() - 1)
+        self.assertTrue(retry.is_exhausted())
+        self.assertFalse(_DeadlineRetry.within(5, time.monotonic() + 60).is_exhausted())
+
+    def test_silent_server_times_out_at_the_deadline(self):
+        for k in ("HTTPS_PROXY", "HTTP_PROXY", "https_proxy", "http_proxy"):
+            os.environ.pop(k, None)
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        accepted = []
+        threading.Thread(target=lambda: accepted.append(server.accept()), daemon=True).start()
+        client = BaseClient("k", url=f"http://127.0.0.1:{server.getsockname()[1]}")
+        t0 = time.monotonic()
+        try:
+            with deadline_scope(0.5):
+                with self.assertRaises(DeadlineExceededError):
+                    client._post("/v1/x", {}, {"Content-Type": "application/json"})
+        finally:
+            for conn, _ in accepted:
+                conn.close()
+            server.close()
+        self.assertLess(time.monotonic() - t0, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
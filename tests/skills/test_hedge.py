@@ -0,0 +1,124 @@
+"""
+Hedged requests: Skill(hedge=...) fires the request at the next model in the
+chain when the current one is slow, returns the first success, and reports
+usage for every model that ran (transport mocked).
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from skills import _stats
+from clients._errors import AuthenticationError, ServerError
+from tests.skills._fakes import chat_response, chat_skill, fake_model
+
+
+def _slow(content, seconds, release=None):
+    def send(*_):
+        if release is not None:
+            release.wait(seconds)
+        else:
+            time.sleep(seconds)
+        return chat_response(content)
+    return MagicMock(side_effect=send)
+
+
+class TestHedge(unittest.TestCase):
+
+    def tearDown(self):
+        _stats._latency.clear()
+
+    def test_slow_primary_loses_to_hedge(self):
+        release = threading.Event()
+        events  = []
+        primary = fake_model("gpt-4o", _slow("slow", 5, release))
+        backup  = fake_model("gpt-4o-mini",
+                             MagicMock(return_value=chat_response("fast", input_tokens=5)))
+        skill = chat_skill([primary, backup], hedge=0.05, hooks=[events.append])
+
+        self.assertEqual(skill.run(), "fast")
+        self.assertEqual(skill.last_usage.input_tokens, 5)   # the loser has not finished
+        release.set()
+        for _ in range(100):
+            if sum(e.type == "llm_call.ended" for e in events) == 2:
+                break
+            time.sleep(0.01)
+        ended = {e.name: e for e in events if e.type == "llm_call.ended"}
+        self.assertTrue(ended["gpt-4o-mini"].payload["won"])
+        self.assertFalse(ended["gpt-4o"].payload["won"])
+        self.assertEqual(ended["gpt-4o"].usage, 4)           # the loser is still reported
+
+    def test_fast_primary_does_not_hedge(self):
+        backup = fake_model("gpt-4o-mini", MagicMock(return_value=chat_response("backup")))
+        primary = fake_model("gpt-4o", MagicMock(return_value=chat_response("primary")))
+        skill = chat_skill([primary, backup], hedge=5)
+        self.assertEqual(skill.run(), "primary")
+        backup.client.send.assert_not_called()
+
+    def test_fallback_error_hedges_at_once(self):
+        primary = fake_model("gpt-4o", MagicMock(side_effect=ServerError(503, "busy")))
+        backup  = fake_model("gpt-4o-mini", MagicMock(return_value=chat_response("backup")))
+        t0 = time.monotonic()
+        self.assertEqual(chat_skill([primary, backup], hedge=10).run(), "backup")
+        self.assertLess(time.monotonic() - t0, 5)
+
+    def test_non_fallback_error_raises(self):
+        primary = fake_model("gpt-4o", MagicMock(side_effect=AuthenticationError(401, "bad key")))
+        backup  = fake_model("gpt-4o-mini", _slow("backup", 0.2))
+        with self.assertRaises(AuthenticationError):
+            chat_skill([primary, backup], hedge=0).run()
+
+    def test_all_failing_retries_then_raises(self):
+        primary = fake_model("gpt-4o", MagicMock(side_effect=ServerError(503, "busy")))
+        backup  = fake_model("gpt-4o-mini", MagicMock(side_effect=ServerError(502, "down")))
+        skill = chat_skill([primary, backup], hedge=1, max_retries=1, retry_delay=0)
+        with self.assertRaises(ServerError):
+            skill.run()
+        self.assertEqual(primary.client.send.call_count, 2)
+
+    def test_percentile_delay_uses_observed_latency(self):
+        for _ in range(_stats._MIN_SAMPLES):
+            _stats.record_latency("gpt-4o", 0.01)
+        skill = chat_skill([fake_model("gpt-4o", MagicMock()),
+                            fake_model("gpt-4o-mini", MagicMock())], hedge="p90")
+        self.assertEqual(skill._hedge_delays(skill.models), [0.01])
+        _stats._latency.clear()
+        self.assertEqual(skill._hedge_delays(skill.models), [2.0])      # too few samples yet
+
+    def test_successful_calls_feed_latency_stats(self):
+        skill = chat_skill(fake_model("gpt-4o", MagicMock(return_value=chat_response("ok"))))
+        skill.run()
+        self.assertEqual(_stats._latency.count("gpt-4o"), 1)
+
+    def test_invalid_hedge(self):
+        for bad in ("fast", "p0", "p100", -1):
+            with self.assertRaises(ValueError):
+                chat_skill(fake_model("gpt-4o", MagicMock()), hedge=bad)
+
+
+class TestHedgeAsync(unittest.IsolatedAsyncioTestCase):
+
+    def tearDown(self):
+        _stats._latency.clear()
+
+    async def test_slow_primary_loses_to_hedge(self):
+        import asyncio
+
+        async def slow(*_):
+            await asyncio.sleep(5)
+            return chat_response("slow")
+
+        primary = fake_model("gpt-4o", asend=slow)
+        backup  = fake_model("gpt-4o-mini",
+                             asend=AsyncMock(return_value=chat_response("fast")))
+        skill = chat_skill([primary, backup], hedge=0.05)
+        self.assertEqual(await skill.arun(), "fast")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Media sources and encoded bodies: MediaSource lazy file loading, immutability
+and sharing through substitute(), plain_input for persistence, and the
+RequestBody encoding memo reused across retries.
+"""
+
+import base64
+import copy
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from clients._base import BaseClient, RequestBody
+from models import Model
+from skills import MediaSource, Skill
+from skills._adapters import normalize_input, plain_input, substitute
+
+_PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+class TestMediaSource(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "pixel.bin")
+        with open(self.path, "wb") as fh:
+            fh.write(_PNG)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_file_is_read_lazily_and_once(self):
+        src = MediaSource({"kind": "file", "path": self.path})
+        self.assertIsNone(src._loaded)
+        self.assertIn("data", src)
+        self.assertIsNone(src._loaded)                      # membership does not load
+        with patch("pathlib.Path.read_bytes", return_value=_PNG) as read:
+            self.assertEqual(src["data"], base64.b64encode(_PNG).decode("ascii"))
+            self.assertEqual(src.get("mime"), "image/png")  # from magic bytes
+            src["data"]
+        read.assert_called_once()
+
+    def test_immutable_and_shared(self):
+        spec = {"kind": "base64", "mime": "image/png", "data": "abc"}
+        src = MediaSource(spec)
+        spec["data"] = "changed"
+        self.assertEqual(src["data"], "abc")
+        self.assertIs(copy.deepcopy(src), src)
+        with self.assertRaises(TypeError):
+            src["data"] = "x"
+        self.assertEqual(dict(src), {"kind": "base64", "mime": "image/png", "data": "abc"})
+
+    def test_normalize_and_substitute_share_the_handle(self):
+        inp = normalize_input({"messages": [{"role": "user", "parts": [
+            {"type": "image", "source": {"kind": "file", "path": self.path}},
+            "Describe {thing}."]}]})
+        src = inp["messages"][0]["parts"][0]["source"]
+        self.assertIsInstance(src, MediaSource)
+        out = substitute(inp["messages"], {"thing": "it"})
+        self.assertIs(out[0]["parts"][0]["source"], src)
+        self.assertEqual(out[0]["parts"][1]["text"], "Describe it.")
+        self.assertEqual(plain_input(inp)["messages"][0]["parts"][0]["source"],
+                         {"kind": "file", "path": self.path})
+
+    def test_missing_file_fails_when_the_skill_is_built(self):
+        missing = os.path.join(self.dir.name, "missing.png")
+        with self.assertRaises(FileNotFoundError):
+            Skill(model=Model("gpt-4o", api_key="k"), input={"messages": [
+                {"role": "user", "parts": [
+                    {"type": "image", "source": {"kind": "file", "path": missing}}]}]})
+
+    def test_provider_request_reads_source(self):
+        skill = Skill(model=Model("gpt-4o", api_key="k"), input={"messages": [
+            {"role": "user", "parts": [
+                {"type": "image", "source": {"kind": "file", "path": self.path}}, "?"]}]})
+        skill.model.client._post = MagicMock(return_value=json.dumps(
+            {"choices": [{"message": {"content": "a pixel"}}]}).encode())
+        self.assertEqual(skill.run(), "a pixel")
+        body = skill.model.client._post.call_args[0][1]
+        url = body["messages"][0]["content"][0]["image_url"]["url"]
+        self.assertTrue(url.startswith("data:image/png;base64,"))
+
+
+class TestRequestBody(unittest.TestCase):
+
+    def test_to_request_returns_memoised_body(self):
+        _, body = Model("gpt-4o", api_key="k").to_request(
+            [{"role": "user", "parts": [{"type": "text", "text": "hi"}]}],
+            {"modalities": ["text"], "format": {"type": "text"}})
+        self.assertIsInstance(body, RequestBody)
+        self.assertIs(body.encoded(), body.encoded())
+        self.assertEqual(json.loads(body.encoded()), body)
+
+    def test_retries_reuse_encoded_bytes(self):
+        skill = Skill(model=Model("gpt-4o", api_key="k"),
+                      input={"messages": [{"role": "user", "parts": ["hi"]}]},
+                      max_retries=2, retry_delay=0)
+        sent = []
+        response = MagicMock(status=500, data=b"busy", headers={})
+        ok = MagicMock(status=200, data=json.dumps(
+            {"choices": [{"message": {"content": "done"}}]}).encode(), headers={})
+
+        def request(method, url, body=None, headers=None, **kw):
+            sent.append(body)
+            return response if len(sent) < 3 else ok
+
+        client = skill.model.client
+        client._http = MagicMock(request=MagicMock(side_effect=request))
+        self.assertEqual(skill.run(), "done")
+        self.assertEqual(len(sent), 3)
+        self.assertIs(sent[0], sent[1])
+        self.assertIs(sent[1], sent[2])
+
+    def test_plain_dict_still_encodes(self):
+        c = BaseClient("k", url="http://x")
+        c._http = MagicMock(request=MagicMock(return_value=MagicMock(status=200, data=b"{}")))
+        c._post("/p", {"a": 1}, {})
+        self.assertEqual(c._http.request.call_args.kwargs["body"], b'{"a": 1}')
+
+
+if __name__ == "__main__":
+    unittest.main()
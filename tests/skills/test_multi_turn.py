@@ -5,11 +5,16 @@ An ``assistant`` turn with no ``parts`` is a "generate here" marker: the model
 produces that turn, the reply is appended to the running context, and later
 turns see it. The last generation uses the skill's output format; intermediate
 ones are plain text. Self-contained — a scripted FakeModel, no network.
+With ``stateful=True`` later turns chain on the provider-stored conversation
+(OpenAI Responses ``previous_response_id``) — real Model, transport mocked.
 """
 
 import json
 import unittest
+from unittest.mock import MagicMock
 
+from yait_aichain.clients import InvalidRequestError, NotFoundError
+from yait_aichain.models import Model
 from yait_aichain.skills import Skill
 
 
@@ -120,6 +125,90 @@ class TestBackwardCompatible(unittest.TestCase):
         self.assertEqual(m.client.i, 1)                    # both users → one call
 
 
+_SCRIPT = [
+    {"role": "system",    "parts": ["Be concise."]},
+    {"role": "user",      "parts": ["10 quotes"]},
+    {"role": "assistant"},
+    {"role": "user",      "parts": ["drop banal"]},
+    {"role": "assistant"},
+    {"role": "user",      "parts": ["translate"]},
+]
+
+
+def _responses_reply(i, text):
+    return json.dumps({
+        "id": f"resp_{i}", "object": "response",
+        "output": [{"type": "message", "role": "assistant",
+                    "content": [{"type": "output_text", "text": text}]}],
+        "usage": {"input_tokens": 10, "output_tokens": 5},
+    }).encode()
+
+
+class TestStatefulConversation(unittest.TestCase):
+
+    def _model(self, name, reply, fail=None, error=None):
+        model, sent = Model(name, api_key="k"), []
+
+        def send(path, body, headers):
+            sent.append(dict(body))
+            if fail is not None and fail(len(sent), body):
+                raise error or NotFoundError(404, "previous response not found")
+            return reply(len(sent), f"turn {len(sent)}")
+
+        model.client.send = MagicMock(side_effect=send)
+        return model, sent
+
+    def test_later_turns_send_only_the_delta(self):
+        model, sent = self._model("gpt-5.4", _responses_reply)
+        out = _skill(model, _SCRIPT, stateful=True).run()
+        self.assertEqual(out, "turn 3")
+        self.assertNotIn("previous_response_id", sent[0])
+        self.assertEqual([b.get("previous_response_id") for b in sent[1:]],
+                         ["resp_1", "resp_2"])
+        # each continuation carries the instructions and one new user turn
+        for body in sent[1:]:
+            self.assertEqual(body["instructions"], "Be concise.")
+            self.assertEqual([m["role"] for m in body["input"]], ["user"])
+        self.assertEqual(sent[2]["input"][0]["content"], "translate")
+
+    def test_off_by_default(self):
+        model, sent = self._model("gpt-5.4", _responses_reply)
+        _skill(model, _SCRIPT).run()
+        self.assertEqual([len(b["input"]) for b in sent], [1, 3, 5])
+
+    def test_stateless_family_resends_everything(self):
+        def reply(i, text):
+            return json.dumps({"content": [{"type": "text", "text": text}],
+                               "usage": {"input_tokens": 1, "output_tokens": 1}}).encode()
+        model, sent = self._model("claude-sonnet-4-6", reply)
+        _skill(model, _SCRIPT, stateful=True).run()
+        self.assertEqual([len(b["messages"]) for b in sent], [1, 3, 5])
+
+    def test_lost_conversation_falls_back_to_full_resend(self):
+        model, sent = self._model(
+            "gpt-5.4", _responses_reply,
+            fail=lambda n, body: body.get("previous_response_id") == "resp_1")
+        self.assertEqual(_skill(model, _SCRIPT, stateful=True).run(), "turn 4")
+        self.assertEqual(len(sent[2]["input"]), 3)            # full resend
+        self.assertEqual(sent[3]["previous_response_id"], "resp_3")
+
+    def test_expired_previous_response_400_falls_back(self):
+        model, sent = self._model(
+            "gpt-5.4", _responses_reply,
+            fail=lambda n, body: body.get("previous_response_id") == "resp_1",
+            error=InvalidRequestError(400, "Previous response with id 'resp_1' not found."))
+        self.assertEqual(_skill(model, _SCRIPT, stateful=True).run(), "turn 4")
+        self.assertEqual(len(sent[2]["input"]), 3)            # full resend
+
+    def test_other_400_is_not_resent(self):
+        model, sent = self._model(
+            "gpt-5.4", _responses_reply, fail=lambda n, body: n == 2,
+            error=InvalidRequestError(400, "Invalid schema for response_format"))
+        with self.assertRaises(InvalidRequestError):
+            _skill(model, _SCRIPT, stateful=True).run()
+        self.assertEqual(len(sent), 2)
+
+
 class TestStructureValidation(unittest.TestCase):
 
     def _bad(self, msgs, frag):
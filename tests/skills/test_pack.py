@@ -0,0 +1,181 @@
+"""
+Prompt micro-batching: Skill.map_batched / Pool(pack=N) pack many items into
+one call with a json_schema results array, split the reply back by index,
+retry missing or malformed items alone and shrink packs to the output budget
+(transport mocked).
+"""
+
+import json
+import os
+import re
+import sys
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from skills import Skill
+from skills._pack import Packer, pack_messages, packed_output
+from pool import Pool, DONE, FAILED
+from clients._errors import AuthenticationError
+from tests.skills._fakes import chat_response, fake_model
+
+_ITEM = re.compile(r"Input (\d+):\n(.*?)(?=\n\nInput \d+:|\Z)", re.S)
+
+
+def _answer(body, drop=(), bad=()):
+    """Reply to one request: a packed listing, or a single item."""
+    text = body["messages"][-1]["content"]
+    if "response_format" not in body:
+        return chat_response(text.upper())
+    results = []
+    for index, item in _ITEM.findall(text):
+        index = int(index)
+        if index in drop:
+            continue
+        results.append({"index": index, "output": 7 if index in bad else item.upper()})
+    return chat_response(json.dumps({"results": results}), output_tokens=5 * len(results))
+
+
+def _model(**answer):
+    return fake_model(send=MagicMock(
+        side_effect=lambda path, body, headers: _answer(body, **answer)))
+
+
+def _skill(model, **kw):
+    return Skill(model=model, input={"messages": [
+        {"role": "system", "parts": ["Shout the text back."]},
+        {"role": "user", "parts": ["{text}"]},
+    ]}, **kw)
+
+
+def _bodies(model):
+    return [c.args[1] for c in model.client.send.call_args_list]
+
+
+class TestPackMessages(unittest.TestCase):
+
+    def test_shared_prefix_once(self):
+        rendered = [[{"role": "system", "parts": [{"type": "text", "text": "S"}]},
+                     {"role": "user", "parts": [{"type": "text", "text": t}]}]
+                    for t in ("a", "b")]
+        packed = pack_messages(rendered)
+        self.assertEqual(len(packed), 2)
+        self.assertIs(packed[0], rendered[0][0])
+        self.assertIn("Input 0:\na\n\nInput 1:\nb", packed[1]["parts"][0]["text"])
+
+    def test_item_schema_follows_the_output(self):
+        schema = {"type": "object", "properties": {"x": {"type": "string"}},
+                  "required": ["x"], "additionalProperties": False}
+        out = packed_output({"modalities": ["text"],
+                             "format": {"type": "json_schema", "schema": schema}})
+        item = out["format"]["schema"]["properties"]["results"]["items"]
+        self.assertEqual(item["properties"]["output"], schema)
+        self.assertFalse(packed_output({"modalities": ["text"],
+                                        "format": {"type": "json"}})["format"]["strict"])
+
+
+class TestMapBatched(unittest.TestCase):
+
+    def test_packs_and_splits(self):
+        model = _model()
+        skill = _skill(model)
+        items = [{"text": f"item {i}"} for i in range(5)]
+        self.assertEqual(skill.map_batched(items, batch_size=3),
+                         [f"ITEM {i}" for i in range(5)])
+        bodies = _bodies(model)
+        self.assertEqual(len(bodies), 2)
+        self.assertEqual(bodies[0]["response_format"]["type"], "json_schema")
+        self.assertEqual([m["role"] for m in bodies[0]["messages"]], ["system", "user"])
+        self.assertEqual(skill.last_usage.input_tokens, 6)        # 3 per call
+
+    def test_missing_and_malformed_items_retried_alone(self):
+        model = _model(drop={1}, bad={2})
+        skill = _skill(model)
+        items = [{"text": f"item {i}"} for i in range(4)]
+        self.assertEqual(skill.map_batched(items, batch_size=4),
+                         ["ITEM 0", "ITEM 1", "ITEM 2", "ITEM 3"])
+        singles = [b for b in _bodies(model) if "response_format" not in b]
+        self.assertEqual([b["messages"][-1]["content"] for b in singles],
+                         ["item 1", "item 2"])
+
+    def test_unreadable_pack_falls_back_and_shrinks(self):
+        model = _model()
+        model.client.send.side_effect = lambda path, body, headers: (
+            chat_response("{\"results\": [") if "response_format" in body
+            else chat_response(body["messages"][-1]["content"].upper()))
+        packer = Packer(_skill(model), [{"text": "a"}, {"text": "b"}], 20)
+        packer.run_pack(*packer.next_pack())
+        self.assertEqual(packer.results, ["A", "B"])
+        self.assertEqual(packer.item_tokens, 400)
+
+    def test_shared_prompt_counted_once_against_the_context_window(self):
+        model = _model()
+        model.max_tokens = 10_000               # the output budget allows all 10
+        skill = Skill(model=model, input={"messages": [
+            {"role": "system", "parts": ["Shout the text back. " * 500]},
+            {"role": "user", "parts": ["{text}"]},
+        ]})
+        one = model.count_tokens(skill._template().render({"text": "0"}))
+        model.context_window = 10_000 + int(one * 1.5 / 0.8)
+        positions, _ = Packer(skill, [{"text": str(i)} for i in range(10)], 10).next_pack()
+        self.assertEqual(len(positions), 10)
+
+    def test_pack_size_respects_output_budget(self):
+        model = _model()
+        model.max_tokens = 1000                 # 800 usable / 200 per item
+        skill = _skill(model)
+        skill.map_batched([{"text": str(i)} for i in range(10)], batch_size=50)
+        self.assertEqual(len(_bodies(model)), 3)     # 4 + 4 + 2
+
+    def test_error_raises(self):
+        model = _model()
+        model.client.send.side_effect = AuthenticationError(401, "bad key")
+        with self.assertRaises(AuthenticationError):
+            _skill(model).map_batched([{"text": "a"}])
+
+    def test_multi_turn_cannot_pack(self):
+        skill = Skill(model=_model(), input={"messages": [
+            {"role": "user", "parts": ["a"]}, {"role": "assistant"},
+            {"role": "user", "parts": ["b"]}]})
+        with self.assertRaises(ValueError):
+            skill.map_batched([{}])
+
+
+class TestAmapBatched(unittest.IsolatedAsyncioTestCase):
+
+    async def test_packs(self):
+        model = fake_model(asend=AsyncMock(
+            side_effect=lambda path, body, headers: _answer(body, drop={0})))
+        result = await _skill(model).amap_batched([{"text": "a"}, {"text": "b"}])
+        self.assertEqual(result, ["A", "B"])
+        self.assertEqual(model.client.asend.await_count, 2)
+
+
+class TestPoolPack(unittest.TestCase):
+
+    def test_pool_packs(self):
+        model = _model(drop={0})
+        pool = Pool(_skill(model), items=[{"text": f"t{i}"} for i in range(6)],
+                    pack=3, max_flows=2)
+        self.assertEqual(pool.run(), [f"T{i}" for i in range(6)])
+        self.assertEqual(pool.status[DONE], 6)
+        self.assertEqual(len(_bodies(model)), 4)     # 2 packs + item 0 of each alone
+
+    def test_pool_collects_errors(self):
+        model = _model()
+        model.client.send.side_effect = AuthenticationError(401, "bad key")
+        pool = Pool(_skill(model), items=[{"text": "a"}, {"text": "b"}], pack=2)
+        self.assertEqual(pool.run(), [None, None])
+        self.assertEqual(pool.status[FAILED], 2)
+        self.assertIn("bad key", pool.history[0]["error"])
+
+    def test_pack_needs_a_skill(self):
+        with self.assertRaises(ValueError):
+            Pool(lambda: None, items=[{}], pack=2)
+        with self.assertRaises(ValueError):
+            Pool(_skill(_model()), items=[{}], pack=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
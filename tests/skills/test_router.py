@@ -0,0 +1,115 @@
+"""
+Routing: Router orders a Skill's fallback chain per call from the shared
+EWMA latency / error-rate / cost averages that every Skill call feeds
+(transport mocked).
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from skills import Router, _stats
+from clients._errors import ServerError
+from tests.skills._fakes import chat_skill, fake_model
+from yait_aichain import Event
+
+
+def _ended(name, duration=1.0, cost=None, error=None):
+    _stats.observe_call(Event(type="llm_call.ended", name=name, duration=duration,
+                              cost=cost, error=error))
+
+
+def _names(models):
+    return [m.name for m in models]
+
+
+class TestRouter(unittest.TestCase):
+
+    def setUp(self):
+        _stats._health.clear()
+        self.a, self.b, self.c = (fake_model("gpt-4o"), fake_model("gpt-4o-mini"),
+                                  fake_model("gpt-4.1"))
+
+    def tearDown(self):
+        _stats._health.clear()
+        _stats._latency.clear()
+
+    def test_latency_policy(self):
+        _ended("gpt-4o", 3.0)
+        _ended("gpt-4o-mini", 1.0)
+        _ended("gpt-4.1", 2.0)
+        self.assertEqual(_names(Router().order([self.a, self.b, self.c])),
+                         ["gpt-4o-mini", "gpt-4.1", "gpt-4o"])
+
+    def test_errors_inflate_expected_latency(self):
+        _ended("gpt-4o", 1.0)
+        _ended("gpt-4o", error="503 busy")
+        _ended("gpt-4o-mini", 1.1)
+        self.assertEqual(_names(Router().order([self.a, self.b])), ["gpt-4o-mini", "gpt-4o"])
+
+    def test_unmeasured_models_first_and_failing_last(self):
+        _ended("gpt-4o", error="503 busy")
+        _ended("gpt-4o-mini", 0.5)
+        self.assertEqual(_names(Router().order([self.a, self.b, self.c])),
+                         ["gpt-4.1", "gpt-4o-mini", "gpt-4o"])
+
+    def test_cost_under_sla(self):
+        _ended("gpt-4o", 1.0, cost=0.010)
+        _ended("gpt-4o-mini", 5.0, cost=0.001)     # cheapest but over the SLA
+        _ended("gpt-4.1", 2.0, cost=0.005)
+        order = Router("cost", sla=3.0).order([self.a, self.b, self.c])
+        self.assertEqual(_names(order), ["gpt-4.1", "gpt-4o", "gpt-4o-mini"])
+        order = Router("cost").order([self.a, self.b, self.c])
+        self.assertEqual(_names(order), ["gpt-4o-mini", "gpt-4.1", "gpt-4o"])
+
+    def test_weighted_round_robin(self):
+        router = Router("round_robin", weights={"gpt-4o": 3})
+        firsts = [router.order([self.a, self.b])[0].name for _ in range(8)]
+        self.assertEqual(firsts.count("gpt-4o"), 6)
+        self.assertEqual(firsts.count("gpt-4o-mini"), 2)
+
+    def test_ewma(self):
+        for seconds in (1.0, 2.0):
+            _ended("gpt-4o", seconds)
+        health = _stats.model_health("gpt-4o")
+        self.assertAlmostEqual(health["latency"], 1.2)
+        self.assertEqual(health["calls"], 2)
+        self.assertIsNone(_stats.model_health("gpt-4.1"))
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            Router("fastest")
+
+
+class TestSkillRoute(unittest.TestCase):
+
+    def setUp(self):
+        _stats._health.clear()
+
+    def tearDown(self):
+        _stats._health.clear()
+        _stats._latency.clear()
+
+    def test_degraded_primary_loses_first_attempts(self):
+        primary = fake_model("gpt-4o", MagicMock(side_effect=ServerError(503, "busy")))
+        backup  = fake_model("gpt-4o-mini")
+        skill = chat_skill([primary, backup], route="latency")
+        self.assertEqual(skill.run(), "gpt-4o-mini")     # falls back, both measured
+        self.assertEqual(skill.run(), "gpt-4o-mini")
+        self.assertEqual(primary.client.send.call_count, 1)
+        self.assertIs(skill.model, primary)               # the declared primary is unchanged
+
+    def test_skills_share_what_they_learn(self):
+        broken = fake_model("gpt-4o", MagicMock(side_effect=ServerError(503, "busy")))
+        first = chat_skill(broken)
+        with self.assertRaises(ServerError):
+            first.run()
+        second = chat_skill([fake_model("gpt-4o"), fake_model("gpt-4o-mini")], route=Router())
+        self.assertEqual(second.run(), "gpt-4o-mini")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+Semantic cache: Skill(semantic_cache=SemanticCache(embedder)) answers a run
+from an earlier one whose user turns embed close enough — per-skill
+namespaces, system-prompt partitions, TTL / LRU eviction, SQLite persistence
+and hit-rate / latency-saved counters (transport and embedder faked).
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from skills import SemanticCache, Skill
+from tests.skills._fakes import chat_response, fake_model
+
+# Words that mean the same thing embed to the same axis.
+_SYNONYMS = {"how": "how", "reset": "reset", "change": "reset", "password": "password",
+             "pass": "password", "my": "my", "i": "i", "do": "do", "can": "do",
+             "weather": "weather", "today": "today"}
+_AXES = sorted(set(_SYNONYMS.values()))
+
+
+class _Result:
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+
+
+class _Embedder:
+    """Bag-of-words vectors over a tiny synonym vocabulary."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed(self, texts, **_):
+        self.calls += 1
+        out = []
+        for text in texts:
+            words = [_SYNONYMS.get(w.strip("?.,!").lower()) for w in text.split()]
+            out.append([float(words.count(axis)) for axis in _AXES] + [0.1])
+        return _Result(out)
+
+
+def _model(*answers):
+    return fake_model(send=MagicMock(side_effect=[chat_response(a) for a in answers]))
+
+
+def _skill(model, cache, system="Be brief.", **kw):
+    return Skill(model=model, input={"messages": [
+        {"role": "system", "parts": [system]},
+        {"role": "user", "parts": ["{q}"]},
+    ]}, semantic_cache=cache, **kw)
+
+
+class TestSemanticCache(unittest.TestCase):
+
+    def setUp(self):
+        self.embedder = _Embedder()
+        self.cache = SemanticCache(self.embedder, threshold=0.9)
+
+    def test_paraphrase_hits(self):
+        model = _model("Use the reset link.")
+        skill = _skill(model, self.cache)
+        self.assertEqual(skill.run({"q": "How do I reset my password?"}), "Use the reset link.")
+        self.assertEqual(skill.run({"q": "how can I change my pass"}), "Use the reset link.")
+        self.assertEqual(model.client.send.call_count, 1)
+        self.assertEqual(skill.history, ["Use the reset link."])
+        self.assertFalse(skill.last_usage)
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stores"]), (1, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertGreater(stats["seconds_saved"], 0)
+
+    def test_normalised_repeat_skips_the_embedder(self):
+        skill = _skill(_model("a"), self.cache)
+        skill.run({"q": "How do I reset my password?"})
+        calls = self.embedder.calls
+        self.assertEqual(skill.run({"q": "  how do i RESET my   password?"}), "a")
+        self.assertEqual(self.embedder.calls, calls)
+
+    def test_dissimilar_prompt_misses(self):
+        model = _model("reset answer", "weather answer")
+        skill = _skill(model, self.cache)
+        skill.run({"q": "How do I reset my password?"})
+        self.assertEqual(skill.run({"q": "weather today"}), "weather answer")
+        self.assertEqual(model.client.send.call_count, 2)
+
+    def test_namespaces_and_partitions(self):
+        _skill(_model("first"), self.cache, name="a").run({"q": "reset my password"})
+        other = _model("other skill", "other system")
+        self.assertEqual(_skill(other, self.cache, name="b").run({"q": "reset my password"}),
+                         "other skill")
+        self.assertEqual(_skill(other, self.cache, name="a", system="Be chatty.")
+                         .run({"q": "reset my password"}), "other system")
+        self.assertEqual(len(self.cache), 3)
+
+    def test_changed_model_settings_miss(self):
+        model = _model("long answer", "short answer")
+        skill = _skill(model, self.cache)
+        skill.run({"q": "reset my password"})
+        model.max_tokens = 100
+        self.assertEqual(skill.run({"q": "reset my password"}), "short answer")
+        self.assertEqual(model.client.send.call_count, 2)
+
+    def test_hit_returns_a_copy(self):
+        model = _model('{"steps": [1]}')
+        skill = _skill(model, self.cache, output={"format": {"type": "json"}})
+        skill.run({"q": "reset my password"})["steps"].append(2)
+        self.assertEqual(skill.run({"q": "reset my password"}), {"steps": [1]})
+
+    def test_ttl_expires(self):
+        cache = SemanticCache(self.embedder, threshold=0.9, ttl=0.01)
+        model = _model("one", "two")
+        skill = _skill(model, cache)
+        skill.run({"q": "reset my password"})
+        time.sleep(0.02)
+        self.assertEqual(skill.run({"q": "reset my password"}), "two")
+
+    def test_lru_eviction(self):
+        cache = SemanticCache(self.embedder, threshold=0.9, max_entries=1)
+        model = _model("reset", "weather", "reset again")
+        skill = _skill(model, cache)
+        skill.run({"q": "reset my password"})
+        skill.run({"q": "weather today"})
+        self.assertEqual(skill.run({"q": "reset my password"}), "reset again")
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+    def test_embedding_failure_falls_through(self):
+        self.embedder.embed = MagicMock(side_effect=RuntimeError("embedder down"))
+        events = []
+        skill = _skill(_model("a"), self.cache, hooks=[events.append])
+        self.assertEqual(skill.run({"q": "reset my password"}), "a")
+        miss = [e for e in events if e.type == "semantic_cache.miss"]
+        self.assertEqual(miss[0].error, "embedder down")
+        self.assertEqual(len(self.cache), 0)
+
+    def test_media_prompt_is_not_cached(self):
+        skill = Skill(model=_model("a"), semantic_cache=self.cache, input={"messages": [
+            {"role": "user", "parts": [
+                {"type": "image", "source": {"kind": "url", "url": "https://x/y.png"}},
+                {"type": "text", "text": "describe"}]}]})
+        self.assertIsNone(skill._semantic_scope(skill._input["messages"]))
+        self.assertEqual(self.embedder.calls, 0)
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sem", "cache.db")
+            _skill(_model("stored"), SemanticCache(self.embedder, 0.9, path=path)) \
+                .run({"q": "reset my password"})
+            reopened = SemanticCache(self.embedder, 0.9, path=path)
+            model = _model("unused")
+            self.assertEqual(_skill(model, reopened).run({"q": "change my pass"}), "stored")
+            model.client.send.assert_not_called()
+            reopened.clear()
+            self.assertEqual(len(SemanticCache(self.embedder, 0.9, path=path)), 0)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            SemanticCache(self.embedder, threshold=0)
+        with self.assertRaises(ValueError):
+            SemanticCache(self.embedder, max_entries=0)
+
+
+class TestSemanticCacheAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_arun_hits(self):
+        cache = SemanticCache(_Embedder(), threshold=0.9)
+        model = fake_model(asend=AsyncMock(return_value=chat_response("async")))
+        skill = _skill(model, cache)
+        self.assertEqual(await skill.arun({"q": "reset my password"}), "async")
+        self.assertEqual(await skill.arun({"q": "change my pass"}), "async")
+        self.assertEqual(model.client.asend.await_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
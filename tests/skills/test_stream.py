@@ -0,0 +1,169 @@
+"""
+Skill.stream(): text deltas through the family stream decoders, usage /
+history / hooks filled at the end, retry and fallback before the first delta
+only, and multi-turn skills streaming just the final turn (transport mocked).
+"""
+
+import contextvars
+import json
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from skills import Skill
+from models import Model
+from clients._errors import (AuthenticationError, DeadlineExceededError, NetworkError,
+                             ServerError)
+from yait_aichain._deadline import deadline_at
+from yait_aichain._events import _active_hooks
+from yait_aichain.clients._sink import download_target
+from tests.skills._fakes import chat_skill
+
+
+def _chat_sse(*pieces, tokens=3) -> list:
+    chunks = [b"data: " + json.dumps({"choices": [{"index": 0, "delta": {"content": p}}]}).encode()
+              + b"\n\n" for p in pieces]
+    chunks.append(b"data: " + json.dumps({"choices": [], "usage": {
+        "prompt_tokens": tokens, "completion_tokens": len(pieces)}}).encode() + b"\n\n")
+    chunks.append(b"data: [DONE]\n\n")
+    return chunks
+
+
+def _failing_after(chunks, exc):
+    yield from chunks
+    raise exc
+
+
+def _model(*streams):
+    m = Model("gpt-4o", api_key="k")
+    m.client._auth_headers = MagicMock(return_value={})
+    m.client._post_stream = MagicMock(side_effect=[iter(s) if isinstance(s, list) else s
+                                                   for s in streams])
+    m.client._post = MagicMock(side_effect=AssertionError("non-streaming path used"))
+    return m
+
+
+def _skill(model, **kw):
+    return chat_skill(model, "Say {word}", variables={"word": "hi"}, **kw)
+
+
+def _consume(gen):
+    deltas = []
+    while True:
+        try:
+            deltas.append(next(gen))
+        except StopIteration as stop:
+            return deltas, stop.value
+
+
+class TestSkillStream(unittest.TestCase):
+
+    def test_yields_deltas_and_returns_result(self):
+        m = _model(_chat_sse("Hel", "lo"))
+        skill = _skill(m)
+        deltas, result = _consume(skill.stream())
+        self.assertEqual(deltas, ["Hel", "lo"])
+        self.assertEqual(result, "Hello")
+        self.assertEqual(skill.history, ["Hello"])
+        self.assertEqual(skill.last_usage.input_tokens, 3)
+        self.assertEqual(skill.last_usage.output_tokens, 2)
+        path, body, _ = m.client._post_stream.call_args[0]
+        self.assertEqual(path, "/v1/chat/completions")
+        self.assertTrue(body["stream"])
+        self.assertEqual(body["messages"][0]["content"], "Say hi")
+
+    def test_hooks_fire_at_end(self):
+        seen = []
+        skill = _skill(_model(_chat_sse("ok")), hooks=[seen.append])
+        _consume(skill.stream())
+        self.assertEqual([e.type for e in seen], ["llm_call.started", "llm_call.ended"])
+        self.assertEqual(seen[-1].usage, 4)
+
+    def test_json_output_is_parsed_at_end(self):
+        m = _model(_chat_sse('{"a"', ": 1}"))
+        skill = chat_skill(m, "x", output={"modalities": ["text"], "format": {"type": "json"}})
+        self.assertEqual(_consume(skill.stream()), (['{"a"', ": 1}"], {"a": 1}))
+
+    def test_retries_before_first_delta(self):
+        m = _model(_failing_after([], ServerError(503, "busy")), _chat_sse("ok"))
+        deltas, result = _consume(_skill(m).stream(max_retries=1, retry_delay=0))
+        self.assertEqual((deltas, result), (["ok"], "ok"))
+        self.assertEqual(m.client._post_stream.call_count, 2)
+
+    def test_falls_back_before_first_delta(self):
+        first  = _model(_failing_after([], NetworkError(0, "reset")))
+        second = _model(_chat_sse("backup"))
+        self.assertEqual(_consume(_skill([first, second]).stream())[1], "backup")
+
+    def test_failure_after_first_delta_is_not_retried(self):
+        seen = []
+        m = _model(_failing_after(_chat_sse("par")[:1], NetworkError(0, "reset")),
+                   _chat_sse("never"))
+        gen = _skill(m, max_retries=3, retry_delay=0, hooks=[seen.append]).stream()
+        self.assertEqual(next(gen), "par")
+        with self.assertRaises(NetworkError):
+            next(gen)
+        self.assertEqual(m.client._post_stream.call_count, 1)
+        self.assertIn("reset", seen[-1].error)
+
+    def test_non_transient_error_propagates(self):
+        m = _model(_failing_after([], AuthenticationError(401, "bad key")))
+        with self.assertRaises(AuthenticationError):
+            _consume(_skill(m).stream())
+
+    def test_multi_turn_streams_final_turn_only(self):
+        m = _model(_chat_sse("final"))
+        m.client._post = MagicMock(return_value=json.dumps({
+            "choices": [{"message": {"content": "draft"}}],
+            "usage": {"prompt_tokens": 2, "completion_tokens": 1}}).encode())
+        skill = Skill(model=m, input={"messages": [
+            {"role": "user", "parts": ["Draft it"]},
+            {"role": "assistant"},
+            {"role": "user", "parts": ["Improve it"]},
+        ]})
+        self.assertEqual(_consume(skill.stream()), (["final"], "final"))
+        self.assertEqual(skill.history, ["draft", "final"])
+        self.assertEqual(skill.last_usage.input_tokens, 5)
+        m.client._post.assert_called_once()
+
+    def test_image_output_rejected(self):
+        skill = chat_skill(_model(), "x", output={"modalities": ["image"]})
+        with self.assertRaises(ValueError):
+            next(skill.stream())
+
+
+class TestStreamScopes(unittest.TestCase):
+    """Run-scoped context (deadline, hooks, save_to) never spans a yield."""
+
+    def test_deadline_not_active_between_deltas(self):
+        gen = _skill(_model(_chat_sse("a", "b"))).stream(deadline=30)
+        self.assertEqual(next(gen), "a")
+        self.assertIsNone(deadline_at())
+        self.assertEqual(_consume(gen), (["b"], "ab"))
+
+    def test_hooks_and_save_to_not_active_between_deltas(self):
+        skill = _skill(_model(_chat_sse("a", "b")), hooks=[lambda e: None],
+                       output={"save_to": lambda name, data: None})
+        gen = skill.stream()
+        self.assertEqual(next(gen), "a")
+        self.assertEqual(_active_hooks.get(), ())
+        self.assertIsNone(download_target())
+        self.assertEqual(_consume(gen), (["b"], "ab"))
+
+    def test_closed_in_another_context(self):
+        gen = _skill(_model(_chat_sse("a", "b"))).stream(deadline=30)
+        next(gen)
+        contextvars.copy_context().run(gen.close)       # no token-reset error
+
+    def test_expired_deadline_still_stops_the_stream(self):
+        gen = _skill(_model(_chat_sse("a"))).stream(deadline=0)
+        with self.assertRaises(DeadlineExceededError):
+            next(gen)
+
+
+if __name__ == "__main__":
+    unittest.main()
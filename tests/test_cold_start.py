@@ -0,0 +1,101 @@
+"""
+Cold start: ``import yait_aichain`` leaves Chain / Pool / Agent and the tool
+groups unloaded until first use, and the provider registry is served from a
+marshal cache keyed by the TOML files' mtime.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
+
+from yait_aichain.models import _data
+
+
+def _run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, check=True,
+        capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": os.path.abspath(ROOT)},
+    ).stdout.strip()
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_skill_import_leaves_the_rest_unloaded(self):
+        out = _run(
+            "import sys\n"
+            "from yait_aichain import Model, Skill\n"
+            "print(sorted(m for m in ('yait_aichain.chain', 'yait_aichain.pool',\n"
+            "      'yait_aichain.agent', 'yait_aichain.tools.search',\n"
+            "      'yait_aichain.tools.mcp') if m in sys.modules))"
+        )
+        self.assertEqual(out, "[]")
+
+    def test_lazy_names_resolve(self):
+        out = _run(
+            "import yait_aichain, yait_aichain.tools as tools\n"
+            "from yait_aichain import Chain, Pool, Agent, DONE\n"
+            "from yait_aichain.tools import searchBrave, VectorDB\n"
+            "print(Chain.__name__, Pool.__name__, Agent.__name__, DONE,\n"
+            "      searchBrave.__name__, yait_aichain.chain.Chain is Chain,\n"
+            "      set(tools.__all__) <= set(dir(tools)), 'Agent' in dir(yait_aichain))"
+        )
+        self.assertEqual(out, "Chain Pool Agent 2 searchBrave True True True")
+
+    def test_star_import_exports_lazy_names(self):
+        out = _run(
+            "from yait_aichain import *\n"
+            "print(Chain.__name__, Pool.__name__, Agent.__name__, PENDING, RUNNING,\n"
+            "      DONE, FAILED, Skill.__name__, APIError.__name__)"
+        )
+        self.assertEqual(out, "Chain Pool Agent 0 1 2 3 Skill APIError")
+
+    def test_unknown_attribute(self):
+        import yait_aichain
+        import yait_aichain.tools
+        with self.assertRaises(AttributeError):
+            yait_aichain.Nope
+        with self.assertRaises(AttributeError):
+            yait_aichain.tools.searchNope
+
+
+class TestRegistryCache(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        for p in (patch.object(sys, "pycache_prefix", tmp.name),
+                  patch.object(sys, "dont_write_bytecode", False)):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_cache_round_trip(self):
+        self.assertFalse(os.path.exists(_data._cache_path()))
+        providers = _data._load()
+        self.assertTrue(os.path.exists(_data._cache_path()))
+        with patch.object(_data, "_parse", side_effect=AssertionError("re-parsed")):
+            self.assertEqual(_data._load(), providers)
+
+    def test_changed_source_invalidates(self):
+        _data._load()
+        sources = _data._sources()
+        changed = [(sources[0][0], sources[0][1] + 1, sources[0][2])] + sources[1:]
+        with patch.object(_data, "_sources", return_value=changed), \
+                patch.object(_data, "_parse", return_value={"fresh": {}}) as parse:
+            self.assertEqual(_data._load(), {"fresh": {}})
+        parse.assert_called_once_with(changed)
+
+    def test_no_write_when_bytecode_disabled(self):
+        with patch.object(sys, "dont_write_bytecode", True):
+            self.assertEqual(_data._load(), _data.PROVIDERS)
+        self.assertFalse(os.path.exists(_data._cache_path()))
+
+
+if __name__ == "__main__":
+    unittest.main()
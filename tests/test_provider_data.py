@@ -21,7 +21,9 @@ for _k in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_AI_API_KEY",
            "MOONSHOT_API_KEY", "DASHSCOPE_API_KEY"):
     os.environ.setdefault(_k, "test-key")
 
-from yait_aichain.models._data import PROVIDERS, provider_of
+from yait_aichain.models._data import (
+    MODELS, PROVIDER_MODELS, PROVIDERS, TASK_MODELS, TASK_PROVIDERS, provider_of,
+)
 
 
 _PROVIDER_KEYS = {"openai", "anthropic", "google", "xai",
@@ -98,6 +100,30 @@ class TestProviderDataConsistency(unittest.TestCase):
         self.assertEqual(provider_of("deepseek-chat"), "deepseek")
         self.assertIsNone(provider_of("nonexistent-model-xyz"))
 
+    def test_index_matches_the_data(self):
+        scanned = {name: (prov, mdl.get("price"), frozenset(mdl.get("caps", [])))
+                   for prov, data in PROVIDERS.items()
+                   for name, mdl in data.get("models", {}).items()}
+        self.assertEqual({n: (e.provider, e.price, e.caps) for n, e in MODELS.items()},
+                         scanned)
+        for prov, names in PROVIDER_MODELS.items():
+            self.assertEqual(list(names), sorted(PROVIDERS[prov].get("models", {})))
+        for task, names in TASK_MODELS.items():
+            self.assertEqual(set(names), {n for n, s in scanned.items() if task in s[2]})
+            self.assertEqual(set(TASK_PROVIDERS[task]), {MODELS[n].provider for n in names})
+
+    def test_registry_queries_use_the_index(self):
+        from yait_aichain.models import registry
+        self.assertEqual(registry.models(provider="deepseek"),
+                         sorted(PROVIDERS["deepseek"]["models"]))
+        self.assertIn("gpt-4o", registry.models(task="image-to-text"))
+        self.assertNotIn("dall-e-3", registry.models(task="text-to-text"))
+        self.assertEqual(registry.models(), sorted(MODELS))
+        self.assertIn("recraft", registry.providers(task="text-to-image"))
+        self.assertNotIn("recraft", registry.providers(task="text-to-text"))
+        self.assertEqual(registry.tasks("nonexistent-model-xyz"), [])
+        self.assertFalse(registry.is_supported("dall-e-3", "text-to-text"))
+
 
 if __name__ == "__main__":
     unittest.main()
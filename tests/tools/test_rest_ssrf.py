@@ -25,14 +25,14 @@ class TestRestApiSSRF(unittest.TestCase):
 
     def test_metadata_ip_blocked(self):
         tool = _tool("http://169.254.169.254/latest/meta-data/")
-        tool._http.request = MagicMock()           # must never be reached
+        tool._http = MagicMock()                   # must never be reached
         with self.assertRaises(ValueError):
             tool.run()
         tool._http.request.assert_not_called()
 
     def test_loopback_blocked(self):
         tool = _tool("http://127.0.0.1:8080/admin")
-        tool._http.request = MagicMock()
+        tool._http = MagicMock()
         with self.assertRaises(ValueError):
             tool.run()
         tool._http.request.assert_not_called()
@@ -41,7 +41,7 @@ class TestRestApiSSRF(unittest.TestCase):
         os.environ["AICHAIN_ALLOW_PRIVATE_URLS"] = "1"
         tool = _tool("http://127.0.0.1:8080/admin")
         resp = MagicMock(status=200, data=b"{}")
-        tool._http.request = MagicMock(return_value=resp)
+        tool._http = MagicMock(**{"request.return_value": resp})
         tool.run()                                  # no SSRF error → request made
         tool._http.request.assert_called_once()
 
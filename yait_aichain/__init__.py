@@ -43,9 +43,6 @@ _logging.getLogger("yait_aichain").addHandler(_logging.NullHandler())
 from .models import Model                                          # noqa: F401
 from .models._usage import Usage                                   # noqa: F401
 from .skills import Skill                                          # noqa: F401
-from .chain  import Chain                                          # noqa: F401
-from .pool   import Pool, PENDING, RUNNING, DONE, FAILED          # noqa: F401
-from .agent  import Agent                                          # noqa: F401
 
 # Observability events & lifecycle hooks (1.4.4).
 from ._events import Event, Hook, Tracer, LoggingTracer            # noqa: F401
@@ -64,4 +61,53 @@ from .clients import (                                             # noqa: F401
     NotFoundError,
     ServerError,
     TaskFailedError,
+    DeadlineExceededError,
+    ContextWindowExceededError,
 )
+
+# ── Lazily imported ────────────────────────────────────────────────────────────
+# Chain, Pool and Agent (and the tool layer Agent pulls in) load on first use,
+# so a handler that only runs a Skill does not pay for them at cold start.
+
+import importlib as _importlib
+
+_LAZY = {
+    "Chain":   ".chain",
+    "Pool":    ".pool",
+    "PENDING": ".pool",
+    "RUNNING": ".pool",
+    "DONE":    ".pool",
+    "FAILED":  ".pool",
+    "Agent":   ".agent",
+}
+
+# ``from yait_aichain import *`` exports the eager names and, through
+# ``__getattr__``, the lazy ones.
+__all__ = [
+    "Model", "Usage", "Skill",
+    "Event", "Hook", "Tracer", "LoggingTracer", "PermissionPolicy",
+    "APIError", "NetworkError", "RateLimitError", "AuthenticationError",
+    "InsufficientCreditsError", "InvalidRequestError", "NotFoundError", "ServerError",
+    "TaskFailedError", "DeadlineExceededError", "ContextWindowExceededError",
+    *_LAZY,
+]
+
+# Subpackages reachable as attributes (``yait_aichain.tools``) without an
+# explicit ``import yait_aichain.tools``.
+_SUBPACKAGES = frozenset({"agent", "chain", "clients", "models", "pool",
+                          "skills", "state", "tools"})
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(_importlib.import_module(_LAZY[name], __name__), name)
+    elif name in _SUBPACKAGES:
+        value = _importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value          # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY) | _SUBPACKAGES)
@@ -0,0 +1,107 @@
+"""
+yait_aichain._deadline — run-level time budgets
+===============================================
+
+``Skill.run``, ``Chain.run`` and ``Agent.run`` (and their ``arun`` /
+``resume`` siblings) take ``deadline=`` — seconds the whole run may take.
+Without one, the per-attempt HTTP read timeout (600 s), urllib3's retries,
+Skill retries and fallbacks and every nested step multiply into runs of many
+minutes.
+
+The deadline is held in a context variable, like the active hooks of
+``hook_scope``: set once at the entry point, it reaches every nested step,
+Skill and HTTP request of the run — including Pool worker threads and
+``asyncio`` tasks, which copy the context.  A nested ``deadline=`` can only
+tighten the budget, never extend it.
+
+Consumers:
+
+* ``BaseClient`` caps each request's connect / read timeout to the time left
+  and stops urllib3 / asyncio transport retries at the deadline;
+* ``Skill`` refuses to start an attempt, retry or fallback past it;
+* ``Chain`` and ``Agent`` check it before every step.
+
+Each raises :class:`~clients.DeadlineExceededError` instead of starting work
+that cannot finish in time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import time
+
+from .clients._errors import DeadlineExceededError
+
+_deadline: "contextvars.ContextVar[float | None]" = contextvars.ContextVar(
+    "yait_aichain_deadline", default=None)
+
+
+def deadline_scope(seconds: "float | None"):
+    """
+    Give the enclosed block *seconds* from now to finish.
+
+    ``None`` leaves the enclosing deadline (if any) in effect; a deadline
+    later than the enclosing one is ignored.
+    """
+    return deadline_until(deadline_after(seconds))
+
+
+def deadline_after(seconds: "float | None") -> "float | None":
+    """*seconds* from now as a ``time.monotonic()`` value (``None`` stays ``None``)."""
+    if seconds is None:
+        return None
+    if seconds < 0:
+        raise ValueError(f"deadline must be >= 0 seconds; got {seconds!r}")
+    return time.monotonic() + seconds
+
+
+@contextlib.contextmanager
+def deadline_until(at: "float | None"):
+    """
+    :func:`deadline_scope` for an absolute deadline *at* (a
+    ``time.monotonic()`` value, e.g. from :func:`deadline_after`).
+
+    A generator that yields to its caller re-enters the scope around each
+    piece of its own work, so the deadline never covers the caller's code.
+    """
+    if at is None:
+        yield
+        return
+    current = _deadline.get()
+    if current is not None and current <= at:
+        yield
+        return
+    token = _deadline.set(at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def deadline_at() -> "float | None":
+    """The active deadline as a ``time.monotonic()`` value, or ``None``."""
+    return _deadline.get()
+
+
+def remaining() -> "float | None":
+    """Seconds left before the active deadline (may be negative), or ``None``."""
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+def check_deadline(what: str, need: float = 0.0) -> None:
+    """
+    Raise ``DeadlineExceededError`` unless more than *need* seconds are left
+    for *what* (e.g. ``"retry of gpt-4o"`` after a *need*-second backoff).
+    """
+    left = remaining()
+    if left is not None and left <= need:
+        raise DeadlineExceededError(
+            f"Deadline exceeded: no time left for {what}"
+            + (f" ({max(left, 0.0):.1f}s left, {need:.1f}s needed)." if need else ".")
+        )
+
+
+__all__ = ["deadline_scope", "deadline_after", "deadline_until", "deadline_at",
+           "remaining", "check_deadline"]
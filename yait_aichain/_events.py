@@ -28,6 +28,8 @@ in the application (or the product).
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import logging
 import time
 from dataclasses import dataclass, field
@@ -148,4 +150,34 @@ def emit(hooks: "Iterable[Callable[[Event], None]] | None", event: "Event") -> N
             _log.debug("hook %r failed on %s: %s", hook, event.type, exc)
 
 
-__all__ = ["Event", "Hook", "Tracer", "LoggingTracer", "emit"]
+# Hooks of the innermost Skill / Agent call in progress, for events raised
+# below the step boundary (the transport has no hooks of its own).
+_active_hooks: "contextvars.ContextVar[tuple]" = contextvars.ContextVar(
+    "yait_aichain_active_hooks", default=())
+
+
+@contextlib.contextmanager
+def hook_scope(hooks: "Iterable[Callable[[Event], None]] | None"):
+    """
+    Make *hooks* the target of :func:`emit_active` for the enclosed block.
+
+    With no hooks the enclosing scope (if any) stays in effect, so a hook-less
+    Skill run inside an Agent still reports to the Agent's hooks.
+    """
+    if not hooks:
+        yield
+        return
+    token = _active_hooks.set(tuple(hooks))
+    try:
+        yield
+    finally:
+        _active_hooks.reset(token)
+
+
+def emit_active(event: "Event") -> None:
+    """Dispatch *event* to the hooks of the current :func:`hook_scope`."""
+    emit(_active_hooks.get(), event)
+
+
+__all__ = ["Event", "Hook", "Tracer", "LoggingTracer", "emit",
+           "hook_scope", "emit_active"]
@@ -14,6 +14,10 @@ in the text — a JSON example (``{"a": 1}``), an empty ``{}``, an unbalanced
 else — unknown placeholders, format specs (``{x:>10}``), conversions
 (``{x!r}``), attribute/index access, literal braces of any kind — is left
 intact.  No escaping syntax is needed or honoured: ``{{`` stays ``{{``.
+
+``Template`` parses a text once into literal and slot segments, so a
+template rendered on every run (a Skill's input) pays for the regex scan a
+single time; rendering is then one ``str.format`` call in C.
 """
 
 from __future__ import annotations
@@ -26,6 +30,39 @@ import re
 _PLACEHOLDER_RE = re.compile(r"(?<!\{)\{([A-Za-z_][A-Za-z0-9_]*)\}(?!\})")
 
 
+class Template:
+    """
+    A text parsed once into literal and ``{name}`` slot segments.
+
+    ``names`` is the set of placeholders the text references;
+    ``render(variables)`` gives the same result as
+    ``substitute_placeholders(text, variables)``.
+    """
+
+    __slots__ = ("text", "names", "_slots", "_format")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        pieces, slots, end = [], [], 0
+        for match in _PLACEHOLDER_RE.finditer(text):
+            pieces.append(text[end:match.start()].replace("{", "{{").replace("}", "}}"))
+            pieces.append("{%d}" % len(slots))
+            slots.append(match.group(1))
+            end = match.end()
+        pieces.append(text[end:].replace("{", "{{").replace("}", "}}"))
+        self.names   = frozenset(slots)
+        self._slots  = tuple(slots)
+        self._format = "".join(pieces)
+
+    def render(self, variables: dict) -> str:
+        if not variables or self.names.isdisjoint(variables):
+            return self.text
+        return self._format.format(*[
+            str(variables[name]) if name in variables else "{" + name + "}"
+            for name in self._slots
+        ])
+
+
 def substitute_placeholders(text: str, variables: dict) -> str:
     """
     Return *text* with every ``{name}`` replaced by ``str(variables[name])``.
@@ -36,11 +73,4 @@ def substitute_placeholders(text: str, variables: dict) -> str:
     """
     if not variables or "{" not in text:
         return text
-
-    def _replace(match: "re.Match[str]") -> str:
-        key = match.group(1)
-        if key in variables:
-            return str(variables[key])
-        return match.group(0)
-
-    return _PLACEHOLDER_RE.sub(_replace, text)
+    return Template(text).render(variables)
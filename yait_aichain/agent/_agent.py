@@ -63,7 +63,8 @@ from ._memory      import AgentMemory
 from ._result      import AgentResult
 from .             import _prompts as prompts
 from .._template     import substitute_placeholders
-from .._events       import Event, emit
+from .._deadline     import check_deadline, deadline_scope
+from .._events       import Event, emit, hook_scope
 from ..tools._base   import Tool
 from ..tools._permissions import APPROVE, DENY
 
@@ -222,7 +223,10 @@ class Agent:
 
     max_tokens : int, optional
         Total token budget across all LLM calls (planning + execution +
-        reflection).  The agent stops when this is exceeded.  Default 50 000.
+        reflection).  The agent stops when this is exceeded — and, before
+        each action / reflection call, when the call's locally estimated
+        prompt (``Model.count_tokens``) would not fit in what is left.
+        Default 50 000.
 
     memory : AgentMemory | None, optional
         Custom memory instance.  When omitted a fresh one is created per
@@ -416,17 +420,25 @@ class Agent:
         variables: dict | None = None,
         *,
         context=None,
+        deadline: "float | None" = None,
     ) -> AgentResult:
         """
         Execute *task* autonomously and return an :class:`AgentResult`.
 
         Emits ``run.started`` then ``run.finished`` (or ``run.suspended``) to any
         registered ``hooks``; the body is :meth:`_run_core`.
+
+        *deadline* is the number of seconds the whole run may take, planning,
+        every step and every model / tool call included (see
+        ``yait_aichain._deadline``).  Once it is spent no further step or call
+        starts and the run fails with a ``DeadlineExceededError`` message in
+        ``AgentResult.error``.
         """
         self._run_id   = _new_run_id()
         self._step_idx = None
         self._emit("run.started", payload={"task": task, "mode": self.mode})
-        result = self._run_core(task, variables, context=context)
+        with deadline_scope(deadline):
+            result = self._run_core(task, variables, context=context)
         self._emit_terminal(result)
         return result
 
@@ -560,21 +572,24 @@ class Agent:
             tokens_used=tokens_used, resume_action=None, resume_signal=None,
         )
 
-    def resume(self, run_id: str, signal=None, *, context=None) -> "AgentResult":
+    def resume(self, run_id: str, signal=None, *, context=None,
+               deadline: "float | None" = None) -> "AgentResult":
         """
         Resume a previously suspended agent run.
 
         Loads the parked document, restores memory and the plan/cursor, and
         re-runs the suspended action with *signal* — then continues the normal
         plan/act/reflect loop. Idempotent: a ``run_id`` no longer in the store
-        raises ``KeyError`` (already resumed or unknown).
+        raises ``KeyError`` (already resumed or unknown).  *deadline* is a
+        fresh budget for the resumed part of the run, as in :meth:`run`.
 
         Emits ``run.resumed`` then the closing lifecycle event to any ``hooks``.
         """
         self._run_id   = run_id
         self._step_idx = None
         self._emit("run.resumed", payload={"signal": signal})
-        result = self._resume_core(run_id, signal, context=context)
+        with deadline_scope(deadline):
+            result = self._resume_core(run_id, signal, context=context)
         self._emit_terminal(result)
         return result
 
@@ -623,15 +638,17 @@ class Agent:
             advance = True
             replans = 0   # agile replans are capped to avoid a non-progressing loop
             self._uncounted_tokens = 0   # tokens from calls that failed to parse
+            out_of_budget = False   # the next call's prompt alone would overrun the budget
 
             while step_idx < len(current_plan):
 
-                if tokens_used >= self.max_tokens:
+                if tokens_used >= self.max_tokens or out_of_budget:
                     self._log(1, "\n[Stop] Token budget exhausted.")
                     break
 
                 step    = current_plan[step_idx]
                 advance = True
+                check_deadline(f"agent step {step_idx + 1}")
 
                 self._log(1,
                     f"\n[Step {step_idx + 1}/{len(current_plan)}]  "
@@ -652,6 +669,7 @@ class Agent:
                         break
 
                     if attempt > 1:
+                        check_deadline(f"attempt {attempt} of agent step {step_idx + 1}")
                         self._log(1, f"  ↺  Retry attempt {attempt}/{self.max_attempts}")
 
                     context = self.memory.all()
@@ -693,6 +711,9 @@ class Agent:
                             available_tool_names = [t.name for t in self.tools],
                             persona              = self.persona,
                         )
+                        if self._over_budget(action_msgs, tokens_used):
+                            out_of_budget, advance = True, False
+                            break
                         action, action_tokens = self._llm_call_json(
                             self.orchestrator, action_msgs
                         )
@@ -770,6 +791,9 @@ class Agent:
                         remaining_tokens = max(0, self.max_tokens - tokens_used),
                         persona          = self.persona,
                     )
+                    if self._over_budget(reflect_msgs, tokens_used):
+                        out_of_budget, advance = True, False
+                        break
                     reflection, reflect_tokens = self._llm_call_json(
                         self.orchestrator, reflect_msgs
                     )
@@ -1165,7 +1189,8 @@ class Agent:
             path, body = model.to_request(messages, output)
             # Go through the send() seam (like Skill) so async providers work and
             # the transport path is consistent; the default send() is a single POST.
-            raw        = model.client.send(path, body, model.client._auth_headers())
+            with hook_scope(self.hooks):
+                raw = model.client.send(path, body, model.client._auth_headers())
             response   = json.loads(raw)
             content    = model.from_response(response, output)
             tokens     = self._extract_tokens(response)
@@ -1362,6 +1387,18 @@ class Agent:
             return self._executor_map[hint]
         return self.executors[0]
 
+    def _over_budget(self, messages: list[dict], tokens_used: int) -> bool:
+        """
+        ``True`` when the orchestrator prompt *messages* alone — estimated
+        locally, before sending — would take the run past ``max_tokens``.
+        An orchestrator without ``count_tokens`` is never stopped early.
+        """
+        count = getattr(self.orchestrator, "count_tokens", None)
+        if count is None or tokens_used + count(messages) <= self.max_tokens:
+            return False
+        self._log(1, "\n[Stop] Token budget would be exceeded by the next call.")
+        return True
+
     def _llm_call_json(self, model, messages: list[dict]) -> tuple[dict, int]:
         """
         Make one LLM call and parse the reply as a JSON object, retrying
@@ -44,6 +44,17 @@ Each element of *steps* may be any of the following forms:
             (default), ``"memory"`` for the agent's memory snapshot, or
             any other ``AgentResult`` attribute name.
 
+        ``memo``         (bool, default ``True``)
+            ``False`` keeps the step out of memoization (``memo=``), e.g.
+            for a tool with side effects.
+
+        ``workers``      (int, default 1, ``pipeline()`` only)
+            Worker threads of the step's stage.
+
+        ``depends_on``   (int | str | list, DAG mode only)
+            The earlier steps this step waits for — by index, output_key or
+            runner name — instead of the inferred ones (see below).
+
 Variable flow
 -------------
 1. The chain starts with *initial variables* — merged from
@@ -75,6 +86,22 @@ Variable flow
 
 4. The final step's output is returned by ``run()``.
 
+DAG mode
+--------
+``Chain(..., mode="dag", max_workers=4)`` runs independent steps
+concurrently.  Each step waits only for the earlier steps that write what it
+reads: a Skill reads its template placeholders, a Tool its declared
+``parameters`` (both through *input_map*); a step writes its *output_key*
+(plus the schema properties of a ``json_schema`` Skill).  Agents and nested
+Chains read anything and so wait for every earlier step; a key read from
+neither an earlier step nor the initial variables waits for every earlier
+step that may return a dict (Tools, Agents, ``json`` Skills).  A
+``depends_on`` option overrides the inference for its step.
+
+A step's input is the initial variables plus its dependencies' outputs,
+applied in step order, so results, ``history`` and the run document do not
+depend on which step happens to finish first.
+
 Memory / history
 ----------------
 After each ``run()`` call, ``chain.history`` holds one record per step::
@@ -88,18 +115,32 @@ After each ``run()`` call, ``chain.history`` holds one record per step::
         "output_key": str,                    # variable name for str output
         "options":    dict,                   # step-level options (agents)
     }
+
+A failed step's record adds ``"error"``; a step served by ``memo=`` adds
+``"cached": True``.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import copy
 import importlib
+import inspect
 import os
+import queue
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 from ..models._usage import Usage
+from .._deadline import check_deadline, deadline_scope
 from .._events import Event, emit
+from ..clients._errors import DeadlineExceededError
+from ._memo import decode, encode, runner_definition, step_key
+from ._scope import Scope
 
 _VALID_ON_STEP_ERROR: frozenset[str] = frozenset({"raise", "stop", "skip"})
+_VALID_MODES:         frozenset[str] = frozenset({"sequential", "dag"})
 
 # Default options applied to every Agent step unless overridden.
 _AGENT_DEFAULT_OPTIONS: dict = {
@@ -137,6 +178,8 @@ def _usage_to_dict(usage) -> dict:
         "output_tokens": usage.output_tokens,
         "total_tokens":  usage.total_tokens,
         "cost":          usage.cost,
+        "cache_read_tokens":  usage.cache_read_tokens,
+        "cache_write_tokens": usage.cache_write_tokens,
     }
 
 
@@ -154,6 +197,116 @@ def _is_agent(runner) -> bool:
     return any(cls.__name__ == "Agent" for cls in type(runner).__mro__)
 
 
+# Effects of the DAG-mode step loop (``Chain._run_dag``) besides the plain
+# ``(runner, method, kwargs)`` call: ``(_START, idx, runner, method, kwargs)``
+# starts a step without waiting for it, ``(_WAIT,)`` waits for any started
+# step and is answered with ``(idx, ok, result_or_exception)``.
+_START = object()
+_WAIT  = object()
+
+
+def _drive(gen, workers: int = 1):
+    """
+    Run a ``Chain._run_from`` generator, calling each step blocking; DAG-mode
+    steps started with ``_START`` run on a pool of *workers* threads.
+    """
+    step, value = gen.send, None
+    executor = finished = None
+    try:
+        while True:
+            try:
+                effect = step(value)
+            except StopIteration as stop:
+                return stop.value
+            if effect[0] is _START:
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=workers)
+                    finished = queue.SimpleQueue()
+                _, idx, runner, method, kwargs = effect
+                future = executor.submit(contextvars.copy_context().run,
+                                         getattr(runner, method), **kwargs)
+                future.add_done_callback(
+                    lambda f, idx=idx: finished.put(
+                        (idx, False, f.exception()) if f.exception() is not None
+                        else (idx, True, f.result())))
+                step, value = gen.send, None
+                continue
+            if effect[0] is _WAIT:
+                step, value = gen.send, finished.get()
+                continue
+            runner, method, kwargs = effect
+            try:
+                step, value = gen.send, getattr(runner, method)(**kwargs)
+            except Exception as exc:
+                step, value = gen.throw, exc
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+async def _acall(runner, method: str, kwargs: dict):
+    """Await one step: natively through ``arun``, else in a worker thread."""
+    arun = getattr(runner, "arun", None) if method == "run" else None
+    if inspect.iscoroutinefunction(arun):
+        return await arun(**kwargs)
+    return await asyncio.to_thread(getattr(runner, method), **kwargs)
+
+
+async def _adrive(gen):
+    """
+    Run a ``Chain._run_from`` generator on the event loop: runners with a
+    native ``arun`` (Skill, Chain) are awaited, everything else is called in
+    a worker thread.  DAG-mode steps started with ``_START`` run as
+    concurrent tasks.
+    """
+    step, value = gen.send, None
+    tasks: dict = {}             # in-flight task -> step index
+    finished: list = []
+    try:
+        while True:
+            try:
+                effect = step(value)
+            except StopIteration as stop:
+                return stop.value
+            if effect[0] is _START:
+                _, idx, runner, method, kwargs = effect
+                tasks[asyncio.ensure_future(_acall(runner, method, kwargs))] = idx
+                step, value = gen.send, None
+                continue
+            if effect[0] is _WAIT:
+                if not finished:
+                    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    finished.extend(sorted(done, key=tasks.get))
+                task = finished.pop(0)
+                idx  = tasks.pop(task)
+                step = gen.send
+                value = ((idx, False, task.exception()) if task.exception() is not None
+                         else (idx, True, task.result()))
+                continue
+            runner, method, kwargs = effect
+            try:
+                value = await _acall(runner, method, kwargs)
+                step = gen.send
+            except Exception as exc:
+                step, value = gen.throw, exc
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def _child_awaiting(result) -> "dict | None":
+    """
+    The ``awaiting`` record of an Agent step whose nested run suspended
+    (carrying the child ``run_id`` so resume can continue it), else ``None``.
+    """
+    from ..state import SuspendedResult
+    if not isinstance(result, SuspendedResult):
+        return None
+    awaiting = dict(result.awaiting or {})
+    awaiting["child_run_id"] = result.run_id
+    return awaiting
+
+
 def _build_tool_kwargs(tool, accumulated: dict, input_map: dict) -> dict:
     """
     Build the ``**kwargs`` dict to pass to ``tool.run()``.
@@ -224,6 +377,21 @@ class Chain:
     description : str | None, optional
         Short description of what the chain does.
 
+    mode : str, optional
+        ``"sequential"`` (default) runs the steps one after another;
+        ``"dag"`` runs each step as soon as the steps it depends on are
+        done, independent ones concurrently (see *DAG mode* above).
+
+    max_workers : int, optional
+        Most steps in flight at once in DAG mode (default 4).
+
+    memo : clients.ResponseCache | None, optional
+        Memoize steps in this cache (``MemoryCache``, or ``SQLiteCache`` to
+        keep them across processes): a step whose definition and read
+        variables match an earlier run is not run again; its stored output
+        is used instead (see :mod:`chain._memo`).  A step with the option
+        ``{"memo": False}`` always runs.
+
     Raises
     ------
     ValueError
@@ -271,6 +439,9 @@ class Chain:
         on_step_error:  str         = "raise",
         store=None,
         hooks:          list | None = None,
+        mode:           str         = "sequential",
+        max_workers:    int         = 4,
+        memo=None,
     ) -> None:
         if not steps:
             raise ValueError("Chain requires at least one step.")
@@ -279,7 +450,24 @@ class Chain:
                 f"on_step_error must be one of {sorted(_VALID_ON_STEP_ERROR)}; "
                 f"got {on_step_error!r}"
             )
+        if mode not in _VALID_MODES:
+            raise ValueError(
+                f"mode must be one of {sorted(_VALID_MODES)}; got {mode!r}"
+            )
+        if isinstance(max_workers, bool) or not isinstance(max_workers, int) \
+                or max_workers < 1:
+            raise ValueError(
+                f"max_workers must be a positive int; got {max_workers!r}"
+            )
         self._steps         = self._normalise(steps)
+        self.mode           = mode
+        self.max_workers    = max_workers
+        # Step memoization cache (a clients.ResponseCache); None disables it.
+        self.memo           = memo
+        # Fail fast on a depends_on that names no earlier step.
+        for idx, step in enumerate(self._steps):
+            if step[4].get("depends_on") is not None:
+                self._resolve_depends_on(idx, step[4]["depends_on"])
         self.variables      = variables or {}
         self.name           = name
         self.description    = description
@@ -314,6 +502,7 @@ class Chain:
         on_step_error: str  | None = None,
         *,
         context=None,
+        deadline: "float | None" = None,
     ) -> "str | dict | None":
         """
         Execute all steps in order and return the final step's output.
@@ -326,6 +515,12 @@ class Chain:
         on_step_error : str | None, optional
             Override the instance-level ``on_step_error`` for this call only.
             Must be ``"raise"``, ``"stop"``, or ``"skip"`` when provided.
+        deadline : float | None, optional
+            Seconds the whole run may take.  The budget reaches every nested
+            step — Skills, Agents, tools, nested Chains — and the HTTP
+            requests they make (see ``yait_aichain._deadline``).  Once spent,
+            no further step starts and ``DeadlineExceededError`` is raised
+            whatever ``on_step_error`` says.
 
         Returns
         -------
@@ -341,7 +536,33 @@ class Chain:
             (the default).
         ValueError
             If *on_step_error* override value is not recognised.
+        clients.DeadlineExceededError
+            When *deadline* runs out.
         """
+        with deadline_scope(deadline):
+            return _drive(self._start(variables, on_step_error, context),
+                          self.max_workers)
+
+    async def arun(
+        self,
+        variables:     dict | None = None,
+        on_step_error: str  | None = None,
+        *,
+        context=None,
+        deadline: "float | None" = None,
+    ) -> "str | dict | None":
+        """
+        Async :meth:`run`: same semantics, awaited on the running event loop.
+
+        Skill and nested-chain steps are awaited through their own ``arun``;
+        tool and agent steps (synchronous by nature) run in a worker thread
+        via ``asyncio.to_thread`` so they never block the loop.
+        """
+        with deadline_scope(deadline):
+            return await _adrive(self._start(variables, on_step_error, context))
+
+    def _start(self, variables, on_step_error, context):
+        """Validate run() arguments and return the step-loop generator from step 0."""
         _on_error = self.on_step_error if on_step_error is None else on_step_error
         if _on_error not in _VALID_ON_STEP_ERROR:
             raise ValueError(
@@ -357,6 +578,76 @@ class Chain:
         return self._run_from(doc, accumulated, start_idx=0, signal=None,
                               usage_in=None, on_error=_on_error, context=context)
 
+    def pipeline(
+        self,
+        items,
+        variables:     dict | None = None,
+        *,
+        workers=None,
+        queue_size:    int  | None = None,
+        ordered:       bool        = True,
+        on_step_error: str  | None = None,
+    ):
+        """
+        Run the chain over many *items* with every step as its own stage.
+
+        Each step gets its own worker threads and a bounded input queue;
+        items stream from stage to stage, so a slow stage and a fast one
+        overlap, each at its own width, and a full queue holds the stages
+        before it back (see :mod:`chain._pipeline`).
+
+        Parameters
+        ----------
+        items : iterable of dict
+            One variable dict per item, merged over ``self.variables`` and
+            *variables*.  Read lazily, so a generator works.
+        variables : dict | None, optional
+            Variables shared by every item (item values win).
+        workers : int | list[int] | None, optional
+            Threads per stage: one count for every step, one per step, or
+            ``None`` for each step's ``"workers"`` option (default 1).
+        queue_size : int | None, optional
+            Capacity of each stage's input queue (default: twice the
+            stage's workers).
+        ordered : bool, optional
+            ``True`` (default) yields items in input order; ``False`` as they
+            finish.
+        on_step_error : str | None, optional
+            Per item: ``"raise"`` raises the item's error when it is yielded
+            and stops the pipeline; ``"stop"`` ends the item at the failed
+            step; ``"skip"`` warns and continues with the next step.
+
+        Yields
+        ------
+        tuple[int, str | dict | None]
+            ``(index, output)`` — the item's position and the output of its
+            last successful step.  ``last_usage`` sums every item once the
+            iteration ends.
+
+        Example
+        -------
+        ::
+
+            chain = Chain([(convert, "doc", {}, {"workers": 2}),
+                           (summariser, "summary", {}, {"workers": 16})])
+            for index, summary in chain.pipeline({"source": p} for p in paths):
+                save(paths[index], summary)
+        """
+        from ._pipeline import Pipeline, stage_workers
+
+        _on_error = self.on_step_error if on_step_error is None else on_step_error
+        if _on_error not in _VALID_ON_STEP_ERROR:
+            raise ValueError(
+                f"on_step_error must be one of {sorted(_VALID_ON_STEP_ERROR)}; "
+                f"got {_on_error!r}"
+            )
+        if queue_size is not None and (not isinstance(queue_size, int) or queue_size < 1):
+            raise ValueError(f"queue_size must be a positive int; got {queue_size!r}")
+        pipeline = Pipeline(self, items, variables or {}, stage_workers(self, workers),
+                            queue_size, ordered, _on_error)
+        self.last_usage = None
+        return iter(pipeline)
+
     def resume(
         self,
         run_id:        str,
@@ -364,6 +655,7 @@ class Chain:
         *,
         on_step_error: str | None = None,
         context=None,
+        deadline: "float | None" = None,
     ) -> "str | dict | None":
         """
         Resume a previously suspended run.
@@ -375,7 +667,8 @@ class Chain:
 
         Idempotent: a ``run_id`` no longer in the store (already resumed to
         completion, or unknown) raises ``KeyError`` so an at-least-once trigger
-        can treat that as "already handled".
+        can treat that as "already handled".  *deadline* is a fresh budget
+        for the resumed part of the run, as in :meth:`run`.
         """
         _on_error = self.on_step_error if on_step_error is None else on_step_error
         if _on_error not in _VALID_ON_STEP_ERROR:
@@ -408,32 +701,141 @@ class Chain:
             output_tokens = u.get("output_tokens", 0),
             total_tokens  = u.get("total_tokens", 0),
             cost          = u.get("cost"),
+            cache_read_tokens  = u.get("cache_read_tokens", 0),
+            cache_write_tokens = u.get("cache_write_tokens", 0),
         ) if u else None
-        return self._run_from(doc, accumulated, start_idx=start, signal=signal,
-                              usage_in=usage_in, on_error=_on_error, context=context)
+        with deadline_scope(deadline):
+            return _drive(self._run_from(doc, accumulated, start_idx=start, signal=signal,
+                                         usage_in=usage_in, on_error=_on_error,
+                                         context=context),
+                          self.max_workers)
 
     def _park(self, doc, idx, awaiting, accumulated, usage_total, history):
         """Persist the run as suspended at *idx* and return a SuspendedResult."""
         from ..state import StepStatus, SuspendedResult
         doc.steps[idx]["status"]  = StepStatus.SUSPENDED
         doc.steps[idx]["suspend"] = awaiting
-        doc.variables = dict(accumulated)
+        doc.variables = accumulated
         doc.usage     = _usage_to_dict(usage_total)
         self._history     = history
-        self._accumulated = dict(accumulated)
+        self._accumulated = accumulated
         self.last_usage   = usage_total
         self._store.save(doc.run_id, doc.to_dict())
         return SuspendedResult(run_id=doc.run_id, awaiting=awaiting,
                                document=doc.to_dict())
 
+    def _step_call(self, idx, accumulated, signal, doc) -> tuple:
+        """
+        The ``(runner, method, kwargs)`` invocation of step *idx* over
+        *accumulated*; *signal* (on resume) goes to the suspended step.
+        A Skill runner is a shallow per-call copy, so concurrent calls (DAG
+        branches, pipeline items) each keep their own ``last_usage``.
+        """
+        runner, output_key, input_map, kind, options = self._steps[idx]
+        if kind == "tool":
+            kwargs = _build_tool_kwargs(runner, accumulated, input_map)
+            if signal is not None:
+                return (runner, "run", {"_signal": signal, **kwargs})
+            return (runner, "run", kwargs)
+
+        if kind == "agent":
+            # On resume of a previously-suspended agent step, continue
+            # the child run instead of starting a new one.
+            child_id = (doc.steps[idx].get("suspend", {}).get("child_run_id")
+                        if signal is not None else None)
+            if child_id is not None:
+                return (runner, "resume", {"run_id": child_id, "signal": signal})
+            task_key = options.get("task_key", _AGENT_DEFAULT_OPTIONS["task_key"])
+            task     = accumulated.get(task_key, "")
+            if not task:
+                name = getattr(runner, "name", None) or f"step_{idx}"
+                raise ValueError(
+                    f"Agent step {idx} ({name!r}): accumulated variable "
+                    f"{task_key!r} is empty or missing.  Set it in a "
+                    f"prior step or in the initial variables."
+                )
+            return (runner, "run", {"task": task, "variables": accumulated})
+
+        # Skill: pass full accumulated dict, honouring input_map renames.
+        runner = copy.copy(runner)
+        if input_map:
+            skill_vars = accumulated.updated({dst: accumulated[src]
+                                              for dst, src in input_map.items()
+                                              if src in accumulated})
+            return (runner, "run", {"variables": skill_vars})
+        return (runner, "run", {"variables": accumulated})
+
+    def _step_output(self, idx, value, called=None) -> tuple:
+        """
+        ``(output, usage)`` of step *idx* from the runner's return *value*;
+        raises ``RuntimeError`` for a failed agent result.  *called* is the
+        runner actually called when it was a per-call copy.
+        """
+        runner, output_key, input_map, kind, options = self._steps[idx]
+        if kind != "agent":
+            return value, getattr(called or runner, "last_usage", None)
+
+        if not value:
+            name = getattr(runner, "name", None) or f"step_{idx}"
+            raise RuntimeError(
+                f"Agent step {idx} ({name!r}) failed: "
+                f"{getattr(value, 'error', 'no result returned')}"
+            )
+        output_field = options.get(
+            "output_field", _AGENT_DEFAULT_OPTIONS["output_field"]
+        )
+        # An Agent has no ``last_usage``; it reports tokens on AgentResult.
+        tokens = getattr(value, "tokens_used", 0) or 0
+        return (getattr(value, output_field, None),
+                Usage(total_tokens=tokens) if tokens else None)
+
+    def _memo_key(self, idx, accumulated) -> "str | None":
+        """Fingerprint of step *idx* over *accumulated*, or ``None`` when not memoized."""
+        runner, output_key, input_map, kind, options = self._steps[idx]
+        if getattr(self, "memo", None) is None or options.get("memo") is False:
+            return None
+        definition = runner_definition(runner, kind)
+        if definition is None:
+            return None
+        reads, _writes = self._step_io(idx)
+        return step_key(definition, output_key, input_map, reads, accumulated)
+
+    def _memo_lookup(self, idx, name, key) -> "tuple | None":
+        """``(output,)`` stored for *key*, or ``None``; emits ``memo.hit`` / ``memo.miss``."""
+        if key is None:
+            return None
+        value = self.memo.get(key)
+        payload = {"kind": self._steps[idx][3], "key": key}
+        if value is None:
+            self._emit("memo.miss", step=idx, name=name, payload=payload)
+            return None
+        self._emit("memo.hit", step=idx, name=name, payload=payload)
+        return (decode(value),)
+
+    def _memo_store(self, key, output) -> None:
+        if key is None:
+            return
+        data = encode(output)
+        if data is not None:
+            self.memo.set(key, data)
+
     def _run_from(self, doc, accumulated, *, start_idx, signal, usage_in,
                   on_error, context) -> "str | dict | None":
         """
         Shared step loop for ``run()`` (from step 0) and ``resume()`` (from the
         suspended step). On ``resume``, *signal* is delivered to the step at
         *start_idx* (the suspended tool) via ``_signal=``.
+
+        A generator: each step invocation is yielded as ``(runner, method,
+        kwargs)`` and its return value sent back (or its exception thrown in),
+        so ``_drive`` runs it blocking and ``_adrive`` on the event loop.
         """
-        from ..state import StepStatus, Suspend, SuspendedResult
+        if self.mode == "dag":
+            return (yield from self._run_dag(doc, accumulated, signal=signal,
+                                             usage_in=usage_in, on_error=on_error,
+                                             context=context))
+
+        from ..state import StepStatus, Suspend
 
         # Expose the per-request context for the duration of the run and persist
         # it in the document so it survives suspend/resume.
@@ -443,78 +845,37 @@ class Chain:
         history:     list[dict] = []
         last_output: "str | dict | None" = None
         usage_total: "Usage | None" = usage_in
+        # Snapshots (history inputs, checkpoints) share the variables they
+        # have in common instead of copying them (see chain._scope).
+        accumulated = Scope(accumulated)
 
         for idx in range(start_idx, len(self._steps)):
             runner, output_key, input_map, kind, options = self._steps[idx]
-            step_input  = dict(accumulated)          # snapshot before the step
+            step_input  = accumulated                # snapshot before the step
             name        = getattr(runner, "name", None) or f"step_{idx}"
             step_signal = signal if idx == start_idx else None
 
             self._emit("step.started", step=idx, name=name, payload={"kind": kind})
 
             try:
-                if kind == "tool":
-                    kwargs = _build_tool_kwargs(runner, accumulated, input_map)
-                    if step_signal is not None:
-                        output = runner.run(_signal=step_signal, **kwargs)
-                    else:
-                        output = runner.run(**kwargs)
-
-                elif kind == "agent":
-                    # On resume of a previously-suspended agent step, continue
-                    # the child run instead of starting a new one.
-                    child_id = (doc.steps[idx].get("suspend", {}).get("child_run_id")
-                                if step_signal is not None else None)
-                    if child_id is not None:
-                        agent_result = runner.resume(child_id, signal=step_signal)
-                    else:
-                        task_key = options.get("task_key", _AGENT_DEFAULT_OPTIONS["task_key"])
-                        task     = accumulated.get(task_key, "")
-                        if not task:
-                            raise ValueError(
-                                f"Agent step {idx} ({name!r}): accumulated variable "
-                                f"{task_key!r} is empty or missing.  Set it in a "
-                                f"prior step or in the initial variables."
-                            )
-                        agent_result = runner.run(task=task, variables=accumulated)
+                check_deadline(f"chain step {idx} ({name!r})")
+                memo_key = self._memo_key(idx, accumulated) if step_signal is None else None
+                cached   = self._memo_lookup(idx, name, memo_key)
+                if cached is None:
+                    call  = self._step_call(idx, accumulated, step_signal, doc)
+                    value = yield call
 
                     # The nested agent paused (Wait/Gate) — suspend the chain
                     # too, recording the child run_id so resume can continue it.
-                    if isinstance(agent_result, SuspendedResult):
-                        awaiting = dict(agent_result.awaiting or {})
-                        awaiting["child_run_id"] = agent_result.run_id
+                    awaiting = _child_awaiting(value) if kind == "agent" else None
+                    if awaiting is not None:
                         return self._park(doc, idx, awaiting, accumulated,
                                           usage_total, history)
 
-                    if not agent_result:
-                        raise RuntimeError(
-                            f"Agent step {idx} ({name!r}) failed: "
-                            f"{getattr(agent_result, 'error', 'no result returned')}"
-                        )
-
-                    output_field = options.get(
-                        "output_field", _AGENT_DEFAULT_OPTIONS["output_field"]
-                    )
-                    output = getattr(agent_result, output_field, None)
-
-                    # Fold the agent's token usage into the chain total. An
-                    # Agent has no ``last_usage`` (the generic accumulation
-                    # below would miss it); it reports tokens on AgentResult.
-                    _atok = getattr(agent_result, "tokens_used", 0) or 0
-                    if _atok:
-                        usage_total = (Usage(total_tokens=_atok) if usage_total is None
-                                       else usage_total + Usage(total_tokens=_atok))
-
+                    output, step_usage = self._step_output(idx, value, call[0])
+                    self._memo_store(memo_key, output)
                 else:
-                    # Skill: pass full accumulated dict, honouring input_map renames.
-                    if input_map:
-                        skill_vars = dict(accumulated)
-                        for dst, src in input_map.items():
-                            if src in accumulated:
-                                skill_vars[dst] = accumulated[src]
-                        output = runner.run(variables=skill_vars)
-                    else:
-                        output = runner.run(variables=accumulated)
+                    (output,), step_usage = cached, None
 
             except Suspend as susp:
                 # A suspend tool paused the run: park the document and return a
@@ -537,16 +898,19 @@ class Chain:
                     "error":      str(exc),
                 })
 
-                if on_error in ("raise", "stop"):
+                # An expired deadline ends the run whatever on_error says:
+                # every later step would fail the same way.
+                expired = isinstance(exc, DeadlineExceededError)
+                if on_error in ("raise", "stop") or expired:
                     # Terminal exit: mark the step failed and drop any parked
                     # document so a re-resume can't re-run the already-attempted
                     # steps (a duplicate trigger becomes a no-op / KeyError).
                     doc.steps[idx]["status"] = StepStatus.FAILED
                     self._store.delete(doc.run_id)
                     self._history     = history
-                    self._accumulated = dict(accumulated)
+                    self._accumulated = accumulated
                     self.last_usage   = usage_total
-                    if on_error == "raise":
+                    if on_error == "raise" or expired:
                         raise
                     return last_output
 
@@ -554,7 +918,7 @@ class Chain:
                 # re-run this step (first_pending would otherwise land on it).
                 doc.steps[idx]["status"] = StepStatus.SKIPPED
                 doc.steps[idx].pop("suspend", None)
-                doc.variables = dict(accumulated)
+                doc.variables = accumulated
                 warnings.warn(
                     f"Chain step {idx} ({name!r}) failed and was skipped: {exc}. "
                     f"Downstream steps that read {output_key!r} will receive a "
@@ -573,22 +937,21 @@ class Chain:
                 "output_key": output_key,
                 "options":    options,
             })
+            if cached is not None:
+                history[-1]["cached"] = True
 
-            step_usage = getattr(runner, "last_usage", None)
             if step_usage:
                 usage_total = step_usage if usage_total is None else usage_total + step_usage
 
-            if isinstance(output, dict):
-                accumulated.update(output)
-            else:
-                accumulated[output_key] = output
+            accumulated = accumulated.updated(
+                output if isinstance(output, dict) else {output_key: output})
 
             last_output = output
 
             # Checkpoint: the step is done; variables reflect its output.
             doc.steps[idx]["status"] = StepStatus.DONE
             doc.steps[idx].pop("suspend", None)
-            doc.variables = dict(accumulated)
+            doc.variables = accumulated
 
             self._emit("step.ended", step=idx, name=name, payload={"kind": kind})
 
@@ -596,7 +959,281 @@ class Chain:
         # the run never suspended and was therefore never stored).
         self._store.delete(doc.run_id)
         self._history     = history
-        self._accumulated = dict(accumulated)
+        self._accumulated = accumulated
+        self.last_usage   = usage_total
+        return last_output
+
+    # ------------------------------------------------------------------
+    # DAG mode
+    # ------------------------------------------------------------------
+
+    def _step_io(self, idx) -> "tuple[set | None, set | None]":
+        """
+        ``(reads, writes)`` — the accumulated keys step *idx* reads and
+        writes, inferred from the runner; ``None`` where they cannot be
+        known (agents and nested chains read anything; tools, agents and
+        ``json`` skills may return a dict with any keys).
+        """
+        runner, output_key, input_map, kind, options = self._steps[idx]
+        writes: "set | None" = None
+        if kind == "tool":
+            reads = {input_map.get(p, p)
+                     for p in runner.parameters.get("properties", {})}
+        elif kind == "skill" and callable(getattr(runner, "_template", None)):
+            reads = {input_map.get(n, n) for n in runner._template().names}
+            fmt = getattr(runner, "_output", {}).get("format", {})
+            if fmt.get("type") == "json_schema":
+                writes = {output_key, *fmt.get("schema", {}).get("properties", {})}
+            elif fmt.get("type") != "json":
+                writes = {output_key}
+        else:
+            reads = None
+        return reads, writes
+
+    def _resolve_depends_on(self, idx, spec) -> set:
+        """Step indices named by step *idx*'s ``depends_on`` option."""
+        deps = set()
+        for ref in spec if isinstance(spec, (list, tuple, set)) else [spec]:
+            if isinstance(ref, int) and not isinstance(ref, bool):
+                found = [ref] if 0 <= ref < idx else []
+            else:
+                found = [j for j in range(idx)
+                         if ref in (self._steps[j][1],
+                                    getattr(self._steps[j][0], "name", None))]
+            if not found:
+                raise ValueError(
+                    f"Step {idx}: depends_on entry {ref!r} does not name an "
+                    f"earlier step (by index, output_key or runner name)."
+                )
+            deps.add(found[-1])
+        return deps
+
+    def _dag_deps(self, initial) -> "list[set]":
+        """
+        The steps each step waits for: explicit ``depends_on``, else the
+        latest earlier writer of every key it reads.  A key that is neither
+        written by an earlier step nor among the *initial* variables may come
+        from an earlier dict output, so the step waits for every earlier step
+        whose writes are unknown; a step whose reads are unknown waits for
+        every earlier step.
+        """
+        writers: dict = {}
+        opaque:  list = []
+        deps:    list = []
+        for idx, (runner, output_key, input_map, kind, options) in enumerate(self._steps):
+            reads, writes = self._step_io(idx)
+            if options.get("depends_on") is not None:
+                step_deps = self._resolve_depends_on(idx, options["depends_on"])
+            elif reads is None:
+                step_deps = set(range(idx))
+            else:
+                step_deps = set()
+                for key in reads:
+                    if key in writers:
+                        step_deps.add(writers[key])
+                    elif key not in initial:
+                        step_deps.update(opaque)
+            deps.append(step_deps)
+            for key in writes if writes is not None else (output_key,):
+                writers[key] = idx
+            if writes is None:
+                opaque.append(idx)
+        return deps
+
+    def _run_dag(self, doc, accumulated, *, signal, usage_in, on_error,
+                 context) -> "str | dict | None":
+        """
+        DAG-mode step loop for ``run()`` and ``resume()``.
+
+        Every step whose dependencies are settled (done or skipped) is
+        started, lowest index first, up to ``max_workers`` at a time, with
+        ``(_START, idx, runner, method, kwargs)``; ``(_WAIT,)`` collects the
+        next finished one.  A step sees the initial variables plus the
+        outputs of its (transitive) dependencies, applied in step order, so
+        its input never depends on timing; ``history``, the final variables
+        and the returned output (the highest done step's, kept on the step in
+        *doc* across parks) follow step order too.
+
+        A failure under ``"raise"`` / ``"stop"`` and a suspension stop new
+        steps from starting; the ones in flight finish first.  The run then
+        raises (the lowest failed step's error) or parks at the lowest
+        suspended step — other suspended steps go back to ``pending`` and
+        are re-run on resume.  On ``resume``, *signal* goes to the suspended
+        step and every step not yet done is run.
+        """
+        from ..state import StepStatus, Suspend
+
+        self.context = context
+        doc.context  = context.to_dict() if context is not None else None
+
+        base      = Scope(accumulated)
+        deps      = self._dag_deps(base)
+        ancestors: list = []
+        for step_deps in deps:
+            closure = set(step_deps)
+            for j in step_deps:
+                closure |= ancestors[j]
+            ancestors.append(closure)
+
+        suspended  = doc.suspended_step()
+        signal_idx = suspended["id"] if suspended is not None else None
+        settled    = (StepStatus.DONE, StepStatus.SKIPPED)
+        waiting    = [s["id"] for s in doc.steps if s["status"] not in StepStatus.TERMINAL]
+
+        outputs: dict = {}       # step -> output, for steps done in this call
+        records: dict = {}       # step -> history record
+        failed:  dict = {}       # step -> exception ending the run
+        parked:  dict = {}       # step -> awaiting record
+        memo_keys: dict = {}     # step -> memo fingerprint (None: not memoized)
+        called:  dict = {}       # step -> runner started (a Skill's per-call copy)
+        running     = 0
+        usage_total = usage_in
+
+        def merged(steps) -> Scope:
+            variables = base
+            for j in sorted(steps):
+                if j in outputs:
+                    output = outputs[j]
+                    variables = variables.updated(
+                        output if isinstance(output, dict) else {self._steps[j][1]: output})
+            return variables
+
+        def fail(idx, exc) -> None:
+            records[idx]["error"] = str(exc)
+            if on_error in ("raise", "stop") or isinstance(exc, DeadlineExceededError):
+                failed[idx] = exc
+                doc.steps[idx]["status"] = StepStatus.FAILED
+                return
+            name = records[idx]["name"]
+            doc.steps[idx]["status"] = StepStatus.SKIPPED
+            doc.steps[idx].pop("suspend", None)
+            warnings.warn(
+                f"Chain step {idx} ({name!r}) failed and was skipped: {exc}. "
+                f"Downstream steps that read {self._steps[idx][1]!r} will "
+                f"receive a stale or absent value.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+        def settle(idx, output, step_usage) -> None:
+            nonlocal usage_total
+            records[idx]["output"] = output
+            if step_usage:
+                usage_total = step_usage if usage_total is None else usage_total + step_usage
+            outputs[idx] = output
+            # Checkpoint: the step is done; variables reflect every output so far.
+            # The output is kept on the step too: a later step may finish before
+            # a park, and resume() must still return the highest step's output.
+            doc.steps[idx]["status"] = StepStatus.DONE
+            doc.steps[idx]["output"] = output
+            doc.steps[idx].pop("suspend", None)
+            doc.variables = merged(outputs)
+            self._emit("step.ended", step=idx, name=records[idx]["name"],
+                       payload={"kind": self._steps[idx][3]})
+
+        while True:
+            # A failure or a suspension stops new steps; in-flight ones drain.
+            startable = [] if failed or parked else list(waiting)
+            progressed = False
+            for idx in startable:
+                if running >= self.max_workers:
+                    break
+                if any(doc.steps[j]["status"] not in settled for j in deps[idx]):
+                    continue
+                waiting.remove(idx)
+                runner, output_key, input_map, kind, options = self._steps[idx]
+                name = getattr(runner, "name", None) or f"step_{idx}"
+                step_input = merged(ancestors[idx])
+                step_signal = signal if idx == signal_idx else None
+                records[idx] = {
+                    "step":       idx,
+                    "kind":       kind,
+                    "name":       name,
+                    "input":      step_input,
+                    "output":     None,
+                    "output_key": output_key,
+                    "options":    options,
+                }
+                self._emit("step.started", step=idx, name=name, payload={"kind": kind})
+                try:
+                    check_deadline(f"chain step {idx} ({name!r})")
+                    memo_keys[idx] = (self._memo_key(idx, step_input)
+                                      if step_signal is None else None)
+                    cached = self._memo_lookup(idx, name, memo_keys[idx])
+                    if cached is None:
+                        call = self._step_call(idx, step_input, step_signal, doc)
+                        called[idx] = call[0]
+                except Exception as exc:
+                    fail(idx, exc)
+                    continue
+                if cached is not None:
+                    records[idx]["cached"] = True
+                    settle(idx, cached[0], None)
+                    progressed = True
+                    continue
+                yield (_START, idx, *call)
+                running += 1
+
+            if progressed:
+                continue          # a memoized step may have readied others
+            if not running:
+                break
+            idx, ok, value = yield (_WAIT,)
+            running -= 1
+            runner = called.pop(idx)
+            kind = self._steps[idx][3]
+
+            if ok:
+                awaiting = _child_awaiting(value) if kind == "agent" else None
+                if awaiting is not None:
+                    parked[idx] = awaiting
+                    del records[idx]
+                    continue
+                try:
+                    output, step_usage = self._step_output(idx, value, runner)
+                except Exception as exc:
+                    ok, value = False, exc
+            if not ok:
+                if isinstance(value, Suspend):
+                    parked[idx] = {"reason":      value.reason,
+                                   "resume_with": value.resume_with,
+                                   "hint":        value.hint}
+                    del records[idx]
+                else:
+                    fail(idx, value)
+                continue
+
+            self._memo_store(memo_keys.get(idx), output)
+            settle(idx, output, step_usage)
+
+        history     = [records[j] for j in sorted(records)]
+        accumulated = merged(outputs)
+        done        = [s for s in doc.steps if s["status"] == StepStatus.DONE]
+        last_output = done[-1].get("output") if done else None
+
+        if failed:
+            # Terminal exit, as in sequential mode: drop any parked document.
+            self._store.delete(doc.run_id)
+            self._history     = history
+            self._accumulated = accumulated
+            self.last_usage   = usage_total
+            errors  = [failed[j] for j in sorted(failed)]
+            expired = [e for e in errors if isinstance(e, DeadlineExceededError)]
+            if on_error == "raise" or expired:
+                raise (expired or errors)[0]
+            return last_output
+
+        if parked:
+            idx = min(parked)
+            for j in parked:
+                if j != idx:
+                    doc.steps[j]["status"] = StepStatus.PENDING
+                    doc.steps[j].pop("suspend", None)
+            return self._park(doc, idx, parked[idx], accumulated, usage_total, history)
+
+        self._store.delete(doc.run_id)
+        self._history     = history
+        self._accumulated = accumulated
         self.last_usage   = usage_total
         return last_output
 
@@ -633,8 +1270,10 @@ class Chain:
         ``input``      — accumulated variable dict *before* this step ran
         ``output``     — raw output (``str`` or ``dict``)
         ``output_key`` — variable name used to store a ``str`` output
+        ``cached``     — ``True`` when the output came from ``memo=``
         """
-        return list(self._history)
+        # Inputs are kept as shared Scope snapshots; readers get plain dicts.
+        return [{**record, "input": dict(record["input"])} for record in self._history]
 
     # ------------------------------------------------------------------
     # Persistence
@@ -680,6 +1319,7 @@ class Chain:
                 "PyYAML is required for Chain.save(). "
                 "Install it with: pip install pyyaml"
             )
+        from ..skills._adapters import plain_input
 
         steps_data = []
         for runner, output_key, input_map, kind, options in self._steps:
@@ -691,7 +1331,7 @@ class Chain:
                     skill_data["name"] = runner.name
                 if runner.description:
                     skill_data["description"] = runner.description
-                skill_data["input"]  = runner._input
+                skill_data["input"]  = plain_input(runner._input)
                 skill_data["output"] = runner._output
                 if runner.variables:
                     skill_data["variables"] = runner.variables
@@ -764,9 +1404,13 @@ class Chain:
             data["variables"] = self.variables
         if self.on_step_error != "raise":
             data["on_step_error"] = self.on_step_error
+        if self.mode != "sequential":
+            data["mode"]        = self.mode
+            data["max_workers"] = self.max_workers
         # Reorder so name/description/variables appear before steps
         ordered: dict = {}
-        for k in ("name", "description", "on_step_error", "variables", "steps"):
+        for k in ("name", "description", "on_step_error", "mode", "max_workers",
+                  "variables", "steps"):
             if k in data:
                 ordered[k] = data[k]
 
@@ -941,6 +1585,8 @@ class Chain:
             name           = data.get("name"),
             description    = data.get("description"),
             on_step_error  = data.get("on_step_error", "raise"),
+            mode           = data.get("mode", "sequential"),
+            max_workers    = data.get("max_workers", 4),
         )
 
     # ------------------------------------------------------------------
@@ -1023,4 +1669,6 @@ class Chain:
             parts.append(f"name={self.name!r}")
         if self.on_step_error != "raise":
             parts.append(f"on_step_error={self.on_step_error!r}")
+        if self.mode != "sequential":
+            parts.append(f"mode={self.mode!r}, max_workers={self.max_workers}")
         return f"Chain({', '.join(parts)})"
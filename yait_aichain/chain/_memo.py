@@ -0,0 +1,163 @@
+"""
+chain._memo
+===========
+
+Incremental step memoization for ``Chain`` — build-system style.
+
+Re-running a long chain after editing only its last prompt should not
+convert, search and summarise again.  With ``Chain(memo=cache)`` each step
+gets a fingerprint: its runner's definition plus the values of the
+variables it actually reads.  A step whose fingerprint is in *cache* is not
+run; its stored output is merged into the accumulated variables as if it
+had.  Any change to a step's definition, or to an input it reads, changes
+the fingerprint — and, through its new output, those of the steps
+downstream.
+
+*cache* is any :class:`~clients.ResponseCache` — ``MemoryCache`` for one
+process, ``SQLiteCache`` for a file that survives restarts and is shared
+between processes.
+
+The definition covers:
+
+* **Skill** — model settings, message template (with a content digest of
+  each ``kind: "file"`` media source), output spec, options and default
+  variables;
+* **Tool** — class path and constructor arguments (``_serialise_init_args()``
+  when the tool defines it, else the attributes named after ``__init__``'s
+  parameters);
+* **Agent** — class path, orchestrator, tools, persona and limits;
+* **nested Chain** — the definitions of its steps.
+
+Any other runner has no definition and is never memoized.  The variables
+read are those the DAG inference uses (template placeholders, tool
+parameters); a step whose reads are unknown (agents, nested chains) is
+fingerprinted over every accumulated variable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+
+from ..clients._cache import request_key
+
+# Bumped when the fingerprint layout changes, so stale entries never match.
+_VERSION = 1
+
+_MISSING = {"__missing__": True}
+
+
+def _class_path(obj) -> str:
+    cls = type(obj)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _file_digest(path: str) -> "str | None":
+    """SHA-256 of the file at *path*, or ``None`` when it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(os.path.expanduser(path), "rb") as fh:
+            for block in iter(lambda: fh.read(1 << 20), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _with_file_digests(node):
+    """*node* (a plain skill input) with a ``sha256`` on each file source."""
+    if isinstance(node, dict):
+        node = {k: _with_file_digests(v) for k, v in node.items()}
+        if node.get("kind") == "file" and "path" in node and not node.get("data"):
+            node["sha256"] = _file_digest(node["path"])
+        return node
+    if isinstance(node, list):
+        return [_with_file_digests(v) for v in node]
+    return node
+
+
+def _init_args(obj) -> dict:
+    """
+    The constructor arguments of *obj* as it kept them: for each parameter of
+    ``__init__``, the attribute of the same name (or with a leading ``_``).
+    """
+    args = {}
+    for param in inspect.signature(type(obj).__init__).parameters.values():
+        if param.name == "self" or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        for attr in (param.name, "_" + param.name):
+            if attr in getattr(obj, "__dict__", {}):
+                args[param.name] = vars(obj)[attr]
+                break
+    return args
+
+
+def runner_definition(runner, kind: str) -> "dict | None":
+    """The JSON-able definition of *runner* that a fingerprint covers, or ``None``."""
+    if kind == "tool":
+        args = (runner._serialise_init_args()
+                if hasattr(runner, "_serialise_init_args") else _init_args(runner))
+        return {"class": _class_path(runner), "args": args}
+
+    if kind == "agent":
+        orchestrator = getattr(runner, "orchestrator", None)
+        return {
+            "class":        _class_path(runner),
+            "orchestrator": getattr(orchestrator, "name", None),
+            "tools":        [_class_path(t) for t in getattr(runner, "tools", None) or []],
+            "persona":      getattr(runner, "persona", None),
+            "mode":         getattr(runner, "mode", None),
+            "max_steps":    getattr(runner, "max_steps", None),
+            "max_attempts": getattr(runner, "max_attempts", None),
+        }
+
+    steps = getattr(runner, "_steps", None)
+    if steps is not None and callable(getattr(runner, "_run_from", None)):
+        nested = [runner_definition(r, k) for r, _key, _map, k, _opts in steps]
+        if any(d is None for d in nested):
+            return None
+        return {"class": _class_path(runner), "steps": nested,
+                "keys": [[key, input_map] for _r, key, input_map, _k, _o in steps],
+                "variables": runner.variables}
+
+    if callable(getattr(runner, "_template", None)):
+        from ..skills._adapters import plain_input
+        return {
+            # Each model's request settings, not just its name: a changed
+            # temperature or max_tokens must not be served a stale output.
+            "models":    [m._params() for m in runner.models],
+            # A file source is kept as its path: hash the content too, so an
+            # edited file is not served the output of the old one.
+            "input":     _with_file_digests(plain_input(runner._input)),
+            "output":    runner._output,
+            "options":   runner.options,
+            "variables": runner.variables,
+        }
+    return None
+
+
+def step_key(definition: dict, output_key: str, input_map: dict,
+             reads: "set | None", accumulated: dict) -> str:
+    """
+    The fingerprint of one step: its *definition* and wiring plus the values
+    of the variables it *reads* (every accumulated variable when ``None``).
+    """
+    names  = sorted(accumulated) if reads is None else sorted(reads)
+    inputs = {name: accumulated.get(name, _MISSING) for name in names}
+    return request_key(("chain.memo", _VERSION), output_key,
+                       {"definition": definition, "input_map": input_map,
+                        "inputs": inputs})
+
+
+def encode(output) -> "bytes | None":
+    """*output* as stored bytes, or ``None`` when it is not JSON-serialisable."""
+    try:
+        return json.dumps({"output": output}, ensure_ascii=False).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+
+
+def decode(value: bytes):
+    return json.loads(value.decode("utf-8"))["output"]
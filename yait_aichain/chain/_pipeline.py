@@ -0,0 +1,269 @@
+"""
+chain._pipeline
+===============
+
+Stage-pipelined execution of one ``Chain`` over many items.
+
+``Pool(chain, items)`` runs whole chains per item under one concurrency cap,
+so a slow stage (PDF conversion) and a fast one (an LLM call) cannot each
+run at their own width.  ``Chain.pipeline(items)`` turns every step into a
+*stage* — its own worker threads reading a bounded queue — and streams the
+items through them, producer / consumer style::
+
+    items ─▶ [q0] ─▶ step 0 × w0 ─▶ [q1] ─▶ step 1 × w1 ─▶ … ─▶ results
+
+A full queue blocks the stage before it (backpressure), so a slow stage
+throttles the producer instead of letting items pile up in memory.  Results
+come out in item order (``ordered=True``) or as items finish.
+
+Each item carries its own accumulated variables from stage to stage, with
+the same step semantics as :meth:`Chain.run` — input building, ``dict``
+merging, ``on_step_error`` and ``memo=``.  Suspending steps (``Wait`` /
+``Gate``, suspended agents) are not supported: a run that needs a human per
+item belongs in ``run()`` / ``resume()``.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import queue
+import threading
+import warnings
+from typing import TYPE_CHECKING, Iterator
+
+from .._deadline import check_deadline
+from ..clients._errors import DeadlineExceededError
+from ._scope import Scope
+
+if TYPE_CHECKING:
+    from ._chain import Chain
+
+# How often a blocked worker re-checks whether the pipeline was closed.
+_POLL = 0.1
+
+_END = object()   # end-of-stream marker, one per downstream worker
+
+
+class _Item:
+    """One item in flight: its index, accumulated variables and outcome."""
+
+    __slots__ = ("index", "accumulated", "output", "error", "done")
+
+    def __init__(self, index: int, accumulated: dict) -> None:
+        self.index       = index
+        self.accumulated = accumulated
+        self.output      = None
+        self.error: "Exception | None" = None
+        self.done        = False      # left the pipeline early (on_step_error="stop")
+
+
+def stage_workers(chain: "Chain", workers) -> "list[int]":
+    """Worker count per step from *workers* (int, list, or ``None``: each step's option)."""
+    steps = chain._steps
+    if workers is None:
+        counts = [options.get("workers", 1) for *_rest, options in steps]
+    elif isinstance(workers, int):
+        counts = [workers] * len(steps)
+    else:
+        counts = list(workers)
+        if len(counts) != len(steps):
+            raise ValueError(
+                f"workers must give one count per step ({len(steps)}); got {len(counts)}"
+            )
+    for count in counts:
+        if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+            raise ValueError(f"stage worker counts must be positive ints; got {count!r}")
+    return counts
+
+
+class Pipeline:
+    """
+    The stages, queues and threads of one ``Chain.pipeline`` call; iterate
+    it for ``(index, output)`` pairs.  The threads start with the iteration
+    and are stopped when it ends, however it ends.
+    """
+
+    def __init__(self, chain: "Chain", items, shared: dict, workers: "list[int]",
+                 queue_size: "int | None", ordered: bool, on_error: str) -> None:
+        self.chain    = chain
+        self.items    = items
+        self.shared   = shared
+        self.workers  = workers
+        self.ordered  = ordered
+        self.on_error = on_error
+        self.usage    = None
+        sizes = [queue_size or 2 * count for count in workers]
+        self.queues   = [queue.Queue(maxsize=size) for size in sizes]
+        self.results  = queue.Queue(maxsize=queue_size or 2 * workers[-1])
+        self._closed  = threading.Event()
+        self._lock    = threading.Lock()
+        self._live    = list(workers)          # running workers per stage
+        self._threads: list = []
+        self._error: "Exception | None" = None
+
+    # ── plumbing ─────────────────────────────────────────────────────
+
+    def _put(self, target: "queue.Queue", value) -> bool:
+        """Blocking put that gives up once the pipeline is closed."""
+        while not self._closed.is_set():
+            try:
+                target.put(value, timeout=_POLL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: "queue.Queue"):
+        while not self._closed.is_set():
+            try:
+                return source.get(timeout=_POLL)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _downstream(self, stage: int) -> "tuple[queue.Queue, int]":
+        if stage + 1 < len(self.queues):
+            return self.queues[stage + 1], self.workers[stage + 1]
+        return self.results, 1
+
+    def start(self) -> None:
+        for stage, count in enumerate(self.workers):
+            for _ in range(count):
+                self._spawn(self._work, stage)
+        self._spawn(self._produce)
+
+    def _spawn(self, target, *args) -> None:
+        # Each thread runs in its own copy of the caller's context, so a run
+        # deadline set around the pipeline reaches every stage.
+        thread = threading.Thread(target=contextvars.copy_context().run,
+                                  args=(target, *args), daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def close(self) -> None:
+        self._closed.set()
+        for thread in self._threads:
+            thread.join()
+
+    # ── threads ──────────────────────────────────────────────────────
+
+    def _produce(self) -> None:
+        try:
+            for index, item in enumerate(self.items):
+                accumulated = Scope({**self.chain.variables, **self.shared, **item})
+                if not self._put(self.queues[0], _Item(index, accumulated)):
+                    return
+        except Exception as exc:
+            # A failing items iterable ends the pipeline; the consumer raises it.
+            self._error = exc
+            self._closed.set()
+            return
+        for _ in range(self.workers[0]):
+            self._put(self.queues[0], _END)
+
+    def _work(self, stage: int) -> None:
+        target, count = self._downstream(stage)
+        while True:
+            item = self._get(self.queues[stage])
+            if item is _END:
+                break
+            if not item.done and item.error is None:
+                self._run_step(stage, item)
+            if not self._put(target, item):
+                return
+        # The last worker of a stage to finish ends the next stage's input.
+        with self._lock:
+            self._live[stage] -= 1
+            last = self._live[stage] == 0
+        if last:
+            for _ in range(count):
+                self._put(target, _END)
+
+    def _run_step(self, idx: int, item: _Item) -> None:
+        from ..state import Suspend
+
+        chain = self.chain
+        runner, output_key, input_map, kind, options = chain._steps[idx]
+        name = getattr(runner, "name", None) or f"step_{idx}"
+        payload = {"kind": kind, "item": item.index}
+        chain._emit("step.started", step=idx, name=name, payload=payload)
+        try:
+            check_deadline(f"chain step {idx} ({name!r}) for item {item.index}")
+            memo_key = chain._memo_key(idx, item.accumulated)
+            cached   = chain._memo_lookup(idx, name, memo_key)
+            if cached is not None:
+                output, usage = cached[0], None
+            else:
+                call_runner, method, kwargs = chain._step_call(idx, item.accumulated,
+                                                               None, None)
+                try:
+                    value = getattr(call_runner, method)(**kwargs)
+                except Suspend as exc:
+                    raise RuntimeError(
+                        f"Chain step {idx} ({name!r}) suspended "
+                        f"({exc.reason!r}); pipeline() cannot suspend."
+                    ) from exc
+                if kind == "agent" and _suspended(value):
+                    raise RuntimeError(
+                        f"Agent step {idx} ({name!r}) suspended; pipeline() "
+                        f"cannot suspend."
+                    )
+                output, usage = chain._step_output(idx, value, call_runner)
+                chain._memo_store(memo_key, output)
+        except Exception as exc:
+            expired = isinstance(exc, DeadlineExceededError)
+            if self.on_error == "raise" or expired:
+                item.error = exc
+            elif self.on_error == "stop":
+                item.done = True
+            else:
+                warnings.warn(
+                    f"Chain step {idx} ({name!r}) failed for item {item.index} "
+                    f"and was skipped: {exc}.",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+            return
+
+        if usage:
+            with self._lock:
+                self.usage = usage if self.usage is None else self.usage + usage
+        item.accumulated = item.accumulated.updated(
+            output if isinstance(output, dict) else {output_key: output})
+        item.output = output
+        chain._emit("step.ended", step=idx, name=name, payload=payload)
+
+    # ── consumer ─────────────────────────────────────────────────────
+
+    def __iter__(self) -> "Iterator[tuple[int, object]]":
+        waiting: dict = {}
+        next_index = 0
+        self.start()
+        try:
+            while True:
+                item = self._get(self.results)
+                if item is _END:
+                    if self._error is not None:
+                        raise self._error
+                    break
+                if not self.ordered:
+                    yield self._outcome(item)
+                    continue
+                waiting[item.index] = item
+                while next_index in waiting:
+                    yield self._outcome(waiting.pop(next_index))
+                    next_index += 1
+        finally:
+            self.close()
+            self.chain.last_usage = self.usage
+
+    @staticmethod
+    def _outcome(item: _Item) -> "tuple[int, object]":
+        if item.error is not None:
+            raise item.error
+        return item.index, item.output
+
+
+def _suspended(value) -> bool:
+    from ..state import SuspendedResult
+    return isinstance(value, SuspendedResult)
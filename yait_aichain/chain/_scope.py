@@ -0,0 +1,109 @@
+"""
+chain._scope
+============
+
+``Scope`` — the persistent (immutable, structurally shared) mapping that
+holds a chain run's accumulated variables.
+
+A chain snapshots its variables at every step: the ``input`` of each
+``history`` record and the run document's checkpoint.  With plain dicts each
+snapshot is a copy of every key, so a run costs O(steps × variables).  A
+``Scope`` is never changed in place — ``updated`` returns a new
+scope that adds one layer of written keys on top of the old one, which
+stays valid — so a snapshot is just a reference, and a step costs only the
+keys it writes.
+
+Lookups walk the layers, newest first.  Once a scope is ``_MAX_DEPTH``
+layers deep the next write folds them into one, keeping lookups cheap;
+that fold is the only full copy, once every ``_MAX_DEPTH`` steps.
+
+The values themselves are shared, never copied: the chain replaces a
+variable's value, it does not mutate it.  A ``Scope`` is a read-only
+:class:`~collections.abc.Mapping`; ``dict(scope)`` materialises it where a
+real dict is needed (serialisation, ``Chain.accumulated``, ``history``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+# Layers before a write folds the scope into one.
+_MAX_DEPTH = 16
+
+_MISSING = object()
+
+
+class Scope(Mapping):
+    """
+    Immutable mapping of variables that shares structure with the scopes it
+    was derived from.
+
+    Parameters
+    ----------
+    values : Mapping | None
+        Initial variables (copied once, shallowly).
+    """
+
+    __slots__ = ("_layer", "_parent", "_depth")
+
+    def __init__(self, values: "Mapping | None" = None) -> None:
+        self._layer: dict = dict(values or {})
+        self._parent: "Scope | None" = None
+        self._depth = 1
+
+    @classmethod
+    def _derive(cls, parent: "Scope", layer: dict) -> "Scope":
+        scope = cls.__new__(cls)
+        scope._layer  = layer
+        scope._parent = parent
+        scope._depth  = parent._depth + 1
+        return scope
+
+    # ── writes (return a new scope) ──────────────────────────────────
+
+    def updated(self, values: Mapping) -> "Scope":
+        """A new scope with *values* written over this one's."""
+        if not values:
+            return self
+        if self._depth >= _MAX_DEPTH:
+            return Scope({**self._materialise(), **values})
+        return Scope._derive(self, dict(values))
+
+    # ── Mapping ──────────────────────────────────────────────────────
+
+    def __getitem__(self, key):
+        scope = self
+        while scope is not None:
+            value = scope._layer.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            scope = scope._parent
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        scope = self
+        while scope is not None:
+            if key in scope._layer:
+                return True
+            scope = scope._parent
+        return False
+
+    def __iter__(self):
+        return iter(self._materialise())
+
+    def __len__(self) -> int:
+        return len(self._materialise())
+
+    def __repr__(self) -> str:
+        return f"Scope({self._materialise()!r})"
+
+    def _materialise(self) -> dict:
+        """Every variable in one new dict, in first-written order."""
+        layers, scope = [], self
+        while scope is not None:
+            layers.append(scope._layer)
+            scope = scope._parent
+        flat: dict = {}
+        for layer in reversed(layers):
+            flat.update(layer)
+        return flat
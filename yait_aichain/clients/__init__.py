@@ -16,9 +16,18 @@ requests) for one API family.  Five family classes cover all eight providers:
 
 A client is created per provider with that provider's data dict; the model
 layer (``models.Model``) picks and builds the right one.
+
+All clients share one process-wide set of per-host connection pools; tune it
+with ``configure_http()`` and inspect reuse with ``http_stats()``.  Client-side
+RPM / TPM limits per provider + model are set with ``set_rate_limit()``, and
+repeated identical requests can be served from a ``MemoryCache`` /
+``SQLiteCache`` (``set_response_cache()`` or ``client_options["cache"]``).
 """
 
 from ._base import BaseClient, APIError
+from ._http import configure_http, http_stats
+from ._ratelimit import RateLimiter, set_rate_limit
+from ._cache import ResponseCache, MemoryCache, SQLiteCache, set_response_cache
 from ._errors import (
     NetworkError,
     RateLimitError,
@@ -28,6 +37,8 @@ from ._errors import (
     NotFoundError,
     ServerError,
     TaskFailedError,
+    DeadlineExceededError,
+    ContextWindowExceededError,
 )
 from ._families.openai     import OpenAIClient
 from ._families.perplexity import PerplexityClient
@@ -38,6 +49,14 @@ from ._families.google     import GoogleClient
 __all__ = [
     "BaseClient",
     "APIError",
+    "configure_http",
+    "http_stats",
+    "RateLimiter",
+    "set_rate_limit",
+    "ResponseCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "set_response_cache",
     "NetworkError",
     "RateLimitError",
     "AuthenticationError",
@@ -46,6 +65,8 @@ __all__ = [
     "NotFoundError",
     "ServerError",
     "TaskFailedError",
+    "DeadlineExceededError",
+    "ContextWindowExceededError",
     "OpenAIClient",
     "PerplexityClient",
     "QwenClient",
@@ -0,0 +1,433 @@
+"""
+clients._aio
+============
+
+Minimal asyncio HTTP/1.1 transport used by the ``a*`` methods of
+``BaseClient`` (``asend`` / ``_apost`` / ``_aget`` / ``_adownload``).
+
+Built on ``asyncio`` streams only — no extra dependency — so thousands of
+requests can be in flight on a single event loop without one OS thread per
+call.  It mirrors the parts of urllib3 the sync path relies on:
+
+  - keep-alive connection reuse per ``(scheme, host, port)``
+  - TLS, ``Content-Length`` and ``chunked`` response bodies
+  - HTTP and HTTPS-over-``CONNECT`` proxies with Basic auth
+  - the same ``urllib3.Retry`` / ``urllib3.Timeout`` objects the sync path
+    uses (status retries, ``Retry-After``, exponential backoff, redirects)
+
+Anything not listed (HTTP/2, compressed bodies, cookies) is deliberately out of
+scope — provider APIs don't need it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import ssl
+from urllib.parse import urljoin
+
+import urllib3
+from urllib3.util import parse_url
+
+from ._constants import DEFAULT_TIMEOUT, DEFAULT_RETRIES
+from ._sink import CHUNK_SIZE
+
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_IDLE_PER_HOST = 100
+
+
+class AsyncResponse:
+    """Fully-read HTTP response: ``status``, ``headers`` and ``data`` bytes."""
+
+    __slots__ = ("status", "headers", "data")
+
+    def __init__(self, status: int, headers: urllib3.HTTPHeaderDict, data: bytes) -> None:
+        self.status  = status
+        self.headers = headers
+        self.data    = data
+
+
+class _Connection:
+    __slots__ = ("reader", "writer", "loop", "reused")
+
+    def __init__(self, reader, writer, loop) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.loop   = loop
+        self.reused = False
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class _IncompleteResponse(ConnectionError):
+    """The peer closed a pooled connection before sending a status line."""
+
+
+def _seconds(value) -> "float | None":
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+class AsyncHTTP:
+    """
+    asyncio counterpart of the ``urllib3.PoolManager`` built by ``make_http``.
+
+    Parameters
+    ----------
+    proxy : dict | None
+        Same shape as ``make_http``: ``{"url", "username", "password"}``.
+    timeout : urllib3.Timeout
+        ``connect`` bounds connection setup, ``read`` bounds reading one
+        response.
+    retries : urllib3.Retry
+        Default retry policy; may be overridden per request.
+    maxsize : int
+        Idle keep-alive connections kept per host.
+    """
+
+    def __init__(
+        self,
+        proxy:   "dict | None" = None,
+        *,
+        timeout: urllib3.Timeout = DEFAULT_TIMEOUT,
+        retries: urllib3.Retry   = DEFAULT_RETRIES,
+        maxsize: int             = _MAX_IDLE_PER_HOST,
+    ) -> None:
+        self._timeout = timeout
+        self._retries = retries
+        self._maxsize = maxsize
+        self._idle: dict[tuple, list[_Connection]] = {}
+        # Reuse counters, read by clients._http.http_stats().
+        self.num_connections = 0
+        self.num_requests    = 0
+        self.num_reused      = 0
+        self._ssl = ssl.create_default_context()
+
+        self._proxy = None
+        self._proxy_headers: dict = {}
+        if proxy:
+            self._proxy = parse_url(proxy["url"])
+            username = proxy.get("username")
+            password = proxy.get("password")
+            if username and password:
+                encoded = base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("utf-8")
+                self._proxy_headers["Proxy-Authorization"] = f"Basic {encoded}"
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    async def request(
+        self,
+        method:  str,
+        url:     str,
+        *,
+        body:    "bytes | None" = None,
+        fields:  "dict | None"  = None,
+        headers: "dict | None"  = None,
+        retries: "urllib3.Retry | None" = None,
+        timeout: "urllib3.Timeout | None" = None,
+        sink=None,
+    ) -> AsyncResponse:
+        """
+        Send one request, applying the retry policy, and return the response.
+
+        Network failures are re-raised once retries are exhausted; non-2xx
+        statuses are returned (``raise_on_status=False`` semantics) so the
+        caller maps them to ``APIError`` exactly like the sync path.
+
+        With a *sink* (``clients._sink.FileSink``) a 2xx body is written to it
+        chunk by chunk as it arrives and the response's ``data`` is empty.
+        *timeout* overrides the transport's own for this request.
+        """
+        headers = dict(headers or {})
+        if fields is not None:
+            body, content_type = urllib3.encode_multipart_formdata(fields)
+            headers["Content-Type"] = content_type
+
+        retry = urllib3.Retry.from_int(retries if retries is not None else self._retries)
+        while True:
+            try:
+                response = await self._request_once(method, url, body, headers, sink,
+                                                    timeout or self._timeout)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ssl.SSLError) as exc:
+                if sink is not None and sink.size:
+                    raise          # part of the body is already written out
+                try:
+                    retry = retry.increment(method, url, error=_as_urllib3_error(exc))
+                except urllib3.exceptions.HTTPError:
+                    raise exc from None
+                await asyncio.sleep(retry.get_backoff_time())
+                continue
+
+            location = response.headers.get("Location")
+            if location and response.status in _REDIRECT_STATUSES and retry.redirect != 0:
+                try:
+                    retry = retry.increment(method, url, response=_shim(response))
+                except urllib3.exceptions.MaxRetryError:
+                    return response
+                url = urljoin(url, location)
+                if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+                    method, body = "GET", None
+                    headers.pop("Content-Type", None)
+                continue
+
+            has_retry_after = "Retry-After" in response.headers
+            if retry.is_retry(method, response.status, has_retry_after):
+                try:
+                    retry = retry.increment(method, url, response=_shim(response))
+                except urllib3.exceptions.MaxRetryError:
+                    return response
+                delay = None
+                if retry.respect_retry_after_header:
+                    delay = retry.get_retry_after(_shim(response))
+                await asyncio.sleep(delay if delay is not None else retry.get_backoff_time())
+                continue
+            return response
+
+    async def aclose(self) -> None:
+        """Close every idle pooled connection."""
+        for conns in self._idle.values():
+            for conn in conns:
+                conn.close()
+        self._idle.clear()
+
+    # ── Connection pool ───────────────────────────────────────────────────────
+
+    async def _acquire(self, scheme: str, host: str, port: int,
+                       timeout: "urllib3.Timeout | None" = None) -> _Connection:
+        loop = asyncio.get_running_loop()
+        idle = self._idle.get((scheme, host, port))
+        while idle:
+            conn = idle.pop()
+            if conn.loop is loop and not conn.writer.is_closing() and not conn.reader.at_eof():
+                conn.reused = True
+                self.num_reused += 1
+                return conn
+            conn.close()
+
+        connect_timeout = _seconds((timeout or self._timeout).connect_timeout)
+        self.num_connections += 1
+        return await asyncio.wait_for(self._open(scheme, host, port, loop), connect_timeout)
+
+    async def _open(self, scheme: str, host: str, port: int, loop) -> _Connection:
+        proxy = self._proxy
+        if proxy is None:
+            reader, writer = await asyncio.open_connection(
+                host, port,
+                ssl=self._ssl if scheme == "https" else None,
+                server_hostname=host if scheme == "https" else None,
+            )
+            return _Connection(reader, writer, loop)
+
+        reader, writer = await asyncio.open_connection(
+            proxy.host, proxy.port or (443 if proxy.scheme == "https" else 80),
+            ssl=self._ssl if proxy.scheme == "https" else None,
+        )
+        conn = _Connection(reader, writer, loop)
+        if scheme != "https":
+            return conn
+
+        # HTTPS through a proxy: open a CONNECT tunnel, then upgrade to TLS.
+        lines = [f"CONNECT {host}:{port} HTTP/1.1", f"Host: {host}:{port}"]
+        lines += [f"{k}: {v}" for k, v in self._proxy_headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+        status, _, _ = await _read_head(reader)
+        if status != 200:
+            conn.close()
+            raise OSError(f"Tunnel connection failed: proxy returned {status}")
+        if not hasattr(writer, "start_tls"):
+            conn.close()
+            raise OSError("HTTPS over a proxy requires Python 3.11+ for async requests")
+        await writer.start_tls(self._ssl, server_hostname=host)
+        return conn
+
+    def _release(self, key: tuple, conn: _Connection) -> None:
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self._maxsize:
+            idle.append(conn)
+        else:
+            conn.close()
+
+    # ── One round trip ────────────────────────────────────────────────────────
+
+    async def _request_once(self, method: str, url: str, body, headers: dict,
+                            sink=None, timeout: "urllib3.Timeout | None" = None) -> AsyncResponse:
+        parsed = parse_url(url)
+        scheme = parsed.scheme or "http"
+        host   = parsed.host
+        port   = parsed.port or (443 if scheme == "https" else 80)
+        key    = (scheme, host, port)
+
+        # Through a plain-HTTP proxy the request line carries the absolute URL.
+        forward = self._proxy is not None and scheme == "http"
+        target  = url if forward else parsed.request_uri
+        default_port = (scheme == "https" and port == 443) or (scheme == "http" and port == 80)
+        head = {
+            "Host":            host if default_port else f"{host}:{port}",
+            "Accept-Encoding": "identity",
+            "User-Agent":      f"python-urllib3/{urllib3.__version__}",
+        }
+        if forward:
+            head.update(self._proxy_headers)
+        head.update(headers)
+        if body is not None or method in ("POST", "PUT", "PATCH"):
+            head["Content-Length"] = str(len(body or b""))
+
+        payload = f"{method} {target} HTTP/1.1\r\n"
+        payload += "".join(f"{k}: {v}\r\n" for k, v in head.items()) + "\r\n"
+        raw = payload.encode("latin-1") + (body or b"")
+
+        # A pooled connection may have been closed by the server while idle;
+        # that surfaces as an immediate EOF — retry once on a fresh socket.
+        for _ in range(2):
+            conn = await self._acquire(scheme, host, port, timeout)
+            self.num_requests += 1
+            try:
+                response, keep_alive = await asyncio.wait_for(
+                    self._exchange(conn, method, raw, sink),
+                    _seconds((timeout or self._timeout).read_timeout),
+                )
+            except _IncompleteResponse:
+                conn.close()
+                if conn.reused:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if keep_alive:
+                self._release(key, conn)
+            else:
+                conn.close()
+            return response
+        raise _IncompleteResponse("connection closed before a response was received")
+
+    async def _exchange(self, conn: _Connection, method: str, raw: bytes, sink=None):
+        conn.writer.write(raw)
+        await conn.writer.drain()
+        reader = conn.reader
+
+        status, version, headers = await _read_head(reader)
+        while 100 <= status < 200:      # skip interim 1xx responses
+            status, version, headers = await _read_head(reader)
+
+        keep_alive = version == "HTTP/1.1" and headers.get("Connection", "").lower() != "close"
+        if sink is not None and 200 <= status < 300:
+            sink.start(headers.get("Content-Type"))
+            keep_alive = await _stream_body(reader, headers, sink.write) and keep_alive
+            return AsyncResponse(status, headers, b""), keep_alive
+        if method == "HEAD" or status in (204, 304):
+            data = b""
+        elif "chunked" in headers.get("Transfer-Encoding", "").lower():
+            data = await _read_chunked(reader)
+        elif "Content-Length" in headers:
+            data = await reader.readexactly(int(headers["Content-Length"]))
+        else:
+            data = await reader.read()
+            keep_alive = False
+        return AsyncResponse(status, headers, data), keep_alive
+
+
+# ── Wire helpers ──────────────────────────────────────────────────────────────
+
+async def _read_head(reader) -> "tuple[int, str, urllib3.HTTPHeaderDict]":
+    line = await reader.readline()
+    if not line:
+        raise _IncompleteResponse("connection closed before a response was received")
+    parts   = line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+    version = parts[0]
+    try:
+        status = int(parts[1])
+    except (IndexError, ValueError):
+        raise OSError(f"Malformed HTTP status line: {line!r}") from None
+
+    headers = urllib3.HTTPHeaderDict()
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers.add(name.strip(), value.strip())
+    return status, version, headers
+
+
+async def _read_chunked(reader) -> bytes:
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+        if size == 0:
+            # Drain optional trailers up to the terminating blank line.
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readline()          # CRLF after each chunk
+
+
+async def _stream_body(reader, headers, write) -> bool:
+    """
+    Pass a response body to *write* piece by piece; False when it ran to EOF
+    (no length given), so the connection cannot be reused.
+    """
+    if "chunked" in headers.get("Transfer-Encoding", "").lower():
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return True
+            while size:
+                piece = await reader.readexactly(min(size, CHUNK_SIZE))
+                write(piece)
+                size -= len(piece)
+            await reader.readline()
+    if "Content-Length" in headers:
+        remaining = int(headers["Content-Length"])
+        while remaining:
+            piece = await reader.readexactly(min(remaining, CHUNK_SIZE))
+            write(piece)
+            remaining -= len(piece)
+        return True
+    while piece := await reader.read(CHUNK_SIZE):
+        write(piece)
+    return False
+
+
+def _shim(response: AsyncResponse):
+    """Adapt an ``AsyncResponse`` for ``urllib3.Retry`` bookkeeping."""
+    return urllib3.HTTPResponse(
+        body=b"", headers=response.headers, status=response.status,
+        preload_content=False,
+    )
+
+
+def _as_urllib3_error(exc: Exception) -> Exception:
+    """Map a raw asyncio error onto the urllib3 class ``Retry`` understands."""
+    if isinstance(exc, asyncio.TimeoutError):
+        return urllib3.exceptions.ReadTimeoutError(None, None, str(exc) or "read timed out")
+    if isinstance(exc, (asyncio.IncompleteReadError, _IncompleteResponse)):
+        return urllib3.exceptions.ProtocolError(str(exc), exc)
+    return urllib3.exceptions.NewConnectionError(None, str(exc))
+
+
+def make_async_http(
+    proxy: "dict | None" = None,
+    *,
+    timeout = DEFAULT_TIMEOUT,
+    retries = DEFAULT_RETRIES,
+) -> AsyncHTTP:
+    """
+    Async sibling of ``make_http``: same proxy rules (explicit dict wins,
+    else ``HTTPS_PROXY`` / ``HTTP_PROXY``), same timeout and retry objects,
+    and the same process-wide sharing (see ``clients._http``).
+    """
+    from ._base import _proxy_from_env
+    from ._http import shared_async
+    if proxy is None:
+        proxy = _proxy_from_env()
+    return shared_async(proxy or None, timeout=timeout, retries=retries)
@@ -1,8 +1,16 @@
+import hashlib
+import inspect
+import math
 import os
+import time
 import urllib3
 import json
-import base64
 
+from ._http import shared_manager
+from ._ratelimit import estimate_tokens
+from ._cache import default_cache, is_sampled, request_key
+from ._sink import CHUNK_SIZE, FileSink, download_target
+from .._events import Event, emit_active
 from ._constants import (
     DEFAULT_TIMEOUT,
     DEFAULT_RETRIES,
@@ -31,24 +39,14 @@ def make_http(proxy: "dict | None" = None, *, timeout=DEFAULT_TIMEOUT, retries=D
         {"url": "http://host:3128", "username": "u", "password": "p"}
 
     Basic ``Proxy-Authorization`` is added when username + password are given.
+
+    Callers with the same settings share one process-wide manager, so
+    connections to a host are pooled and reused across clients (see
+    ``clients._http``).
     """
     if proxy is None:
         proxy = _proxy_from_env()
-    if not proxy:
-        return urllib3.PoolManager(timeout=timeout, retries=retries)
-
-    proxy_headers: dict = {}
-    username = proxy.get("username")
-    password = proxy.get("password")
-    if username and password:
-        encoded = base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("utf-8")
-        proxy_headers["Proxy-Authorization"] = f"Basic {encoded}"
-    return urllib3.ProxyManager(
-        proxy_url=proxy["url"],
-        proxy_headers=proxy_headers,
-        timeout=timeout,
-        retries=retries,
-    )
+    return shared_manager(proxy or None, timeout=timeout, retries=retries)
 
 # APIError and its subclasses live in ._errors; re-exported here so the
 # long-standing ``from ._base import APIError`` imports keep working.
@@ -61,8 +59,103 @@ from ._errors import (  # noqa: F401
     NotFoundError,
     ServerError,
     TaskFailedError,
+    DeadlineExceededError,
     error_from_status,
 )
+from .._deadline import check_deadline, deadline_at, remaining
+
+
+class RequestBody(dict):
+    """
+    A JSON request body that is encoded once and reused by every send of it.
+
+    ``Model.to_request`` returns its body as a ``RequestBody``; the Skill
+    layer sends that same object on every retry and every rate-limit
+    re-admission, so a multi-megabyte vision body is serialised once per
+    model call rather than once per attempt.  Treat it as frozen once sent:
+    the encoding is taken on the first send and not refreshed.
+    """
+
+    __slots__ = ("_encoded",)
+
+    def encoded(self) -> bytes:
+        try:
+            return self._encoded
+        except AttributeError:
+            self._encoded = json.dumps(self).encode("utf-8")
+            return self._encoded
+
+
+def _json_bytes(data) -> bytes:
+    """The UTF-8 JSON encoding of *data*, memoised for a ``RequestBody``."""
+    if isinstance(data, RequestBody):
+        return data.encoded()
+    return json.dumps(data).encode("utf-8")
+
+
+def _body_or_raise(response) -> bytes:
+    """Return the body of a 2xx *response*; raise the matching ``APIError`` otherwise."""
+    if 200 <= response.status < 300:
+        return response.data
+    raise error_from_status(
+        response.status,
+        response.data.decode("utf-8", errors="replace"),
+        response.headers,
+    )
+
+
+def _network_error(exc) -> APIError:
+    """
+    The error for a transport failure: ``NetworkError``, or
+    ``DeadlineExceededError`` when the run's deadline cut the request short.
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        return DeadlineExceededError(f"Deadline exceeded during the request: {exc}")
+    return NetworkError(0, str(exc))
+
+
+def _capped(seconds, left: float) -> float:
+    """A ``Timeout`` component capped to *left* seconds (unset counts as no limit)."""
+    return min(float(seconds), left) if isinstance(seconds, (int, float)) else left
+
+
+class _DeadlineRetry(urllib3.Retry):
+    """
+    A ``Retry`` that also runs out at an absolute ``time.monotonic()``
+    deadline: no attempt starts after it, and no backoff or ``Retry-After``
+    sleep runs past it.
+    """
+
+    def __init__(self, *args, deadline: float = math.inf, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.deadline = deadline
+
+    @classmethod
+    def within(cls, retries, deadline: float) -> "_DeadlineRetry":
+        """*retries* (a ``Retry`` or int) bounded by *deadline*."""
+        base = urllib3.Retry.from_int(retries)
+        params = inspect.signature(urllib3.Retry.__init__).parameters
+        return cls(deadline=deadline, **{
+            name: getattr(base, name) for name in params
+            if name != "self" and hasattr(base, name)
+        })
+
+    def new(self, **kw) -> "_DeadlineRetry":
+        kw.setdefault("deadline", self.deadline)
+        return super().new(**kw)
+
+    def is_exhausted(self) -> bool:
+        return super().is_exhausted() or time.monotonic() >= self.deadline
+
+    def get_backoff_time(self) -> float:
+        return min(super().get_backoff_time(), max(self.deadline - time.monotonic(), 0.0))
+
+    def get_retry_after(self, response) -> "float | None":
+        delay = super().get_retry_after(response)
+        if delay is None:
+            return None
+        return min(delay, max(self.deadline - time.monotonic(), 0.0))
 
 
 class BaseClient:
@@ -104,6 +197,14 @@ class BaseClient:
 
         When both ``username`` and ``password`` are present the
         ``Proxy-Authorization: Basic …`` header is added automatically.
+    rate_limit : RateLimiter | None, optional
+        Admit every ``send`` / ``stream`` through this shared limiter (see
+        ``clients._ratelimit``).  429s are then handled by the limiter's
+        coordinated cooldown instead of urllib3's per-request back-off.
+    cache : ResponseCache | None, optional
+        Serve repeated identical requests from this cache (see
+        ``clients._cache``).  Defaults to the process-wide cache set with
+        ``set_response_cache``, if any.
     """
 
     # Subclasses must override this.
@@ -116,14 +217,32 @@ class BaseClient:
         timeout: urllib3.Timeout = DEFAULT_TIMEOUT,
         retries: urllib3.Retry = DEFAULT_RETRIES,
         proxy: dict | None = None,
+        rate_limit: "RateLimiter | None" = None,
+        cache: "ResponseCache | None" = None,
     ) -> None:
         self._api_key = api_key
         self._base_url = (url or self.BASE_URL).rstrip("/")
 
+        # With a limiter, 429 must surface to send() so every caller of this
+        # provider + model cools down together; urllib3 would otherwise sleep
+        # and retry each request on its own.
+        self._limiter = rate_limit
+        self._cache   = cache
+        if rate_limit is not None and isinstance(retries, urllib3.Retry) \
+                and retries.status_forcelist and 429 in retries.status_forcelist:
+            retries = retries.new(status_forcelist=set(retries.status_forcelist) - {429})
+
         # An explicit proxy wins; otherwise HTTPS_PROXY / HTTP_PROXY env vars
         # are honoured (shared with every tool client via make_http).
         self._http = make_http(proxy, timeout=timeout, retries=retries)
 
+        # The asyncio transport is built lazily on first async call, from the
+        # same proxy / timeout / retry settings.
+        self._proxy   = proxy
+        self._timeout = timeout
+        self._retries = retries
+        self._aio     = None
+
     # ------------------------------------------------------------------
     # Authentication — must be overridden by every provider subclass
     # ------------------------------------------------------------------
@@ -151,8 +270,9 @@ class BaseClient:
         into the provider's native ``(path, body)`` pair.
 
         ``params`` carries the model-level settings the family needs:
-        ``{name, temperature, max_tokens, top_p, top_k, reasoning}``.  The
-        client is stateless about the model — everything comes in here.
+        ``{name, temperature, max_tokens, top_p, top_k, reasoning,
+        cache_control}``.  The client is stateless about the model —
+        everything comes in here.
 
         Abstract: each family client (openai / anthropic / google / …)
         implements its own wire format.  Not a passthrough — an unimplemented
@@ -162,6 +282,17 @@ class BaseClient:
             f"{type(self).__name__} must implement build_request()"
         )
 
+    def build_continuation(
+        self, previous: dict, messages: list, output: dict, params: dict
+    ) -> "tuple[str, dict] | None":
+        """
+        A request that continues the conversation the provider stored for
+        the raw response *previous*, sending only the new *messages* — or
+        ``None`` when the family keeps no server-side state (the default), so
+        the caller resends the whole conversation with ``build_request``.
+        """
+        return None
+
     def parse_response(self, response: dict, output: dict) -> "str | dict":
         """
         Translate the provider's raw response into our clean result
@@ -180,6 +311,73 @@ class BaseClient:
         Execute one logical completion and return the raw response bytes that
         ``parse_response`` will consume.
 
+        A repeated request is answered from the response cache when one is
+        configured.  Otherwise the request is admitted through the client's
+        rate limiter (when one is set) and ``_send`` runs.  A 429 starts the
+        limiter's shared cooldown — ``Retry-After`` when the provider sent
+        one — and the request is re-admitted, up to ``_RATE_LIMIT_RETRIES``
+        times.  Past the run's deadline (``run(deadline=...)``) nothing is
+        sent: ``DeadlineExceededError`` is raised instead.
+        """
+        cache, key = self._cache_lookup(path, body, headers)
+        if key is not None:
+            raw = cache.get(key)
+            self._report_cache(raw is not None, key, body)
+            if raw is not None:
+                return raw
+        check_deadline(f"a request to {self._base_url}")
+        raw = self._limited_send(path, body, headers)
+        if key is not None:
+            cache.set(key, raw)
+        return raw
+
+    async def asend(self, path: str, body: dict, headers: dict) -> bytes:
+        """
+        Async counterpart of ``send``: same contract, awaited on the event loop
+        via the native asyncio transport instead of blocking a thread.
+        """
+        cache, key = self._cache_lookup(path, body, headers)
+        if key is not None:
+            raw = cache.get(key)
+            self._report_cache(raw is not None, key, body)
+            if raw is not None:
+                return raw
+        check_deadline(f"a request to {self._base_url}")
+        raw = await self._alimited_send(path, body, headers)
+        if key is not None:
+            cache.set(key, raw)
+        return raw
+
+    def _limited_send(self, path: str, body: dict, headers: dict) -> bytes:
+        if self._limiter is None:
+            return self._send(path, body, headers)
+        tokens = estimate_tokens(body)
+        for attempt in range(self._RATE_LIMIT_RETRIES + 1):
+            self._report_wait(self._limiter.acquire(tokens), tokens)
+            try:
+                return self._send(path, body, headers)
+            except RateLimitError as exc:
+                if attempt == self._RATE_LIMIT_RETRIES:
+                    raise
+                self._limiter.cooldown(self._rate_limit_delay(exc, attempt))
+
+    async def _alimited_send(self, path: str, body: dict, headers: dict) -> bytes:
+        if self._limiter is None:
+            return await self._asend(path, body, headers)
+        tokens = estimate_tokens(body)
+        for attempt in range(self._RATE_LIMIT_RETRIES + 1):
+            self._report_wait(await self._limiter.aacquire(tokens), tokens)
+            try:
+                return await self._asend(path, body, headers)
+            except RateLimitError as exc:
+                if attempt == self._RATE_LIMIT_RETRIES:
+                    raise
+                self._limiter.cooldown(self._rate_limit_delay(exc, attempt))
+
+    def _send(self, path: str, body: dict, headers: dict) -> bytes:
+        """
+        The transport behind ``send``.
+
         The default is a single JSON POST — the right behaviour for every
         synchronous API.  A provider whose endpoint is *asynchronous* (submit a
         job, poll for completion, then download the artefact) overrides this to
@@ -189,6 +387,127 @@ class BaseClient:
         """
         return self._post(path, body, headers)
 
+    async def _asend(self, path: str, body: dict, headers: dict) -> bytes:
+        """
+        The transport behind ``asend``.  Providers that override ``_send``
+        with a multi-step flow override this too (``QwenClient``,
+        ``BFLClient``).
+        """
+        return await self._apost(path, body, headers)
+
+    # 429 handling when a rate limiter is set: re-admissions per request, and
+    # the cooldown used when the provider sends no Retry-After (doubling,
+    # like DEFAULT_RETRIES' back-off).
+    _RATE_LIMIT_RETRIES = 4
+    _RATE_LIMIT_BACKOFF = 2.0
+
+    def _rate_limit_delay(self, exc: "RateLimitError", attempt: int) -> float:
+        if exc.retry_after is not None:
+            return exc.retry_after
+        return self._RATE_LIMIT_BACKOFF * (2 ** attempt)
+
+    def _cache_lookup(self, path: str, body,
+                      headers: dict) -> "tuple[ResponseCache | None, str | None]":
+        """
+        The cache to use and the request's key, or ``(…, None)`` to bypass.
+        The key is scoped to the client's endpoint and credential (a hash of
+        the API key and auth *headers*), so accounts never share entries.
+        """
+        cache = self._cache if self._cache is not None else default_cache()
+        if cache is None:
+            return None, None
+        # A response that points at a file written by this call must not be
+        # replayed to another call (or into another directory).
+        if (is_sampled(body) and not cache.force) or download_target() is not None:
+            cache.record_bypass()
+            return cache, None
+        identity = hashlib.sha256(
+            json.dumps([self._api_key, headers], sort_keys=True, default=str).encode()
+        ).hexdigest()
+        scope = (type(self).__name__, getattr(self, "_provider", None), self._base_url,
+                 identity)
+        return cache, request_key(scope, path, body)
+
+    def _report_cache(self, hit: bool, key: str, body) -> None:
+        name = body.get("model") if isinstance(body, dict) else None
+        emit_active(Event(type="cache.hit" if hit else "cache.miss",
+                          name=name, payload={"key": key}))
+
+    def _report_wait(self, waited: float, tokens: int) -> None:
+        """Emit ``rate_limit.waited`` for a non-zero admission delay."""
+        if waited > 0:
+            provider, model = self._limiter.key or (None, None)
+            emit_active(Event(type="rate_limit.waited", name=model, duration=waited,
+                              payload={"provider": provider, "tokens": tokens}))
+
+    def stream(self, path: str, body: dict, headers: dict) -> "TextStream":
+        """
+        Streaming sibling of ``send``: execute one completion with the
+        provider's SSE streaming mode and return a ``TextStream`` of text deltas.
+
+        *path* / *body* are the ordinary ``build_request`` pair; the family's
+        ``stream_request`` switches them to the streaming variant and its
+        ``stream_decoder`` turns events into deltas.  After the stream is
+        exhausted ``TextStream.response`` is shaped like the non-streaming
+        response, so ``parse_response`` applies unchanged.
+        """
+        from ._sse import TextStream, iter_sse
+        spath, sbody = self.stream_request(path, body)
+        if self._limiter is not None:
+            tokens = estimate_tokens(body)
+            self._report_wait(self._limiter.acquire(tokens), tokens)
+        events = iter_sse(self._post_stream(spath, sbody, headers))
+        return TextStream(events, self.stream_decoder(spath))
+
+    def stream_request(self, path: str, body: dict) -> "tuple[str, dict]":
+        """
+        Turn a ``build_request`` pair into the provider's streaming request.
+
+        Abstract for streaming: families that support token streaming override
+        this together with ``stream_decoder``.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming"
+        )
+
+    def stream_decoder(self, path: str):
+        """
+        Return a fresh decoder for one stream: ``feed(event) -> list[str]``
+        yields text deltas, ``response() -> dict`` the synthesised response.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming"
+        )
+
+    # Provider batch APIs (``pool.BatchPool``).  Families with one override
+    # all three; see ``clients._batch``.
+
+    def max_batch_requests(self) -> int:
+        """Most requests one batch job accepts; ``0`` when there is no batch API."""
+        return 0
+
+    def batch_submit(self, requests: "list[tuple[str, str, dict]]") -> str:
+        """
+        Submit ``(custom_id, path, body)`` requests — ordinary
+        ``build_request`` pairs sharing one *path* — as one provider batch
+        job and return the job id.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support batch jobs"
+        )
+
+    def batch_poll(self, job_id: str) -> "dict | None":
+        """
+        ``None`` while job *job_id* runs; once it has ended, a dict mapping
+        each finished ``custom_id`` to its response dict (shaped like the
+        synchronous response) or to the ``APIError`` it failed with.
+
+        Raises ``TaskFailedError`` when the job failed as a whole.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support batch jobs"
+        )
+
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
@@ -239,6 +558,38 @@ class BaseClient:
     # Protected HTTP primitives
     # ------------------------------------------------------------------
 
+    def _budget(self, retries=None) -> dict:
+        """
+        Transport overrides that keep one request inside the run's deadline
+        (``_deadline``): the connect / read timeout capped to the time left
+        and *retries* (default: the client's) stopped at the deadline.  Empty
+        (or just *retries*) when no deadline is set.
+
+        Raises
+        ------
+        DeadlineExceededError
+            When the deadline has already passed.
+        """
+        at = deadline_at()
+        if at is None:
+            return {} if retries is None else {"retries": retries}
+        left = at - time.monotonic()
+        if left <= 0:
+            raise DeadlineExceededError(
+                f"Deadline exceeded: no time left for a request to {self._base_url}."
+            )
+        timeout = self._timeout
+        if not isinstance(timeout, urllib3.Timeout):
+            timeout = urllib3.Timeout.from_float(timeout)
+        return {
+            "timeout": urllib3.Timeout(
+                connect=_capped(timeout.connect_timeout, left),
+                read=_capped(timeout.read_timeout, left),
+            ),
+            "retries": _DeadlineRetry.within(
+                self._retries if retries is None else retries, at),
+        }
+
     def _get(self, path: str, headers: dict | None = None) -> bytes:
         """
         Send a GET request to ``{base_url}{path}``.
@@ -258,24 +609,18 @@ class BaseClient:
         APIError
             On any non-2xx status code or network failure.
         """
+        budget = self._budget(DEFAULT_IDEMPOTENT_RETRIES)
         try:
             response = self._http.request(
                 "GET",
                 self._base_url + path,
                 headers=headers,
-                retries=DEFAULT_IDEMPOTENT_RETRIES,
+                **budget,
             )
         except Exception as exc:
-            raise NetworkError(0, str(exc)) from exc
+            raise _network_error(exc) from exc
 
-        if 200 <= response.status < 300:
-            return response.data
-
-        raise error_from_status(
-            response.status,
-            response.data.decode("utf-8", errors="replace"),
-            response.headers,
-        )
+        return _body_or_raise(response)
 
     def _post(self, path: str, data: dict, headers: dict) -> bytes:
         """
@@ -297,24 +642,19 @@ class BaseClient:
         APIError
             On any non-2xx status code or network failure.
         """
+        budget = self._budget()
         try:
             response = self._http.request(
                 "POST",
                 self._base_url + path,
-                body=json.dumps(data).encode("utf-8"),
+                body=_json_bytes(data),
                 headers=headers,
+                **budget,
             )
         except Exception as exc:
-            raise NetworkError(0, str(exc)) from exc
+            raise _network_error(exc) from exc
 
-        if 200 <= response.status < 300:
-            return response.data
-
-        raise error_from_status(
-            response.status,
-            response.data.decode("utf-8", errors="replace"),
-            response.headers,
-        )
+        return _body_or_raise(response)
 
     def _post_form(self, path: str, fields: dict, headers: dict) -> bytes:
         """
@@ -339,26 +679,22 @@ class BaseClient:
         APIError
             On any non-2xx status code or network failure.
         """
+        budget = self._budget()
         try:
             response = self._http.request(
                 "POST",
                 self._base_url + path,
                 fields=fields,
                 headers=headers,
+                **budget,
             )
         except Exception as exc:
-            raise NetworkError(0, str(exc)) from exc
+            raise _network_error(exc) from exc
 
-        if 200 <= response.status < 300:
-            return response.data
+        return _body_or_raise(response)
 
-        raise error_from_status(
-            response.status,
-            response.data.decode("utf-8", errors="replace"),
-            response.headers,
-        )
-
-    def _download(self, url: str, headers: dict | None = None) -> dict:
+    def _download(self, url: str, headers: dict | None = None,
+                  sink: "FileSink | None" = None) -> dict:
         """
         Download binary content from an absolute URL (not base_url-relative).
 
@@ -366,32 +702,190 @@ class BaseClient:
         ----------
         url     : Fully-qualified URL to download.
         headers : Optional HTTP headers.
+        sink    : Where to stream the body instead of reading it into memory
+                  (see ``_download_artifact``).
 
         Returns
         -------
         dict
-            ``{"data": bytes, "media_type": str}``
+            ``{"data": bytes, "media_type": str}``, or with a *sink*
+            ``{"path": str | None, "media_type": str, "size": int, "head": bytes}``.
 
         Raises
         ------
         APIError
             On any non-2xx status code or network failure.
         """
+        budget = self._budget()
         try:
-            response = self._http.request("GET", url, headers=headers)
+            response = self._http.request("GET", url, headers=headers,
+                                          preload_content=sink is None, **budget)
         except Exception as exc:
-            raise NetworkError(0, str(exc)) from exc
-
-        if 200 <= response.status < 300:
-            return {
-                "data": response.data,
-                "media_type": response.headers.get(
-                    "Content-Type", "application/octet-stream"
-                ),
-            }
+            raise _network_error(exc) from exc
 
-        raise error_from_status(
-            response.status,
-            response.data.decode("utf-8", errors="replace"),
-            response.headers,
-        )
+        media_type = response.headers.get("Content-Type", "application/octet-stream")
+        if sink is None:
+            return {"data": _body_or_raise(response), "media_type": media_type}
+
+        complete = False
+        try:
+            if not 200 <= response.status < 300:
+                _body_or_raise(response)
+            sink.start(media_type)
+            for chunk in response.stream(CHUNK_SIZE):
+                sink.write(chunk)
+            complete = True
+        except urllib3.exceptions.HTTPError as exc:
+            raise _network_error(exc) from exc
+        finally:
+            if complete:
+                sink.close()
+            else:
+                sink.discard()
+                response.close()
+            response.release_conn()
+        return sink.result()
+
+    def _download_artifact(self, url: str) -> dict:
+        """
+        ``_download`` a generated artifact (image, audio, video): streamed to
+        the active download target (``clients._sink``) if any, else into memory.
+        """
+        target = download_target()
+        if target is None:
+            return self._download(url)
+        return self._download(url, sink=FileSink(target))
+
+    def _post_stream(self, path: str, data: dict, headers: dict):
+        """
+        Send a JSON POST and yield the response body in chunks as they arrive.
+
+        Uses a non-preloaded urllib3 response, so the first bytes reach the
+        caller while the provider is still generating.  The connection is
+        released when the generator is exhausted or closed.
+
+        Raises
+        ------
+        APIError
+            On a non-2xx status (raised before the first chunk) or a network
+            failure mid-stream.
+        """
+        budget = self._budget()
+        try:
+            response = self._http.request(
+                "POST",
+                self._base_url + path,
+                body=_json_bytes(data),
+                headers=headers,
+                preload_content=False,
+                **budget,
+            )
+        except Exception as exc:
+            raise _network_error(exc) from exc
+
+        complete = False
+        try:
+            if not 200 <= response.status < 300:
+                _body_or_raise(response)
+            # Chunked bodies arrive one HTTP chunk at a time; otherwise read1
+            # returns whatever is buffered instead of waiting for a full block.
+            if response.chunked:
+                yield from response.stream(8192)
+            else:
+                while chunk := response.read1(8192):
+                    yield chunk
+            complete = True
+        except urllib3.exceptions.HTTPError as exc:
+            raise _network_error(exc) from exc
+        finally:
+            # An abandoned stream still has unread bytes on the socket: close
+            # it rather than hand a dirty connection back to the pool.
+            if not complete:
+                response.close()
+            response.release_conn()
+
+    # ------------------------------------------------------------------
+    # Protected async HTTP primitives
+    # ------------------------------------------------------------------
+
+    @property
+    def _ahttp(self):
+        """The asyncio transport (``clients._aio.AsyncHTTP``), built on first use."""
+        if self._aio is None:
+            from ._aio import make_async_http
+            self._aio = make_async_http(
+                self._proxy, timeout=self._timeout, retries=self._retries,
+            )
+        return self._aio
+
+    async def _aget(self, path: str, headers: dict | None = None) -> bytes:
+        """Async ``_get``."""
+        budget = self._budget(DEFAULT_IDEMPOTENT_RETRIES)
+        try:
+            response = await self._ahttp.request(
+                "GET",
+                self._base_url + path,
+                headers=headers,
+                **budget,
+            )
+        except Exception as exc:
+            raise _network_error(exc) from exc
+        return _body_or_raise(response)
+
+    async def _apost(self, path: str, data: dict, headers: dict) -> bytes:
+        """Async ``_post``."""
+        budget = self._budget()
+        try:
+            response = await self._ahttp.request(
+                "POST",
+                self._base_url + path,
+                body=_json_bytes(data),
+                headers=headers,
+                **budget,
+            )
+        except Exception as exc:
+            raise _network_error(exc) from exc
+        return _body_or_raise(response)
+
+    async def _apost_form(self, path: str, fields: dict, headers: dict) -> bytes:
+        """Async ``_post_form``."""
+        budget = self._budget()
+        try:
+            response = await self._ahttp.request(
+                "POST",
+                self._base_url + path,
+                fields=fields,
+                headers=headers,
+                **budget,
+            )
+        except Exception as exc:
+            raise _network_error(exc) from exc
+        return _body_or_raise(response)
+
+    async def _adownload(self, url: str, headers: dict | None = None,
+                         sink: "FileSink | None" = None) -> dict:
+        """Async ``_download``."""
+        budget = self._budget()
+        try:
+            response = await self._ahttp.request("GET", url, headers=headers, sink=sink,
+                                                 **budget)
+        except Exception as exc:
+            if sink is not None:
+                sink.discard()
+            raise _network_error(exc) from exc
+        if sink is not None and 200 <= response.status < 300:
+            sink.close()
+            return sink.result()
+        return {
+            "data": _body_or_raise(response),
+            "media_type": response.headers.get(
+                "Content-Type", "application/octet-stream"
+            ),
+        }
+
+    async def _adownload_artifact(self, url: str) -> dict:
+        """Async ``_download_artifact``."""
+        target = download_target()
+        if target is None:
+            return await self._adownload(url)
+        return await self._adownload(url, sink=FileSink(target))
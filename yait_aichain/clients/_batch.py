@@ -0,0 +1,48 @@
+"""
+clients._batch
+==============
+
+Shared pieces of the provider batch APIs (OpenAI Batch, Anthropic Message
+Batches, Gemini batch mode) behind ``BaseClient.batch_submit`` /
+``batch_poll``.
+
+A batch job takes many ordinary ``build_request`` bodies, each tagged with a
+caller-chosen ``custom_id``, runs them asynchronously (minutes to hours, at
+roughly half the interactive price) and returns one result per id.  Each
+family client translates its bodies into the provider's job format and the
+job's results back into plain response dicts — the same shape the
+synchronous endpoint returns, so ``parse_response`` applies unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+
+from ._errors import APIError, TaskFailedError, error_from_status
+
+
+def to_jsonl(records) -> bytes:
+    """Encode an iterable of JSON-safe records as JSON Lines."""
+    return b"".join(json.dumps(r, ensure_ascii=False).encode("utf-8") + b"\n"
+                    for r in records)
+
+
+def iter_jsonl(data: bytes):
+    """Yield the records of a JSON Lines payload, skipping blank lines."""
+    for line in data.splitlines():
+        if line.strip():
+            yield json.loads(line)
+
+
+def item_error(status: int, err) -> APIError:
+    """An ``APIError`` for one failed request inside a batch."""
+    if isinstance(err, dict):
+        message = err.get("message") or json.dumps(err)
+    else:
+        message = str(err)
+    return error_from_status(status, message)
+
+
+def job_failed(provider: str, job_id: str, detail: str) -> TaskFailedError:
+    """A ``TaskFailedError`` for a batch job that failed as a whole."""
+    return TaskFailedError(502, f"{provider} batch {job_id} failed: {detail}".rstrip(": "))
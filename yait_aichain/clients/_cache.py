@@ -0,0 +1,308 @@
+"""
+clients._cache
+==============
+
+Opt-in, content-addressed cache of raw provider responses at the
+``BaseClient.send`` seam.
+
+Evals, backfills and restarted jobs send byte-identical requests again and
+again.  With a cache configured, ``send`` / ``asend`` hash the request —
+client family, provider, base URL, a hash of the credential, path and the
+canonicalised body (sorted keys; inline bytes by their SHA-256) — and return
+a stored response for a
+repeated one instead of calling the provider.  Everything that goes through
+``send`` is covered (text, JSON and image outputs, async-job providers
+included), so ``Skill`` and ``Agent`` calls benefit without changes.
+Streamed calls are not cached.
+
+Sampling with a non-zero ``temperature`` is meant to vary, so such requests
+bypass the cache unless it was built with ``force=True``.
+
+Backends:
+
+* ``MemoryCache``  — process-local LRU bounded by total bytes;
+* ``SQLiteCache``  — one SQLite file, shareable by every process on the
+  machine (or a shared volume), bounded by total bytes.
+
+Both take a default ``ttl`` in seconds.  Enable for every client::
+
+    from yait_aichain.clients import MemoryCache, set_response_cache
+
+    set_response_cache(MemoryCache(max_bytes=256 * 2**20, ttl=86_400))
+
+or for one model with ``client_options={"cache": SQLiteCache("llm.db")}``.
+Each lookup is reported to the calling Skill's / Agent's hooks as a
+``cache.hit`` / ``cache.miss`` event; ``cache.stats()`` holds the counters.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Nested objects that may carry the sampling temperature (Google's
+# generationConfig); the top level of the body is always checked.
+_TEMPERATURE_SCOPES = ("generationConfig",)
+
+
+def _canonical(node):
+    """JSON-safe, order-independent form of a request body."""
+    if isinstance(node, dict):
+        return {str(k): _canonical(v) for k, v in node.items()}
+    if isinstance(node, (list, tuple)):
+        return [_canonical(v) for v in node]
+    if isinstance(node, (bytes, bytearray)):
+        return {"__sha256__": hashlib.sha256(node).hexdigest()}
+    return node
+
+
+def request_key(scope: tuple, path: str, body) -> str:
+    """SHA-256 hex digest of one request: *scope* + *path* + canonical *body*."""
+    payload = json.dumps([list(scope), path, _canonical(body)], sort_keys=True,
+                         separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_sampled(body) -> bool:
+    """True when *body* asks for a non-zero sampling temperature."""
+    if not isinstance(body, dict):
+        return False
+    for scope in (body, *(body.get(k) or {} for k in _TEMPERATURE_SCOPES)):
+        temperature = scope.get("temperature") if isinstance(scope, dict) else None
+        if temperature:
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    Base class for response caches: ``bytes`` values under string keys.
+
+    Subclasses implement ``_get`` / ``_set`` / ``clear``; the public ``get`` /
+    ``set`` add TTL handling and the hit / miss counters.
+
+    Parameters
+    ----------
+    ttl : float | None
+        Default lifetime of an entry in seconds (``None``: no expiry).
+    force : bool
+        Cache sampled (non-zero temperature) requests too.
+    """
+
+    def __init__(self, *, ttl: "float | None" = None, force: bool = False) -> None:
+        self.ttl   = ttl
+        self.force = force
+        self._counts_lock = threading.Lock()
+        self._counts = {"hits": 0, "misses": 0, "bypassed": 0, "stores": 0, "evictions": 0}
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def get(self, key: str) -> "bytes | None":
+        value = self._get(key, time.time())
+        self._count("hits" if value is not None else "misses")
+        return value
+
+    def set(self, key: str, value: bytes, ttl: "float | None" = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self._set(key, bytes(value), time.time() + ttl if ttl is not None else None)
+        self._count("stores")
+
+    def record_bypass(self) -> None:
+        """Count a request that skipped the cache (sampled, or saved to disk)."""
+        self._count("bypassed")
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        """Counters since creation: hits, misses, bypassed, stores, evictions."""
+        with self._counts_lock:
+            return dict(self._counts)
+
+    # ── backend ──────────────────────────────────────────────────────
+
+    def _get(self, key: str, now: float) -> "bytes | None":
+        raise NotImplementedError
+
+    def _set(self, key: str, value: bytes, expires: "float | None") -> None:
+        raise NotImplementedError
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._counts_lock:
+            self._counts[name] += n
+
+
+class MemoryCache(ResponseCache):
+    """
+    Process-local LRU cache bounded by the total size of stored responses.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Evict least-recently-used entries beyond this many bytes
+        (default 64 MiB).  An entry larger than this is not stored.
+    ttl, force
+        See :class:`ResponseCache`.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, *,
+                 ttl: "float | None" = None, force: bool = False) -> None:
+        super().__init__(ttl=ttl, force=force)
+        self.max_bytes = max_bytes
+        self._lock  = threading.Lock()
+        self._data: "OrderedDict[str, tuple[bytes, float | None]]" = OrderedDict()
+        self._bytes = 0
+
+    def _get(self, key: str, now: float) -> "bytes | None":
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires is not None and expires <= now:
+                self._drop(key)
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: bytes, expires: "float | None") -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._drop(key)
+            self._data[key] = (value, expires)
+            self._bytes += len(value)
+            evicted = 0
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._data)))
+                evicted += 1
+        if evicted:
+            self._count("evictions", evicted)
+
+    def _drop(self, key: str) -> None:
+        value, _ = self._data.pop(key)
+        self._bytes -= len(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Cache in one SQLite file, safe to share between threads and processes.
+
+    Parameters
+    ----------
+    path : str
+        Database file (created on first use, with its directory; ``~`` is
+        expanded).
+    max_bytes : int | None
+        Evict least-recently-used entries beyond this many bytes of stored
+        responses (default ``None``: unbounded).
+    ttl, force
+        See :class:`ResponseCache`.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS responses ("
+        " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,"
+        " expires REAL, accessed REAL NOT NULL)"
+    )
+
+    def __init__(self, path: str, max_bytes: "int | None" = None, *,
+                 ttl: "float | None" = None, force: bool = False) -> None:
+        super().__init__(ttl=ttl, force=force)
+        self.path      = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.execute(self._SCHEMA)
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread; SQLite's file locking serialises writers
+        # across threads and processes (WAL lets readers run alongside).
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _get(self, key: str, now: float) -> "bytes | None":
+        with self._conn() as conn:
+            row = conn.execute("SELECT value, expires FROM responses WHERE key = ?",
+                               (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            return bytes(row[0])
+
+    def _set(self, key: str, value: bytes, expires: "float | None") -> None:
+        if self.max_bytes is not None and len(value) > self.max_bytes:
+            return
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, expires, accessed)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), expires, time.time()),
+            )
+            if self.max_bytes is not None:
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        evicted = 0
+        for key, size in conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed").fetchall():
+            if excess <= 0:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            excess  -= size
+            evicted += 1
+        self._count("evictions", evicted)
+
+    def clear(self) -> None:
+        with self._conn() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+# ── Process-wide default ──────────────────────────────────────────────────────
+
+_default: "ResponseCache | None" = None
+
+
+def set_response_cache(cache: "ResponseCache | None") -> "ResponseCache | None":
+    """
+    Use *cache* for every client without a cache of its own (``None`` turns
+    the process-wide cache off).  Returns the previous one.
+    """
+    global _default
+    previous, _default = _default, cache
+    return previous
+
+
+def default_cache() -> "ResponseCache | None":
+    return _default
@@ -22,6 +22,11 @@ Mapping (HTTP status → class):
     5xx              → ServerError
     0 (no response)  → NetworkError
     other            → APIError
+
+``DeadlineExceededError`` is raised locally, never mapped from a response: the
+run's deadline (``run(deadline=...)``) passed before the next attempt.
+``ContextWindowExceededError`` is also local: the pre-flight token estimate
+says the request cannot fit the model's context window.
 """
 
 from __future__ import annotations
@@ -84,6 +89,22 @@ class InvalidRequestError(APIError):
     """HTTP 400 / 422 — malformed request (bad params, schema, etc.)."""
 
 
+class ContextWindowExceededError(InvalidRequestError):
+    """
+    The prompt plus the requested output does not fit the model's context
+    window, by the local estimate of ``Model.count_tokens`` — raised before
+    the request is sent rather than waiting for the provider's 400.
+
+    Attributes ``tokens`` (the estimate, output budget included) and
+    ``context_window`` carry the numbers.
+    """
+
+    def __init__(self, message: str, tokens: int, context_window: int) -> None:
+        super().__init__(400, message)
+        self.tokens = tokens
+        self.context_window = context_window
+
+
 class NotFoundError(APIError):
     """HTTP 404 — model or endpoint does not exist."""
 
@@ -92,6 +113,19 @@ class ServerError(APIError):
     """HTTP 5xx — provider-side outage or transient failure."""
 
 
+class DeadlineExceededError(APIError):
+    """
+    The run's deadline (``run(deadline=...)``) expired.
+
+    Raised instead of starting another HTTP attempt, retry, fallback or step
+    once the time budget is spent; status 408.  Terminal for the run — it is
+    never retried and never triggers model fallback.
+    """
+
+    def __init__(self, message: str) -> None:
+        super().__init__(408, message)
+
+
 class TaskFailedError(APIError):
     """
     A provider's asynchronous job reached a terminal failure.
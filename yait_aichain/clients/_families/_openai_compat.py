@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import base64
 import json
+from collections.abc import Mapping
 
 
 def _part_to_openai(part: dict) -> "dict | None":
@@ -286,6 +287,20 @@ def _detect_image_mime(b64_data: "str | None") -> str:
     return "image/png"
 
 
+def _downloaded_image(blob: dict) -> dict:
+    """
+    One ``data[]`` entry for an image fetched with ``BaseClient._download``:
+    inline ``b64_json``, or — when it was streamed to a download target — the
+    ``path`` it was saved to.
+    """
+    if "data" in blob:
+        return {"b64_json": base64.b64encode(blob["data"]).decode("ascii")}
+    mime = blob["media_type"].split(";")[0].strip()
+    if not mime.startswith("image/"):
+        mime = _detect_image_mime(base64.b64encode(blob["head"]).decode("ascii"))
+    return {"path": blob["path"], "mime_type": mime}
+
+
 def _parse_image_generations_response(response: dict) -> dict:
     """
     Extract the image result from an OpenAI ``/v1/images/generations``
@@ -294,7 +309,9 @@ def _parse_image_generations_response(response: dict) -> dict:
     Shared by the openai and xai providers.
 
     Returns a dict with keys ``url``, ``base64``, ``mime_type``, and
-    ``revised_prompt`` — consistent with the Google image response format.
+    ``revised_prompt`` — consistent with the Google image response format —
+    plus ``path`` when the image was saved to disk instead of inlined
+    (``output["save_to"]``).
 
     ``mime_type`` is detected from the image's magic bytes so it is always
     accurate, regardless of which provider generated the image.
@@ -314,12 +331,15 @@ def _parse_image_generations_response(response: dict) -> dict:
         )
     item = data[0]
     b64  = item.get("b64_json")
-    return {
+    result = {
         "url":            item.get("url"),
         "base64":         b64,
         "mime_type":      item.get("mime_type") or _detect_image_mime(b64),
         "revised_prompt": item.get("revised_prompt", ""),
     }
+    if item.get("path"):
+        result["path"] = item["path"]
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -336,12 +356,12 @@ def _messages_have_image(messages: list) -> bool:
 
 
 def _image_sources(messages: list) -> list:
-    """Every image part's ``source`` dict, in message/part order."""
+    """Every image part's ``source`` mapping, in message/part order."""
     return [
         p["source"]
         for msg in messages
         for p in msg.get("parts", [])
-        if p.get("type") == "image" and isinstance(p.get("source"), dict)
+        if p.get("type") == "image" and isinstance(p.get("source"), Mapping)
     ]
 
 
@@ -554,3 +574,106 @@ def _parse_responses_api_response(response: dict, output: dict) -> "str | dict":
 # openai provider
 # ---------------------------------------------------------------------------
 
+
+
+# ---------------------------------------------------------------------------
+# Streaming decoders  (SSE events → text deltas → synthesised response)
+# ---------------------------------------------------------------------------
+
+def _stream_error(err: dict) -> Exception:
+    """Map an in-stream ``{"error": {...}}`` payload onto an ``APIError``."""
+    from .._errors import error_from_status
+    code = err.get("code")
+    status = code if isinstance(code, int) else 500
+    return error_from_status(status, err.get("message") or json.dumps(err))
+
+
+class _ChatCompletionsStream:
+    """
+    Decoder for Chat Completions ``stream: true`` chunks.
+
+    Deltas are ``choices[0].delta.content``; usage arrives on the final chunk
+    (``stream_options.include_usage``) or, for some compatible providers, on
+    every chunk / inside the choice.  ``response()`` rebuilds the
+    non-streaming ``{"choices": [{"message": …}], "usage": …}`` shape.
+    """
+
+    def __init__(self) -> None:
+        self._text:    list[str] = []
+        self._refusal: list[str] = []
+        self._finish:  "str | None" = None
+        self._usage:   "dict | None" = None
+        self._seen_choice = False
+
+    def feed(self, event) -> list[str]:
+        if event.data == "[DONE]":
+            return []
+        chunk = json.loads(event.data)
+        if chunk.get("error"):
+            raise _stream_error(chunk["error"])
+        if chunk.get("usage"):
+            self._usage = chunk["usage"]
+
+        deltas: list[str] = []
+        for choice in chunk.get("choices") or []:
+            if choice.get("index", 0) != 0:
+                continue
+            self._seen_choice = True
+            delta = choice.get("delta") or {}
+            if delta.get("content"):
+                self._text.append(delta["content"])
+                deltas.append(delta["content"])
+            if delta.get("refusal"):
+                self._refusal.append(delta["refusal"])
+            if choice.get("finish_reason"):
+                self._finish = choice["finish_reason"]
+            if choice.get("usage"):
+                self._usage = choice["usage"]
+        return deltas
+
+    def response(self) -> dict:
+        response: dict = {"choices": []}
+        if self._seen_choice:
+            message: dict = {"role": "assistant", "content": "".join(self._text)}
+            if self._refusal:
+                message["refusal"] = "".join(self._refusal)
+            response["choices"].append(
+                {"index": 0, "message": message, "finish_reason": self._finish})
+        if self._usage:
+            response["usage"] = self._usage
+        return response
+
+
+class _ResponsesStream:
+    """
+    Decoder for Responses API streaming events.
+
+    ``response.output_text.delta`` carries the deltas; ``response.completed``
+    (or ``response.incomplete``) carries the full final response object, which
+    is returned as-is.
+    """
+
+    def __init__(self) -> None:
+        self._text:  list[str] = []
+        self._final: "dict | None" = None
+
+    def feed(self, event) -> list[str]:
+        payload = json.loads(event.data)
+        etype   = payload.get("type") or event.event
+        if etype == "response.output_text.delta":
+            self._text.append(payload.get("delta", ""))
+            return [payload.get("delta", "")]
+        if etype in ("response.completed", "response.incomplete"):
+            self._final = payload.get("response")
+        elif etype == "response.failed":
+            raise _stream_error((payload.get("response") or {}).get("error") or {})
+        elif etype == "error":
+            raise _stream_error(payload.get("error") or payload)
+        return []
+
+    def response(self) -> dict:
+        if self._final is not None:
+            return self._final
+        return {"output": [{"type": "message", "role": "assistant",
+                            "content": [{"type": "output_text",
+                                         "text": "".join(self._text)}]}]}
@@ -6,7 +6,8 @@ Anthropic Messages API family (``POST /v1/messages``): format
 (build_request / parse_response) + transport (x-api-key + version header).
 
 System messages lift to a top-level ``system`` field; structured output uses
-a forced ``tool_use``; extended thinking maps to ``budget_tokens``.
+a forced ``tool_use``; extended thinking maps to ``budget_tokens``; prompt
+caching (``cache_control``) marks ephemeral cache breakpoints.
 """
 
 from __future__ import annotations
@@ -15,6 +16,7 @@ import json
 from types import SimpleNamespace
 
 from .._base import BaseClient
+from .._batch import item_error, iter_jsonl
 
 
 def _extract_first_json(t: str) -> str:
@@ -46,6 +48,87 @@ def _extract_first_json(t: str) -> str:
 
 _API_VERSION = "2023-06-01"
 
+# Prompt-cache breakpoint: everything up to and including the marked block is
+# cached for five minutes (refreshed on every hit).
+_CACHE_BREAKPOINT = {"type": "ephemeral"}
+
+# Anthropic error types (in-stream ``error`` events, errored batch results)
+# → the HTTP status they stand for.
+_STREAM_ERROR_STATUS = {
+    "invalid_request_error": 400,
+    "authentication_error":  401,
+    "permission_error":      403,
+    "not_found_error":       404,
+    "rate_limit_error":      429,
+    "api_error":             500,
+    "overloaded_error":      529,
+}
+
+# Message Batches: requests per batch, and the result types that are not a
+# message (``errored`` carries an error; the others never ran to completion).
+_BATCH_PATH         = "/v1/messages/batches"
+_BATCH_MAX_REQUESTS = 100_000
+_BATCH_UNFINISHED   = {"canceled": 499, "expired": 504}
+
+
+class _MessagesStream:
+    """
+    Decoder for Messages API ``stream: true`` events.
+
+    Text deltas come from ``text_delta``; a forced ``tool_use`` (json_schema
+    output) streams its input as ``input_json_delta`` fragments, which are
+    yielded too and parsed into ``input`` at the end.  ``response()``
+    rebuilds the non-streaming message (content blocks, stop_reason, usage).
+    """
+
+    def __init__(self) -> None:
+        self._message: dict = {}
+        self._blocks:  dict[int, dict] = {}
+        self._partial: dict[int, list[str]] = {}
+        self._usage:   dict = {}
+
+    def feed(self, event) -> list[str]:
+        payload = json.loads(event.data)
+        etype   = payload.get("type") or event.event
+
+        if etype == "message_start":
+            self._message = dict(payload.get("message") or {})
+            self._usage.update(self._message.get("usage") or {})
+        elif etype == "content_block_start":
+            idx = payload.get("index", 0)
+            self._blocks[idx] = dict(payload.get("content_block") or {})
+            if self._blocks[idx].get("type") == "tool_use":
+                self._partial[idx] = []
+        elif etype == "content_block_delta":
+            idx   = payload.get("index", 0)
+            delta = payload.get("delta") or {}
+            block = self._blocks.setdefault(idx, {"type": "text", "text": ""})
+            if delta.get("type") == "text_delta":
+                block["text"] = block.get("text", "") + delta["text"]
+                return [delta["text"]]
+            if delta.get("type") == "input_json_delta":
+                self._partial.setdefault(idx, []).append(delta["partial_json"])
+                return [delta["partial_json"]]
+        elif etype == "message_delta":
+            self._message.update(payload.get("delta") or {})
+            self._usage.update(payload.get("usage") or {})
+        elif etype == "error":
+            from .._errors import error_from_status
+            err = payload.get("error") or {}
+            raise error_from_status(_STREAM_ERROR_STATUS.get(err.get("type"), 500),
+                                    err.get("message") or json.dumps(err))
+        return []
+
+    def response(self) -> dict:
+        content = []
+        for idx in sorted(self._blocks):
+            block = self._blocks[idx]
+            if idx in self._partial:
+                raw = "".join(self._partial[idx])
+                block["input"] = json.loads(raw) if raw else {}
+            content.append(block)
+        return {**self._message, "content": content, "usage": self._usage}
+
 
 def _part_to_anthropic(part: dict) -> "dict | None":
     """
@@ -94,6 +177,17 @@ def _part_to_anthropic(part: dict) -> "dict | None":
     return None
 
 
+def _batch_item(result: dict) -> "dict | Exception":
+    """One batch ``result`` → the message, or the ``APIError`` it ended with."""
+    rtype = result.get("type")
+    if rtype == "succeeded":
+        return result["message"]
+    if rtype in _BATCH_UNFINISHED:
+        return item_error(_BATCH_UNFINISHED[rtype], f"batch request {rtype}")
+    err = (result.get("error") or {}).get("error") or result.get("error") or {}
+    return item_error(_STREAM_ERROR_STATUS.get(err.get("type"), 500), err)
+
+
 class AnthropicClient(BaseClient):
 
     def __init__(self, api_key: str, *, data: dict, **client_opts) -> None:
@@ -101,7 +195,7 @@ class AnthropicClient(BaseClient):
         super().__init__(
             api_key,
             url=client_opts.get("url") or prov.get("base_url"),
-            **{k: client_opts[k] for k in ("timeout", "retries", "proxy")
+            **{k: client_opts[k] for k in ("timeout", "retries", "proxy", "rate_limit", "cache")
                if k in client_opts},
         )
         self._data = data
@@ -116,6 +210,31 @@ class AnthropicClient(BaseClient):
         data = self._get("/v1/models", self._auth_headers())
         return [m["id"] for m in json.loads(data)["data"]]
 
+    def stream_request(self, path: str, body: dict) -> "tuple[str, dict]":
+        return path, {**body, "stream": True}
+
+    def stream_decoder(self, path: str):
+        return _MessagesStream()
+
+    # ── batch (Message Batches: create → poll → download results) ────
+    def max_batch_requests(self) -> int:
+        return _BATCH_MAX_REQUESTS
+
+    def batch_submit(self, requests: "list[tuple[str, str, dict]]") -> str:
+        job = json.loads(self._post(_BATCH_PATH, {
+            "requests": [{"custom_id": cid, "params": body} for cid, _, body in requests],
+        }, self._auth_headers()))
+        return job["id"]
+
+    def batch_poll(self, job_id: str) -> "dict | None":
+        headers = self._auth_headers()
+        job = json.loads(self._get(f"{_BATCH_PATH}/{job_id}", headers))
+        if job.get("processing_status") != "ended":
+            return None
+        content = self._download(job["results_url"], headers)["data"]
+        return {record["custom_id"]: _batch_item(record["result"])
+                for record in iter_jsonl(content)}
+
     # ── format ───────────────────────────────────────────────────────
     def build_request(self, messages, output, params) -> "tuple[str, dict]":
         prov = self._data["provider"]
@@ -143,10 +262,18 @@ class AnthropicClient(BaseClient):
             "temperature": params["temperature"],
         }
         if system_parts:
-            if all(b["type"] == "text" for b in system_parts):
+            if all(b["type"] == "text" for b in system_parts) and not params.get("cache_control"):
                 body["system"] = "\n\n".join(b["text"] for b in system_parts)
             else:
                 body["system"] = system_parts
+        if params.get("cache_control"):
+            # Breakpoints on the system prompt (with any tools before it) and
+            # on the conversation so far: the next turn re-reads both.
+            if system_parts:
+                system_parts[-1] = {**system_parts[-1], "cache_control": _CACHE_BREAKPOINT}
+            if len(amsgs) > 1:
+                prefix = amsgs[-2]["content"]
+                prefix[-1] = {**prefix[-1], "cache_control": _CACHE_BREAKPOINT}
         if params.get("top_p") is not None:
             body["top_p"] = params["top_p"]
         if params.get("top_k") is not None:
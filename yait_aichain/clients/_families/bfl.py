@@ -11,7 +11,8 @@ client (not OpenAI-compatible):
 * the **model name is the endpoint path**: ``POST /v1/{model}``;
 * the call is **asynchronous** — it returns ``{"id", "polling_url"}``; poll the
   URL until ``status == "Ready"``, then download ``result.sample`` (a signed URL,
-  valid ~10 min) and base64 it.
+  valid ~10 min) and base64 it — or stream it to the download target
+  (``clients._sink``) when one is active.
 
 The async submit → poll → download flow lives behind the ``send()`` seam and
 synthesises the standard ``{"data": [{"b64_json": ...}]}`` shape, so the shared
@@ -24,13 +25,18 @@ turns a generation request into an edit. Verified live against the BFL API
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import json as _json
 import time
 
 from .._base import BaseClient
 from .._errors import TaskFailedError
-from ._openai_compat import _image_sources, _parse_image_generations_response, _prompt_from_messages
+from ._openai_compat import (
+    _downloaded_image,
+    _image_sources,
+    _parse_image_generations_response,
+    _prompt_from_messages,
+)
 
 # BFL polling statuses that are terminal failures (anything but Ready / pending).
 _FAILED_STATUSES = frozenset(
@@ -57,7 +63,7 @@ class BFLClient(BaseClient):
         super().__init__(
             api_key,
             url=client_opts.get("url") or prov.get("base_url"),
-            **{k: client_opts[k] for k in ("timeout", "retries", "proxy")
+            **{k: client_opts[k] for k in ("timeout", "retries", "proxy", "rate_limit", "cache")
                if k in client_opts},
         )
         self._data     = data
@@ -105,36 +111,64 @@ class BFLClient(BaseClient):
         return _parse_image_generations_response(response)
 
     # ── request lifecycle: submit → poll → download ──────────────────
-    def send(self, path: str, body: dict, headers: dict) -> bytes:
-        submitted   = _json.loads(self._post(path, body, headers))
+    def _send(self, path: str, body: dict, headers: dict) -> bytes:
+        polling_url = self._polling_url(self._post(path, body, headers))
+        result_url  = self._poll(polling_url, headers)
+        return self._synthesise(self._download_artifact(result_url))
+
+    async def _asend(self, path: str, body: dict, headers: dict) -> bytes:
+        polling_url = self._polling_url(await self._apost(path, body, headers))
+        result_url  = await self._apoll(polling_url, headers)
+        return self._synthesise(await self._adownload_artifact(result_url))
+
+    @staticmethod
+    def _polling_url(raw: bytes) -> str:
+        submitted   = _json.loads(raw)
         polling_url = submitted.get("polling_url")
         if not polling_url:
             raise TaskFailedError(502, f"BFL returned no polling_url: {submitted}")
+        return polling_url
 
-        result_url = self._poll(polling_url, headers)
-        blob = self._download(result_url)
-        b64  = base64.b64encode(blob["data"]).decode("ascii")
-        return _json.dumps({"data": [{"b64_json": b64}]}).encode("utf-8")
+    @staticmethod
+    def _synthesise(blob: dict) -> bytes:
+        return _json.dumps({"data": [_downloaded_image(blob)]}).encode("utf-8")
 
     def _poll(self, polling_url: str, headers: dict) -> str:
         """Poll the (absolute) polling URL until Ready; return result.sample URL."""
         deadline = time.monotonic() + self._POLL_TIMEOUT
         while True:
             payload = _json.loads(self._download(polling_url, headers)["data"])
-            status  = payload.get("status")
-
-            if status == "Ready":
-                sample = (payload.get("result") or {}).get("sample")
-                if not sample:
-                    raise TaskFailedError(502, f"BFL task ready but no result.sample: {payload}")
+            sample  = self._check_poll(payload, deadline)
+            if sample:
                 return sample
-            if status in _FAILED_STATUSES:
-                raise TaskFailedError(502, f"BFL task {status}: {payload.get('details') or payload}")
-
-            if time.monotonic() >= deadline:
-                raise TaskFailedError(
-                    504,
-                    f"BFL task did not finish within {self._POLL_TIMEOUT:.0f}s "
-                    f"(last status: {status}).",
-                )
             time.sleep(self._POLL_INTERVAL)
+
+    async def _apoll(self, polling_url: str, headers: dict) -> str:
+        """Async ``_poll``: sleeps on the event loop instead of a thread."""
+        deadline = time.monotonic() + self._POLL_TIMEOUT
+        while True:
+            payload = _json.loads((await self._adownload(polling_url, headers))["data"])
+            sample  = self._check_poll(payload, deadline)
+            if sample:
+                return sample
+            await asyncio.sleep(self._POLL_INTERVAL)
+
+    def _check_poll(self, payload: dict, deadline: float) -> "str | None":
+        """Return result.sample once Ready, None while pending; raise on failure/timeout."""
+        status = payload.get("status")
+
+        if status == "Ready":
+            sample = (payload.get("result") or {}).get("sample")
+            if not sample:
+                raise TaskFailedError(502, f"BFL task ready but no result.sample: {payload}")
+            return sample
+        if status in _FAILED_STATUSES:
+            raise TaskFailedError(502, f"BFL task {status}: {payload.get('details') or payload}")
+
+        if time.monotonic() >= deadline:
+            raise TaskFailedError(
+                504,
+                f"BFL task did not finish within {self._POLL_TIMEOUT:.0f}s "
+                f"(last status: {status}).",
+            )
+        return None
@@ -8,13 +8,55 @@ format + transport (x-goog-api-key).
 System messages lift into ``system_instruction``; generation params live in
 ``generationConfig``; reasoning maps to ``thinkingConfig``; image output uses
 ``responseModalities``.
+
+With ``cache_control`` the stable prefix — the system instruction and the
+seed turns before the first model reply — is stored once as a
+``cachedContents`` resource, and ``generateContent`` references it instead of
+resending it.  The growing history after it is always sent, so every turn of
+a conversation reuses the same resource.  It is created on the first send of
+a prefix and reused by the client until shortly before its TTL runs out (the
+client remembers a bounded number of prefixes, least recently used evicted);
+streamed and batched requests always carry the full prompt.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
+import time
+from collections import OrderedDict
+
+from .._base import BaseClient, RequestBody
+from .._batch import item_error, job_failed
+from .._errors import InvalidRequestError, NotFoundError
+
+# Batch mode: requests are sent inline (the whole job must stay under the
+# inline-request size cap, so keep jobs modest); these states end a job.
+_BATCH_MAX_REQUESTS = 5_000
+_BATCH_ENDED  = frozenset({"BATCH_STATE_SUCCEEDED", "BATCH_STATE_FAILED",
+                           "BATCH_STATE_CANCELLED", "BATCH_STATE_EXPIRED"})
+# Per-request errors in a batch carry google.rpc.Status (gRPC) codes.
+_GRPC_HTTP_STATUS = {3: 400, 4: 504, 5: 404, 7: 403, 8: 429, 13: 500, 14: 503, 16: 401}
+
+# Context caching: lifetime of a cachedContents resource, how long before its
+# expiry the client stops referencing it, the smallest prefix worth caching
+# (the API rejects prefixes under ~1k tokens; ~4 JSON chars a token), and how
+# many prefixes a client remembers.
+_CACHE_TTL          = 3600
+_CACHE_MARGIN       = 60
+_CACHE_MIN_CHARS    = 4 * 1024
+_CACHE_MAX_CONTEXTS = 128
+
+
+class _CacheableBody(RequestBody):
+    """
+    A full ``generateContent`` body whose first ``prefix_len`` contents (and
+    system instruction) may be sent as a ``cachedContents`` reference: the
+    seed turns before the first model reply, never the newest turn.
+    """
 
-from .._base import BaseClient
+    __slots__ = ("prefix_len",)
 
 
 def _sanitize_google_schema(schema: object) -> object:
@@ -117,6 +159,68 @@ def _part_to_google(part: dict) -> "dict | None":
     return None
 
 
+class _GenerateContentStream:
+    """
+    Decoder for ``:streamGenerateContent?alt=sse`` chunks.
+
+    Each event is a partial ``GenerateContentResponse``; text parts (not
+    ``thought`` parts) are the deltas and the last ``usageMetadata`` holds the
+    totals.  ``response()`` folds them back into one response.
+    """
+
+    def __init__(self) -> None:
+        self._text:   list[str] = []
+        self._finish: "str | None" = None
+        self._usage:  "dict | None" = None
+        self._extra:  dict = {}
+        self._seen_candidate = False
+
+    def feed(self, event) -> list[str]:
+        chunk = json.loads(event.data)
+        if chunk.get("error"):
+            from .._errors import error_from_status
+            err = chunk["error"]
+            raise error_from_status(err.get("code") or 500,
+                                    err.get("message") or json.dumps(err))
+        if chunk.get("usageMetadata"):
+            self._usage = chunk["usageMetadata"]
+        if chunk.get("promptFeedback"):
+            self._extra["promptFeedback"] = chunk["promptFeedback"]
+
+        deltas: list[str] = []
+        cands = chunk.get("candidates") or []
+        if cands:
+            self._seen_candidate = True
+            cand = cands[0]
+            for part in (cand.get("content") or {}).get("parts", []):
+                if "text" in part and not part.get("thought"):
+                    self._text.append(part["text"])
+                    deltas.append(part["text"])
+            if cand.get("finishReason"):
+                self._finish = cand["finishReason"]
+        return deltas
+
+    def response(self) -> dict:
+        response: dict = dict(self._extra)
+        if self._seen_candidate:
+            cand: dict = {"content": {"role": "model",
+                                      "parts": [{"text": "".join(self._text)}]}}
+            if self._finish:
+                cand["finishReason"] = self._finish
+            response["candidates"] = [cand]
+        if self._usage:
+            response["usageMetadata"] = self._usage
+        return response
+
+
+def _with_cached_content(body: "_CacheableBody", name: str) -> dict:
+    """*body* with its prefix replaced by a reference to cachedContents *name*."""
+    sent = {k: v for k, v in body.items() if k != "system_instruction"}
+    sent["contents"]      = body["contents"][body.prefix_len:]
+    sent["cachedContent"] = name
+    return sent
+
+
 class GoogleClient(BaseClient):
 
     def __init__(self, api_key: str, *, data: dict, **client_opts) -> None:
@@ -124,20 +228,127 @@ class GoogleClient(BaseClient):
         super().__init__(
             api_key,
             url=client_opts.get("url") or prov.get("base_url"),
-            **{k: client_opts[k] for k in ("timeout", "retries", "proxy")
+            **{k: client_opts[k] for k in ("timeout", "retries", "proxy", "rate_limit", "cache")
                if k in client_opts},
         )
         self._data = data
+        # prefix key → (cachedContents name or None when refused, until); LRU
+        self._contexts: "OrderedDict[str, tuple[str | None, float]]" = OrderedDict()
+        self._contexts_lock = threading.Lock()
 
     # ── transport ────────────────────────────────────────────────────
     def _auth_headers(self) -> dict:
         return {"Content-Type": "application/json",
                 "x-goog-api-key": self._api_key}
 
+    def _send(self, path: str, body: dict, headers: dict) -> bytes:
+        if isinstance(body, _CacheableBody):
+            key, prefix, name = self._cache_lookup_prefix(path, body)
+            if prefix is not None:
+                try:
+                    made = json.loads(self._post("/cachedContents", prefix, headers))
+                except (InvalidRequestError, NotFoundError):
+                    made = {}
+                name = self._cache_store(key, made)
+            if name is not None:
+                body = _with_cached_content(body, name)
+        return super()._send(path, body, headers)
+
+    async def _asend(self, path: str, body: dict, headers: dict) -> bytes:
+        if isinstance(body, _CacheableBody):
+            key, prefix, name = self._cache_lookup_prefix(path, body)
+            if prefix is not None:
+                try:
+                    made = json.loads(await self._apost("/cachedContents", prefix, headers))
+                except (InvalidRequestError, NotFoundError):
+                    made = {}
+                name = self._cache_store(key, made)
+            if name is not None:
+                body = _with_cached_content(body, name)
+        return await super()._asend(path, body, headers)
+
+    def _cache_lookup_prefix(self, path: str, body: "_CacheableBody") -> tuple:
+        """
+        ``(key, create_request, name)`` for *body*'s prefix: the live
+        ``cachedContents`` name, or the request that would create it (``None``
+        when the prefix is too short or known to be uncacheable).
+        """
+        prefix: dict = {"model":    path.rpartition(":")[0].lstrip("/"),
+                        "contents": body["contents"][:body.prefix_len]}
+        if "system_instruction" in body:
+            prefix["systemInstruction"] = body["system_instruction"]
+        encoded = json.dumps(prefix, sort_keys=True)
+        key = hashlib.sha256(encoded.encode()).hexdigest()
+        if len(encoded) < _CACHE_MIN_CHARS:
+            return key, None, None
+        with self._contexts_lock:
+            entry = self._contexts.get(key)
+            if entry is not None:
+                if entry[1] > time.monotonic():
+                    self._contexts.move_to_end(key)
+                    return key, None, entry[0]
+                del self._contexts[key]
+        return key, {**prefix, "ttl": f"{_CACHE_TTL}s"}, None
+
+    def _cache_store(self, key: str, made: dict) -> "str | None":
+        """Remember a created ``cachedContents`` (``{}``: creation refused)."""
+        name = made.get("name")
+        with self._contexts_lock:
+            self._contexts[key] = (name, time.monotonic() + _CACHE_TTL - _CACHE_MARGIN)
+            self._contexts.move_to_end(key)
+            while len(self._contexts) > _CACHE_MAX_CONTEXTS:
+                self._contexts.popitem(last=False)
+        return name
+
     def list_models(self) -> list[str]:
         data = self._get("/models", self._auth_headers())
         return [m["name"].removeprefix("models/") for m in json.loads(data)["models"]]
 
+    def stream_request(self, path: str, body: dict) -> "tuple[str, dict]":
+        base, _, method = path.rpartition(":")
+        if method != "generateContent":
+            raise ValueError(f"Only text generation can be streamed; {path} cannot.")
+        return f"{base}:streamGenerateContent?alt=sse", body
+
+    def stream_decoder(self, path: str):
+        return _GenerateContentStream()
+
+    # ── batch (batchGenerateContent with inline requests → poll the batch) ─
+    def max_batch_requests(self) -> int:
+        return _BATCH_MAX_REQUESTS
+
+    def batch_submit(self, requests: "list[tuple[str, str, dict]]") -> str:
+        base, _, method = requests[0][1].rpartition(":")
+        if method != "generateContent":
+            raise ValueError(f"Only generateContent requests can be batched; {requests[0][1]} cannot.")
+        job = json.loads(self._post(f"{base}:batchGenerateContent", {"batch": {
+            "display_name": "yait-aichain",
+            "input_config": {"requests": {"requests": [
+                {"request": body, "metadata": {"key": cid}} for cid, _, body in requests
+            ]}},
+        }}, self._auth_headers()))
+        return job["name"]
+
+    def batch_poll(self, job_id: str) -> "dict | None":
+        job = json.loads(self._get(f"/{job_id}", self._auth_headers()))
+        meta  = job.get("metadata") or {}
+        state = meta.get("state") or job.get("state")
+        if not job.get("done") and state not in _BATCH_ENDED:
+            return None
+        if state == "BATCH_STATE_FAILED" or job.get("error"):
+            raise job_failed("Gemini", job_id, (job.get("error") or {}).get("message", ""))
+        output = job.get("response") or meta.get("output") or job.get("output") or {}
+        inlined = (output.get("inlinedResponses") or {}).get("inlinedResponses") or []
+        results: dict = {}
+        for i, entry in enumerate(inlined):
+            key = (entry.get("metadata") or {}).get("key", str(i))
+            if entry.get("error"):
+                err = entry["error"]
+                results[key] = item_error(_GRPC_HTTP_STATUS.get(err.get("code"), 500), err)
+            else:
+                results[key] = entry.get("response") or {}
+        return results
+
     # ── format ───────────────────────────────────────────────────────
     def build_request(self, messages, output, params) -> "tuple[str, dict]":
         prov = self._data["provider"]
@@ -183,6 +394,15 @@ class GoogleClient(BaseClient):
         body: dict = {"contents": contents, "generationConfig": gc}
         if system_parts:
             body["system_instruction"] = {"parts": system_parts}
+        if params.get("cache_control"):
+            # The seed: leading turns up to the first model reply, so later
+            # turns of the same conversation share one prefix.
+            seed = next((i for i, c in enumerate(contents) if c["role"] == "model"),
+                        len(contents))
+            seed = min(seed, len(contents) - 1)
+            if system_parts or seed > 0:
+                body = _CacheableBody(body)
+                body.prefix_len = seed
         return f"/models/{name}:generateContent", body
 
     def parse_response(self, response, output) -> "str | dict":
@@ -16,10 +16,12 @@ property of the API, so it belongs in the client layer).
 
 from __future__ import annotations
 
+import hashlib
 import json as _json
 from types import SimpleNamespace
 
 from .._base import BaseClient
+from .._batch import item_error, iter_jsonl, job_failed, to_jsonl
 from ._openai_compat import (
     _part_to_openai,                       # noqa: F401  (kept for parity)
     _build_openai_compat_request,
@@ -35,8 +37,31 @@ from ._openai_compat import (
     _messages_have_image,
     _is_o_series_model,
     _should_use_responses_api,
+    _ChatCompletionsStream,
+    _ResponsesStream,
 )
 
+# Providers whose Chat Completions endpoint accepts ``stream_options`` to
+# report usage on the final chunk (the others report it unprompted).
+_STREAM_USAGE_PROVIDERS = frozenset({"openai", "xai", "deepseek", "qwen"})
+_RESPONSES_PATH = "/v1/responses"
+
+# OpenAI Batch API: providers that offer it, the per-job request cap, and the
+# job statuses that mean "still running" / "ended without an output file".
+_BATCH_PROVIDERS     = frozenset({"openai"})
+_BATCH_MAX_REQUESTS  = 50_000
+_BATCH_RUNNING       = frozenset({"validating", "in_progress", "finalizing", "cancelling"})
+
+
+def _batch_item(record: dict) -> "dict | Exception":
+    """One output/error-file line → the response body, or its ``APIError``."""
+    response = record.get("response") or {}
+    status = response.get("status_code", 500)
+    if record.get("error") or not 200 <= status < 300:
+        err = record.get("error") or (response.get("body") or {}).get("error") or {}
+        return item_error(status if status >= 400 else 500, err)
+    return response.get("body") or {}
+
 
 # ── model-name gates (by prefix) ────────────────────────────────────────────
 def _is_xai_image(name: str) -> bool:    return name.startswith("grok-imagine-")
@@ -54,7 +79,7 @@ class OpenAIClient(BaseClient):
         super().__init__(
             api_key,
             url=client_opts.get("url") or prov.get("base_url"),
-            **{k: client_opts[k] for k in ("timeout", "retries", "proxy")
+            **{k: client_opts[k] for k in ("timeout", "retries", "proxy", "rate_limit", "cache")
                if k in client_opts},
         )
         self._data        = data
@@ -75,14 +100,77 @@ class OpenAIClient(BaseClient):
         return [m["id"] for m in _json.loads(data)["data"]]
 
     # ── request lifecycle ────────────────────────────────────────────
-    def send(self, path: str, body: dict, headers: dict) -> bytes:
+    def _send(self, path: str, body: dict, headers: dict) -> bytes:
         # Image edits go out as multipart/form-data: urllib3 sets the
         # Content-Type (with its boundary), so the JSON Content-Type we carry
         # for every other call must be dropped. Everything else is a JSON POST.
         if isinstance(body, dict) and body.get("_multipart"):
             h = {k: v for k, v in headers.items() if k.lower() != "content-type"}
             return self._post_form(path, body["fields"], h)
-        return super().send(path, body, headers)
+        return super()._send(path, body, headers)
+
+    async def _asend(self, path: str, body: dict, headers: dict) -> bytes:
+        if isinstance(body, dict) and body.get("_multipart"):
+            h = {k: v for k, v in headers.items() if k.lower() != "content-type"}
+            return await self._apost_form(path, body["fields"], h)
+        return await super()._asend(path, body, headers)
+
+    def stream_request(self, path: str, body: dict) -> "tuple[str, dict]":
+        if path == _RESPONSES_PATH:
+            return path, {**body, "stream": True}
+        if path != self._chat_path:
+            raise ValueError(f"Only text generation can be streamed; {path} cannot.")
+        body = {**body, "stream": True}
+        if self._provider in _STREAM_USAGE_PROVIDERS:
+            body["stream_options"] = {"include_usage": True}
+        return path, body
+
+    def stream_decoder(self, path: str):
+        return _ResponsesStream() if path == _RESPONSES_PATH else _ChatCompletionsStream()
+
+    # ── batch (upload JSONL → create batch → poll → download output) ─
+    def max_batch_requests(self) -> int:
+        return _BATCH_MAX_REQUESTS if self._provider in _BATCH_PROVIDERS else 0
+
+    def batch_submit(self, requests: "list[tuple[str, str, dict]]") -> str:
+        if not self.max_batch_requests():
+            return super().batch_submit(requests)
+        path = requests[0][1]
+        lines = to_jsonl({"custom_id": cid, "method": "POST", "url": p, "body": body}
+                         for cid, p, body in requests)
+        headers = self._auth_headers()
+        form_headers = {k: v for k, v in headers.items() if k.lower() != "content-type"}
+        upload = _json.loads(self._post_form(
+            "/v1/files",
+            {"purpose": "batch", "file": ("batch.jsonl", lines, "application/jsonl")},
+            form_headers,
+        ))
+        job = _json.loads(self._post("/v1/batches", {
+            "input_file_id":     upload["id"],
+            "endpoint":          path,
+            "completion_window": "24h",
+        }, headers))
+        return job["id"]
+
+    def batch_poll(self, job_id: str) -> "dict | None":
+        if not self.max_batch_requests():
+            return super().batch_poll(job_id)
+        headers = self._auth_headers()
+        job = _json.loads(self._get(f"/v1/batches/{job_id}", headers))
+        status = job.get("status")
+        if status in _BATCH_RUNNING:
+            return None
+        if status == "failed":
+            errors = (job.get("errors") or {}).get("data") or []
+            raise job_failed("OpenAI", job_id, "; ".join(e.get("message", "") for e in errors))
+        # completed / expired / cancelled: whatever finished is in the files.
+        results: dict = {}
+        for key in ("output_file_id", "error_file_id"):
+            if job.get(key):
+                content = self._get(f"/v1/files/{job[key]}/content", headers)
+                for record in iter_jsonl(content):
+                    results[record["custom_id"]] = _batch_item(record)
+        return results
 
     # ── format: model params → provider body ─────────────────────────
     def _wrap(self, params: dict):
@@ -104,7 +192,10 @@ class OpenAIClient(BaseClient):
 
         if p == "openai":
             if _should_use_responses_api(m.name):
-                return _build_responses_api_request(m, messages, output)
+                path, body = _build_responses_api_request(m, messages, output)
+                if params.get("cache_control"):
+                    body["prompt_cache_key"] = _prompt_cache_key(m.name, messages)
+                return path, body
             if _is_openai_image_model(m.name):
                 # An input image + an editable image model ⇒ edit, else generate.
                 if _is_openai_editable_image_model(m.name) and _messages_have_image(messages):
@@ -119,6 +210,8 @@ class OpenAIClient(BaseClient):
                 if m.reasoning:
                     eff = m._REASONING_MAP.get(m.reasoning)
                     if eff: body["reasoning_effort"] = eff
+            if params.get("cache_control"):
+                body["prompt_cache_key"] = _prompt_cache_key(m.name, messages)
             return path, body
 
         if p == "xai":
@@ -181,6 +274,19 @@ class OpenAIClient(BaseClient):
 
         raise ValueError(f"Unknown openai-family provider {p!r}")
 
+    def build_continuation(self, previous, messages, output, params) -> "tuple[str, dict] | None":
+        # Responses API only: it stores each response, and previous_response_id
+        # carries the whole conversation so far (but not its instructions,
+        # which *messages* repeat as system turns).
+        if self._provider != "openai" or previous.get("object") != "response" \
+                or not previous.get("id"):
+            return None
+        path, body = self.build_request(messages, output, params)
+        if path != _RESPONSES_PATH:
+            return None
+        body["previous_response_id"] = previous["id"]
+        return path, body
+
     # ── format: provider response → our result ───────────────────────
     def parse_response(self, response, output) -> "str | dict":
         p = self._provider
@@ -193,6 +299,18 @@ class OpenAIClient(BaseClient):
         return _parse_openai_compat_response(response, output)
 
 
+def _prompt_cache_key(name: str, messages: list) -> str:
+    """
+    A ``prompt_cache_key`` shared by every call with the same model and
+    system prompt (or, without one, the same first message), so OpenAI routes
+    them to the machine holding that prefix in its prompt cache.
+    """
+    prefix = [m for m in messages if m["role"] == "system"] or messages[:1]
+    stable = _json.dumps([name, prefix], sort_keys=True, default=str)
+    digest = hashlib.sha256(stable.encode())
+    return "yait-" + digest.hexdigest()[:32]
+
+
 def _last_user_text(messages: list) -> str:
     for msg in reversed(messages):
         if msg["role"] == "user":
@@ -17,17 +17,19 @@ the synchronous image path returns, so ``parse_response`` is reused unchanged.
             (header X-DashScope-Async: enable)  → { output.task_id }
     poll    GET  /api/v1/tasks/{task_id}        → until task_status terminal
     collect download each result URL → base64 → { "data": [{"b64_json": …}] }
+            (or streamed to the download target → { "data": [{"path": …}] })
 """
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import json as _json
 import os
 import time
+from collections.abc import Mapping
 
 from .._errors import TaskFailedError
-from ._openai_compat import _image_source_to_data_uri
+from ._openai_compat import _downloaded_image, _image_source_to_data_uri
 from .openai import OpenAIClient, _is_qwen_image, _last_user_text
 
 REGION_URLS = {
@@ -100,7 +102,7 @@ def _build_qwen_image_edit_request(model, messages: list, output: dict) -> "tupl
         for part in msg["parts"]:
             if part["type"] == "text":
                 content.append({"text": part["text"]})
-            elif part["type"] == "image" and isinstance(part.get("source"), dict):
+            elif part["type"] == "image" and isinstance(part.get("source"), Mapping):
                 content.append({"image": _image_source_to_data_uri(part["source"])})
         if content:
             input_messages.append({"role": msg["role"], "content": content})
@@ -138,7 +140,7 @@ class QwenClient(OpenAIClient):
         return super().build_request(messages, output, params)
 
     # ── request lifecycle ────────────────────────────────────────────
-    def send(self, path: str, body: dict, headers: dict) -> bytes:
+    def _send(self, path: str, body: dict, headers: dict) -> bytes:
         # wanx text-to-image is async (submit → poll → download); image-edit is
         # a synchronous multimodal-generation call that returns result URLs.
         # Everything else defers to the base (JSON POST / multipart) seam.
@@ -146,7 +148,14 @@ class QwenClient(OpenAIClient):
             return self._image_synthesis(body, headers)
         if path == _MULTIMODAL_GEN_PATH:
             return self._image_edit_sync(body, headers)
-        return super().send(path, body, headers)
+        return super()._send(path, body, headers)
+
+    async def _asend(self, path: str, body: dict, headers: dict) -> bytes:
+        if path == _IMAGE_SYNTHESIS_PATH:
+            return await self._aimage_synthesis(body, headers)
+        if path == _MULTIMODAL_GEN_PATH:
+            return await self._aimage_edit_sync(body, headers)
+        return await super()._asend(path, body, headers)
 
     # ── synchronous image edit: POST → download result URL(s) → base64 ─
     def _image_edit_sync(self, body: dict, headers: dict) -> bytes:
@@ -159,59 +168,107 @@ class QwenClient(OpenAIClient):
         it (the same normalisation ``_collect`` does for the async wan path).
         An empty result falls through to the parser's descriptive error.
         """
-        resp = _json.loads(self._post(_MULTIMODAL_GEN_PATH, body, headers))
-        items: list = []
-        for choice in resp.get("output", {}).get("choices", []):
-            content = (choice.get("message") or {}).get("content") or []
-            for c in content:
-                url = c.get("image")
-                if url:
-                    blob = self._download(url)
-                    items.append({"b64_json": base64.b64encode(blob["data"]).decode("ascii")})
-        return _json.dumps({"data": items}).encode("utf-8")
+        resp  = _json.loads(self._post(_MULTIMODAL_GEN_PATH, body, headers))
+        blobs = [self._download_artifact(url) for url in _edit_result_urls(resp)]
+        return _images_response(blobs)
+
+    async def _aimage_edit_sync(self, body: dict, headers: dict) -> bytes:
+        resp  = _json.loads(await self._apost(_MULTIMODAL_GEN_PATH, body, headers))
+        blobs = [await self._adownload_artifact(url) for url in _edit_result_urls(resp)]
+        return _images_response(blobs)
 
     # ── async image synthesis: submit → poll → collect ───────────────
     def _image_synthesis(self, body: dict, headers: dict) -> bytes:
         submit_headers = {**headers, "X-DashScope-Async": "enable"}
-        submitted = _json.loads(self._post(_IMAGE_SYNTHESIS_PATH, body, submit_headers))
-        task_id = submitted.get("output", {}).get("task_id")
-        if not task_id:
-            raise TaskFailedError(502, f"DashScope returned no task_id: {submitted}")
-
-        output = self._poll_task(task_id, headers)
+        submitted = self._post(_IMAGE_SYNTHESIS_PATH, body, submit_headers)
+        output = self._poll_task(_task_id(submitted), headers)
         return self._collect(output)
 
+    async def _aimage_synthesis(self, body: dict, headers: dict) -> bytes:
+        submit_headers = {**headers, "X-DashScope-Async": "enable"}
+        submitted = await self._apost(_IMAGE_SYNTHESIS_PATH, body, submit_headers)
+        output = await self._apoll_task(_task_id(submitted), headers)
+        return await self._acollect(output)
+
     def _poll_task(self, task_id: str, headers: dict) -> dict:
         deadline = time.monotonic() + self._POLL_TIMEOUT
         while True:
             payload = _json.loads(self._get(_TASKS_PATH + task_id, headers))
-            output = payload.get("output", {})
-            status = output.get("task_status")
-
-            if status == "SUCCEEDED":
+            output = self._check_task(task_id, payload, deadline)
+            if output is not None:
                 return output
-            if status in ("FAILED", "CANCELED", "UNKNOWN"):
-                code = output.get("code", status)
-                message = output.get("message", "")
-                raise TaskFailedError(502, f"DashScope task {task_id} {status}: {code} {message}".rstrip())
-
-            if time.monotonic() >= deadline:
-                raise TaskFailedError(
-                    504,
-                    f"DashScope task {task_id} did not finish within "
-                    f"{self._POLL_TIMEOUT:.0f}s (last status: {status}).",
-                )
             time.sleep(self._POLL_INTERVAL)
 
+    async def _apoll_task(self, task_id: str, headers: dict) -> dict:
+        deadline = time.monotonic() + self._POLL_TIMEOUT
+        while True:
+            payload = _json.loads(await self._aget(_TASKS_PATH + task_id, headers))
+            output = self._check_task(task_id, payload, deadline)
+            if output is not None:
+                return output
+            await asyncio.sleep(self._POLL_INTERVAL)
+
+    def _check_task(self, task_id: str, payload: dict, deadline: float) -> "dict | None":
+        """Return the task output once SUCCEEDED, None while running; raise on failure/timeout."""
+        output = payload.get("output", {})
+        status = output.get("task_status")
+
+        if status == "SUCCEEDED":
+            return output
+        if status in ("FAILED", "CANCELED", "UNKNOWN"):
+            code = output.get("code", status)
+            message = output.get("message", "")
+            raise TaskFailedError(502, f"DashScope task {task_id} {status}: {code} {message}".rstrip())
+
+        if time.monotonic() >= deadline:
+            raise TaskFailedError(
+                504,
+                f"DashScope task {task_id} did not finish within "
+                f"{self._POLL_TIMEOUT:.0f}s (last status: {status}).",
+            )
+        return None
+
     def _collect(self, output: dict) -> bytes:
         """Download every result URL and shape it like an images response."""
-        items: list = []
-        for result in output.get("results", []):
-            url = result.get("url")
-            if not url:
-                continue
-            blob = self._download(url)
-            items.append({"b64_json": base64.b64encode(blob["data"]).decode("ascii")})
-        if not items:
-            raise TaskFailedError(502, f"DashScope task returned no image results: {output}")
-        return _json.dumps({"data": items}).encode("utf-8")
+        blobs = [self._download_artifact(url) for url in _synthesis_result_urls(output)]
+        return _images_response(blobs, output)
+
+    async def _acollect(self, output: dict) -> bytes:
+        blobs = [await self._adownload_artifact(url) for url in _synthesis_result_urls(output)]
+        return _images_response(blobs, output)
+
+
+# ── response shaping shared by the sync and async flows ──────────────────────
+
+def _task_id(raw: bytes) -> str:
+    submitted = _json.loads(raw)
+    task_id = submitted.get("output", {}).get("task_id")
+    if not task_id:
+        raise TaskFailedError(502, f"DashScope returned no task_id: {submitted}")
+    return task_id
+
+
+def _edit_result_urls(resp: dict) -> list:
+    urls: list = []
+    for choice in resp.get("output", {}).get("choices", []):
+        content = (choice.get("message") or {}).get("content") or []
+        urls.extend(c["image"] for c in content if c.get("image"))
+    return urls
+
+
+def _synthesis_result_urls(output: dict) -> list:
+    return [r["url"] for r in output.get("results", []) if r.get("url")]
+
+
+def _images_response(blobs: list, output: "dict | None" = None) -> bytes:
+    """
+    Base64 each downloaded blob into ``{"data": [{"b64_json": …}]}`` — or, for
+    blobs streamed to a download target, ``{"path": …, "mime_type": …}``.
+
+    With *output* given (the wan synthesis path) an empty result is a task
+    failure; the edit path leaves it to the parser's descriptive error.
+    """
+    items = [_downloaded_image(b) for b in blobs]
+    if not items and output is not None:
+        raise TaskFailedError(502, f"DashScope task returned no image results: {output}")
+    return _json.dumps({"data": items}).encode("utf-8")
@@ -13,14 +13,21 @@ The multipart edit goes out through the ``send()`` seam already implemented on
 a form POST), and the ``{"data": [...]}`` response is parsed by the shared image
 parser — so this client is just the request shaping.
 
+With ``output["save_to"]`` the images are requested as URLs and streamed to the
+download target (``clients._sink``) instead of arriving inline as base64.
+
 Verified live against the Recraft API (external.api.recraft.ai).
 """
 
 from __future__ import annotations
 
 import base64
+import json as _json
+
+from .._sink import download_target
 
 from ._openai_compat import (
+    _downloaded_image,
     _image_sources,
     _messages_have_image,
     _parse_image_generations_response,
@@ -37,6 +44,11 @@ _EDIT_PASSTHROUGH = ("style", "style_id", "negative_prompt")
 _DEFAULT_STRENGTH = 0.2
 
 
+def _response_format(output: dict) -> str:
+    """URLs to stream to disk when the output is saved, else inline base64."""
+    return "url" if output.get("save_to") is not None else "b64_json"
+
+
 def _build_recraft_generation_request(name, messages, output, path):
     """OpenAI-shaped text-to-image body (Recraft returns ``{"data": [...]}``)."""
     fmt = output.get("format", {})
@@ -44,7 +56,7 @@ def _build_recraft_generation_request(name, messages, output, path):
         "model":           name,
         "prompt":          _prompt_from_messages(messages),
         "n":               1,
-        "response_format": "b64_json",
+        "response_format": _response_format(output),
     }
     if fmt.get("size"):
         body["size"] = fmt["size"]
@@ -74,7 +86,7 @@ def _build_recraft_edit_request(name, messages, output, path):
         ("model",           name),
         ("prompt",          _prompt_from_messages(messages)),
         ("strength",        str(fmt.get("strength", _DEFAULT_STRENGTH))),
-        ("response_format", "b64_json"),
+        ("response_format", _response_format(output)),
     ]
     for k in _EDIT_PASSTHROUGH:
         if fmt.get(k) is not None:
@@ -95,3 +107,33 @@ class RecraftClient(OpenAIClient):
 
     def parse_response(self, response, output) -> dict:
         return _parse_image_generations_response(response)
+
+    # ── request lifecycle: URL results are saved to the download target ──
+    def _send(self, path: str, body: dict, headers: dict) -> bytes:
+        raw = super()._send(path, body, headers)
+        urls = _result_urls(raw)
+        if not urls:
+            return raw
+        return _saved_response([self._download_artifact(u) for u in urls])
+
+    async def _asend(self, path: str, body: dict, headers: dict) -> bytes:
+        raw = await super()._asend(path, body, headers)
+        urls = _result_urls(raw)
+        if not urls:
+            return raw
+        return _saved_response(
+            [await self._adownload_artifact(u) for u in urls])
+
+
+def _result_urls(raw: bytes) -> list:
+    """Image URLs to fetch: only while a download target is active."""
+    if download_target() is None:
+        return []
+    data = _json.loads(raw).get("data") or []
+    if not all(item.get("url") for item in data):
+        return []
+    return [item["url"] for item in data]
+
+
+def _saved_response(blobs: list) -> bytes:
+    return _json.dumps({"data": [_downloaded_image(b) for b in blobs]}).encode("utf-8")
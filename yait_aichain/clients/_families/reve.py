@@ -117,7 +117,7 @@ class ReveClient(BaseClient):
         super().__init__(
             api_key,
             url=client_opts.get("url") or prov.get("base_url"),
-            **{k: client_opts[k] for k in ("timeout", "retries", "proxy")
+            **{k: client_opts[k] for k in ("timeout", "retries", "proxy", "rate_limit", "cache")
                if k in client_opts},
         )
         self._data     = data
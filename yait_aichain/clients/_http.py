@@ -0,0 +1,256 @@
+"""
+clients._http
+=============
+
+Process-wide registry of shared urllib3 connection managers behind
+``make_http``.
+
+Every ``BaseClient`` and every tool client (embedders, rerankers, vector
+backends, search tools, …) used to build its own urllib3 manager, and each
+manager owned its own per-host connection pools with urllib3's default of 10
+connections — so keep-alive connections were thrown away with their owner and
+a busy ``Pool`` paid a fresh TLS handshake per request.
+
+``make_http`` now returns one shared manager per configuration (proxy,
+timeout, retries and the pool policy below).  urllib3 managers are
+thread-safe and key their host pools by scheme, host and port, so clients
+talking to the same host with the same settings share the same warm
+connections, and differently-configured clients never mix.
+
+Tuning (call before the clients are built)::
+
+    from yait_aichain.clients import configure_http, http_stats
+
+    configure_http(maxsize=64, block=False, keepalive=True)
+    ...
+    http_stats()   # {"connections_opened": 12, "requests": 480, "reused": 468, …}
+"""
+
+from __future__ import annotations
+
+import base64
+import socket
+import threading
+
+import urllib3
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+_DEFAULTS: dict = {
+    "maxsize":   32,      # connections kept per host (urllib3 default: 10)
+    "block":     False,   # True: wait for a free connection instead of opening extra ones
+    "keepalive": True,    # TCP keep-alive probes on pooled sockets
+    "num_pools": 100,     # host pools kept per manager (LRU beyond that)
+}
+
+_lock = threading.Lock()
+_config: dict = dict(_DEFAULTS)
+# Canonical Timeout / Retry objects, so equal settings map to one manager key.
+_canonical: dict = {}
+_managers: dict = {}
+_async: dict = {}
+# Sync transport counters, kept by the connection classes below.
+_counts = {"connections_opened": 0, "requests": 0, "reused": 0}
+
+
+def _count(**deltas) -> None:
+    with _lock:
+        for name, n in deltas.items():
+            _counts[name] += n
+
+
+class _Counting:
+    """
+    Connection mixin counting new sockets and the requests sent over a socket
+    that had already carried one (a keep-alive reuse).
+    """
+
+    _fresh = False
+
+    def connect(self) -> None:
+        super().connect()
+        self._fresh = True
+        _count(connections_opened=1)
+
+    def request(self, *args, **kwargs):
+        # HTTPS connects before request(), plain HTTP inside it: either way a
+        # socket opened for this request is flagged fresh, not reused.
+        reused = self.sock is not None and not self._fresh
+        try:
+            return super().request(*args, **kwargs)
+        finally:
+            self._fresh = False
+            _count(requests=1, reused=int(reused))
+
+
+class _HTTPConnection(_Counting, HTTPConnection):
+    pass
+
+
+class _HTTPSConnection(_Counting, HTTPSConnection):
+    pass
+
+
+class _HTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _HTTPConnection
+
+
+class _HTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _HTTPSConnection
+
+
+# Host-pool classes for every shared manager, so its connections are counted.
+_POOL_CLASSES = {"http": _HTTPConnectionPool, "https": _HTTPSConnectionPool}
+
+
+def configure_http(
+    *,
+    maxsize:   "int | None"  = None,
+    block:     "bool | None" = None,
+    keepalive: "bool | None" = None,
+    num_pools: "int | None"  = None,
+) -> dict:
+    """
+    Set the shared connection-pool policy and return the resulting config.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Connections kept alive per host (default 32).  Size it to the
+        concurrency you run against one provider, e.g. ``Pool(max_flows=64)``.
+    block : bool, optional
+        ``False`` (default): when every pooled connection is busy, open an
+        extra one and drop it afterwards.  ``True``: wait for a free one — a
+        hard cap on sockets per host.
+    keepalive : bool, optional
+        Enable TCP keep-alive probes so idle pooled connections survive NAT and
+        load-balancer idle timeouts (default ``True``).
+    num_pools : int, optional
+        Number of host pools kept per manager (default 100); the least
+        recently used is closed beyond that.
+
+    The policy applies to clients built *after* the call; existing clients
+    keep the manager they were built with.
+    """
+    updates = {"maxsize": maxsize, "block": block,
+               "keepalive": keepalive, "num_pools": num_pools}
+    with _lock:
+        _config.update({k: v for k, v in updates.items() if v is not None})
+        return dict(_config)
+
+
+def http_stats() -> dict:
+    """
+    Connection-reuse counters for the shared transports (sync and async).
+
+    ``connections_opened`` counts new TCP (+TLS) connections, ``requests``
+    every request sent (retries and failed requests included), and
+    ``reused`` the requests that went out over a connection that had already
+    carried one.
+    """
+    with _lock:
+        counts = dict(_counts)
+        for transport in _async.values():
+            counts["connections_opened"] += transport.num_connections
+            counts["requests"]           += transport.num_requests
+            counts["reused"]             += transport.num_reused
+        return {
+            "managers": len(_managers),
+            **counts,
+            "config":   dict(_config),
+        }
+
+
+def shared_manager(proxy: "dict | None", *, timeout, retries) -> urllib3.PoolManager:
+    """The process-wide manager for *proxy*, *timeout*, *retries* and the current policy."""
+    with _lock:
+        config  = dict(_config)
+        timeout = _canonical.setdefault(_timeout_key(timeout), timeout)
+        retries = _canonical.setdefault(_retries_key(retries), retries)
+        # The manager class is part of the key: one replaced at runtime (a
+        # subclass installed by the application, a test double) gets its own.
+        factory = urllib3.ProxyManager if proxy else urllib3.PoolManager
+        key = (factory, _proxy_key(proxy), _timeout_key(timeout), _retries_key(retries),
+               tuple(sorted(config.items())))
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = _build_manager(factory, proxy, config,
+                                                      timeout=timeout, retries=retries)
+        return manager
+
+
+def _build_manager(factory, proxy: "dict | None", config: dict, *, timeout, retries):
+    kw: dict = {
+        "num_pools": config["num_pools"],
+        "maxsize":   config["maxsize"],
+        "block":     config["block"],
+        "timeout":   timeout,
+        "retries":   retries,
+    }
+    if config["keepalive"]:
+        kw["socket_options"] = HTTPConnection.default_socket_options + _keepalive_options()
+
+    if not proxy:
+        manager = factory(**kw)
+    else:
+        proxy_headers: dict = {}
+        username = proxy.get("username")
+        password = proxy.get("password")
+        if username and password:
+            encoded = base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("utf-8")
+            proxy_headers["Proxy-Authorization"] = f"Basic {encoded}"
+        manager = factory(proxy_url=proxy["url"], proxy_headers=proxy_headers, **kw)
+    manager.pool_classes_by_scheme = _POOL_CLASSES
+    return manager
+
+
+def shared_async(proxy: "dict | None", *, timeout, retries):
+    """Async counterpart of :func:`shared_manager`: one ``AsyncHTTP`` per configuration."""
+    from ._aio import AsyncHTTP
+    key = (_proxy_key(proxy), _timeout_key(timeout), _retries_key(retries))
+    with _lock:
+        transport = _async.get(key)
+        if transport is None:
+            transport = AsyncHTTP(proxy, timeout=timeout, retries=retries,
+                                  maxsize=_config["maxsize"])
+            _async[key] = transport
+        return transport
+
+
+# ── Internals ─────────────────────────────────────────────────────────────────
+
+def _keepalive_options() -> list:
+    opts = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # Probe after 60 s idle, every 15 s — well under common LB idle timeouts.
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        opts += [(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+                 (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15)]
+    return opts
+
+
+def _proxy_key(proxy: "dict | None") -> tuple:
+    if not proxy:
+        return ()
+    return (proxy.get("url"), proxy.get("username"), proxy.get("password"))
+
+
+def _timeout_key(timeout) -> tuple:
+    if isinstance(timeout, urllib3.Timeout):
+        return ("timeout", timeout.connect_timeout, timeout.read_timeout, timeout.total)
+    return ("timeout", timeout)
+
+
+def _retries_key(retries) -> tuple:
+    if not isinstance(retries, urllib3.Retry):
+        return ("retries", retries)
+    forcelist = retries.status_forcelist
+    methods   = retries.allowed_methods
+    return (
+        "retries", retries.total, retries.connect, retries.read, retries.redirect,
+        retries.status, retries.other, retries.backoff_factor, getattr(retries, "backoff_max", None),
+        tuple(sorted(forcelist)) if forcelist else None,
+        tuple(sorted(methods)) if methods else methods,
+        retries.raise_on_status, retries.raise_on_redirect,
+        retries.respect_retry_after_header,
+    )
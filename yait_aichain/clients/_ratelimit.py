@@ -0,0 +1,234 @@
+"""
+clients._ratelimit
+==================
+
+Process-wide client-side rate limiting, keyed by provider + model.
+
+Without it every thread of a busy ``Pool`` fires as fast as it can, the
+provider answers 429, and each request then backs off on its own inside
+urllib3's ``Retry`` — uncoordinated sleeps that wake together and hit the
+limit again.  A ``RateLimiter`` admits each request against two token buckets
+before it is sent:
+
+* **RPM** — one unit per request;
+* **TPM** — the request's estimated token cost (prompt estimate + the
+  output budget it asks for, which is what providers count against TPM).
+
+Admission is by reservation: ``reserve`` debits the buckets immediately and
+returns how long the caller must wait, so concurrent callers queue in
+arrival order instead of polling.  A 429 puts the whole limiter in a shared
+*cooldown* (``Retry-After`` when the provider sends one), and every caller —
+including those already queued — waits it out before sending again.
+
+Limits come from the provider data (``[provider] rate_limit`` or a model's
+``rate_limit`` in ``models/providers/*.toml``) or per model via
+``client_options={"rate_limit": {"rpm": …, "tpm": …}}``; all models with
+the same provider + name share one limiter::
+
+    from yait_aichain.clients import set_rate_limit
+
+    set_rate_limit("openai", "gpt-4o", rpm=500, tpm=30_000)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+# Keys under which request bodies carry their output-token budget.
+_OUTPUT_BUDGET_KEYS = ("max_tokens", "max_completion_tokens",
+                       "max_output_tokens", "maxOutputTokens")
+
+# A string this long without whitespace is an inline binary payload (base64
+# image / audio), which providers bill per item, not per character.
+_BLOB_CHARS  = 10_000
+_BLOB_TOKENS = 1_000
+
+
+class _Bucket:
+    """One token bucket refilled continuously at *per_minute* / 60 per second."""
+
+    def __init__(self, per_minute: float) -> None:
+        self.rate     = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.level    = float(per_minute)
+        self.stamp    = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Debit *amount* (the level may go negative) and return the wait."""
+        self.level = min(self.capacity, self.level + (now - self.stamp) * self.rate)
+        self.stamp = now
+        self.level -= amount
+        return max(0.0, -self.level / self.rate)
+
+    def drain(self, until: float) -> None:
+        """Empty the bucket and pause its refill until *until*."""
+        self.level = min(self.level, 0.0)
+        self.stamp = max(self.stamp, until)
+
+
+class RateLimiter:
+    """
+    RPM / TPM token buckets plus a shared 429 cooldown for one provider + model.
+
+    Parameters
+    ----------
+    rpm : float | None
+        Requests per minute; ``None`` for no request limit.
+    tpm : float | None
+        Tokens per minute; ``None`` for no token limit.
+    key : tuple
+        ``(provider, model)`` — reported on the ``rate_limit.waited`` event.
+    """
+
+    def __init__(self, rpm: "float | None" = None, tpm: "float | None" = None,
+                 key: tuple = ()) -> None:
+        self.key        = key
+        self._lock      = threading.Lock()
+        self._not_before = 0.0
+        self._rpm: "_Bucket | None" = None
+        self._tpm: "_Bucket | None" = None
+        self.configure(rpm=rpm, tpm=tpm)
+
+    @property
+    def rpm(self) -> "float | None":
+        return self._rpm.capacity if self._rpm else None
+
+    @property
+    def tpm(self) -> "float | None":
+        return self._tpm.capacity if self._tpm else None
+
+    def configure(self, *, rpm: "float | None" = None, tpm: "float | None" = None) -> None:
+        """Replace the limits that are given and changed (a fresh, full bucket each)."""
+        with self._lock:
+            if rpm is not None and rpm != self.rpm:
+                self._rpm = _Bucket(rpm) if rpm > 0 else None
+            if tpm is not None and tpm != self.tpm:
+                self._tpm = _Bucket(tpm) if tpm > 0 else None
+
+    # ── admission ────────────────────────────────────────────────────
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve one request of *tokens*; return the seconds to wait first."""
+        with self._lock:
+            now  = time.monotonic()
+            wait = self._not_before - now
+            if self._rpm is not None:
+                wait = max(wait, self._rpm.reserve(1, now))
+            if self._tpm is not None and tokens:
+                wait = max(wait, self._tpm.reserve(tokens, now))
+            return max(0.0, wait)
+
+    def _cooldown_left(self) -> float:
+        with self._lock:
+            return max(0.0, self._not_before - time.monotonic())
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until a request of *tokens* may be sent; return the seconds waited."""
+        waited = 0.0
+        wait = self.reserve(tokens)
+        while wait > 0:
+            time.sleep(wait)
+            waited += wait
+            # A 429 elsewhere may have started a cooldown while we slept.
+            wait = self._cooldown_left()
+        return waited
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Async :meth:`acquire`: waits with ``asyncio.sleep``."""
+        waited = 0.0
+        wait = self.reserve(tokens)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            waited += wait
+            wait = self._cooldown_left()
+        return waited
+
+    def cooldown(self, seconds: float) -> None:
+        """
+        Hold every caller for *seconds* (after a 429) and restart the buckets
+        empty afterwards, so the queue resumes at the steady rate rather than
+        as one burst.
+        """
+        with self._lock:
+            until = time.monotonic() + max(0.0, seconds)
+            self._not_before = max(self._not_before, until)
+            for bucket in (self._rpm, self._tpm):
+                if bucket is not None:
+                    bucket.drain(self._not_before)
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(key={self.key!r}, rpm={self.rpm}, tpm={self.tpm})"
+
+
+# ── Registry ──────────────────────────────────────────────────────────────────
+
+_registry_lock = threading.Lock()
+_limiters: dict[tuple, RateLimiter] = {}
+
+
+def shared_limiter(provider: str, model: str, *,
+                   rpm: "float | None" = None,
+                   tpm: "float | None" = None) -> RateLimiter:
+    """
+    Return the process-wide limiter for *provider* + *model*, creating it on
+    first use; limits given here replace that limiter's current ones.
+    """
+    key = (provider, model)
+    with _registry_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = RateLimiter(rpm=rpm, tpm=tpm, key=key)
+            return limiter
+    if rpm is not None or tpm is not None:
+        limiter.configure(rpm=rpm, tpm=tpm)
+    return limiter
+
+
+def find_limiter(provider: str, model: str) -> "RateLimiter | None":
+    """Return the limiter registered for *provider* + *model*, if any."""
+    with _registry_lock:
+        return _limiters.get((provider, model))
+
+
+def set_rate_limit(provider: str, model: str, *,
+                   rpm: "float | None" = None,
+                   tpm: "float | None" = None) -> RateLimiter:
+    """
+    Set the client-side RPM / TPM limits for *provider* + *model*.
+
+    Applies to every ``Model`` of that name built afterwards (and to existing
+    ones that already have a limiter).  Pass ``0`` to lift a limit.
+    """
+    return shared_limiter(provider, model, rpm=rpm, tpm=tpm)
+
+
+def estimate_tokens(body) -> int:
+    """
+    Rough token cost of a request body for TPM admission: ~4 characters per
+    token of text, a flat allowance per inline binary payload, plus the
+    output budget the request asks for.
+    """
+    def walk(node) -> int:
+        if isinstance(node, (bytes, bytearray)):
+            return _BLOB_TOKENS * 4
+        if isinstance(node, str):
+            if len(node) > _BLOB_CHARS and " " not in node[:_BLOB_CHARS]:
+                return _BLOB_TOKENS * 4
+            return len(node)
+        if isinstance(node, dict):
+            return sum(walk(v) for v in node.values())
+        if isinstance(node, (list, tuple)):
+            return sum(walk(v) for v in node)
+        return len(str(node)) if node is not None else 0
+
+    if not isinstance(body, dict):
+        return 0
+    budget = 0
+    for scope in (body, body.get("generationConfig") or {}):
+        for k in _OUTPUT_BUDGET_KEYS:
+            if isinstance(scope.get(k), int):
+                budget = max(budget, scope[k])
+    return walk(body) // 4 + budget
@@ -0,0 +1,125 @@
+"""
+clients._sink
+=============
+
+Streaming downloads of generated artifacts (images, audio, video) to disk.
+
+Providers that return a generated file by URL (Qwen/DashScope, BFL, Recraft
+with ``response_format="url"``) used to be downloaded whole into memory and
+base64-encoded into the JSON response the parser reads — several copies of
+every image.  With a download target active, ``BaseClient._download`` writes
+the body to a file in chunks as it arrives instead, and the response carries
+the file's path.
+
+The target is carried in a context variable, set by ``Skill`` from
+``output["save_to"]`` around each model call (as ``hook_scope`` does for
+hooks), so the family clients' ``_send`` flows need no extra parameter:
+
+* a directory (``str`` / ``PathLike``) — each artifact is written to a new
+  file named ``<random hex>.<ext>`` inside it (created on demand);
+* a callable ``target(media_type)`` returning a path, or a writable binary
+  file object the caller owns (it is written to, never closed).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import mimetypes
+import os
+import uuid
+
+_target: contextvars.ContextVar = contextvars.ContextVar(
+    "yait_aichain_download_target", default=None)
+
+#: Bytes read from the socket per write.
+CHUNK_SIZE = 64 * 1024
+
+# Leading bytes kept for content sniffing when the server's type is generic.
+_HEAD_BYTES = 16
+
+
+@contextlib.contextmanager
+def download_to(target):
+    """Send artifact downloads inside the block to *target* (``None``: inline)."""
+    token = _target.set(target)
+    try:
+        yield
+    finally:
+        _target.reset(token)
+
+
+def download_target():
+    """The active download target, or ``None`` when downloads stay in memory."""
+    return _target.get()
+
+
+def validate_target(target) -> None:
+    """Raise ``ValueError`` unless *target* is a directory path or a callable."""
+    if target is not None and not (isinstance(target, (str, os.PathLike)) or callable(target)):
+        raise ValueError(
+            "save_to must be a directory path or a callable returning a path "
+            f"or binary file; got {type(target).__name__}"
+        )
+
+
+class FileSink:
+    """
+    Destination of one artifact download.
+
+    ``start`` is called once the response headers are in, ``write`` per
+    chunk, then ``close`` — or ``discard`` when the download failed, which
+    also removes a file the sink created.
+    """
+
+    def __init__(self, target) -> None:
+        self._target    = target
+        self._file      = None
+        self._owned     = False
+        self.path:       "str | None" = None
+        self.media_type = "application/octet-stream"
+        self.size       = 0
+        self.head       = b""
+
+    def start(self, media_type: "str | None") -> None:
+        if self._file is not None:
+            return         # a transport retry before any byte was written
+        self.media_type = media_type or self.media_type
+        if callable(self._target):
+            dest = self._target(self.media_type)
+        else:
+            ext  = mimetypes.guess_extension(self.media_type.split(";")[0].strip()) or ".bin"
+            dest = os.path.join(os.fspath(self._target), uuid.uuid4().hex + ext)
+        if isinstance(dest, (str, os.PathLike)):
+            dest = os.fspath(dest)
+            parent = os.path.dirname(dest)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            self._file  = open(dest, "wb")
+            self._owned = True
+            self.path   = dest
+        else:
+            self._file = dest
+            name = getattr(dest, "name", None)
+            self.path = name if isinstance(name, str) else None
+
+    def write(self, chunk: bytes) -> None:
+        if len(self.head) < _HEAD_BYTES:
+            self.head += chunk[:_HEAD_BYTES - len(self.head)]
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def close(self) -> None:
+        if self._owned and self._file is not None:
+            self._file.close()
+
+    def discard(self) -> None:
+        self.close()
+        if self._owned and self.path:
+            with contextlib.suppress(OSError):
+                os.remove(self.path)
+
+    def result(self) -> dict:
+        """The ``_download`` return value: where the artifact went, not its bytes."""
+        return {"path": self.path, "media_type": self.media_type,
+                "size": self.size, "head": self.head}
@@ -0,0 +1,92 @@
+"""
+clients._sse
+============
+
+Incremental Server-Sent Events parsing and the ``TextStream`` returned by
+``BaseClient.stream``.
+
+``iter_sse`` turns raw body chunks (as they arrive off the socket) into
+``SSEEvent`` objects per the WHATWG event-stream rules — ``data:`` lines are
+joined, ``event:`` names the event, ``:`` comments are ignored, a blank line
+dispatches.  Each family client supplies a *decoder* that maps its events to
+text deltas and, at the end, synthesises the same response dict its
+non-streaming endpoint returns, so ``parse_response`` and ``extract_usage``
+run unchanged on a streamed call.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+
+@dataclass(frozen=True)
+class SSEEvent:
+    """One dispatched server-sent event."""
+
+    event: "str | None"
+    data:  str
+    id:    "str | None" = None
+
+
+def iter_sse(chunks: Iterable[bytes]) -> Iterator[SSEEvent]:
+    """Yield ``SSEEvent`` objects from an iterable of raw byte chunks."""
+    buf = b""
+    event: "str | None" = None
+    event_id: "str | None" = None
+    data: list[str] = []
+
+    def lines_of(chunk_iter):
+        nonlocal buf
+        for chunk in chunk_iter:
+            buf += chunk
+            *complete, buf = buf.split(b"\n")
+            for raw in complete:
+                yield raw.rstrip(b"\r").decode("utf-8")
+        if buf:
+            yield buf.rstrip(b"\r").decode("utf-8")
+        yield ""        # end of stream dispatches a final unterminated event
+
+    for line in lines_of(chunks):
+        if not line:
+            if data:
+                yield SSEEvent(event=event, data="\n".join(data), id=event_id)
+            event, data = None, []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            data.append(value)
+        elif field == "event":
+            event = value
+        elif field == "id":
+            event_id = value
+
+
+class TextStream:
+    """
+    Iterator of text deltas for one streamed completion.
+
+    Iterate it to receive each delta as it arrives; once exhausted,
+    ``response`` holds the provider-shaped response dict (text, finish reason
+    and usage) for ``parse_response`` / ``extract_usage``.  ``close()``
+    releases the connection early when the caller stops reading.
+    """
+
+    def __init__(self, events: Iterator[SSEEvent], decoder) -> None:
+        self._events  = events
+        self._decoder = decoder
+        self.response: "dict | None" = None
+
+    def __iter__(self) -> Iterator[str]:
+        for event in self._events:
+            yield from self._decoder.feed(event)
+        self.response = self._decoder.response()
+
+    def close(self) -> None:
+        close = getattr(self._events, "close", None)
+        if close is not None:
+            close()
@@ -49,6 +49,7 @@ from ._base import (
     refresh      as _q_refresh,
     TASKS        as _TASKS,
 )
+from ._tokens import register_tokenizer
 
 #: Data-driven registry query surface.  Capabilities/prices live in the
 #: ``providers/`` data; these functions read it (there is no registry module).
@@ -65,4 +66,5 @@ registry = SimpleNamespace(
 __all__ = [
     "Model",
     "registry",
+    "register_tokenizer",
 ]
@@ -35,11 +35,14 @@ Provider detection is based on well-known model-name prefixes:
   ============  ============================================
 """
 
+import importlib
 import os
 import re
 from typing import TYPE_CHECKING
 
-from ._data import PROVIDERS
+from ._data import MODELS, PROVIDERS, PROVIDER_MODELS, TASK_MODELS, TASK_PROVIDERS
+from ._tokens import count_message_tokens
+from ..clients._errors import ContextWindowExceededError
 
 if TYPE_CHECKING:
     from ..clients._base import BaseClient
@@ -59,30 +62,59 @@ def _build_client(provider: str, api_key: str, client_options: dict) -> "BaseCli
     endpoints, base URL and quirk branches; per-call model settings arrive in
     ``params`` later.
     """
-    data  = PROVIDERS[provider]
-    ctype = data["provider"]["client"]
-
-    # Lazy imports keep module load cheap and avoid import cycles.
-    from ..clients._families.openai     import OpenAIClient
-    from ..clients._families.anthropic  import AnthropicClient
-    from ..clients._families.google     import GoogleClient
-    from ..clients._families.perplexity import PerplexityClient
-    from ..clients._families.qwen       import QwenClient
-    from ..clients._families.recraft    import RecraftClient
-    from ..clients._families.bfl        import BFLClient
-    from ..clients._families.reve       import ReveClient
-
-    family = {
-        "openai":     OpenAIClient,
-        "anthropic":  AnthropicClient,
-        "google":     GoogleClient,
-        "perplexity": PerplexityClient,
-        "qwen":       QwenClient,
-        "recraft":    RecraftClient,
-        "bfl":        BFLClient,
-        "reve":       ReveClient,
-    }[ctype]
-    return family(api_key, data=data, **client_options)
+    data = PROVIDERS[provider]
+    return _family(data["provider"]["client"])(api_key, data=data, **client_options)
+
+
+# ``[provider].client`` → (module in ``clients._families``, class name).
+_FAMILIES: dict[str, tuple[str, str]] = {
+    "openai":     ("openai",     "OpenAIClient"),
+    "anthropic":  ("anthropic",  "AnthropicClient"),
+    "google":     ("google",     "GoogleClient"),
+    "perplexity": ("perplexity", "PerplexityClient"),
+    "qwen":       ("qwen",       "QwenClient"),
+    "recraft":    ("recraft",    "RecraftClient"),
+    "bfl":        ("bfl",        "BFLClient"),
+    "reve":       ("reve",       "ReveClient"),
+}
+_family_classes: dict = {}
+
+
+def _family(ctype: str) -> type:
+    """The family client class for *ctype*, imported on first use."""
+    cls = _family_classes.get(ctype)
+    if cls is None:
+        # Lazy imports keep module load cheap and avoid import cycles.
+        module, name = _FAMILIES[ctype]
+        cls = getattr(importlib.import_module(f"..clients._families.{module}", __package__), name)
+        _family_classes[ctype] = cls
+    return cls
+
+
+def _rate_limiter(provider: str, name: str, override: "dict | None"):
+    """
+    Resolve the shared ``RateLimiter`` for *provider* + *name*: limits from the
+    provider data (``[provider] rate_limit``, then the model's own
+    ``rate_limit``) overlaid with *override*; else a limiter registered with
+    ``set_rate_limit``; else ``None``.
+    """
+    from ..clients._ratelimit import find_limiter, shared_limiter
+
+    data   = PROVIDERS[provider]
+    limits = {**data["provider"].get("rate_limit", {}),
+              **data.get("models", {}).get(name, {}).get("rate_limit", {}),
+              **(override or {})}
+    unknown = set(limits) - {"rpm", "tpm"}
+    if unknown:
+        raise ValueError(f"rate_limit accepts 'rpm' and 'tpm'; got {sorted(unknown)}")
+    if not limits:
+        return find_limiter(provider, name)
+    return shared_limiter(provider, name, rpm=limits.get("rpm"), tpm=limits.get("tpm"))
+
+
+# ``options["on_overflow"]``: what ``to_request`` does with a prompt that does
+# not fit the model's context window.
+_ON_OVERFLOW = frozenset({"raise", "trim", "ignore"})
 
 
 # ---------------------------------------------------------------------------
@@ -132,6 +164,9 @@ def _split_provider_prefix(name: str) -> "tuple[str | None, str]":
 
 def _resolve_provider(name: str) -> str:
     """Return the provider key for *name*, or raise ``ValueError``."""
+    entry = MODELS.get(name)
+    if entry is not None:
+        return entry.provider
     explicit, model_name = _split_provider_prefix(name)
     if explicit:
         return explicit
@@ -182,6 +217,8 @@ class Model:
         ``top_k``         int       Top-K sampling (provider-dependent).
         ``cache_control`` bool      Enable provider-level prompt caching.
         ``reasoning``     str|None  Universal reasoning depth (see below).
+        ``on_overflow``   str       ``"raise"`` (default), ``"trim"`` or
+                                    ``"ignore"`` — see *Context window*.
         ================  ========  =======================================
 
         **reasoning** accepts ``None``, ``"low"``, ``"medium"``, or
@@ -217,6 +254,28 @@ class Model:
           For the reasoner, ``temperature`` / ``top_p`` are omitted from the
           request (ignored by the API).
 
+        **Context window** — when the provider data gives the model a
+        ``context_window``, ``to_request`` estimates the prompt with
+        :meth:`count_tokens` and adds ``max_tokens``.  If that does not fit,
+        ``"raise"`` raises ``ContextWindowExceededError`` before anything is
+        sent; ``"trim"`` drops the oldest non-system messages (never the
+        last one) until it fits, and raises if it still does not;
+        ``"ignore"`` sends the request as-is.
+
+        **cache_control** reuses a long, stable prompt prefix across calls:
+
+        * **Anthropic**  — ``cache_control`` breakpoints on the system block
+          and on the conversation before the newest message.
+        * **OpenAI**     — a ``prompt_cache_key`` derived from the system
+          prompt, so calls sharing it reach the same prompt cache.
+        * **Google AI**  — the system instruction and the seed turns before
+          the first model reply are stored once as ``cachedContents`` and
+          referenced by later calls.
+
+        Other providers cache prompt prefixes automatically.  Cached tokens
+        are reported in ``Usage.cache_read_tokens`` /
+        ``cache_write_tokens`` and priced at the provider's cache rates.
+
     client_options : dict | None, optional
         Override settings for the underlying HTTP client.
         Supported keys (all optional):
@@ -228,8 +287,21 @@ class Model:
         ``timeout``  ``urllib3.Timeout``       Custom connect/read timeout.
         ``retries``  ``urllib3.Retry``         Custom retry policy.
         ``proxy``    dict                      Proxy config (see BaseClient).
+        ``rate_limit`` dict                    ``{"rpm": N, "tpm": N}`` —
+                                               client-side limits, shared
+                                               by every Model of this
+                                               provider + name.
+        ``cache``    ``ResponseCache``         Serve repeated identical
+                                               requests from this cache
+                                               (``MemoryCache`` /
+                                               ``SQLiteCache``).
         ===========  ========================  ==========================
 
+        Without ``rate_limit`` the provider data's ``rate_limit`` (provider-
+        or model-level) applies, or a limit set with
+        ``clients.set_rate_limit``; with none of them requests are not
+        limited client-side.
+
     api_key : str | None, optional
         Provider API key.  When omitted it is read from the provider's
         environment variable (e.g. ``OPENAI_API_KEY``), named in the provider
@@ -244,6 +316,8 @@ class Model:
     top_k         : int | None
     cache_control : bool
     reasoning     : str | None  (None | "low" | "medium" | "high")
+    context_window : int | None  (prompt + output tokens; from the data)
+    max_output     : int | None  (output tokens; from the data)
     client        : family client (ready to use)
 
     Examples
@@ -261,6 +335,11 @@ class Model:
     'https://generativelanguage.googleapis.com/v1beta'
     """
 
+    # Unknown limits: no pre-flight context check.
+    context_window: "int | None" = None
+    max_output:     "int | None" = None
+    on_overflow:    str          = "raise"
+
     # ------------------------------------------------------------------
     # Data-driven initialiser
     # ------------------------------------------------------------------
@@ -306,8 +385,26 @@ class Model:
             )
         self.reasoning = reasoning
 
+        on_overflow = opts.get("on_overflow", "raise")
+        if on_overflow not in _ON_OVERFLOW:
+            raise ValueError(
+                f"on_overflow must be one of {sorted(_ON_OVERFLOW)}; got {on_overflow!r}"
+            )
+        self.on_overflow = on_overflow
+
+        entry = MODELS.get(self.name)
+        self.context_window = entry.context_window if entry is not None else None
+        self.max_output     = entry.max_output     if entry is not None else None
+
+        # ── client-side rate limit: data ← client_options ─────────────
+        client_options = dict(client_options or {})
+        limiter = _rate_limiter(self._provider, self.name,
+                                client_options.pop("rate_limit", None))
+        if limiter is not None:
+            client_options["rate_limit"] = limiter
+
         # ── build the family client (format + transport) ──────────────
-        self.client = _build_client(self._provider, resolved_key, client_options or {})
+        self.client = _build_client(self._provider, resolved_key, client_options)
 
     # ------------------------------------------------------------------
     # Format — thin delegation to the family client
@@ -316,12 +413,13 @@ class Model:
     def _params(self) -> dict:
         """Per-call model settings handed to the client's ``build_request``."""
         return {
-            "name":        self.name,
-            "temperature": self.temperature,
-            "max_tokens":  self.max_tokens,
-            "top_p":       self.top_p,
-            "top_k":       self.top_k,
-            "reasoning":   self.reasoning,
+            "name":          self.name,
+            "temperature":   self.temperature,
+            "max_tokens":    self.max_tokens,
+            "top_p":         self.top_p,
+            "top_k":         self.top_k,
+            "reasoning":     self.reasoning,
+            "cache_control": self.cache_control,
         }
 
     def to_request(self, messages: list, output: dict) -> "tuple[str, dict]":
@@ -329,8 +427,69 @@ class Model:
         Translate substituted universal *messages* + *output* spec into the
         provider's native ``(path, body)`` pair, by delegating to the family
         client that owns this provider's wire format.
+
+        A JSON body is returned as a ``RequestBody``, whose encoding is
+        computed once and reused when the same request is sent again.
+        """
+        from ..clients._base import RequestBody
+        if self.context_window is not None and self.on_overflow != "ignore":
+            messages = self._fit_context(messages)
+        path, body = self.client.build_request(messages, output, self._params())
+        if type(body) is dict:
+            body = RequestBody(body)
+        return path, body
+
+    def to_continuation(self, previous: dict, messages: list,
+                        output: dict) -> "tuple[str, dict] | None":
+        """
+        The ``(path, body)`` pair that continues the conversation the provider
+        stored for the raw response *previous* with only the new *messages*
+        (plus any system turns), or ``None`` when this model's API keeps no
+        server-side conversation state (see ``build_continuation``).
         """
-        return self.client.build_request(messages, output, self._params())
+        from ..clients._base import RequestBody
+        request = self.client.build_continuation(previous, messages, output, self._params())
+        if request is None:
+            return None
+        path, body = request
+        if type(body) is dict:
+            body = RequestBody(body)
+        return path, body
+
+    def count_tokens(self, messages: list) -> int:
+        """
+        Estimate the prompt tokens of universal *messages* for this model,
+        locally (``models._tokens``): exact where a tokenizer is available,
+        a character heuristic otherwise.
+        """
+        return count_message_tokens(messages, self._provider,
+                                    PROVIDERS[self._provider]["provider"]["client"],
+                                    self.name)
+
+    def _fit_context(self, messages: list) -> list:
+        """
+        *messages*, trimmed per ``on_overflow`` to fit ``context_window``
+        together with the ``max_tokens`` output budget.
+        """
+        budget = self.context_window - (self.max_tokens or 0)
+        tokens = self.count_tokens(messages)
+        if tokens <= budget:
+            return messages
+        if self.on_overflow == "trim":
+            kept = list(messages)
+            droppable = [i for i, m in enumerate(kept[:-1]) if m.get("role") != "system"]
+            for i in droppable:
+                tokens -= self.count_tokens([kept[i]])
+                kept[i] = None
+                if tokens <= budget:
+                    return [m for m in kept if m is not None]
+        raise ContextWindowExceededError(
+            f"{self.name}: the prompt is ~{tokens:,} tokens and max_tokens is "
+            f"{self.max_tokens or 0:,}, more than the {self.context_window:,}-token "
+            f"context window.",
+            tokens=tokens + (self.max_tokens or 0),
+            context_window=self.context_window,
+        )
 
     def from_response(self, response: dict, output: dict) -> "str | dict":
         """
@@ -389,47 +548,35 @@ def models(provider: "str | None" = None, task: "str | None" = None) -> list[str
     """Return model names, optionally filtered by *provider* and/or *task*."""
     _check_provider(provider)
     _check_task(task)
-    result: set[str] = set()
-    for prov, data in PROVIDERS.items():
-        if provider is not None and prov != provider:
-            continue
-        for name, mdl in data.get("models", {}).items():
-            if task is None or task in mdl.get("caps", []):
-                result.add(name)
-    return sorted(result)
+    if provider is not None:
+        names = PROVIDER_MODELS[provider]
+        if task is None:
+            return list(names)
+        return [n for n in names if task in MODELS[n].caps]
+    if task is not None:
+        return list(TASK_MODELS.get(task, ()))
+    return sorted(MODELS)
 
 
 def providers(task: "str | None" = None) -> list[str]:
     """Return providers with at least one model (optionally supporting *task*)."""
     _check_task(task)
-    out: list[str] = []
-    for prov, data in PROVIDERS.items():
-        ms = data.get("models", {})
-        if not ms:
-            continue
-        if task is None or any(task in m.get("caps", []) for m in ms.values()):
-            out.append(prov)
-    return out
+    if task is not None:
+        return list(TASK_PROVIDERS.get(task, ()))
+    return [prov for prov, names in PROVIDER_MODELS.items() if names]
 
 
 def tasks(model_name: str) -> list[str]:
     """Return the tasks supported by *model_name* (empty list if unknown)."""
-    found: set[str] = set()
-    for data in PROVIDERS.values():
-        mdl = data.get("models", {}).get(model_name)
-        if mdl is not None:
-            found.update(mdl.get("caps", []))
-    return sorted(found)
+    entry = MODELS.get(model_name)
+    return sorted(entry.caps) if entry is not None else []
 
 
 def is_supported(model_name: str, task: "str | None" = None) -> bool:
     """Return True when *model_name* is known (and supports *task* if given)."""
     _check_task(task)
-    for data in PROVIDERS.values():
-        mdl = data.get("models", {}).get(model_name)
-        if mdl is not None and (task is None or task in mdl.get("caps", [])):
-            return True
-    return False
+    entry = MODELS.get(model_name)
+    return entry is not None and (task is None or task in entry.caps)
 
 
 def refresh(provider: str, api_key: "str | None" = None, client=None) -> dict:
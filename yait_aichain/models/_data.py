@@ -7,16 +7,30 @@ tier of the two-tier model layer.
 
 One file per provider; each holds the provider's transport/format settings
 (`[provider]`) and its models (`[models."name"]`).  Loaded once at import into
-``PROVIDERS`` (provider key → data).  ``Model`` and the registry query
-functions read from here.
+``PROVIDERS`` (provider key → data) and indexed into ``MODELS`` (model name →
+provider, price, capabilities) plus per-provider and per-task name lists, so
+``Model(...)``, cost accounting and the registry queries are dictionary
+lookups rather than scans.
 
 TOML parsing uses stdlib ``tomllib`` (Python 3.11+); on 3.10 it falls back to
 the optional ``tomli`` package.
+
+Parsing every file costs several milliseconds of cold start, so the parsed
+registry is cached in ``providers/__pycache__/`` as a ``marshal`` blob —
+written on first import, the way Python caches bytecode (honouring
+``PYTHONDONTWRITEBYTECODE`` and ``PYTHONPYCACHEPREFIX``).  The cache is keyed
+by each TOML file's name, mtime and size, so editing, adding or removing a
+provider file re-parses.  To ship it precompiled (e.g. in a serverless image),
+``import yait_aichain.models`` once at build time.
 """
 
 from __future__ import annotations
 
+import contextlib
+import marshal
 import os
+import sys
+from dataclasses import dataclass
 
 try:
     import tomllib as _toml          # Python 3.11+
@@ -31,12 +45,32 @@ except ModuleNotFoundError:          # pragma: no cover
 
 _DIR = os.path.join(os.path.dirname(__file__), "providers")
 
+# Bump when the cached layout changes; part of the cache key.
+_CACHE_FORMAT = 1
 
-def _load() -> dict:
-    providers: dict = {}
+
+def _cache_path() -> str:
+    """Where the parsed registry is cached — beside the sources, like bytecode."""
+    name = f"providers.{sys.implementation.cache_tag}.marshal"
+    if sys.pycache_prefix:
+        rel = os.path.splitdrive(_DIR)[1].lstrip(os.sep)
+        return os.path.join(sys.pycache_prefix, rel, name)
+    return os.path.join(_DIR, "__pycache__", name)
+
+
+def _sources() -> list:
+    """``(file name, mtime_ns, size)`` of every provider file: the cache key."""
+    found = []
     for fname in sorted(os.listdir(_DIR)):
-        if not fname.endswith(".toml"):
-            continue
+        if fname.endswith(".toml"):
+            st = os.stat(os.path.join(_DIR, fname))
+            found.append((fname, st.st_mtime_ns, st.st_size))
+    return found
+
+
+def _parse(sources: list) -> dict:
+    providers: dict = {}
+    for fname, _mtime, _size in sources:
         with open(os.path.join(_DIR, fname), "rb") as fh:
             data = _toml.load(fh)
         key = data["provider"]["key"]
@@ -44,13 +78,94 @@ def _load() -> dict:
     return providers
 
 
+def _read_cache(key: list) -> "dict | None":
+    try:
+        with open(_cache_path(), "rb") as fh:
+            cached_key, providers = marshal.load(fh)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return providers if cached_key == key else None
+
+
+def _write_cache(key: list, providers: dict) -> None:
+    """Best effort: a read-only install or unmarshallable data just skips it."""
+    if sys.dont_write_bytecode:
+        return
+    path = _cache_path()
+    tmp  = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "wb") as fh:
+            marshal.dump((key, providers), fh)
+        os.replace(tmp, path)
+    except (OSError, ValueError):
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+
+
+def _load() -> dict:
+    key = [_CACHE_FORMAT, _sources()]
+    providers = _read_cache(key)
+    if providers is None:
+        providers = _parse(key[1])
+        _write_cache(key, providers)
+    return providers
+
+
 #: provider key → {"provider": {...}, "models": {name: {...}}}
 PROVIDERS: dict[str, dict] = _load()
 
 
+# ---------------------------------------------------------------------------
+# Index — built once so per-call lookups never scan the provider tables
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ModelEntry:
+    """
+    A registered model: its provider, price table, capability set and token
+    limits (``None`` where the data does not say).
+    """
+    provider:       str
+    price:          "dict | None"
+    caps:           frozenset
+    context_window: "int | None" = None
+    max_output:     "int | None" = None
+
+
+def _index(providers: dict) -> tuple:
+    by_name:     dict = {}
+    by_provider: dict = {}
+    by_task:     dict = {}
+    task_provs:  dict = {}
+    for key, data in providers.items():
+        table = data.get("models", {})
+        by_provider[key] = tuple(sorted(table))
+        for name, mdl in table.items():
+            caps = frozenset(mdl.get("caps", []))
+            # A name listed by two providers belongs to the first file.
+            by_name.setdefault(name, ModelEntry(key, mdl.get("price"), caps,
+                                                mdl.get("context_window"),
+                                                mdl.get("max_output")))
+            for task in caps:
+                by_task.setdefault(task, set()).add(name)
+                task_provs.setdefault(task, {})[key] = None
+    return (
+        by_name,
+        by_provider,
+        {task: tuple(sorted(names)) for task, names in by_task.items()},
+        {task: tuple(provs) for task, provs in task_provs.items()},
+    )
+
+
+#: model name → ModelEntry
+#: provider key → its model names, sorted
+#: task → names of the models supporting it, sorted
+#: task → providers with at least one model supporting it, in PROVIDERS order
+MODELS, PROVIDER_MODELS, TASK_MODELS, TASK_PROVIDERS = _index(PROVIDERS)
+
+
 def provider_of(model_name: str) -> "str | None":
     """Return the provider key that owns *model_name*, or None."""
-    for key, data in PROVIDERS.items():
-        if model_name in data.get("models", {}):
-            return key
-    return None
+    entry = MODELS.get(model_name)
+    return entry.provider if entry is not None else None
@@ -0,0 +1,109 @@
+"""
+models._tokens
+==============
+
+Local token counts for pre-flight checks — ``Model.count_tokens``, the
+context-window check in ``Model.to_request`` and the Agent's step budget.
+
+Counting happens before anything is sent, so it cannot ask the provider.  Each
+provider (or client family) has a counter ``count(text, model_name) -> int``:
+
+* ``openai`` — exact, via ``tiktoken`` when it is installed
+  (``pip install yait-aichain[tokens]``);
+* everything else — a heuristic: ~4 ASCII characters per token, ~2 other
+  characters per token (CJK and most non-Latin scripts tokenize far denser
+  than English).
+
+``register_tokenizer(key, count)`` plugs in an exact tokenizer for a provider
+key (``"deepseek"``) or a whole client family (``"anthropic"``); a provider's
+own counter wins over its family's.
+
+Messages are the universal ``[{"role", "parts"}]`` list.  Each message adds a
+few tokens of role / separator overhead; an image, audio or video part counts
+as a flat ``MEDIA_TOKENS`` — the provider's real figure depends on resolution
+and duration, which are not known locally.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+#: Flat allowance for one image / audio / video part.
+MEDIA_TOKENS = 1_000
+
+# Role and separator tokens each message costs on top of its text.
+_MESSAGE_OVERHEAD = 4
+
+_counters: "dict[str, Callable[[str, str], int]]" = {}
+
+
+def register_tokenizer(key: str, count: "Callable[[str, str], int] | None") -> None:
+    """
+    Count text for provider or client family *key* with
+    ``count(text, model_name) -> int``; ``None`` restores the default.
+    """
+    if count is None:
+        _counters.pop(key, None)
+    else:
+        _counters[key] = count
+
+
+def heuristic_count(text: str, model_name: str = "") -> int:
+    """Rough token count: ~4 ASCII characters or ~2 other characters per token."""
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return -(-ascii_chars // 4) + -(-(len(text) - ascii_chars) // 2)
+
+
+def _tiktoken_count() -> "Callable[[str, str], int] | None":
+    """An exact OpenAI counter backed by ``tiktoken``, or ``None`` without it."""
+    try:
+        import tiktoken  # optional dependency
+    except ImportError:
+        return None
+    encodings: dict = {}
+
+    def count(text: str, model_name: str) -> int:
+        enc = encodings.get(model_name)
+        if enc is None:
+            try:
+                enc = tiktoken.encoding_for_model(model_name)
+            except KeyError:
+                enc = tiktoken.get_encoding("o200k_base")
+            encodings[model_name] = enc
+        return len(enc.encode(text, disallowed_special=()))
+
+    return count
+
+
+_defaults: dict = {}
+
+
+def counter_for(provider: str, family: str) -> "Callable[[str, str], int]":
+    """The text counter for *provider* (falling back to its client *family*)."""
+    count = _counters.get(provider) or _counters.get(family)
+    if count is not None:
+        return count
+    if provider == "openai":
+        if "openai" not in _defaults:
+            _defaults["openai"] = _tiktoken_count()
+        if _defaults["openai"] is not None:
+            return _defaults["openai"]
+    return heuristic_count
+
+
+def count_message_tokens(messages: list, provider: str, family: str,
+                         model_name: str) -> int:
+    """Estimated prompt tokens of universal *messages* for one model."""
+    count = counter_for(provider, family)
+    total = 0
+    for msg in messages:
+        total += _MESSAGE_OVERHEAD
+        for part in msg.get("parts", []):
+            if isinstance(part, str):
+                total += count(part, model_name)
+            elif isinstance(part, dict):
+                if part.get("type", "text") == "text":
+                    total += count(str(part.get("text", "")), model_name)
+                else:
+                    total += MEDIA_TOKENS
+    return total
@@ -12,7 +12,11 @@ Each provider reports token counts under a different shape:
 
 ``extract_usage(response)`` flattens all of them into a single ``Usage``
 object, so ``result.usage.input_tokens`` means the same thing no matter
-which model produced it.
+which model produced it.  Prompt-cache counts are normalised the same way:
+``input_tokens`` is always the whole prompt, of which ``cache_read_tokens``
+were served from the provider's prompt cache and ``cache_write_tokens`` were
+written to it (Anthropic reports these apart from ``input_tokens``; the
+others report them as a share of it).
 
 ``Usage`` is additive (``a + b``), so a Chain/Pool can sum the usage of its
 steps into one total.  Cost is attached separately in block 1.2-C.
@@ -30,16 +34,20 @@ class Usage:
 
     Attributes
     ----------
-    input_tokens  : prompt / input tokens billed.
-    output_tokens : completion / output tokens billed.
-    total_tokens  : provider-reported total, or input+output when absent.
-    cost          : estimated cost in USD (filled in 1.2-C; ``None`` until then).
+    input_tokens       : prompt / input tokens billed, cached ones included.
+    output_tokens      : completion / output tokens billed.
+    total_tokens       : provider-reported total, or input+output when absent.
+    cost               : estimated cost in USD (filled in 1.2-C; ``None`` until then).
+    cache_read_tokens  : part of ``input_tokens`` read from the prompt cache.
+    cache_write_tokens : part of ``input_tokens`` written to the prompt cache.
     """
 
-    input_tokens:  int = 0
-    output_tokens: int = 0
-    total_tokens:  int = 0
-    cost:          "float | None" = None
+    input_tokens:       int = 0
+    output_tokens:      int = 0
+    total_tokens:       int = 0
+    cost:               "float | None" = None
+    cache_read_tokens:  int = 0
+    cache_write_tokens: int = 0
 
     def __add__(self, other: "Usage") -> "Usage":
         if not isinstance(other, Usage):
@@ -52,6 +60,8 @@ class Usage:
             output_tokens = self.output_tokens + other.output_tokens,
             total_tokens  = self.total_tokens  + other.total_tokens,
             cost          = merged_cost,
+            cache_read_tokens  = self.cache_read_tokens  + other.cache_read_tokens,
+            cache_write_tokens = self.cache_write_tokens + other.cache_write_tokens,
         )
 
     def __radd__(self, other):
@@ -84,8 +94,12 @@ def extract_usage(response: dict) -> Usage:
             out = u.get("completion_tokens", 0)
         inp = inp or 0
         out = out or 0
+        read, write = _cache_counts(u)
+        if "cache_read_input_tokens" in u or "cache_creation_input_tokens" in u:
+            inp += read + write      # Anthropic: input_tokens is the uncached rest
         total = u.get("total_tokens") or (inp + out)
-        return Usage(input_tokens=inp, output_tokens=out, total_tokens=total)
+        return Usage(input_tokens=inp, output_tokens=out, total_tokens=total,
+                     cache_read_tokens=read, cache_write_tokens=write)
 
     # Google: "usageMetadata".
     g = response.get("usageMetadata")
@@ -93,11 +107,23 @@ def extract_usage(response: dict) -> Usage:
         inp = g.get("promptTokenCount", 0) or 0
         out = g.get("candidatesTokenCount", 0) or 0
         total = g.get("totalTokenCount") or (inp + out)
-        return Usage(input_tokens=inp, output_tokens=out, total_tokens=total)
+        return Usage(input_tokens=inp, output_tokens=out, total_tokens=total,
+                     cache_read_tokens=g.get("cachedContentTokenCount", 0) or 0)
 
     return Usage()
 
 
+def _cache_counts(u: dict) -> "tuple[int, int]":
+    """``(read, write)`` prompt-cache tokens of a top-level ``usage`` block."""
+    details = u.get("prompt_tokens_details") or u.get("input_tokens_details") or {}
+    read = (u.get("cache_read_input_tokens")       # Anthropic
+            or details.get("cached_tokens")         # OpenAI chat / Responses, xAI
+            or u.get("prompt_cache_hit_tokens")     # DeepSeek
+            or u.get("cached_tokens")               # Kimi
+            or 0)
+    return read, u.get("cache_creation_input_tokens") or 0
+
+
 # ---------------------------------------------------------------------------
 # Cost — prices live in the provider data (providers/*.toml)
 # ---------------------------------------------------------------------------
@@ -105,14 +131,23 @@ def extract_usage(response: dict) -> Usage:
 # The price lookup is imported lazily so that merely importing ``Usage`` (which
 # every primitive does for ``.last_usage``) stays light and never triggers the
 # provider-data load.
+#
+# Cached prompt tokens are priced at the model's ``cache_read`` / ``cache_write``
+# rates when its price table lists them, else at the provider's ``cache_price``
+# multipliers of the input rate (``{ read = 0.1, write = 1.25 }``), else at the
+# input rate.
 
 def _price_of(model_name: str) -> "dict | None":
-    from ._data import PROVIDERS
-    for data in PROVIDERS.values():
-        mdl = data.get("models", {}).get(model_name)
-        if mdl is not None and "price" in mdl:
-            return mdl["price"]
-    return None
+    from ._data import MODELS, PROVIDERS
+    entry = MODELS.get(model_name)
+    if entry is None or entry.price is None:
+        return None
+    mult = PROVIDERS[entry.provider]["provider"].get("cache_price", {})
+    return {
+        "cache_read":  entry.price["input"] * mult.get("read", 1.0),
+        "cache_write": entry.price["input"] * mult.get("write", 1.0),
+        **entry.price,
+    }
 
 
 def estimate_cost(usage: Usage, model_name: str) -> "float | None":
@@ -123,8 +158,12 @@ def estimate_cost(usage: Usage, model_name: str) -> "float | None":
     price = _price_of(model_name)
     if price is None:
         return None
+    read, write = usage.cache_read_tokens, usage.cache_write_tokens
+    uncached = max(usage.input_tokens - read - write, 0)
     return (
-        usage.input_tokens  / 1_000_000 * price["input"]
+        uncached              / 1_000_000 * price["input"]
+        + read                / 1_000_000 * price["cache_read"]
+        + write               / 1_000_000 * price["cache_write"]
         + usage.output_tokens / 1_000_000 * price["output"]
     )
 
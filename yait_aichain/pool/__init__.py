@@ -10,8 +10,14 @@ in the same order as the input items regardless of completion order.
 
 Public API
 ----------
-``Pool(runner, items, *, max_flows, on_error)``
-    Run *runner* in parallel for every dict in *items*.
+``Pool(runner, items, *, max_flows, on_error, flow_bounds)``
+    Run *runner* in parallel for every dict in *items*.  ``max_flows="auto"``
+    adapts the concurrency between ``flow_bounds`` as the pool runs.
+
+``BatchPool(skill, items, *, store, job_key, poll_interval, timeout, on_error)``
+    Run a Skill for every item through the provider's batch API (OpenAI,
+    Anthropic, Google) — about half the price, results within 24 hours.
+    Job ids are kept in a ``StateStore`` so a restarted process reattaches.
 
 ``PENDING = 0``  ``RUNNING = 1``  ``DONE = 2``  ``FAILED = 3``
     Integer status constants for reading ``pool.history`` and ``pool.status``.
@@ -39,8 +45,8 @@ Result and memory
       ``duration``  — seconds, or ``None`` if not yet finished
 
 ``pool.status``  → ``dict``
-    ``{PENDING: N, RUNNING: N, DONE: N, FAILED: N}``
-    Thread-safe — safe to poll while the pool is running.
+    ``{PENDING: N, RUNNING: N, DONE: N, FAILED: N, "max_flows": N}``
+    (``"max_flows"`` is the current concurrency limit).  Thread-safe — safe to poll while the pool is running.
 
 on_error
 --------
@@ -102,9 +108,11 @@ Use a Chain as runner (multi-step pipeline per item)::
 """
 
 from ._pool import Pool, PENDING, RUNNING, DONE, FAILED
+from ._batch import BatchPool
 
 __all__ = [
     "Pool",
+    "BatchPool",
     "PENDING",
     "RUNNING",
     "DONE",
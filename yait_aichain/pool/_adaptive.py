@@ -0,0 +1,154 @@
+"""
+pool._adaptive
+==============
+
+``FlowLimit`` — the concurrency gate behind ``Pool``, fixed or adaptive.
+
+A fixed limit (``Pool(max_flows=8)``) admits at most that many items at a
+time.  An adaptive limit (``Pool(max_flows="auto")``) moves between a floor
+and a ceiling with AIMD — additive increase, multiplicative decrease — the
+congestion control TCP uses, fed by the duration and outcome of every item
+the pool finishes:
+
+* **Slow start** — until the first cut, each success raises the limit by
+  one, so it doubles roughly every "round" of ``limit`` completions.
+* **Additive increase** — after a cut, each success adds ``1 / limit``:
+  one more flow per round while latency and error rates are healthy.
+* **Multiplicative decrease** — a ``RateLimitError`` or ``ServerError``
+  halves the limit; a p95 latency over the recent window that has risen
+  well above the longer-term p95 cuts it by a quarter.  Items already in
+  flight when the limit was cut all report the same overload, so only one
+  cut is taken per round.
+
+The limit never leaves ``[floor, ceiling]``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+
+from ..clients._errors import RateLimitError, ServerError
+
+# Multiplicative cuts on an overload error / a latency rise.
+_ERROR_DECREASE   = 0.5
+_LATENCY_DECREASE = 0.75
+# Recent p95 above this multiple of the long-term p95 counts as "rising".
+_LATENCY_TOLERANCE = 1.5
+# Durations kept for the recent and the long-term p95.
+_SHORT_WINDOW = 20
+_LONG_WINDOW  = 200
+
+
+def _p95(samples) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+
+class FlowLimit:
+    """
+    Concurrency gate for one pool run: ``acquire`` / ``aacquire`` before an
+    item starts, ``release`` after it finishes, ``record`` its outcome.
+
+    Parameters
+    ----------
+    limit : int
+        Starting limit (the floor for an adaptive gate).
+    floor, ceiling : int | None
+        Bounds for an adaptive gate; ``None`` keeps ``limit`` fixed.
+    """
+
+    def __init__(self, limit: int, floor: "int | None" = None,
+                 ceiling: "int | None" = None) -> None:
+        self.adaptive  = floor is not None
+        self.floor     = floor if self.adaptive else limit
+        self.ceiling   = ceiling if self.adaptive else limit
+        self._limit    = float(limit)
+        self._in_flight = 0
+        self._slow_start = True
+        self._since_cut  = 0
+        self._cut_round  = 0
+        self._short: deque = deque(maxlen=_SHORT_WINDOW)
+        self._long:  deque = deque(maxlen=_LONG_WINDOW)
+        self._cond = threading.Condition()
+        self._waiters: deque = deque()      # asyncio futures parked in aacquire
+
+    @property
+    def limit(self) -> int:
+        """The current number of items allowed in flight."""
+        return int(self._limit)
+
+    # ── gate ─────────────────────────────────────────────────────────
+
+    def _try_acquire(self) -> bool:
+        with self._cond:
+            if self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        """Block the calling worker thread until it may start an item."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    async def aacquire(self) -> None:
+        """Async :meth:`acquire` for ``Pool.arun`` (one event loop)."""
+        while not self._try_acquire():
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    # ── control ──────────────────────────────────────────────────────
+
+    def record(self, duration: float, exc: "BaseException | None" = None) -> None:
+        """Feed one finished item's duration and error (``None`` on success)."""
+        if not self.adaptive:
+            return
+        with self._cond:
+            self._since_cut += 1
+            if isinstance(exc, (RateLimitError, ServerError)):
+                self._cut(_ERROR_DECREASE)
+            elif exc is None:
+                self._short.append(duration)
+                self._long.append(duration)
+                if self._latency_rising():
+                    self._cut(_LATENCY_DECREASE)
+                elif self._slow_start:
+                    self._limit += 1
+                else:
+                    self._limit += 1 / self._limit
+            self._limit = min(float(self.ceiling), max(float(self.floor), self._limit))
+            self._cond.notify_all()
+
+    def _latency_rising(self) -> bool:
+        if len(self._long) < 2 * _SHORT_WINDOW or len(self._short) < _SHORT_WINDOW:
+            return False
+        return _p95(self._short) > _LATENCY_TOLERANCE * _p95(self._long)
+
+    def _cut(self, factor: float) -> None:
+        # Everything that was in flight at the last cut saw the same overload.
+        if self._since_cut <= self._cut_round:
+            return
+        self._limit      = self._limit * factor
+        self._slow_start = False
+        self._since_cut  = 0
+        self._cut_round  = max(1, int(self._limit) + self._in_flight)
+        self._short.clear()
+
+    def __repr__(self) -> str:
+        if not self.adaptive:
+            return f"FlowLimit({self.limit})"
+        return f"FlowLimit(auto, limit={self.limit}, floor={self.floor}, ceiling={self.ceiling})"
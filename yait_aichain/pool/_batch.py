@@ -0,0 +1,284 @@
+"""
+pool._batch
+===========
+
+``BatchPool`` — run one Skill over many items through the provider's batch
+API instead of live calls.
+
+OpenAI (Batch API), Anthropic (Message Batches) and Gemini (batch mode) run
+large jobs asynchronously at about half the interactive price and outside
+the interactive rate limits, finishing within 24 hours.  For overnight jobs
+of many thousands of prompts that trade is worth it; ``BatchPool`` makes it
+a drop-in for ``Pool``:
+
+1. every item's request is built exactly as ``Skill.run`` would build it —
+   variables substituted, then ``Model.to_request``;
+2. the requests are submitted as one batch job per
+   ``client.max_batch_requests()`` chunk (``BaseClient.batch_submit``);
+3. the jobs are polled until they end (``BaseClient.batch_poll`` — the
+   submit / poll / collect pattern of ``QwenClient._poll_task``);
+4. each response goes through ``Model.from_response`` into the same ordered
+   result list ``Pool.run`` returns, with the same ``history`` / ``status``
+   / ``on_error`` semantics.
+
+Reattaching
+-----------
+With a ``store`` (any ``state.StateStore``), the submitted job ids are saved
+under ``job_key`` as soon as each job is created.  A process that crashes
+while the jobs run can call ``run()`` again with the same items and store:
+it finds the saved ids and resumes polling instead of paying for a second
+batch.  The document is deleted once every result has been collected.
+``job_key`` defaults to a digest of the model and every request body, so an
+identical run reattaches without naming its key.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import replace
+
+from ..clients._cache import request_key
+from ..clients._errors import TaskFailedError
+from ..models._usage import Usage, attach_cost, extract_usage
+from ._pool import Pool
+
+#: Batch jobs are billed at this fraction of the interactive price.
+BATCH_DISCOUNT = 0.5
+
+
+def _is_skill(runner) -> bool:
+    """True for a :class:`~skills.Skill` (or subclass) instance."""
+    from ..skills import Skill
+    return isinstance(runner, Skill)
+
+
+class BatchPool(Pool):
+    """
+    Run a Skill for every item through the provider's batch API.
+
+    Parameters
+    ----------
+    skill : Skill
+        A single-call skill (no multi-turn ``assistant`` generate markers)
+        whose model's provider offers a batch API: OpenAI, Anthropic or
+        Google.  Only the primary model is used — fallbacks do not apply to
+        a batch job.
+    items : list[dict]
+        One variable dict per task, merged with the shared ``variables`` of
+        :meth:`run` (item values win), as in ``Pool``.
+    store : StateStore | None, optional
+        Where the job ids are kept while the jobs run, so a restarted process
+        can reattach.  ``None`` keeps them in memory only.
+    job_key : str | None, optional
+        The store key.  Defaults to a digest of the model and the requests.
+    poll_interval : float, optional
+        Seconds between polls of the running jobs (default 60).
+    timeout : float, optional
+        Give up waiting after this many seconds (default 25 hours — providers
+        end a batch within 24).  The ids stay in the store, so a later
+        ``run()`` reattaches.
+    on_error, name, description
+        As for ``Pool``.
+
+    Attributes
+    ----------
+    job_ids : list[str]
+        Ids of the batch jobs behind the most recent run.
+    last_usage : Usage | None
+        Summed usage of the successful items, with the cost discounted by
+        ``BATCH_DISCOUNT``.
+
+    Example
+    -------
+    ::
+
+        from pool import BatchPool
+        from state import FileStore
+
+        pool = BatchPool(classify_skill,
+                         items=[{"text": t} for t in texts],
+                         store=FileStore("./batches"), job_key="nightly-classify")
+        labels = pool.run()        # blocks until the provider finishes
+    """
+
+    def __init__(
+        self,
+        skill,
+        items:         list[dict],
+        store=None,
+        job_key:       "str | None" = None,
+        poll_interval: float = 60.0,
+        timeout:       float = 25 * 3600.0,
+        on_error:      str   = "collect",
+        name:          "str | None" = None,
+        description:   "str | None" = None,
+    ) -> None:
+        if not _is_skill(skill):
+            raise TypeError(
+                f"BatchPool runs a Skill; got {type(skill).__name__}."
+            )
+        if not skill.model.client.max_batch_requests():
+            raise ValueError(
+                f"Model {skill.model.name!r} has no provider batch API "
+                "(supported: OpenAI, Anthropic, Google)."
+            )
+        super().__init__(skill, items, on_error=on_error,
+                         name=name, description=description)
+        self._store        = store
+        self._job_key      = job_key
+        self.poll_interval = poll_interval
+        self.timeout       = timeout
+        self.job_ids:    list[str] = []
+        self.last_usage: "Usage | None" = None
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def run(self, variables: dict | None = None) -> list:
+        """
+        Submit (or reattach to) the batch jobs, wait for them to end, and
+        return one output per item in *items* order.
+
+        Failed items produce ``None`` unless ``on_error="raise"``.
+
+        Raises
+        ------
+        TaskFailedError
+            A job failed as a whole, or the jobs did not end within
+            ``timeout`` (the ids stay in the store for a later reattach).
+        """
+        shared = variables or {}
+        self._history   = self._init_history()
+        self.last_usage = None
+
+        skill  = self._runner
+        model  = skill.model
+        client = model.client
+        merged = [{**shared, **item} for item in self._items]
+        requests = [self._request(vs) for vs in merged]
+
+        key = self._job_key or "batch-" + request_key(
+            ("batch", model.name), "", [[p, b] for p, b in requests])
+        chunks = self._chunks(requests, client.max_batch_requests())
+        document = (self._store.load(key) if self._store is not None else None) or {}
+        if document and document.get("count") != len(requests):
+            raise ValueError(
+                f"Stored batch {key!r} covers {document.get('count')} items, "
+                f"not {len(requests)}; pass a different job_key."
+            )
+        jobs: dict = dict(document.get("jobs") or {})
+
+        for start, end in chunks:
+            if str(start) not in jobs:
+                jobs[str(start)] = client.batch_submit(
+                    [(str(i), requests[i][0], requests[i][1]) for i in range(start, end)])
+                self._save(key, {"kind": "batch", "model": model.name,
+                                 "count": len(requests), "jobs": jobs})
+            for i in range(start, end):
+                self._mark_running(i, merged[i])
+        self.job_ids = [jobs[str(start)] for start, _ in chunks]
+
+        results: list = [None] * len(requests)
+        pending = {jobs[str(start)]: (start, end) for start, end in chunks}
+        deadline = time.monotonic() + self.timeout
+        started  = time.monotonic()
+        while pending:
+            for job_id, (start, end) in list(pending.items()):
+                try:
+                    outcome = client.batch_poll(job_id)
+                except TaskFailedError as exc:
+                    outcome = {str(i): exc for i in range(start, end)}
+                if outcome is None:
+                    continue
+                del pending[job_id]
+                self._collect(job_id, outcome, range(start, end), started, results)
+            if not pending:
+                break
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise TaskFailedError(
+                    504,
+                    f"Batch jobs {sorted(pending)} did not end within "
+                    f"{self.timeout:.0f}s; run() again to reattach.",
+                )
+            time.sleep(min(self.poll_interval, left))
+
+        if self._store is not None:
+            self._store.delete(key)
+        return results
+
+    async def arun(self, variables: dict | None = None) -> list:
+        """
+        Async :meth:`run`.  A batch spends its time waiting on the provider,
+        so the blocking run happens in one worker thread.
+        """
+        return await asyncio.to_thread(self.run, variables)
+
+    @property
+    def status(self) -> dict:
+        """Count of tasks per status code (RUNNING = submitted, not yet back)."""
+        counts = super().status
+        counts.pop("max_flows", None)
+        return counts
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    def _request(self, variables: dict) -> "tuple[str, dict]":
+        """The ``(path, body)`` that ``Skill.run(variables=...)`` would send."""
+        from ..skills import _adapters as adapters
+        skill = self._runner
+        messages = skill._template().render({**skill.variables, **variables})
+        if any(adapters.is_generate_marker(m) for m in messages):
+            raise ValueError(
+                "BatchPool cannot run a multi-turn skill (assistant generate "
+                "markers need one call per turn)."
+            )
+        return skill.model.to_request(messages, skill._output)
+
+    @staticmethod
+    def _chunks(requests: list, size: int) -> "list[tuple[int, int]]":
+        """``(start, end)`` ranges of at most *size* requests sharing one path."""
+        chunks, start = [], 0
+        for i in range(1, len(requests) + 1):
+            if (i == len(requests) or i - start == size
+                    or requests[i][0] != requests[start][0]):
+                chunks.append((start, i))
+                start = i
+        return chunks
+
+    def _save(self, key: str, document: dict) -> None:
+        if self._store is not None:
+            self._store.save(key, document)
+
+    def _collect(self, job_id: str, outcome: dict, indices: range,
+                 started: float, results: list) -> None:
+        """Map one ended job's responses onto ``results`` and ``history``."""
+        skill = self._runner
+        model = skill.model
+        for i in indices:
+            response = outcome.get(str(i))
+            try:
+                if response is None:
+                    raise TaskFailedError(
+                        502, f"Batch {job_id} ended without a result for item {i}.")
+                if isinstance(response, Exception):
+                    raise response
+                output = model.from_response(response, skill._output)
+                usage  = attach_cost(extract_usage(response), model.name)
+            except Exception as exc:
+                self._mark_failed(i, started, exc)
+                self._handle_error(i, exc)
+                continue
+            if usage.cost is not None:
+                usage = replace(usage, cost=usage.cost * BATCH_DISCOUNT)
+            self.last_usage = usage if self.last_usage is None else self.last_usage + usage
+            self._mark_done(i, started, output)
+            results[i] = output
+
+    def __repr__(self) -> str:
+        runner_name = getattr(self._runner, "name", None) or \
+                      type(self._runner).__name__
+        return (
+            f"BatchPool(runner={runner_name!r}, items={len(self._items)}, "
+            f"on_error={self._on_error!r})"
+        )
@@ -13,7 +13,8 @@ Design
 ------
   runner   — one Skill, Tool, Chain, or Agent
   items    — list of variable dicts, one per task
-  max_flows — maximum number of parallel worker threads
+  max_flows — maximum number of parallel worker threads, or ``"auto"``
+              to adapt it between ``flow_bounds`` (see ``pool._adaptive``)
 
 Every item is merged with the shared ``variables`` passed to ``run()``
 and then handed to the runner independently.  No state flows between items.
@@ -37,15 +38,29 @@ Thread safety
 All writes to ``_history`` are protected by a ``threading.Lock`` so
 ``pool.history`` and ``pool.status`` can be read safely from outside
 while the pool is still running (e.g. for progress monitoring).
+
+Streaming
+---------
+``run()`` holds every item, output and history record in memory.
+``imap(iterable)`` pulls items lazily, keeps at most ``window`` of them in
+flight and yields results as they finish; ``status`` becomes running
+counters and ``history`` a ring buffer of the latest records, so memory
+stays flat however long the iterable is.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import threading
 import time
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Iterable, Iterator
+
+from ..skills._pack import Packer
+from ._adaptive import FlowLimit
 
 # ---------------------------------------------------------------------------
 # Status constants
@@ -91,17 +106,31 @@ class Pool:
     ----------
     runner : Skill | Tool | Chain | Agent
         The runner applied to every item.
-    items : list[dict]
+    items : list[dict] | None
         One variable dict per task.  Each dict is merged with the shared
         ``variables`` passed to :meth:`run` (item values win on conflicts).
-    max_flows : int, optional
-        Maximum number of parallel worker threads (default 10).
+        May be omitted for a pool that only streams through :meth:`imap`.
+    max_flows : int | ``"auto"``, optional
+        Maximum number of parallel worker threads (default 10).  ``"auto"``
+        adapts it while the pool runs (AIMD): it grows while items finish
+        quickly and cleanly, and is cut on ``RateLimitError`` /
+        ``ServerError`` or a rising p95 latency.  The current value is
+        ``pool.status["max_flows"]``.
+    flow_bounds : tuple[int, int], optional
+        ``(floor, ceiling)`` for ``max_flows="auto"`` (default ``(2, 32)``).
+        Ignored for a fixed ``max_flows``.
     on_error : ``"raise"`` | ``"collect"`` | ``"skip"``
         How to handle a task that raises an exception:
 
         ``"raise"``    — re-raise immediately; other tasks may still finish.
         ``"collect"``  — record the error; result for that item is ``None``.
         ``"skip"``     — same as ``"collect"`` but emits a ``RuntimeWarning``.
+    pack : int | None, optional
+        Skill runners only: pack up to this many items into each model call
+        (``Skill.map_batched``), splitting the reply back per item and
+        retrying missing or malformed items on their own.  Each pack is one
+        flow, so ``max_flows`` bounds the packs in flight.  An item's
+        ``duration`` is its pack's.  Default ``None``: one call per item.
     name : str | None, optional
     description : str | None, optional
 
@@ -154,13 +183,15 @@ class Pool:
     def __init__(
         self,
         runner,
-        items:       list[dict],
-        max_flows:   int       = 10,
+        items:       list[dict] | None = None,
+        max_flows:   "int | str" = 10,
         on_error:    str       = "collect",
         name:        str | None = None,
         description: str | None = None,
+        flow_bounds: tuple[int, int] = (2, 32),
+        pack:        int | None = None,
     ) -> None:
-        if not items:
+        if items is not None and not items:
             raise ValueError("Pool requires at least one item.")
         if on_error not in _VALID_ON_ERROR:
             raise ValueError(
@@ -168,15 +199,34 @@ class Pool:
                 f"got {on_error!r}"
             )
 
+        if max_flows == "auto":
+            floor, ceiling = flow_bounds
+            if not 1 <= floor <= ceiling:
+                raise ValueError(
+                    f"flow_bounds must satisfy 1 <= floor <= ceiling; got {flow_bounds!r}"
+                )
+        elif isinstance(max_flows, str):
+            raise ValueError(f"max_flows must be an int or 'auto'; got {max_flows!r}")
+        if pack is not None:
+            if not isinstance(pack, int) or pack < 1:
+                raise ValueError(f"pack must be a positive int; got {pack!r}")
+            if not hasattr(runner, "map_batched"):
+                raise ValueError("pack= needs a Skill runner.")
+
         self._runner    = runner
-        self._items     = list(items)
+        self._items     = list(items) if items is not None else []
         self._max_flows = max_flows
+        self._flow_bounds = tuple(flow_bounds)
         self._on_error  = on_error
+        self._pack      = pack
         self.name       = name
         self.description = description
 
         self._lock: threading.Lock = threading.Lock()
         self._history: list[dict]  = self._init_history()
+        self._flows: FlowLimit     = self._new_flow_limit()
+        # Running per-status counts while imap() streams; None otherwise.
+        self._counts: dict | None  = None
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -203,18 +253,29 @@ class Pool:
             The first task exception when ``on_error="raise"``.
         """
         shared = variables or {}
+        self._require_items()
 
-        # Reset history before each run
+        # Reset history (and the adaptive limit) before each run
         self._history = self._init_history()
+        self._flows   = self._new_flow_limit()
+        self._counts  = None
+
+        if self._pack is not None:
+            return self._run_packed(shared)
 
         results: list = [None] * len(self._items)
 
-        with ThreadPoolExecutor(max_workers=self._max_flows) as executor:
+        # One thread per flow the limit can reach; with "auto" the threads
+        # above the current limit wait in _run_one until it grows.
+        with ThreadPoolExecutor(max_workers=self._flows.ceiling) as executor:
             future_to_idx: dict = {}
 
             for i, item in enumerate(self._items):
                 merged = {**shared, **item}
-                future = executor.submit(self._run_one, i, merged)
+                # Each task runs in a copy of the caller's context, so a run
+                # deadline (``_deadline``) set around this pool reaches it.
+                future = executor.submit(contextvars.copy_context().run,
+                                         self._run_one, i, merged)
                 future_to_idx[future] = i
 
             for future in as_completed(future_to_idx):
@@ -222,25 +283,128 @@ class Pool:
                 try:
                     results[idx] = future.result()
                 except Exception as exc:
-                    if self._on_error == "raise":
-                        raise
-                    if self._on_error == "skip":
-                        name = getattr(self._runner, "name", None) or \
-                               type(self._runner).__name__
-                        warnings.warn(
-                            f"Pool item {idx} ({name!r}) failed and was "
-                            f"skipped: {exc}",
-                            RuntimeWarning,
-                            stacklevel=2,
-                        )
+                    self._handle_error(idx, exc)
                     # "collect" or "skip": leave results[idx] as None
 
         return results
 
+    async def arun(self, variables: dict | None = None) -> list:
+        """
+        Async :meth:`run` on the running event loop.
+
+        ``max_flows`` bounds the number of items in flight (a gate on the
+        event loop instead of worker threads; ``"auto"`` adapts as in
+        :meth:`run`).  Skill and Chain
+        runners are awaited through their native ``arun`` — no thread per
+        request, so ``max_flows`` can be raised into the thousands.  Tool and
+        Agent runners have no async path and run in worker threads via
+        ``asyncio.to_thread``.
+
+        Same arguments, result order and ``on_error`` semantics as ``run()``;
+        with ``on_error="raise"`` the first failure cancels the items still
+        in flight.
+        """
+        shared = variables or {}
+        self._require_items()
+        self._history = self._init_history()
+        self._flows   = self._new_flow_limit()
+        self._counts  = None
+
+        if self._pack is not None:
+            return await self._arun_packed(shared)
+
+        results: list = [None] * len(self._items)
+
+        async def one(idx: int, merged: dict) -> None:
+            try:
+                results[idx] = await self._arun_one(idx, merged)
+            except Exception as exc:
+                self._handle_error(idx, exc)
+
+        tasks = [asyncio.ensure_future(one(i, {**shared, **item}))
+                 for i, item in enumerate(self._items)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return results
+
+    def imap(
+        self,
+        items:     Iterable[dict],
+        variables: dict | None = None,
+        *,
+        ordered:   bool = True,
+        window:    int | None = None,
+        keep:      int = 100,
+    ) -> Iterator[tuple[int, Any]]:
+        """
+        Stream *items* through the runner, yielding results as they finish.
+
+        Unlike :meth:`run`, nothing is held per item for the whole job:
+        items are pulled from *items* lazily, at most *window* of them are
+        in flight (submitted, running, or finished but not yet yielded), and
+        the pool keeps running counts plus a ring buffer of the *keep* most
+        recent records instead of one history record per item.  A job over
+        millions of rows runs in flat memory.
+
+        Parameters
+        ----------
+        items : iterable of dict
+            Any iterable — a generator, a file reader — of variable dicts.
+            It is consumed as the window frees up, never read ahead.
+        variables : dict | None, optional
+            Shared variables merged into every item, as in :meth:`run`.
+        ordered : bool, optional
+            ``True`` (default) yields in item order; a slow item holds back
+            the ones after it, and once *window* results are waiting behind
+            it no new items start.  ``False`` yields each result as soon as
+            it finishes.
+        window : int | None, optional
+            Maximum items in flight.  Default ``2 × max_flows`` (the
+            ceiling of ``flow_bounds`` for ``"auto"``).
+        keep : int, optional
+            Finished records kept in :attr:`history` (default 100; 0 keeps
+            none).
+
+        Yields
+        ------
+        tuple[int, Any]
+            ``(index, output)`` — *index* is the item's position in
+            *items*.  A failed item yields ``None`` as its output under
+            ``on_error="collect"`` / ``"skip"``.
+
+        Raises
+        ------
+        Exception
+            The first task exception when ``on_error="raise"``; items not
+            yet started are cancelled and those running are awaited.
+        ValueError
+            For an invalid *window* / *keep*, or a pool built with ``pack=``.
+
+        Examples
+        --------
+        ::
+
+            rows = ({"text": line} for line in open("reviews.txt"))
+            for index, label in Pool(classify, max_flows=16).imap(rows, ordered=False):
+                out.write(f"{index}\t{label}\n")
+        """
+        if self._pack is not None:
+            raise ValueError("imap() does not support pack=; use run().")
+        if window is not None and (not isinstance(window, int) or window < 1):
+            raise ValueError(f"window must be a positive int; got {window!r}")
+        if not isinstance(keep, int) or keep < 0:
+            raise ValueError(f"keep must be a non-negative int; got {keep!r}")
+        return self._imap(iter(items), variables or {}, ordered, window, keep)
+
     @property
     def history(self) -> list[dict]:
         """
-        One record per item from the most recent :meth:`run` call.
+        One record per item from the most recent :meth:`run` call.  After
+        :meth:`imap`, only the most recently finished records (its ``keep``).
 
         Each record:
           ``index``     — position in the original items list
@@ -263,7 +427,9 @@ class Pool:
         Returns
         -------
         dict
-            ``{PENDING: N, RUNNING: N, DONE: N, FAILED: N}``
+            ``{PENDING: N, RUNNING: N, DONE: N, FAILED: N, "max_flows": N}``
+            — ``"max_flows"`` is the current concurrency limit (it moves
+            while an ``"auto"`` pool runs).
 
         Thread-safe: safe to poll while the pool is still running::
 
@@ -272,13 +438,23 @@ class Pool:
                 time.sleep(0.5)
         """
         with self._lock:
-            counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
-            for record in self._history:
-                counts[record["status"]] += 1
-            return counts
+            if self._counts is not None:
+                counts = dict(self._counts)
+            else:
+                counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+                for record in self._history:
+                    counts[record["status"]] += 1
+        counts["max_flows"] = self._flows.limit
+        return counts
 
     # ── Internal ──────────────────────────────────────────────────────────────
 
+    def _require_items(self) -> None:
+        if not self._items:
+            raise ValueError(
+                "Pool has no items; pass items= to the constructor or use imap()."
+            )
+
     def _init_history(self) -> list[dict]:
         """Build fresh history with every item in PENDING state."""
         return [
@@ -293,39 +469,248 @@ class Pool:
             for i, item in enumerate(self._items)
         ]
 
+    def _new_flow_limit(self) -> FlowLimit:
+        if self._max_flows == "auto":
+            floor, ceiling = self._flow_bounds
+            return FlowLimit(floor, floor=floor, ceiling=ceiling)
+        return FlowLimit(self._max_flows)
+
     def _run_one(self, index: int, merged: dict) -> Any:
         """
-        Execute the runner for one item.  Called inside a worker thread.
+        Execute the runner for one item.  Called inside a worker thread,
+        once the flow limit admits it.
 
         Updates ``_history[index]`` at every status transition.
         Raises the original exception after recording it as FAILED.
         """
-        with self._lock:
-            self._history[index]["status"]    = RUNNING
-            self._history[index]["variables"] = merged
-
-        start = time.monotonic()
+        self._flows.acquire()
         try:
-            output = self._dispatch(merged)
-            duration = round(time.monotonic() - start, 3)
-
-            with self._lock:
-                self._history[index].update({
-                    "status":   DONE,
-                    "output":   output,
-                    "duration": duration,
-                })
+            start = self._mark_running(index, merged)
+            try:
+                output = self._dispatch(merged)
+            except Exception as exc:
+                self._mark_failed(index, start, exc)
+                raise
+            self._mark_done(index, start, output)
             return output
+        finally:
+            self._flows.release()
 
-        except Exception as exc:
-            duration = round(time.monotonic() - start, 3)
+    async def _arun_one(self, index: int, merged: dict) -> Any:
+        """Async :meth:`_run_one`, used by :meth:`arun`."""
+        await self._flows.aacquire()
+        try:
+            start = self._mark_running(index, merged)
+            try:
+                output = await self._adispatch(merged)
+            except Exception as exc:
+                self._mark_failed(index, start, exc)
+                raise
+            self._mark_done(index, start, output)
+            return output
+        finally:
+            self._flows.release()
+
+    def _imap(self, items: Iterator[dict], shared: dict, ordered: bool,
+              window: int | None, keep: int) -> Iterator[tuple[int, Any]]:
+        """The generator behind :meth:`imap`."""
+        self._flows = self._new_flow_limit()
+        window = window or 2 * self._flows.ceiling
+        with self._lock:
+            self._history = deque(maxlen=keep)
+            self._counts  = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+
+        executor = ThreadPoolExecutor(max_workers=self._flows.ceiling)
+        in_flight: dict = {}     # future -> index
+        waiting:   dict = {}     # index -> output, finished out of order
+        submitted = next_index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) + len(waiting) < window:
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    with self._lock:
+                        self._counts[PENDING] += 1
+                    future = executor.submit(contextvars.copy_context().run,
+                                             self._stream_one, submitted,
+                                             {**shared, **item})
+                    in_flight[future] = submitted
+                    submitted += 1
+                if not in_flight:
+                    return
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = in_flight.pop(future)
+                    try:
+                        output = future.result()
+                    except Exception as exc:
+                        self._handle_error(index, exc)
+                        output = None
+                    if ordered:
+                        waiting[index] = output
+                    else:
+                        yield index, output
+                while next_index in waiting:
+                    yield next_index, waiting.pop(next_index)
+                    next_index += 1
+        finally:
+            # Closed early or failed: drop what has not started, finish the rest.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _stream_one(self, index: int, merged: dict) -> Any:
+        """:meth:`_run_one` for :meth:`imap`: counters and a ring buffer, not ``_history[index]``."""
+        self._flows.acquire()
+        try:
             with self._lock:
+                self._counts[PENDING] -= 1
+                self._counts[RUNNING] += 1
+            start = time.monotonic()
+            try:
+                output = self._dispatch(merged)
+            except Exception as exc:
+                self._settle(index, merged, start, None, exc)
+                raise
+            self._settle(index, merged, start, output, None)
+            return output
+        finally:
+            self._flows.release()
+
+    def _settle(self, index: int, merged: dict, start: float, output: Any,
+                exc: Exception | None) -> None:
+        elapsed = time.monotonic() - start
+        status  = FAILED if exc is not None else DONE
+        self._flows.record(elapsed, exc)
+        with self._lock:
+            self._counts[RUNNING] -= 1
+            self._counts[status]  += 1
+            self._history.append({
+                "index":     index,
+                "variables": merged,
+                "status":    status,
+                "output":    output,
+                "error":     str(exc) if exc is not None else None,
+                "duration":  round(elapsed, 3),
+            })
+
+    def _run_packed(self, shared: dict) -> list:
+        """:meth:`run` with ``pack=``: workers draw packs from one Packer."""
+        packer = Packer(self._runner, [{**shared, **item} for item in self._items],
+                        self._pack)
+
+        def worker() -> None:
+            while True:
+                self._flows.acquire()
+                try:
+                    pack = packer.next_pack()
+                    if pack is None:
+                        return
+                    start = self._mark_pack_running(pack[0], packer)
+                    packer.run_pack(*pack)
+                    self._mark_pack_settled(pack[0], start, packer)
+                finally:
+                    self._flows.release()
+
+        with ThreadPoolExecutor(max_workers=self._flows.ceiling) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, worker)
+                       for _ in range(self._flows.ceiling)]
+            for future in futures:
+                future.result()
+        return self._packed_results(packer)
+
+    async def _arun_packed(self, shared: dict) -> list:
+        """:meth:`arun` with ``pack=``."""
+        packer = Packer(self._runner, [{**shared, **item} for item in self._items],
+                        self._pack)
+
+        async def worker() -> None:
+            while True:
+                await self._flows.aacquire()
+                try:
+                    pack = packer.next_pack()
+                    if pack is None:
+                        return
+                    start = self._mark_pack_running(pack[0], packer)
+                    await packer.arun_pack(*pack)
+                    self._mark_pack_settled(pack[0], start, packer)
+                finally:
+                    self._flows.release()
+
+        await asyncio.gather(*(worker() for _ in range(self._flows.ceiling)))
+        return self._packed_results(packer)
+
+    def _packed_results(self, packer: Packer) -> list:
+        for index, exc in enumerate(packer.errors):
+            if exc is not None:
+                self._handle_error(index, exc)
+        return packer.results
+
+    def _mark_pack_running(self, positions: list, packer: Packer) -> float:
+        with self._lock:
+            for index in positions:
+                self._history[index]["status"]    = RUNNING
+                self._history[index]["variables"] = packer.items[index]
+        return time.monotonic()
+
+    def _mark_pack_settled(self, positions: list, start: float, packer: Packer) -> None:
+        elapsed = time.monotonic() - start
+        errors  = [packer.errors[i] for i in positions if packer.errors[i] is not None]
+        self._flows.record(elapsed, errors[0] if errors else None)
+        with self._lock:
+            for index in positions:
+                exc = packer.errors[index]
                 self._history[index].update({
-                    "status":   FAILED,
-                    "error":    str(exc),
-                    "duration": duration,
+                    "status":   FAILED if exc is not None else DONE,
+                    "output":   packer.results[index],
+                    "error":    str(exc) if exc is not None else None,
+                    "duration": round(elapsed, 3),
                 })
-            raise
+
+    def _mark_running(self, index: int, merged: dict) -> float:
+        with self._lock:
+            self._history[index]["status"]    = RUNNING
+            self._history[index]["variables"] = merged
+        return time.monotonic()
+
+    def _mark_done(self, index: int, start: float, output: Any) -> None:
+        elapsed  = time.monotonic() - start
+        duration = round(elapsed, 3)
+        self._flows.record(elapsed)
+        with self._lock:
+            self._history[index].update({
+                "status":   DONE,
+                "output":   output,
+                "duration": duration,
+            })
+
+    def _mark_failed(self, index: int, start: float, exc: Exception) -> None:
+        elapsed  = time.monotonic() - start
+        duration = round(elapsed, 3)
+        self._flows.record(elapsed, exc)
+        with self._lock:
+            self._history[index].update({
+                "status":   FAILED,
+                "error":    str(exc),
+                "duration": duration,
+            })
+
+    def _handle_error(self, index: int, exc: Exception) -> None:
+        """Apply ``on_error`` to a failed item: re-raise, or warn on ``"skip"``."""
+        if self._on_error == "raise":
+            raise exc
+        if self._on_error == "skip":
+            name = getattr(self._runner, "name", None) or \
+                   type(self._runner).__name__
+            warnings.warn(
+                f"Pool item {index} ({name!r}) failed and was "
+                f"skipped: {exc}",
+                RuntimeWarning,
+                stacklevel=3,
+            )
 
     def _dispatch(self, variables: dict) -> Any:
         """Route the call to the correct runner interface."""
@@ -351,6 +736,13 @@ class Pool:
         # Skill or Chain — both expose run(variables=...)
         return runner.run(variables=variables)
 
+    async def _adispatch(self, variables: dict) -> Any:
+        """Async :meth:`_dispatch`: native ``arun`` for Skill / Chain, else a thread."""
+        runner = self._runner
+        if _is_tool(runner) or _is_agent(runner) or not hasattr(runner, "arun"):
+            return await asyncio.to_thread(self._dispatch, variables)
+        return await runner.arun(variables=variables)
+
     # ── Dunder helpers ────────────────────────────────────────────────────────
 
     def __repr__(self) -> str:
@@ -39,5 +39,8 @@ Typical usage
 """
 
 from ._skill import Skill
+from ._media import MediaSource
+from ._router import Router
+from ._semantic import SemanticCache
 
-__all__ = ["Skill"]
+__all__ = ["Skill", "MediaSource", "Router", "SemanticCache"]
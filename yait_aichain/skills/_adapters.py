@@ -16,6 +16,8 @@ normalisation of *our* universal format, which only the Skill layer needs
 * :func:`validate_input`   — check a normalised input dict
 * :func:`validate_output`  — check a normalised output dict
 * :func:`substitute`       — replace ``{placeholder}`` tokens in message text
+* :func:`compile_messages` — parse a message template once for repeated renders
+* :func:`plain_input`      — a normalised input dict back in plain, savable form
 
 Universal input format
 ----------------------
@@ -98,70 +100,31 @@ Partial forms (each missing key is filled in with its default)::
     →  (already complete; unchanged)
 """
 
-import base64
 import copy
-import pathlib
+import os
+from collections.abc import Mapping
 
-from .._template import substitute_placeholders
+from .._template import Template, substitute_placeholders
+from ..clients._sink import validate_target
+from ._media import MediaSource
 
 
 # ---------------------------------------------------------------------------
-# Local-file media sources
+# Normalisation
 # ---------------------------------------------------------------------------
 
-#: File-extension → MIME, used when a ``kind:"file"`` source omits ``mime``.
-_EXT_MIME = {
-    ".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg",
-    ".webp": "image/webp", ".gif": "image/gif",
-    ".wav": "audio/wav", ".mp3": "audio/mpeg", ".m4a": "audio/mp4",
-    ".ogg": "audio/ogg", ".flac": "audio/flac",
-    ".mp4": "video/mp4", ".mov": "video/quicktime", ".webm": "video/webm",
-}
-
-
-def _guess_mime(path: pathlib.Path, head: bytes) -> str:
-    """Best-effort MIME for a local file: extension first, then magic bytes."""
-    by_ext = _EXT_MIME.get(path.suffix.lower())
-    if by_ext:
-        return by_ext
-    if head[:3] == b"\xff\xd8\xff":
-        return "image/jpeg"
-    if head[:4] == b"\x89PNG":
-        return "image/png"
-    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
-        return "image/webp"
-    if head[:4] == b"GIF8":
-        return "image/gif"
-    return "application/octet-stream"
-
-
-def _resolve_file_source(part: dict) -> None:
+def _check_file_source(spec: dict) -> None:
     """
-    Resolve a ``kind:"file"`` media source into inline base64 *in place*.
-
-    When a media part's ``source`` is ``{"kind": "file", "path": "...",}`` and
-    carries no ``data`` yet, read the file, base64-encode it into ``data``, and
-    fill in ``mime`` (from the extension, falling back to magic bytes) if absent.
-    A ``"file"`` source that already has ``data`` is left untouched, so the
-    family clients (which read ``source["data"]`` for both ``base64`` and
-    ``file`` kinds) keep working unchanged.
+    Raise ``FileNotFoundError`` for a ``kind: "file"`` source whose file is
+    missing, so a bad path fails when the Skill is built, not mid-run.
     """
-    src = part.get("source")
-    if not isinstance(src, dict) or src.get("kind") != "file":
-        return
-    if src.get("data") or "path" not in src:
+    if spec.get("kind") != "file" or spec.get("data") or "path" not in spec:
         return
-    path = pathlib.Path(src["path"]).expanduser()
-    raw = path.read_bytes()
-    src["data"] = base64.b64encode(raw).decode("ascii")
-    if not src.get("mime"):
-        src["mime"] = _guess_mime(path, raw[:16])
+    path = os.path.expanduser(spec["path"])
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"Media source file not found: {path!r}")
 
 
-# ---------------------------------------------------------------------------
-# Normalisation
-# ---------------------------------------------------------------------------
-
 def normalize_input(input_: dict) -> dict:
     """
     Return a normalised deep copy of *input_*, filling in implicit defaults.
@@ -172,8 +135,11 @@ def normalize_input(input_: dict) -> dict:
     * A dict part with a ``"text"`` key but no ``"type"`` key → ``"type"``
       is set to ``"text"`` automatically.
 
-    Media parts (those with a ``"source"`` key) and parts that already have
-    a ``"type"`` field are passed through unchanged.
+    Media parts (those with a ``"source"`` key) keep their fields; the source
+    dict is wrapped in an immutable :class:`~skills._media.MediaSource`, which
+    reads and base64-encodes a ``kind: "file"`` source lazily, once; the file
+    must exist now (``FileNotFoundError`` otherwise).  Other
+    parts that already have a ``"type"`` field are passed through unchanged.
 
     Parameters
     ----------
@@ -219,9 +185,11 @@ def normalize_input(input_: dict) -> dict:
                 # Dict with "text" but no "type" → default type to "text"
                 normalised_parts.append({"type": "text", **part})
             else:
-                # Media part: load a local-file source into inline base64.
-                if isinstance(part, dict):
-                    _resolve_file_source(part)
+                # Media part: freeze the source so it is shared, not copied.
+                if isinstance(part, dict) and isinstance(part.get("source"), Mapping):
+                    source = MediaSource(part["source"])
+                    _check_file_source(source.to_dict())
+                    part = {**part, "source": source}
                 normalised_parts.append(part)
         msg["parts"] = normalised_parts
     return result
@@ -334,7 +302,7 @@ def validate_input(input_: dict) -> None:
                     )
             else:
                 src = part.get("source")
-                if not isinstance(src, dict):
+                if not isinstance(src, Mapping):
                     raise ValueError(
                         f"messages[{i}]['parts'][{j}]['source'] must be a dict"
                     )
@@ -400,6 +368,7 @@ def validate_output(output: dict) -> None:
     - Top-level ``modalities`` is a non-empty list.
     - ``format`` is a dict with a valid ``type`` field.
     - ``json_schema`` format has a ``schema`` dict.
+    - ``save_to``, when present, is a directory path or a callable.
     """
     if not isinstance(output, dict):
         raise ValueError("output must be a dict")
@@ -418,6 +387,7 @@ def validate_output(output: dict) -> None:
         raise ValueError(
             "output['format']['schema'] must be a dict for json_schema format"
         )
+    validate_target(output.get("save_to"))
 
 
 # ---------------------------------------------------------------------------
@@ -435,7 +405,8 @@ def substitute(messages: list, variables: dict) -> list:
     placeholders, format specs and literal braces (e.g. JSON examples like
     ``{"a": 1}``) are left intact — they never raise.
 
-    Non-text parts are deep-copied unchanged.
+    Non-text parts are copied unchanged; a :class:`~skills._media.MediaSource`
+    is immutable and is shared by reference, never copied.
     """
     if not variables:
         return copy.deepcopy(messages)
@@ -449,9 +420,81 @@ def substitute(messages: list, variables: dict) -> list:
                     part["text"], variables
                 )
                 new_parts.append(new_part)
+            elif isinstance(part.get("source"), MediaSource):
+                new_parts.append(dict(part))
             else:
                 new_parts.append(copy.deepcopy(part))
         new_msg = dict(msg)
         new_msg["parts"] = new_parts
         result.append(new_msg)
     return result
+
+
+class CompiledMessages:
+    """
+    A message template parsed once (:func:`compile_messages`) for rendering
+    on every run.
+
+    Each text part with placeholders is held as a
+    :class:`~yait_aichain._template.Template`; ``names`` is the set of
+    variables the whole template references.  :meth:`render` builds new
+    message dicts only where a placeholder is filled in — every other
+    message and part is the template's own object, shared rather than
+    copied, so callers must treat the result as read-only.
+    """
+
+    __slots__ = ("source", "names", "_slots")
+
+    def __init__(self, messages: list) -> None:
+        self.source = messages
+        # Per message: ((part index, Template), ...) for its templated parts.
+        self._slots: list = []
+        names: set = set()
+        for msg in messages:
+            slots = []
+            for i, part in enumerate(msg.get("parts", [])):
+                if part.get("type") == "text" and "{" in part["text"]:
+                    template = Template(part["text"])
+                    if template.names:
+                        slots.append((i, template))
+                        names |= template.names
+            self._slots.append(tuple(slots))
+        self.names = frozenset(names)
+
+    def render(self, variables: dict) -> list:
+        """The messages with ``{placeholders}`` filled in from *variables*."""
+        if not variables or self.names.isdisjoint(variables):
+            return list(self.source)
+        result = []
+        for msg, slots in zip(self.source, self._slots):
+            parts = None
+            for i, template in slots:
+                if template.names.isdisjoint(variables):
+                    continue
+                if parts is None:
+                    parts = list(msg["parts"])
+                parts[i] = {**parts[i], "text": template.render(variables)}
+            result.append(msg if parts is None else {**msg, "parts": parts})
+        return result
+
+
+def compile_messages(messages: list) -> CompiledMessages:
+    """Parse a normalised message template once; see :class:`CompiledMessages`."""
+    return CompiledMessages(messages)
+
+
+def plain_input(input_: dict) -> dict:
+    """
+    Return *input_* with every :class:`~skills._media.MediaSource` replaced by
+    its original spec dict, for persistence (``Skill.save`` / ``Chain.save``).
+    A ``kind: "file"`` source is saved as its path, not its encoded bytes.
+    """
+    def plain(node):
+        if isinstance(node, MediaSource):
+            return node.to_dict()
+        if isinstance(node, dict):
+            return {k: plain(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [plain(v) for v in node]
+        return node
+    return plain(input_)
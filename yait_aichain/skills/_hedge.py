@@ -0,0 +1,173 @@
+"""
+skills._hedge
+=============
+
+Hedged requests across a Skill's fallback chain.
+
+A fallback chain only moves to the next model after the current one has
+failed — with client retries that can take tens of seconds.  A hedge starts
+the primary and, if it has not answered within a delay, fires the same
+request at the next model too (and so on down the chain); the first success
+wins.  A leg that fails with a fallback error (rate limit / server /
+network) starts the next model at once; any other error is raised
+immediately, as in the plain chain.
+
+Losers are not cancelled — the provider has usually billed the request
+already, so every leg runs to completion and reports its outcome through
+``on_settled``, also after the winner has returned.  ``Skill`` uses that to
+emit an ``llm_call.ended`` event (with usage and cost) for every leg.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+import time
+
+# Worker threads for the sync legs; created on first use.
+_executor: "concurrent.futures.ThreadPoolExecutor | None" = None
+_executor_lock = threading.Lock()
+_MAX_WORKERS = 64
+
+
+def _pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_MAX_WORKERS, thread_name_prefix="yait-hedge")
+        return _executor
+
+
+class _Hedge:
+    """
+    One hedged call.
+
+    Parameters
+    ----------
+    calls : list[tuple[Model, str, dict]]
+        ``(model, path, body)`` per leg, in chain order.
+    delays : list[float]
+        Seconds to wait on the legs in flight before starting leg ``i + 1``.
+    fallback_errors : tuple[type, ...]
+        Errors that start the next leg at once instead of failing the call.
+    on_started : callable(index)
+    on_settled : callable(index, outcome, duration, won)
+        *outcome* is the raw response bytes or the exception raised.
+    """
+
+    def __init__(self, calls, delays, fallback_errors, on_started, on_settled) -> None:
+        self.calls           = calls
+        self.delays          = delays
+        self.fallback_errors = fallback_errors
+        self._on_started     = on_started
+        self._on_settled     = on_settled
+        self._lock           = threading.Lock()
+        self._winner: "int | None" = None
+
+    # ── shared bookkeeping ───────────────────────────────────────────
+
+    def _settle(self, index: int, outcome, duration: float) -> bool:
+        """Report leg *index*; True when it is the winning success."""
+        with self._lock:
+            won = not isinstance(outcome, BaseException) and self._winner is None
+            if won:
+                self._winner = index
+        self._on_settled(index, outcome, duration, won)
+        return won
+
+    def _next_timeout(self, launched: int, since: float) -> "float | None":
+        if launched >= len(self.calls):
+            return None
+        return max(0.0, self.delays[launched - 1] - (time.monotonic() - since))
+
+    # ── sync ─────────────────────────────────────────────────────────
+
+    def _send(self, index: int):
+        model, path, body = self.calls[index]
+        t0 = time.monotonic()
+        try:
+            outcome = model.client.send(path, body, model.client._auth_headers())
+        except Exception as exc:
+            outcome = exc
+        duration = time.monotonic() - t0
+        return index, outcome, self._settle(index, outcome, duration)
+
+    def run(self) -> "tuple[int, bytes]":
+        """Run the legs on worker threads; return ``(index, raw)`` of the winner."""
+        pending: set = set()
+
+        def launch(i: int) -> None:
+            self._on_started(i)
+            # Each leg carries the caller's context (active hooks, deadline).
+            pending.add(_pool().submit(contextvars.copy_context().run, self._send, i))
+
+        launch(0)
+        launched, since, last_exc = 1, time.monotonic(), None
+        while True:
+            if not pending and launched >= len(self.calls):
+                raise last_exc
+            done: set = set()
+            if pending:
+                done, pending = concurrent.futures.wait(
+                    pending, timeout=self._next_timeout(launched, since),
+                    return_when=concurrent.futures.FIRST_COMPLETED)
+            winner, failure = self._outcome(f.result() for f in done)
+            if winner is not None:
+                return winner
+            last_exc = failure or last_exc
+            if (failure or not done) and launched < len(self.calls):
+                launch(launched)
+                launched, since = launched + 1, time.monotonic()
+
+    def _outcome(self, finished) -> "tuple[tuple | None, Exception | None]":
+        """The winner among *finished* legs, else their last fallback error."""
+        failure = None
+        for index, outcome, won in finished:
+            if won:
+                return (index, outcome), None
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, self.fallback_errors):
+                    raise outcome
+                failure = outcome
+        return None, failure
+
+    # ── async ────────────────────────────────────────────────────────
+
+    async def _asend(self, index: int):
+        model, path, body = self.calls[index]
+        t0 = time.monotonic()
+        try:
+            outcome = await model.client.asend(path, body, model.client._auth_headers())
+        except Exception as exc:
+            outcome = exc
+        duration = time.monotonic() - t0
+        return index, outcome, self._settle(index, outcome, duration)
+
+    async def arun(self) -> "tuple[int, bytes]":
+        """Run the legs as tasks on the running loop; losers keep running."""
+        pending: set = set()
+
+        def launch(i: int) -> None:
+            self._on_started(i)
+            pending.add(asyncio.ensure_future(self._asend(i)))
+
+        launch(0)
+        launched, since, last_exc = 1, time.monotonic(), None
+        while True:
+            if not pending and launched >= len(self.calls):
+                raise last_exc
+            done: set = set()
+            if pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=self._next_timeout(launched, since),
+                    return_when=asyncio.FIRST_COMPLETED)
+            winner, failure = self._outcome(t.result() for t in done)
+            if winner is not None:
+                return winner
+            last_exc = failure or last_exc
+            if (failure or not done) and launched < len(self.calls):
+                launch(launched)
+                launched, since = launched + 1, time.monotonic()
@@ -0,0 +1,138 @@
+"""
+skills._media
+=============
+
+``MediaSource`` — the immutable handle a Skill keeps for each media part's
+``source``.
+
+:func:`~skills._adapters.normalize_input` wraps every media ``source`` dict
+in a ``MediaSource``.  Because the handle is immutable it is shared by
+reference everywhere a request is assembled — ``substitute``, every
+``run()``, every retry and every fallback model — instead of being
+deep-copied.  A ``kind: "file"`` source is read and base64-encoded lazily,
+on the first ``source["data"]`` lookup, and the encoded string is kept, so a
+skill over a local image pays for the read and the encoding once per
+process rather than once per call.
+
+A ``MediaSource`` is a read-only mapping: family clients read
+``source["kind"]``, ``source["data"]``, ``source.get("mime")`` exactly as
+they read a plain dict.  :meth:`MediaSource.to_dict` returns the original
+spec (a ``file`` source stays a path) for persistence.
+"""
+
+from __future__ import annotations
+
+import base64
+import pathlib
+import threading
+from collections.abc import Mapping
+
+#: File-extension → MIME, used when a ``kind:"file"`` source omits ``mime``.
+_EXT_MIME = {
+    ".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg",
+    ".webp": "image/webp", ".gif": "image/gif",
+    ".wav": "audio/wav", ".mp3": "audio/mpeg", ".m4a": "audio/mp4",
+    ".ogg": "audio/ogg", ".flac": "audio/flac",
+    ".mp4": "video/mp4", ".mov": "video/quicktime", ".webm": "video/webm",
+}
+
+
+def _guess_mime(path: pathlib.Path, head: bytes) -> str:
+    """Best-effort MIME for a local file: extension first, then magic bytes."""
+    by_ext = _EXT_MIME.get(path.suffix.lower())
+    if by_ext:
+        return by_ext
+    if head[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if head[:4] == b"\x89PNG":
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[:4] == b"GIF8":
+        return "image/gif"
+    return "application/octet-stream"
+
+
+class MediaSource(Mapping):
+    """
+    Immutable, lazily-encoded media source.
+
+    Parameters
+    ----------
+    spec : Mapping
+        A media ``source`` dict — ``{"kind": "url", "url": ...}``,
+        ``{"kind": "base64", "data": ..., "mime": ...}`` or
+        ``{"kind": "file", "path": ..., "mime": ...}``.  It is copied; later
+        changes to *spec* do not affect the handle.
+
+    For a ``file`` source without ``data``, the ``data`` and ``mime`` keys are
+    filled in from the file on first access (``mime`` from the extension,
+    falling back to magic bytes).  Copying (``copy.copy`` / ``deepcopy``)
+    returns the handle itself.
+    """
+
+    __slots__ = ("_spec", "_loaded", "_lock")
+
+    def __init__(self, spec: Mapping) -> None:
+        if isinstance(spec, MediaSource):
+            spec = spec._spec
+        self._spec   = dict(spec)
+        self._loaded: "dict | None" = None
+        self._lock   = threading.Lock()
+
+    @property
+    def _lazy(self) -> bool:
+        return (self._spec.get("kind") == "file" and not self._spec.get("data")
+                and "path" in self._spec)
+
+    def _load(self) -> dict:
+        if self._loaded is None:
+            with self._lock:
+                if self._loaded is None:
+                    path = pathlib.Path(self._spec["path"]).expanduser()
+                    raw  = path.read_bytes()
+                    self._loaded = {
+                        "data": base64.b64encode(raw).decode("ascii"),
+                        "mime": self._spec.get("mime") or _guess_mime(path, raw[:16]),
+                    }
+        return self._loaded
+
+    # ── Mapping ──────────────────────────────────────────────────────
+
+    def __getitem__(self, key: str):
+        if key in ("data", "mime") and self._lazy:
+            return self._load()[key]
+        return self._spec[key]
+
+    def __iter__(self):
+        yield from self._spec
+        if self._lazy:
+            yield from (k for k in ("data", "mime") if k not in self._spec)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key) -> bool:
+        return key in self._spec or (key in ("data", "mime") and self._lazy)
+
+    # ── immutability ─────────────────────────────────────────────────
+
+    def __copy__(self) -> "MediaSource":
+        return self
+
+    def __deepcopy__(self, memo) -> "MediaSource":
+        return self
+
+    def __reduce__(self):
+        return (MediaSource, (self._spec,))
+
+    # ── helpers ──────────────────────────────────────────────────────
+
+    def to_dict(self) -> dict:
+        """The original source spec as a plain dict (a ``file`` stays a path)."""
+        return dict(self._spec)
+
+    def __repr__(self) -> str:
+        shown = {k: (f"<{len(v)} chars>" if k == "data" else v)
+                 for k, v in self._spec.items()}
+        return f"MediaSource({shown!r})"
@@ -0,0 +1,316 @@
+"""
+skills._pack
+============
+
+Prompt micro-batching: many small items answered by one LLM call.
+
+Classification and extraction over many short rows spend most of their
+tokens on the repeated system prompt and most of their time on round-trips.
+``Skill.map_batched`` and ``Pool(pack=N)`` render the skill once per item,
+keep the messages every item shares (the system prompt, fixed seed turns)
+once, and list the items' own turns in a single ``user`` turn::
+
+    Input 0:
+    <item 0's user text>
+
+    Input 1:
+    ...
+
+The call asks for a ``json_schema`` output — ``{"results": [{"index": i,
+"output": ...}]}`` whose ``output`` is the skill's own format (a string for
+text, an object for ``json`` / ``json_schema``) — and the array is split
+back onto the items by ``index``.  An item the reply leaves out, or whose
+``output`` does not fit the skill's format, is run again on its own with an
+ordinary ``skill.run``; so is every item of a pack the provider rejects or
+answers with unreadable JSON.
+
+Packs are sized adaptively.  A pack holds at most ``batch_size`` items, as
+many as the output budget allows — the models' ``max_tokens`` (or their
+``max_output``) over the expected output tokens per item, learned from the
+usage of earlier packs — and as many as fit the smallest context window.
+A pack whose reply comes back unreadable (typically truncated) doubles the
+per-item estimate, so the next packs are smaller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+from typing import TYPE_CHECKING
+
+from ..clients._errors import InvalidRequestError
+from . import _adapters as adapters
+
+if TYPE_CHECKING:
+    from ._skill import Skill
+
+# Output tokens assumed per item until a pack has been measured, and the
+# output budget assumed for a model that declares none.
+_DEFAULT_ITEM_TOKENS = 200
+_DEFAULT_MAX_OUTPUT  = 4096
+
+# Share of the output budget / context window a pack may plan to use — the
+# per-item figures are estimates.
+_HEADROOM = 0.8
+
+# Weight of the newest pack in the per-item output estimate.
+_ALPHA = 0.3
+
+_INSTRUCTIONS = (
+    "Answer each of the {n} inputs below independently, exactly as you would "
+    "answer it on its own. Return a JSON object whose \"results\" array has "
+    "one element per input: its \"index\" and your \"output\" for it."
+)
+
+
+def packable(skill: "Skill") -> None:
+    """Raise ``ValueError`` unless *skill* can be packed."""
+    output = skill._output
+    if set(output.get("modalities", ["text"])) - {"text"} or output.get("save_to") is not None:
+        raise ValueError("Only text / JSON skills can be packed.")
+    for msg in skill._input["messages"]:
+        if adapters.is_generate_marker(msg):
+            raise ValueError(
+                "A multi-turn skill cannot be packed (assistant generate "
+                "markers need one call per turn)."
+            )
+        if any(part.get("type") != "text" for part in msg.get("parts", [])):
+            raise ValueError("A skill with media parts cannot be packed.")
+
+
+def _item_schema(output: dict) -> "tuple[dict, bool]":
+    """The JSON schema of one item's answer, and whether it may be strict."""
+    fmt = output.get("format", {})
+    if fmt.get("type") == "json_schema":
+        return fmt["schema"], fmt.get("strict", True)
+    if fmt.get("type") == "json":
+        return {"type": "object"}, False
+    return {"type": "string"}, True
+
+
+def packed_output(output: dict) -> dict:
+    """The ``json_schema`` output of a pack answering items in *output*'s format."""
+    schema, strict = _item_schema(output)
+    return {
+        "modalities": ["text"],
+        "format": {
+            "type":   "json_schema",
+            "name":   "packed_results",
+            "strict": strict,
+            "schema": {
+                "type": "object",
+                "properties": {"results": {"type": "array", "items": {
+                    "type": "object",
+                    "properties": {"index": {"type": "integer"}, "output": schema},
+                    "required": ["index", "output"],
+                    "additionalProperties": False,
+                }}},
+                "required": ["results"],
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+def _text(msg: dict) -> str:
+    return "\n".join(part["text"] for part in msg.get("parts", []))
+
+
+def _common_prefix(first: list, messages: list) -> int:
+    """How many leading messages *messages* shares with *first* (never either's last)."""
+    shared = 0
+    while (shared < min(len(first), len(messages)) - 1
+           and messages[shared] == first[shared]):
+        shared += 1
+    return shared
+
+
+def pack_messages(rendered: "list[list]") -> list:
+    """
+    One message list asking for every item of *rendered* (each item's
+    substituted messages): the shared leading messages once, then a ``user``
+    turn listing each item's remaining turns.
+    """
+    first = rendered[0]
+    shared = min(_common_prefix(first, r) for r in rendered)
+    # The listing is a user turn, so the shared prefix must not end on one.
+    while shared and first[shared - 1].get("role") == "user":
+        shared -= 1
+
+    blocks = []
+    for index, messages in enumerate(rendered):
+        own = messages[shared:]
+        if len(own) == 1 and own[0].get("role") == "user":
+            body = _text(own[0])
+        else:
+            body = "\n\n".join(f"[{m.get('role')}]\n{_text(m)}" for m in own)
+        blocks.append(f"Input {index}:\n{body}")
+    listing = _INSTRUCTIONS.format(n=len(rendered)) + "\n\n" + "\n\n".join(blocks)
+    return first[:shared] + [{"role": "user", "parts": [{"type": "text", "text": listing}]}]
+
+
+def _fits(value, output: dict) -> bool:
+    """True when *value* is a well-formed answer in *output*'s format."""
+    fmt = output.get("format", {})
+    if fmt.get("type") == "text":
+        return isinstance(value, str)
+    if not isinstance(value, dict):
+        return False
+    required = fmt.get("schema", {}).get("required", ()) if fmt.get("type") == "json_schema" else ()
+    return all(key in value for key in required)
+
+
+def split_results(reply, count: int, output: dict) -> dict:
+    """``{position: answer}`` for the well-formed answers in a pack's *reply*."""
+    results = reply.get("results") if isinstance(reply, dict) else None
+    answers: dict = {}
+    for entry in results if isinstance(results, list) else ():
+        if not isinstance(entry, dict):
+            continue
+        index = entry.get("index")
+        if (isinstance(index, int) and 0 <= index < count and index not in answers
+                and _fits(entry.get("output"), output)):
+            answers[index] = entry["output"]
+    return answers
+
+
+class Packer:
+    """
+    Packs items for one skill and runs the packs; thread-safe, so concurrent
+    workers (``Pool(pack=N)``) can draw packs from one Packer.
+
+    ``results[i]`` / ``errors[i]`` hold item *i*'s answer or exception once
+    its pack has run; ``usage`` sums every call made; ``item_tokens`` is the
+    current output-token estimate per item.
+    """
+
+    def __init__(self, skill: "Skill", items: "list[dict]", batch_size: int) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1; got {batch_size!r}")
+        packable(skill)
+        self.skill      = skill
+        self.items      = items
+        self.batch_size = batch_size
+        self.results: list = [None] * len(items)
+        self.errors:  list = [None] * len(items)
+        self.usage   = None
+        self.item_tokens = float(_DEFAULT_ITEM_TOKENS)
+        self._output = packed_output(skill._output)
+        self._next   = 0
+        self._lock   = threading.Lock()
+        models = skill.models
+        self._max_output = min(m.max_tokens or m.max_output or _DEFAULT_MAX_OUTPUT
+                               for m in models)
+        windows = [m.context_window for m in models if m.context_window]
+        self._max_input = (min(windows) - self._max_output) if windows else None
+
+    # ── sizing ───────────────────────────────────────────────────────
+
+    def next_pack(self) -> "tuple[list[int], list[list]] | None":
+        """The next item positions and their rendered messages, or ``None``."""
+        with self._lock:
+            if self._next >= len(self.items):
+                return None
+            limit = max(1, min(self.batch_size,
+                               int(self._max_output * _HEADROOM // max(self.item_tokens, 1))))
+            template, model = self.skill._template(), self.skill.model
+            positions, rendered, tokens = [], [], 0
+            while self._next < len(self.items) and len(positions) < limit:
+                messages = template.render({**self.skill.variables, **self.items[self._next]})
+                if self._max_input is not None:
+                    # The shared prefix (system prompt, seed turns) is sent
+                    # once: count it with the first item only.
+                    own = messages[_common_prefix(rendered[0], messages):] if rendered \
+                        else messages
+                    tokens += model.count_tokens(own)
+                    if positions and tokens > self._max_input * _HEADROOM:
+                        break
+                positions.append(self._next)
+                rendered.append(messages)
+                self._next += 1
+            return positions, rendered
+
+    def _learn(self, usage, count: int, readable: bool) -> None:
+        with self._lock:
+            if not readable:
+                self.item_tokens *= 2
+            elif usage is not None and usage.output_tokens:
+                self.item_tokens = ((1 - _ALPHA) * self.item_tokens
+                                    + _ALPHA * usage.output_tokens / count)
+
+    def _add_usage(self, usage) -> None:
+        if usage is not None:
+            with self._lock:
+                self.usage = usage if self.usage is None else self.usage + usage
+
+    # ── running ──────────────────────────────────────────────────────
+
+    def _packed_skill(self, rendered: list) -> "Skill":
+        from ._skill import Skill
+        skill = self.skill
+        return Skill(model=skill.models, input={"messages": pack_messages(rendered)},
+                     output=self._output, name=skill.name,
+                     max_retries=skill.max_retries, retry_delay=skill.retry_delay,
+                     hooks=skill.hooks, hedge=getattr(skill, "hedge", None),
+                     route=getattr(skill, "router", None))
+
+    def _fail(self, positions: list, packed: "Skill", exc: Exception) -> None:
+        """A pack failed after its retries and fallbacks: so do its items."""
+        self._add_usage(packed.last_usage)
+        for position in positions:
+            self.errors[position] = exc
+
+    def _settle(self, positions: list, packed: "Skill", reply) -> list:
+        """Record a pack's answers; returns the positions to run alone."""
+        answers = split_results(reply, len(positions), self.skill._output) \
+            if reply is not None else {}
+        self._add_usage(packed.last_usage)
+        self._learn(packed.last_usage, len(positions), reply is not None)
+        for k, position in enumerate(positions):
+            if k in answers:
+                self.results[position] = answers[k]
+        return [p for k, p in enumerate(positions) if k not in answers]
+
+    def run_pack(self, positions: list, rendered: list) -> None:
+        """Run one pack, then each item it did not answer, blocking."""
+        packed = self._packed_skill(rendered)
+        try:
+            reply = packed.run()
+        except (InvalidRequestError, ValueError):
+            reply = None
+        except Exception as exc:
+            self._fail(positions, packed, exc)
+            return
+        for position in self._settle(positions, packed, reply):
+            self._run_alone(position)
+
+    async def arun_pack(self, positions: list, rendered: list) -> None:
+        """Async :meth:`run_pack`; the items run alone are awaited concurrently."""
+        packed = self._packed_skill(rendered)
+        try:
+            reply = await packed.arun()
+        except (InvalidRequestError, ValueError):
+            reply = None
+        except Exception as exc:
+            self._fail(positions, packed, exc)
+            return
+        await asyncio.gather(*(self._arun_alone(p)
+                               for p in self._settle(positions, packed, reply)))
+
+    def _run_alone(self, position: int) -> None:
+        # A shallow copy per item, so concurrent runs keep their own last_usage.
+        skill = copy.copy(self.skill)
+        try:
+            self.results[position] = skill.run(variables=self.items[position])
+        except Exception as exc:
+            self.errors[position] = exc
+        self._add_usage(skill.last_usage)
+
+    async def _arun_alone(self, position: int) -> None:
+        skill = copy.copy(self.skill)
+        try:
+            self.results[position] = await skill.arun(variables=self.items[position])
+        except Exception as exc:
+            self.errors[position] = exc
+        self._add_usage(skill.last_usage)
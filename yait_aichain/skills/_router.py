@@ -0,0 +1,145 @@
+"""
+skills._router
+==============
+
+``Router`` — order a Skill's fallback chain per call from what the process
+has observed about each model.
+
+A plain fallback chain is static: a degraded primary keeps taking every
+first attempt and the chain only helps after it has failed.  A Router reads
+the process-wide model health averages (``skills._stats`` — EWMA latency,
+error rate and cost, fed by the ``llm_call.ended`` event of every Skill
+call) and puts the model most likely to serve the call well first.  The
+rest of the order is still a fallback chain.
+
+Policies
+--------
+``"latency"``
+    Lowest expected latency first.  A model's expected latency is its average
+    successful latency divided by its success rate, so a fast model that
+    fails half its calls ranks like one twice as slow.
+``"cost"``
+    Cheapest first among models whose expected latency is within ``sla``
+    seconds; models outside the SLA follow, fastest first.  Without an
+    ``sla`` every model qualifies.
+``"round_robin"``
+    Smooth weighted round-robin over ``weights`` (default 1 each), each
+    weight scaled by the model's success rate.  The picked model goes first;
+    the others keep their chain order behind it.
+
+A model with no calls on record ranks first (ahead of measured models, in
+chain order), so every model in a chain gets measured; one whose calls have
+all failed ranks last.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from . import _stats
+
+_POLICIES = ("latency", "cost", "round_robin")
+
+# Success rates below this still count, so a failing model stays orderable.
+_MIN_SUCCESS = 0.05
+
+
+class Router:
+    """
+    Per-call ordering policy for a Skill's models.
+
+    Parameters
+    ----------
+    policy : str, optional
+        ``"latency"`` (default), ``"cost"`` or ``"round_robin"``.
+    sla : float | None, optional
+        Latency budget in seconds for the ``"cost"`` policy.
+    weights : dict[str, float] | None, optional
+        Relative share of first attempts per model name for
+        ``"round_robin"``; unnamed models weigh 1.
+
+    Example
+    -------
+    ::
+
+        from skills import Router, Skill
+
+        skill = Skill(model=[Model("gpt-4o"), Model("claude-sonnet-4-5")],
+                      input=..., route=Router("cost", sla=3.0))
+
+    Routers hold no model statistics of their own — all Skills in the process
+    share them — so any number of Skills can use separate Routers.  The
+    round-robin position is per Router instance.
+    """
+
+    def __init__(
+        self,
+        policy:  str = "latency",
+        sla:     "float | None" = None,
+        weights: "dict[str, float] | None" = None,
+    ) -> None:
+        if policy not in _POLICIES:
+            raise ValueError(
+                f"Unknown routing policy {policy!r}; expected one of {', '.join(_POLICIES)}."
+            )
+        if weights and any(w < 0 for w in weights.values()):
+            raise ValueError("Router weights must be non-negative.")
+        self.policy  = policy
+        self.sla     = sla
+        self.weights = dict(weights or {})
+        self._lock    = threading.Lock()
+        self._current: dict[str, float] = {}
+
+    def order(self, models: list) -> list:
+        """*models* reordered for the next call (the list is not modified)."""
+        if len(models) < 2:
+            return list(models)
+        health = [_stats.model_health(m.name) for m in models]
+        if self.policy == "round_robin":
+            return self._round_robin(models, health)
+
+        fresh = [m for m, h in zip(models, health) if h is None]
+        known = [(m, h) for m, h in zip(models, health) if h is not None]
+        if self.policy == "latency":
+            known.sort(key=lambda mh: _expected_latency(mh[1]))
+        else:
+            known.sort(key=self._cost_key)
+        return fresh + [m for m, _ in known]
+
+    def _cost_key(self, model_health) -> tuple:
+        _, h = model_health
+        latency = _expected_latency(h)
+        if self.sla is None or latency <= self.sla:
+            cost = h["cost"]
+            return (0, cost if cost is not None else 0.0, latency)
+        return (1, latency)
+
+    def _round_robin(self, models: list, health: list) -> list:
+        weights = {m.name: self.weights.get(m.name, 1.0) * _success(h)
+                   for m, h in zip(models, health)}
+        total = sum(weights.values())
+        if not total:
+            return list(models)
+        with self._lock:
+            for name, weight in weights.items():
+                self._current[name] = self._current.get(name, 0.0) + weight
+            pick = max(weights, key=lambda n: self._current[n])
+            self._current[pick] -= total
+        first = next(m for m in models if m.name == pick)
+        return [first] + [m for m in models if m is not first]
+
+    def __repr__(self) -> str:
+        return f"Router(policy={self.policy!r}, sla={self.sla!r})"
+
+
+def _success(health: "dict | None") -> float:
+    if health is None:
+        return 1.0
+    return max(1.0 - health["error_rate"], _MIN_SUCCESS)
+
+
+def _expected_latency(health: dict) -> float:
+    """Average latency over the success rate; infinite if nothing succeeded yet."""
+    if health["latency"] is None:
+        return float("inf")
+    return health["latency"] / _success(health)
@@ -0,0 +1,305 @@
+"""
+skills._semantic
+================
+
+``SemanticCache`` — an opt-in result cache for Skills that matches prompts
+by meaning rather than by bytes.
+
+The response cache (``clients._cache``) only helps when a request is
+byte-identical.  User-facing prompts rarely are: the same question arrives
+with different whitespace, casing or phrasing.  With
+``Skill(semantic_cache=SemanticCache(embedder))`` a run embeds the text of
+its substituted ``user`` turns with any :class:`~tools.embedding.Embedder`,
+compares the vector with those of earlier runs, and — when the closest one
+is at least ``threshold`` similar (cosine) — returns that run's result
+without calling the model.
+
+Entries are partitioned so that only interchangeable prompts are compared:
+
+* by **namespace** — one per Skill by default (its name, model settings,
+  template and output format), so two skills never answer for each other;
+* by the exact text of every non-``user`` turn — a different system prompt
+  or seed turn is a different question, however similar the user turn.
+
+A prompt whose normalised text (case-folded, whitespace collapsed) was seen
+before is answered without an embedding call at all.
+
+Eviction is least-recently-used beyond ``max_entries``, plus an optional
+``ttl``.  With ``path`` the entries live in a SQLite file as well and are
+loaded again on construction.  ``stats()`` reports hits, misses, stores,
+evictions, the hit rate and the model time the hits saved.
+
+Similarity is computed in pure Python over normalised vectors — a linear
+scan of one partition per lookup, which is fast for the thousands of
+entries such a cache usually holds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from operator import mul
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..tools.embedding._base import Embedder
+
+
+def normalize_text(text: str) -> str:
+    """Case-folded *text* with runs of whitespace collapsed to one space."""
+    return " ".join(text.split()).casefold()
+
+
+def _unit(vector) -> "array":
+    """*vector* scaled to length 1 (a zero vector stays zero)."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    return array("d", (x / norm for x in vector) if norm else vector)
+
+
+class _Entry:
+    __slots__ = ("key", "namespace", "partition", "text", "vector", "value",
+                 "expires", "latency")
+
+    def __init__(self, key, namespace, partition, text, vector, value,
+                 expires, latency) -> None:
+        self.key       = key
+        self.namespace = namespace
+        self.partition = partition
+        self.text      = text
+        self.vector    = vector
+        self.value     = value
+        self.expires   = expires
+        self.latency   = latency
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache of Skill results.
+
+    Parameters
+    ----------
+    embedder : Embedder
+        Any :class:`~tools.embedding.Embedder` (or object with the same
+        ``embed(texts) -> EmbeddingResult`` method).  Use the same embedder
+        for the life of a persisted cache — vectors of different models are
+        not comparable.
+    threshold : float
+        Smallest cosine similarity that counts as a hit (default ``0.95``).
+        Lower values answer more paraphrases and risk wrong answers; tune it
+        for the embedder in use.
+    max_entries : int
+        Evict least-recently-used entries beyond this many (default 1024).
+    ttl : float | None
+        Lifetime of an entry in seconds (``None``: no expiry).
+    path : str | None
+        Also keep the entries in this SQLite file (created on first use,
+        with its directory; ``~`` is expanded).  Entries already in the file
+        are loaded on construction.
+
+    Examples
+    --------
+    ::
+
+        from yait_aichain.skills import SemanticCache, Skill
+        from yait_aichain.tools import Embedding
+
+        cache = SemanticCache(Embedding("openai/text-embedding-3-small"),
+                              threshold=0.93, ttl=86_400, path="~/.cache/faq.db")
+        faq = Skill(model=Model("gpt-4o"), input=..., semantic_cache=cache)
+        faq.run(variables={"q": "How do I reset my password?"})
+        faq.run(variables={"q": "how can I reset my  password"})   # served from cache
+        cache.stats()["hit_rate"]
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        " key TEXT PRIMARY KEY, namespace TEXT NOT NULL, partition TEXT NOT NULL,"
+        " text TEXT NOT NULL, vector BLOB NOT NULL, value TEXT NOT NULL,"
+        " expires REAL, latency REAL NOT NULL, accessed REAL NOT NULL)"
+    )
+
+    def __init__(
+        self,
+        embedder:    "Embedder",
+        threshold:   float = 0.95,
+        *,
+        max_entries: int = 1024,
+        ttl:         "float | None" = None,
+        path:        "str | None" = None,
+    ) -> None:
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1]; got {threshold!r}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1; got {max_entries!r}")
+        self.embedder    = embedder
+        self.threshold   = threshold
+        self.max_entries = max_entries
+        self.ttl         = ttl
+        self.path        = os.path.expanduser(path) if path else None
+        self._lock = threading.Lock()
+        # LRU order over every entry; the partitions index the same entries
+        # for the similarity scan, the texts for exact (normalised) matches.
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._partitions: "dict[tuple[str, str], dict[str, _Entry]]" = {}
+        self._texts: "dict[tuple[str, str, str], _Entry]" = {}
+        self._counts = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0,
+                        "seconds_saved": 0.0}
+        self._conn: "sqlite3.Connection | None" = None
+        if self.path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(self._SCHEMA)
+            self._load()
+
+    # ── public ───────────────────────────────────────────────────────
+
+    def embed(self, text: str) -> "array":
+        """The unit-length embedding of *text* (one call to the embedder)."""
+        return _unit(self.embedder.embed([text]).embeddings[0])
+
+    def match(self, namespace: str, partition: str, text: str) -> "_Entry | None":
+        """The live entry stored for exactly this normalised *text*, or ``None``."""
+        with self._lock:
+            entry = self._texts.get((namespace, partition, normalize_text(text)))
+            return self._touch(entry, time.time()) if entry is not None else None
+
+    def lookup(self, namespace: str, partition: str, vector) -> "tuple[_Entry | None, float]":
+        """
+        The most similar live entry and its similarity, or ``(None, best)``
+        when none reaches ``threshold``.  *vector* is unit-length (:meth:`embed`).
+        """
+        now = time.time()
+        with self._lock:
+            best, score = None, 0.0
+            for entry in list(self._partitions.get((namespace, partition), {}).values()):
+                if entry.expires is not None and entry.expires <= now:
+                    self._drop(entry)
+                    continue
+                similarity = sum(map(mul, vector, entry.vector))
+                if similarity > score:
+                    best, score = entry, similarity
+            if best is None or score < self.threshold:
+                return None, score
+            self._touch(best, now)
+            return best, score
+
+    def hit(self, entry: "_Entry") -> None:
+        """Count *entry* as served (a hit saving its original latency)."""
+        with self._lock:
+            self._counts["hits"] += 1
+            self._counts["seconds_saved"] += entry.latency
+
+    def miss(self) -> None:
+        """Count a lookup that found nothing to serve."""
+        with self._lock:
+            self._counts["misses"] += 1
+
+    def store(self, namespace: str, partition: str, text: str, vector, value,
+              latency: float) -> None:
+        """Remember *value* — a JSON-serialisable result — for *text*."""
+        now = time.time()
+        entry = _Entry(
+            key=hashlib.sha256(json.dumps([namespace, partition, normalize_text(text)])
+                               .encode("utf-8")).hexdigest(),
+            namespace=namespace, partition=partition, text=normalize_text(text),
+            vector=array("d", vector), value=value,
+            expires=now + self.ttl if self.ttl is not None else None,
+            latency=latency,
+        )
+        with self._lock:
+            old = self._entries.get(entry.key)
+            if old is not None:
+                self._drop(old)
+            self._add(entry)
+            self._counts["stores"] += 1
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (entry.key, namespace, partition, entry.text,
+                         sqlite3.Binary(entry.vector.tobytes()),
+                         json.dumps(value, ensure_ascii=False), entry.expires,
+                         latency, now))
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries.values())))
+                evicted += 1
+            self._counts["evictions"] += evicted
+
+    def clear(self, namespace: "str | None" = None) -> None:
+        """Drop every entry, or only those of *namespace*."""
+        with self._lock:
+            for entry in list(self._entries.values()):
+                if namespace is None or entry.namespace == namespace:
+                    self._drop(entry)
+
+    def stats(self) -> dict:
+        """
+        Counters since creation: hits, misses, stores, evictions,
+        ``hit_rate`` (hits / lookups) and ``seconds_saved`` (the summed
+        latency of the original runs the hits replayed).
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = counts["hits"] + counts["misses"]
+        counts["hit_rate"] = counts["hits"] / lookups if lookups else 0.0
+        return counts
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ── internals (callers hold the lock) ─────────────────────────────
+
+    def _add(self, entry: "_Entry") -> None:
+        self._entries[entry.key] = entry
+        self._partitions.setdefault((entry.namespace, entry.partition), {})[entry.key] = entry
+        self._texts[(entry.namespace, entry.partition, entry.text)] = entry
+
+    def _drop(self, entry: "_Entry") -> None:
+        if self._entries.pop(entry.key, None) is None:
+            return
+        scope = (entry.namespace, entry.partition)
+        partition = self._partitions.get(scope)
+        if partition is not None:
+            partition.pop(entry.key, None)
+            if not partition:
+                del self._partitions[scope]
+        self._texts.pop((entry.namespace, entry.partition, entry.text), None)
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (entry.key,))
+
+    def _touch(self, entry: "_Entry", now: float) -> "_Entry | None":
+        if entry.expires is not None and entry.expires <= now:
+            self._drop(entry)
+            return None
+        self._entries.move_to_end(entry.key)
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?",
+                                   (now, entry.key))
+        return entry
+
+    def _load(self) -> None:
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (now,))
+            rows = self._conn.execute(
+                "SELECT key, namespace, partition, text, vector, value, expires, latency"
+                " FROM entries ORDER BY accessed").fetchall()
+        for key, namespace, partition, text, blob, value, expires, latency in rows:
+            vector = array("d")
+            vector.frombytes(bytes(blob))
+            self._add(_Entry(key, namespace, partition, text, vector,
+                             json.loads(value), expires, latency))
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries.values())))
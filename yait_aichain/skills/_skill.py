@@ -19,19 +19,32 @@ Skills can be persisted to YAML with :meth:`Skill.save` and reloaded with
 the :meth:`Skill.load` class method.
 """
 
+import asyncio
+import contextlib
+import copy
+import functools
+import hashlib
 import json
 import os
+import re
 import time
 from typing import TYPE_CHECKING
 
 from ..clients._base import APIError
 from ..clients._errors import (
     RateLimitError, ServerError, NetworkError, TaskFailedError,
-    InsufficientCreditsError,
+    InsufficientCreditsError, InvalidRequestError, NotFoundError,
 )
 from ..models._usage import Usage, extract_usage, attach_cost
-from .._events import Event, emit
+from .._deadline import check_deadline, deadline_after, deadline_scope, deadline_until
+from .._events import Event, emit, hook_scope
+from ..clients._sink import download_to
 from . import _adapters as adapters
+from ._hedge import _Hedge
+from ._pack import Packer
+from ._router import Router
+from ._semantic import SemanticCache
+from ._stats import latency_quantile, observe_call, record_latency
 
 if TYPE_CHECKING:
     from ..models._base import Model
@@ -50,6 +63,165 @@ _TEXT_OUTPUT: dict = {"modalities": ["text"], "format": {"type": "text"}}
 # invalid-request / not-found are NOT here — falling back would hide them.
 _FALLBACK_ERRORS = (RateLimitError, ServerError, NetworkError)
 
+# A 400 that names the stored conversation (``previous_response_id``) means it
+# expired or was deleted; any other 400 is a bad request that a full resend
+# would only repeat.
+_LOST_CONVERSATION = re.compile(r"previous[_ ]response", re.IGNORECASE)
+
+# ``Skill(hedge="p90")``: a percentile of the observed latency; until a model
+# has enough samples its hedge delay is _HEDGE_DEFAULT_DELAY seconds.
+_HEDGE_PERCENTILE    = re.compile(r"p([1-9][0-9]?)")
+_HEDGE_DEFAULT_DELAY = 2.0
+
+# Effects yielded by ``Skill._pipeline`` to its sync / async driver.  The
+# HTTP ones (_SEND, _STREAM, _HEDGE) end with the ``(hooks, save_to)`` scope
+# the driver performs them in.
+_SEND   = "send"
+_SLEEP  = "sleep"
+_STREAM = "stream"
+_HEDGE  = "hedge"
+_CALL   = "call"      # (_CALL, fn, *args): blocking work, off the event loop
+
+
+class _PartialStream(Exception):
+    """
+    A stream failed after deltas were already yielded to the caller.
+
+    Wraps the original error so ``_call_once`` neither retries nor falls back
+    (the caller has seen half an answer); ``_drive_stream`` re-raises ``exc``.
+    """
+
+    def __init__(self, exc: Exception) -> None:
+        super().__init__(str(exc))
+        self.exc = exc
+
+
+def _lost_conversation(exc: Exception) -> bool:
+    """True when *exc* says the provider no longer holds a chained conversation."""
+    if isinstance(exc, NotFoundError):
+        return True
+    return bool(_LOST_CONVERSATION.search(str(getattr(exc, "message", exc))))
+
+
+@contextlib.contextmanager
+def _effect_scope(scope: tuple):
+    """
+    The ``(hooks, save_to)`` *scope* of an HTTP effect, entered by the driver
+    around that effect only: transport events (rate-limit waits) reach the
+    skill's hooks and generated files stream to ``output["save_to"]``.
+    """
+    hooks, save_to = scope
+    with hook_scope(hooks), download_to(save_to):
+        yield
+
+
+def _drive(gen):
+    """Run a ``Skill._pipeline`` generator to completion, blocking."""
+    step, value = gen.send, None
+    while True:
+        try:
+            effect = step(value)
+        except StopIteration as stop:
+            return stop.value
+        step, value = gen.send, None
+        if effect[0] == _SLEEP:
+            time.sleep(effect[1])
+            continue
+        try:
+            if effect[0] == _CALL:
+                value = effect[1](*effect[2:])
+            elif effect[0] == _HEDGE:
+                with _effect_scope(effect[2]):
+                    value = effect[1].run()
+            else:
+                _, model, path, body, scope = effect
+                with _effect_scope(scope):
+                    value = model.client.send(path, body, model.client._auth_headers())
+        except Exception as exc:
+            step, value = gen.throw, exc
+
+
+async def _adrive(gen):
+    """Run a ``Skill._pipeline`` generator to completion on the event loop."""
+    step, value = gen.send, None
+    while True:
+        try:
+            effect = step(value)
+        except StopIteration as stop:
+            return stop.value
+        step, value = gen.send, None
+        if effect[0] == _SLEEP:
+            await asyncio.sleep(effect[1])
+            continue
+        try:
+            if effect[0] == _CALL:
+                value = await asyncio.to_thread(effect[1], *effect[2:])
+            elif effect[0] == _HEDGE:
+                with _effect_scope(effect[2]):
+                    value = await effect[1].arun()
+            else:
+                _, model, path, body, scope = effect
+                with _effect_scope(scope):
+                    value = await model.client.asend(path, body,
+                                                     model.client._auth_headers())
+        except Exception as exc:
+            step, value = gen.throw, exc
+
+
+def _drive_stream(gen, deadline: "float | None" = None):
+    """
+    Run a ``Skill._pipeline`` generator, yielding text deltas of its streamed
+    call; returns the pipeline's result.
+
+    The *deadline* (seconds) and each effect's scope are entered around the
+    pipeline's own steps and effects only — never across a ``yield`` — so
+    they do not reach the consumer's code between deltas.
+    """
+    at = deadline_after(deadline)
+    step, value = gen.send, None
+    try:
+        while True:
+            try:
+                with deadline_until(at):
+                    effect = step(value)
+            except StopIteration as stop:
+                return stop.value
+            except _PartialStream as partial:
+                raise partial.exc
+            step, value = gen.send, None
+            if effect[0] == _SLEEP:
+                time.sleep(effect[1])
+                continue
+            kind, model, path, body, scope = effect
+            if kind == _SEND:
+                try:
+                    with deadline_until(at), _effect_scope(scope):
+                        value = model.client.send(path, body, model.client._auth_headers())
+                except Exception as exc:
+                    step, value = gen.throw, exc
+                continue
+            stream, started = None, False
+            try:
+                with deadline_until(at), _effect_scope(scope):
+                    stream = model.client.stream(path, body, model.client._auth_headers())
+                    deltas = iter(stream)
+                while True:
+                    with deadline_until(at), _effect_scope(scope):
+                        delta = next(deltas, None)
+                    if delta is None:
+                        break
+                    if delta:
+                        started = True
+                        yield delta
+                value = stream.response
+            except Exception as exc:
+                step, value = gen.throw, (_PartialStream(exc) if started else exc)
+            finally:
+                if stream is not None:
+                    stream.close()
+    finally:
+        gen.close()
+
 
 class Skill:
     """
@@ -110,6 +282,13 @@ class Skill:
             # image generation
             output={"modalities": ["image"], "format": {"type": "image"}}
 
+            # image generation, streamed to a file instead of inline base64
+            # (providers that return a download URL: Qwen, BFL, Recraft);
+            # the result carries "path".  Also a callable(media_type) that
+            # returns a path or a writable binary file.
+            output={"modalities": ["image"], "format": {"type": "image"},
+                    "save_to": "renders/"}
+
     variables : dict | None, optional
         Default variable values.  Can be overridden or extended at call
         time via ``run(variables={...})``.  Merged at run time; call-time
@@ -124,6 +303,44 @@ class Skill:
     description : str | None, optional
         Short description of what the skill does.
 
+    hedge : float | str | None, optional
+        Hedge a fallback chain against tail latency.  If a model has not
+        answered within this delay, the same request also goes to the next
+        model in the chain; the first success is returned.  A number is a
+        fixed delay in seconds; ``"p90"`` (any ``"pNN"``) waits for that
+        percentile of the model's observed latency (2 s until it has enough
+        samples).  Every call that runs — winners and losers — reports an
+        ``llm_call.ended`` event with its usage and cost; ``last_usage`` also
+        counts the losers that finished before the winner.  Applies to
+        single-call, non-streaming runs of a multi-model skill.
+
+    route : Router | str | None, optional
+        Order the fallback chain per call instead of always starting with
+        the first model: a :class:`Router`, or a policy name (``"latency"``,
+        ``"cost"``, ``"round_robin"``) for a Router with default settings.
+        The order comes from process-wide per-model latency, error-rate and
+        cost averages that every Skill's calls feed.  ``None`` (default)
+        keeps the list order.
+
+    stateful : bool, optional
+        Multi-turn runs only: after the first generate turn, send just the
+        new turns (and the system prompt) and chain on the conversation the
+        provider stored for the previous reply, instead of resending the
+        whole context every turn.  Supported by the OpenAI Responses API
+        (``previous_response_id``); other models resend the full context as
+        usual, and so does a call whose stored conversation the provider no
+        longer has.  Default ``False``.
+
+    semantic_cache : SemanticCache | None, optional
+        Answer a run from an earlier one whose prompt means the same: the
+        text of the substituted ``user`` turns is embedded and, when an
+        earlier run of this skill with the same system / seed turns is at
+        least the cache's ``threshold`` similar, its result is returned
+        without a model call (``last_usage`` is then an empty ``Usage``).
+        Each lookup emits a ``semantic_cache.hit`` / ``semantic_cache.miss``
+        event.  Only text prompts with text / JSON output are cached, and
+        :meth:`stream` always calls the model.  Default ``None``.
+
     Examples
     --------
     Text output (minimal — ``output`` omitted, shorthand parts)::
@@ -177,6 +394,10 @@ class Skill:
         max_retries:  int           = 0,
         retry_delay:  float         = 2.0,
         hooks:        list  | None  = None,
+        hedge:        "float | str | None" = None,
+        route:        "Router | str | None" = None,
+        stateful:     bool          = False,
+        semantic_cache: "SemanticCache | None" = None,
     ) -> None:
         input  = adapters.normalize_input(input)
         output = adapters.normalize_output(output)
@@ -191,6 +412,7 @@ class Skill:
             raise ValueError("Skill requires at least one model.")
         self.model       = self.models[0]
         self._input      = input
+        self._compiled   = adapters.compile_messages(input["messages"])
         self._output     = output
         self.variables   = variables or {}
         self.options     = options   or {}
@@ -199,6 +421,16 @@ class Skill:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.hooks       = list(hooks or [])     # observability hooks (1.4.4)
+        if hedge is not None and not (
+                (isinstance(hedge, (int, float)) and hedge >= 0)
+                or (isinstance(hedge, str) and _HEDGE_PERCENTILE.fullmatch(hedge))):
+            raise ValueError(
+                f"hedge must be a delay in seconds or a percentile like 'p90'; got {hedge!r}"
+            )
+        self.hedge       = hedge
+        self.router      = Router(route) if isinstance(route, str) else route
+        self.stateful    = stateful
+        self.semantic_cache = semantic_cache
 
         # Token usage of the most recent run() — None until the first call.
         # Reading it is optional; it never affects run()'s inputs or output.
@@ -211,7 +443,14 @@ class Skill:
 
     def _emit(self, etype: str, **fields) -> None:
         """Dispatch an observability :class:`Event` to registered hooks (1.4.4)."""
-        if self.hooks:
+        if etype == "llm_call.ended":
+            # Every finished call feeds the shared model health averages
+            # that Router orders chains by, hooks or not.
+            event = Event(type=etype, **fields)
+            observe_call(event)
+            if self.hooks:
+                emit(self.hooks, event)
+        elif self.hooks:
             emit(self.hooks, Event(type=etype, **fields))
 
     # ------------------------------------------------------------------
@@ -223,6 +462,7 @@ class Skill:
         variables:   dict  | None = None,
         max_retries: int   | None = None,
         retry_delay: float | None = None,
+        deadline:    float | None = None,
     ) -> "str | dict":
         """
         Execute the skill and return the model's response.
@@ -240,6 +480,12 @@ class Skill:
             Base sleep in seconds between retries for this call only.
             Overrides the constructor value when provided.  Each subsequent
             attempt doubles the delay (exponential back-off).
+        deadline : float | None, optional
+            Seconds this call may take in total, across retries, fallbacks and
+            every HTTP request (see ``yait_aichain._deadline``).  Once spent,
+            no further attempt is started and ``DeadlineExceededError`` is
+            raised.  Inside a ``Chain`` or ``Agent`` run with a deadline, the
+            tighter of the two applies.
 
         Returns
         -------
@@ -256,47 +502,309 @@ class Skill:
             exhausted on a transient error (status in
             ``{429, 500, 502, 503, 504}``).  With a fallback chain, the last
             model's transient error is raised only after every model failed.
+        clients.DeadlineExceededError
+            When *deadline* runs out (an ``APIError`` with status 408).
         ValueError
             If the provider response cannot be parsed (never retried —
             this indicates a prompt or schema error, not a transient fault).
         """
+        with deadline_scope(deadline):
+            return _drive(self._pipeline(variables, max_retries, retry_delay))
+
+    async def arun(
+        self,
+        variables:   dict  | None = None,
+        max_retries: int   | None = None,
+        retry_delay: float | None = None,
+        deadline:    float | None = None,
+    ) -> "str | dict":
+        """
+        Async :meth:`run`: same arguments, result, errors, retries, fallback
+        and hooks, but every HTTP call goes through ``client.asend`` on the
+        running event loop and back-off sleeps are ``asyncio.sleep`` — so many
+        skills can be awaited concurrently without a thread each.
+        """
+        with deadline_scope(deadline):
+            return await _adrive(self._pipeline(variables, max_retries, retry_delay))
+
+    def map_batched(
+        self,
+        items:      "list[dict]",
+        batch_size: int          = 20,
+        variables:  dict | None  = None,
+        deadline:   float | None = None,
+    ) -> list:
+        """
+        Run the skill for every item, packing up to *batch_size* items into
+        each model call (see ``skills._pack``).
+
+        Each pack keeps the prompt the items share once, lists the items'
+        own turns, and asks for a ``json_schema`` array that is split back
+        onto the items by index.  An item the reply leaves out or answers
+        malformed is retried on its own with :meth:`run`.  Packs shrink
+        below *batch_size* to keep the expected reply under the models'
+        output-token limit and the prompt inside their context window.
+
+        Packs run one after another; ``Pool(skill, items, pack=N)`` runs
+        them in parallel.
+
+        Parameters
+        ----------
+        items : list[dict]
+            One variable dict per item, merged over *variables* and the
+            skill's own ``variables`` (item values win).
+        batch_size : int, optional
+            Most items per call (default 20).
+        variables : dict | None, optional
+            Variables shared by every item.
+        deadline : float | None, optional
+            Seconds the whole batch may take, as in :meth:`run`.
+
+        Returns
+        -------
+        list
+            One result per item, in order — what :meth:`run` returns for it.
+            ``last_usage`` sums every call made; ``history`` is this list.
+
+        Raises
+        ------
+        ValueError
+            If the skill cannot be packed: multi-turn, media parts, or
+            image output.
+        clients._base.APIError
+            The first item's error, after its pack and its own retry failed.
+        """
+        packer = Packer(self, [{**(variables or {}), **item} for item in items], batch_size)
+        with deadline_scope(deadline):
+            while (pack := packer.next_pack()) is not None:
+                packer.run_pack(*pack)
+        return self._packed_results(packer)
+
+    async def amap_batched(
+        self,
+        items:      "list[dict]",
+        batch_size: int          = 20,
+        variables:  dict | None  = None,
+        deadline:   float | None = None,
+    ) -> list:
+        """Async :meth:`map_batched`: same arguments, result and errors."""
+        packer = Packer(self, [{**(variables or {}), **item} for item in items], batch_size)
+        with deadline_scope(deadline):
+            while (pack := packer.next_pack()) is not None:
+                await packer.arun_pack(*pack)
+        return self._packed_results(packer)
+
+    def _packed_results(self, packer: "Packer") -> list:
+        self.last_usage = packer.usage
+        self.history    = None
+        for error in packer.errors:
+            if error is not None:
+                raise error
+        self.history = list(packer.results)
+        return packer.results
+
+    def stream(
+        self,
+        variables:   dict  | None = None,
+        max_retries: int   | None = None,
+        retry_delay: float | None = None,
+        deadline:    float | None = None,
+    ):
+        """
+        Execute the skill, yielding text deltas as the model generates them.
+
+        Same arguments as :meth:`run`.  The generator's return value (the
+        ``StopIteration.value``) is the parsed result :meth:`run` would have
+        returned; ``last_usage``, ``history`` and the ``llm_call.*`` events are
+        filled in once the stream ends.  In a multi-turn skill only the final
+        generate turn streams; earlier turns run as ordinary calls.
+
+        Retries and model fallback apply until the first delta arrives.  A
+        failure after that is raised as-is — the caller has already consumed
+        part of the answer, so the call is not silently restarted.
+
+        For ``json`` / ``json_schema`` output the deltas are fragments of the
+        JSON text; the parsed dict is the return value.
+
+        Raises
+        ------
+        ValueError
+            If the skill produces images (only text generation streams).
+        NotImplementedError
+            If the model's provider has no streaming support.
+        clients._base.APIError
+            As :meth:`run`.
+        """
+        if set(self._output.get("modalities", ["text"])) - {"text"}:
+            raise ValueError("Skill.stream() supports text output only")
+        return (yield from _drive_stream(
+            self._pipeline(variables, max_retries, retry_delay, stream=True), deadline))
+
+    def _pipeline(
+        self,
+        variables:   dict  | None,
+        max_retries: int   | None,
+        retry_delay: float | None,
+        stream:      bool = False,
+    ):
+        """
+        The body of :meth:`run` / :meth:`arun`, written once as a generator.
+
+        It yields ``(_SEND, model, path, body, scope)`` for each HTTP call (the
+        driver performs it inside *scope*, the skill's hooks and ``save_to``,
+        and sends back the raw response bytes) and ``(_SLEEP, seconds)`` for each
+        back-off; errors raised by a send are thrown back in at the yield.
+        ``_drive`` performs the effects blocking, ``_adrive`` awaits them.
+        With *stream* the final model call is yielded as
+        ``(_STREAM, model, path, body, scope)`` instead and ``_drive_stream`` sends
+        back the decoded response dict.
+        """
         _max_retries = self.max_retries if max_retries is None else max_retries
         _retry_delay = self.retry_delay if retry_delay is None else retry_delay
 
         # Merge variables: instance defaults ← call-time overrides
         merged = {**self.variables, **(variables or {})}
 
-        # Substitute {placeholders} in a deep copy of the messages list
-        messages = adapters.substitute(self._input["messages"], merged)
+        # Fill in {placeholders}; untouched messages / parts are shared
+        # with the template, never mutated downstream.
+        messages = self._template().render(merged)
 
         # Reset usage/history so that, if this call fails, they are None rather
         # than a stale value left over from a previous successful run().
         self.last_usage = None
         self.history    = None
 
+        scope = None if stream else self._semantic_scope(messages)
+        if scope is not None:
+            entry, vector = yield from self._semantic_lookup(*scope)
+            if entry is not None:
+                self.last_usage = Usage()
+                self.history    = copy.deepcopy(entry.value["history"])
+                return copy.deepcopy(entry.value["result"])
+            _t0 = time.monotonic()
+
+        result, usage, history = yield from self._run_models(
+            messages, _max_retries, _retry_delay, stream)
+        self.last_usage = usage
+        self.history    = history
+        if scope is not None and vector is not None:
+            scope[0].store(*scope[1:], vector,
+                           copy.deepcopy({"result": result, "history": history}),
+                           time.monotonic() - _t0)
+        return result
+
+    def _template(self) -> "adapters.CompiledMessages":
+        """``self._input``'s messages, compiled once (again if replaced)."""
+        compiled = getattr(self, "_compiled", None)
+        if compiled is None or compiled.source is not self._input["messages"]:
+            compiled = self._compiled = adapters.compile_messages(self._input["messages"])
+        return compiled
+
+    def _run_models(
+        self,
+        messages:    list,
+        max_retries: int,
+        retry_delay: float,
+        stream:      bool,
+    ):
+        """
+        Run *messages* through the (routed, possibly hedged) fallback chain
+        (a ``_pipeline`` sub-generator); returns ``(result, usage, history)``.
+        """
+        router = getattr(self, "router", None)
+        models = router.order(self.models) if router is not None else self.models
+
+        if (getattr(self, "hedge", None) is not None and len(models) > 1
+                and not stream
+                and not any(adapters.is_generate_marker(m) for m in messages)):
+            result, usage = yield from self._run_hedged(
+                models, messages, max_retries, retry_delay)
+            return result, usage, [result]
+
         # Try each model in the fallback chain.  Transient failures
         # (rate limit / server / network) advance to the next model; a
         # non-transient failure (bad request, auth, parse) propagates
         # immediately — falling back would only hide a real error.
-        for i, model in enumerate(self.models):
+        for i, model in enumerate(models):
             try:
-                return self._run_on_model(
-                    model, messages, _max_retries, _retry_delay
-                )
+                return (yield from self._run_on_model(
+                    model, messages, max_retries, retry_delay, stream
+                ))
             except _FALLBACK_ERRORS:
-                if i < len(self.models) - 1:
+                if i < len(models) - 1:
                     continue   # try the next model in the chain
                 raise          # last model exhausted
 
+    def _semantic_scope(self, messages: list) -> "tuple | None":
+        """
+        ``(cache, namespace, partition, text)`` for a semantic-cache lookup of
+        the substituted *messages*, or ``None`` when this run is not cached:
+        no cache, media parts, non-text output or a ``save_to`` target.
+        """
+        cache = getattr(self, "semantic_cache", None)
+        if (cache is None or self._output.get("save_to") is not None
+                or set(self._output.get("modalities", ["text"])) - {"text"}):
+            return None
+        user, fixed = [], []
+        for msg in messages:
+            texts = []
+            for part in msg.get("parts", []):
+                if part.get("type", "text") != "text":
+                    return None
+                texts.append(str(part.get("text", "")))
+            if msg.get("role") == "user":
+                user.extend(texts)
+            else:
+                fixed.append([msg.get("role"), texts])
+        text = "\n\n".join(user)
+        if not text.strip():
+            return None
+        # Each model's request settings (as a memo fingerprint records them),
+        # so a changed temperature or max_tokens starts a new namespace.
+        namespace = hashlib.sha256(json.dumps(
+            [self.name, [m._params() for m in self.models], self._input, self._output],
+            sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+        partition = hashlib.sha256(json.dumps(fixed).encode("utf-8")).hexdigest()[:16]
+        return cache, f"{self.name or 'skill'}:{namespace}", partition, text
+
+    def _semantic_lookup(self, cache: SemanticCache, namespace: str,
+                         partition: str, text: str):
+        """
+        Look *text* up in *cache* (a ``_pipeline`` sub-generator); returns
+        ``(entry or None, unit vector or None)``.  An embedding failure is a
+        miss that is not stored — the cache never fails a run.
+        """
+        payload = {"namespace": namespace, "similarity": 1.0}
+        entry, vector, error = cache.match(namespace, partition, text), None, None
+        if entry is None:
+            try:
+                vector = yield (_CALL, cache.embed, text)
+            except Exception as exc:
+                error = str(exc)
+                del payload["similarity"]
+            else:
+                entry, payload["similarity"] = cache.lookup(namespace, partition, vector)
+        if entry is not None:
+            cache.hit(entry)
+            self._emit("semantic_cache.hit", name=self.name,
+                       duration=entry.latency, payload=payload)
+        else:
+            cache.miss()
+            self._emit("semantic_cache.miss", name=self.name, error=error,
+                       payload=payload)
+        return entry, vector
+
     def _run_on_model(
         self,
         model:       "Model",
         messages:    list,
         max_retries: int,
         retry_delay: float,
-    ) -> "str | dict":
+        stream:      bool = False,
+    ):
         """
-        Run *messages* against a single model.
+        Run *messages* against a single model (a ``_pipeline`` sub-generator);
+        returns ``(result, usage, history)``.
 
         Single-shot when there are no ``assistant`` generate markers (the
         original behavior). With markers (multi-turn directed reasoning), each
@@ -304,14 +812,12 @@ class Skill:
         — is one model call; each reply is appended to the running context so
         later turns see it. The last call uses the skill's real output format;
         intermediate calls are plain text (they only feed the context).
-        ``last_usage`` is the sum across turns; ``history`` holds each reply.
+        ``usage`` is the sum across turns; ``history`` holds each reply.
         """
         if not any(adapters.is_generate_marker(m) for m in messages):
-            result, usage = self._call_once(
-                model, messages, self._output, max_retries, retry_delay)
-            self.last_usage = usage
-            self.history    = [result]
-            return result
+            result, usage, _ = yield from self._call_once(
+                model, messages, self._output, max_retries, retry_delay, stream)
+            return result, usage, [result]
 
         # Build the turn sequence: real messages interleaved with generate
         # points; add an implicit final generate when the script ends on an
@@ -326,13 +832,30 @@ class Skill:
         total_usage = None
         history: list = []
         final: "str | dict | None" = None
+        # ``stateful``: the provider holds running[:held] for the raw response
+        # ``previous``; the next turn sends only the rest (system turns too —
+        # they are not carried over).
+        previous, held = None, 0
         for k, item in enumerate(seq):
             if item[0] == "msg":
                 running.append(item[1])
                 continue
             output = self._output if k == last_gen else _TEXT_OUTPUT
-            reply, usage = self._call_once(
-                model, running, output, max_retries, retry_delay)
+            chain = None
+            if previous is not None:
+                delta = [m for m in running[:held] if m.get("role") == "system"]
+                chain = (previous, delta + running[held:])
+            try:
+                reply, usage, response = yield from self._call_once(
+                    model, running, output, max_retries, retry_delay,
+                    stream and k == last_gen, chain)
+            except (InvalidRequestError, NotFoundError) as exc:
+                if chain is None or not _lost_conversation(exc):
+                    raise
+                # The stored conversation is gone (expired / deleted): resend.
+                reply, usage, response = yield from self._call_once(
+                    model, running, output, max_retries, retry_delay,
+                    stream and k == last_gen)
             total_usage = usage if total_usage is None else total_usage + usage
             history.append(reply)
             final = reply
@@ -341,10 +864,10 @@ class Skill:
             text = reply if isinstance(reply, str) else json.dumps(reply, ensure_ascii=False)
             running.append({"role": "assistant",
                             "parts": [{"type": "text", "text": text}]})
+            if self.stateful:
+                previous, held = response, len(running)
 
-        self.last_usage = total_usage
-        self.history    = history
-        return final
+        return final, total_usage, history
 
     def _call_once(
         self,
@@ -353,28 +876,46 @@ class Skill:
         output:      dict,
         max_retries: int,
         retry_delay: float,
-    ) -> "tuple[str | dict, Usage]":
-        """One model call with transient retries; returns ``(result, usage)``."""
-        path, body = model.to_request(messages, output)
+        stream:      bool = False,
+        chain:       "tuple[dict, list] | None" = None,
+    ):
+        """
+        One model call with transient retries; returns ``(result, usage,
+        response)``.  With *chain* — ``(previous raw response, new messages)``
+        — the call continues the provider-stored conversation when the model
+        supports it, and sends all of *messages* otherwise.
+        """
+        request = model.to_continuation(*chain, output) if chain is not None else None
+        path, body = request or model.to_request(messages, output)
 
         for attempt in range(max(0, max_retries) + 1):
             if attempt > 0:
-                time.sleep(retry_delay * (2 ** (attempt - 1)))
+                yield (_SLEEP, retry_delay * (2 ** (attempt - 1)))
+            check_deadline(f"a call to {model.name}")
 
             try:
                 self._emit("llm_call.started", name=model.name)
                 _t0 = time.monotonic()
-                raw      = model.client.send(
-                    path, body, model.client._auth_headers()
-                )
-                response = json.loads(raw)
+                # The driver performs the effect in this scope (see _effect_scope).
+                scope = (self.hooks, output.get("save_to"))
+                if stream:
+                    response = yield (_STREAM, model, path, body, scope)
+                else:
+                    response = json.loads((yield (_SEND, model, path, body, scope)))
+                if not stream:
+                    record_latency(model.name, time.monotonic() - _t0)
                 usage    = attach_cost(extract_usage(response), model.name)
                 result   = model.from_response(response, output)
                 self._emit("llm_call.ended", name=model.name,
                            usage=getattr(usage, "total_tokens", None),
                            cost=getattr(usage, "cost", None),
                            duration=time.monotonic() - _t0)
-                return result, usage
+                return result, usage, response
+
+            except _PartialStream as partial:
+                self._emit("llm_call.ended", name=model.name,
+                           duration=time.monotonic() - _t0, error=str(partial.exc))
+                raise
 
             except APIError as exc:
                 self._emit("llm_call.ended", name=model.name,
@@ -390,6 +931,8 @@ class Skill:
                         and not isinstance(exc, (TaskFailedError,
                                                  InsufficientCreditsError))
                         and attempt < max_retries):
+                    check_deadline(f"a retry of {model.name}",
+                                   need=retry_delay * (2 ** attempt))
                     continue   # wait and retry the same model
                 raise          # non-transient, or retries exhausted
 
@@ -397,6 +940,78 @@ class Skill:
         # and every iteration returns or raises.
         raise RuntimeError("retry loop exited without returning or raising")
 
+    def _run_hedged(
+        self,
+        models:      list,
+        messages:    list,
+        max_retries: int,
+        retry_delay: float,
+    ):
+        """
+        One single-shot call hedged across the fallback chain (a ``_pipeline``
+        sub-generator); returns ``(result, usage)``.  Retries re-run the whole
+        hedge after a transient failure of every model.
+        """
+        calls = [(m, *m.to_request(messages, self._output)) for m in models]
+        for attempt in range(max(0, max_retries) + 1):
+            if attempt > 0:
+                yield (_SLEEP, retry_delay * (2 ** (attempt - 1)))
+            check_deadline(f"a call to {models[0].name}")
+
+            usages: list = []
+            hedge = _Hedge(
+                calls, self._hedge_delays(models), _FALLBACK_ERRORS,
+                on_started=lambda i: self._emit("llm_call.started", name=calls[i][0].name,
+                                                payload={"hedge": i}),
+                on_settled=functools.partial(self._hedge_settled, calls, usages),
+            )
+            try:
+                index, raw = yield (_HEDGE, hedge, (self.hooks, self._output.get("save_to")))
+            except APIError as exc:
+                transient = (exc.status in _TRANSIENT_STATUSES
+                             or isinstance(exc, NetworkError))
+                if (transient
+                        and not isinstance(exc, (TaskFailedError,
+                                                 InsufficientCreditsError))
+                        and attempt < max_retries):
+                    check_deadline(f"a retry of {models[0].name}",
+                                   need=retry_delay * (2 ** attempt))
+                    continue
+                raise
+            model  = calls[index][0]
+            result = model.from_response(json.loads(raw), self._output)
+            return result, sum(usages) if usages else None
+
+        raise RuntimeError("retry loop exited without returning or raising")
+
+    def _hedge_delays(self, models: list) -> "list[float]":
+        """Seconds to wait on model ``i`` before hedging to model ``i + 1``."""
+        if not isinstance(self.hedge, str):
+            return [float(self.hedge)] * (len(models) - 1)
+        q = int(self.hedge[1:]) / 100
+        return [latency_quantile(m.name, q) or _HEDGE_DEFAULT_DELAY
+                for m in models[:-1]]
+
+    def _hedge_settled(self, calls: list, usages: list, index: int,
+                       outcome, duration: float, won: bool) -> None:
+        """Report one finished hedge leg (possibly after the winner returned)."""
+        model = calls[index][0]
+        if isinstance(outcome, BaseException):
+            self._emit("llm_call.ended", name=model.name, duration=duration,
+                       error=str(outcome), payload={"hedge": index})
+            return
+        record_latency(model.name, duration)
+        try:
+            usage = attach_cost(extract_usage(json.loads(outcome)), model.name)
+        except ValueError:
+            usage = None
+        if usage is not None:
+            usages.append(usage)
+        self._emit("llm_call.ended", name=model.name,
+                   usage=getattr(usage, "total_tokens", None),
+                   cost=getattr(usage, "cost", None), duration=duration,
+                   payload={"hedge": index, "won": won})
+
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
@@ -434,7 +1049,7 @@ class Skill:
             "model_name":  self.model.name,
             "name":        self.name,
             "description": self.description,
-            "input":       self._input,
+            "input":       adapters.plain_input(self._input),
             "output":      self._output,
             "variables":   self.variables if self.variables else None,
             "options":     self.options   if self.options   else None,
@@ -0,0 +1,135 @@
+"""
+skills._stats
+=============
+
+Process-wide statistics per model, fed by every model call a Skill makes.
+
+Each model keeps a rolling window of its most recent call durations.
+``latency_quantile("gpt-4o", 0.9)`` reads the observed p90 — what
+``Skill(hedge="p90")`` waits before hedging to the next model — and returns
+``None`` until the window holds enough samples to mean anything.
+
+Each model also keeps exponentially weighted moving averages (EWMA) of its
+latency, error rate and cost, updated from the ``llm_call.ended`` events
+Skills emit.  ``Router`` reads them to order a fallback chain per call.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+# Durations kept per model, and the fewest that make a quantile meaningful.
+_WINDOW      = 200
+_MIN_SAMPLES = 20
+
+# Weight of the newest call in the moving averages.
+_ALPHA = 0.2
+
+
+class LatencyStats:
+    """Rolling per-key windows of durations (seconds); thread-safe."""
+
+    def __init__(self, window: int = _WINDOW) -> None:
+        self._window  = window
+        self._lock    = threading.Lock()
+        self._samples: dict[str, deque] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self._window)
+            samples.append(seconds)
+
+    def quantile(self, key: str, q: float,
+                 min_samples: int = _MIN_SAMPLES) -> "float | None":
+        """The *q* quantile (0–1) of *key*'s window, or ``None`` if too few samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def count(self, key: str) -> int:
+        with self._lock:
+            return len(self._samples.get(key, ()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+class ModelHealth:
+    """
+    EWMA latency (seconds), error rate (0–1) and cost (USD) per model name;
+    thread-safe.  A model with no calls on record has no entry.
+    """
+
+    def __init__(self, alpha: float = _ALPHA) -> None:
+        self._alpha = alpha
+        self._lock  = threading.Lock()
+        self._stats: dict[str, dict] = {}
+
+    def observe(self, event) -> None:
+        """Fold one ``llm_call.ended`` event into its model's averages."""
+        if event.type != "llm_call.ended" or not event.name:
+            return
+        failed = event.error is not None
+        with self._lock:
+            entry = self._stats.get(event.name)
+            if entry is None:
+                entry = self._stats[event.name] = {
+                    "latency": None, "error_rate": float(failed),
+                    "cost": None, "calls": 0,
+                }
+            else:
+                entry["error_rate"] = self._ewma(entry["error_rate"], float(failed))
+            entry["calls"] += 1
+            if not failed and event.duration is not None:
+                entry["latency"] = self._ewma(entry["latency"], event.duration)
+            if event.cost is not None:
+                entry["cost"] = self._ewma(entry["cost"], event.cost)
+
+    def get(self, name: str) -> "dict | None":
+        """A snapshot of *name*'s averages, or ``None`` if it has no calls."""
+        with self._lock:
+            entry = self._stats.get(name)
+            return dict(entry) if entry is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def _ewma(self, current: "float | None", value: float) -> float:
+        if current is None:
+            return value
+        return current + self._alpha * (value - current)
+
+
+_latency = LatencyStats()
+_health  = ModelHealth()
+
+
+def record_latency(model_name: str, seconds: float) -> None:
+    """Add one successful call's duration to *model_name*'s window."""
+    _latency.record(model_name, seconds)
+
+
+def latency_quantile(model_name: str, q: float,
+                     min_samples: int = _MIN_SAMPLES) -> "float | None":
+    """Observed *q* quantile of *model_name*'s call latency, or ``None``."""
+    return _latency.quantile(model_name, q, min_samples)
+
+
+def observe_call(event) -> None:
+    """Feed one Skill event into the process-wide model health averages."""
+    _health.observe(event)
+
+
+def model_health(model_name: str) -> "dict | None":
+    """
+    *model_name*'s averages — ``latency``, ``error_rate``, ``cost``, ``calls`` —
+    or ``None`` before its first call.
+    """
+    return _health.get(model_name)
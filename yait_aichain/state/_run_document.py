@@ -8,7 +8,8 @@ A self-contained, JSON-serialisable snapshot of one run. Holds three things:
   steps produce named outputs);
 * ``steps`` — per-step control state: ``status`` (+ optional ``suspend`` and an
   optional observability ``log``); the value of any step's output already lives
-  in ``variables``;
+  in ``variables`` (a DAG-mode chain also keeps it as the step's ``output``, to
+  return the highest step's output after a resume);
 * ``definition`` — the serialised scenario (e.g. ``Chain.save`` output) so a run
   can be resumed from this one artifact alone.
 
@@ -40,7 +41,7 @@ class RunDocument:
 
     run_id:     str
     kind:       str                      # "chain" | "agent"
-    variables:  dict           = field(default_factory=dict)
+    variables:  dict           = field(default_factory=dict)   # any Mapping; to_dict() makes it a dict
     steps:      list[dict]     = field(default_factory=list)
     usage:      dict           = field(default_factory=dict)
     definition: "dict | None"  = None
@@ -101,7 +102,7 @@ class RunDocument:
             "run_id":     self.run_id,
             "kind":       self.kind,
             "status":     self.status,        # derived, stored for readers
-            "variables":  self.variables,
+            "variables":  dict(self.variables),
             "steps":      self.steps,
             "usage":      self.usage,
             "definition": self.definition,
@@ -33,22 +33,40 @@ class StateStore:
         raise NotImplementedError
 
 
+def _detach(document: dict) -> dict:
+    """
+    A copy of *document* that later changes to the original cannot reach:
+    the control state (steps, usage, context, …) is deep-copied, but the
+    variable *values* — possibly whole converted documents — are shared.
+    The engines replace a variable's value, they never mutate it, so a
+    stored value stays as it was saved.
+    """
+    variables = document.get("variables")
+    rest = copy.deepcopy({k: v for k, v in document.items() if k != "variables"})
+    if variables is not None:
+        rest["variables"] = dict(variables)
+    return rest
+
+
 class InMemoryStore(StateStore):
     """
     Process-local store (the default). Survives suspend→resume **within one
     process** only; for cross-process / serverless use a shared store
     (``FileStore`` or a custom S3/Dynamo backend).
+
+    Nothing is serialised, so saving is cheap: the document's control state
+    is copied and its variable values are shared (see ``_detach``).
     """
 
     def __init__(self) -> None:
         self._runs: dict[str, dict] = {}
 
     def save(self, run_id: str, document: dict) -> None:
-        self._runs[run_id] = copy.deepcopy(document)
+        self._runs[run_id] = _detach(document)
 
     def load(self, run_id: str) -> "dict | None":
         doc = self._runs.get(run_id)
-        return copy.deepcopy(doc) if doc is not None else None
+        return _detach(doc) if doc is not None else None
 
     def delete(self, run_id: str) -> None:
         self._runs.pop(run_id, None)
@@ -78,6 +78,8 @@ All previous class names still work:
   OpenAIEmbedder, CohereEmbedder, VoyageEmbedder, GoogleEmbedder
 """
 
+import importlib
+
 from ._base           import Tool, ToolResult
 from ._wait           import Wait, Gate
 from ._permissions    import (
@@ -87,108 +89,69 @@ from ._permissions    import (
     ALLOW, APPROVE, DENY,
 )
 
-# ── Search ────────────────────────────────────────────────────────────────────
-from .search import (
-    Search,
-    searchPerplexity,
-    searchBrave,
-    searchOpenAI,
-    searchSerp,
-    # aliases
-    PerplexitySearchTool,
-    BraveSearchTool,
-    OpenAIWebSearchTool,
-    SerpApiTool,
-)
-
-# ── Embedding ─────────────────────────────────────────────────────────────────
-from .embedding import (
-    Embedding,
-    Embedder,
-    EmbeddingResult,
-    EmbeddingOpenAI,
-    EmbeddingCohere,
-    EmbeddingVoyage,
-    EmbeddingGoogle,
-    EmbeddingQwen,
-    # aliases
-    OpenAIEmbedder,
-    CohereEmbedder,
-    VoyageEmbedder,
-    GoogleEmbedder,
-)
-
-# ── Convert ───────────────────────────────────────────────────────────────────
-from .convert import (
-    convertToMD,
-    convertToHTML,
-    convertToPDF,
-    convertToSpeech,
-    convertToText,
-    # TTS providers
-    ttsOpenAI,
-    ttsGoogle,
-    ttsXAI,
-    ttsQwen,
-    # STT providers
-    sttOpenAI,
-    sttGoogle,
-    sttXAI,
-    sttQwen,
-    # factories
-    TTS,
-    STT,
-    # aliases
-    MarkItDownTool,
-    MistletoeTool,
-    WeasyprintTool,
-)
-
-# ── Universal REST API ────────────────────────────────────────────────────────
-from .rest_api import RestApiTool
-
-# ── Vector DB ────────────────────────────────────────────────────────────────
-from .vectordb import (
-    VectorDB,
-    VectorStore,
-    VectorRecord,
-    VectorBackend,
-    ChromaBackend,
-    PineconeBackend,
-    QdrantBackend,
-    vectorChunk,
-    vectorQuery,
-    vectorUpsert,
-    vectorFetch,
-    vectorDelete,
-    VectorChunkTool,
-    VectorQueryTool,
-    VectorUpsertTool,
-    VectorFetchTool,
-    VectorDeleteTool,
-)
-
-# ── Reranking ────────────────────────────────────────────────────────────────
-from .reranking import (
-    Reranker,
-    RerankBase,
-    RerankResult,
-    RerankCohere,
-    RerankVoyage,
-    RerankQwen,
-)
-
-# ── Local filesystem ─────────────────────────────────────────────────────────
-from .local import (
-    LocalTools,
-    localBrowse, LocalBrowseTool,
-    localRead,   LocalReadTool,
-    localWrite,  LocalWriteTool,
-    localRun,    LocalRunTool,
-)
-
-# ── MCP (Model Context Protocol) ─────────────────────────────────────────────
-from .mcp import MCPTool, MCPTools
+# ── Tool groups (imported on first use) ───────────────────────────────────────
+# Each group pulls in its own provider modules (converters, vector backends,
+# MCP, …); importing them all up front was most of ``import yait_aichain``'s
+# cold-start time.  ``from yait_aichain.tools import searchBrave`` imports
+# only ``tools.search``.
+_LAZY_GROUPS: dict = {
+    ".search": (
+        "Search", "searchPerplexity", "searchBrave", "searchOpenAI", "searchSerp",
+        # aliases
+        "PerplexitySearchTool", "BraveSearchTool", "OpenAIWebSearchTool", "SerpApiTool",
+    ),
+    ".embedding": (
+        "Embedding", "Embedder", "EmbeddingResult",
+        "EmbeddingOpenAI", "EmbeddingCohere", "EmbeddingVoyage",
+        "EmbeddingGoogle", "EmbeddingQwen",
+        # aliases
+        "OpenAIEmbedder", "CohereEmbedder", "VoyageEmbedder", "GoogleEmbedder",
+    ),
+    ".convert": (
+        "convertToMD", "convertToHTML", "convertToPDF", "convertToSpeech", "convertToText",
+        "ttsOpenAI", "ttsGoogle", "ttsXAI", "ttsQwen",
+        "sttOpenAI", "sttGoogle", "sttXAI", "sttQwen",
+        "TTS", "STT",
+        # aliases
+        "MarkItDownTool", "MistletoeTool", "WeasyprintTool",
+    ),
+    ".rest_api": ("RestApiTool",),
+    ".vectordb": (
+        "VectorDB", "VectorStore", "VectorRecord", "VectorBackend",
+        "ChromaBackend", "PineconeBackend", "QdrantBackend",
+        "vectorChunk", "vectorQuery", "vectorUpsert", "vectorFetch", "vectorDelete",
+        "VectorChunkTool", "VectorQueryTool", "VectorUpsertTool",
+        "VectorFetchTool", "VectorDeleteTool",
+    ),
+    ".reranking": (
+        "Reranker", "RerankBase", "RerankResult",
+        "RerankCohere", "RerankVoyage", "RerankQwen",
+    ),
+    ".local": (
+        "LocalTools",
+        "localBrowse", "LocalBrowseTool",
+        "localRead",   "LocalReadTool",
+        "localWrite",  "LocalWriteTool",
+        "localRun",    "LocalRunTool",
+    ),
+    ".mcp": ("MCPTool", "MCPTools"),
+}
+
+#: public name → the tool group module that defines it
+_LAZY: dict = {name: module for module, names in _LAZY_GROUPS.items() for name in names}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value          # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY))
 
 
 __all__ = [